@@ -200,8 +200,8 @@ export async function POST(request: NextRequest) {
     // Apply adjustments to household input
     const modifiedHousehold = applyAdjustments(household, adjustments);
 
-    // Forward modified household to Python API
-    const pythonResponse = await fetch(`${PYTHON_API_URL}/api/run-simulation`, {
+    // Forward modified household to Python API (what_if=1: resume from the stored base run)
+    const pythonResponse = await fetch(`${PYTHON_API_URL}/api/run-simulation?what_if=1`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -54,8 +54,52 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Failed to load tax configuration: {e}")
         raise
 
+    # Engine worker pool for Monte Carlo and strategy searches: ENGINE_WORKERS=0
+    # (default) runs in-process, "auto" uses every core, any other number sets
+    # the worker count
+    engine_workers = os.environ.get("ENGINE_WORKERS", "0").strip().lower()
+    if engine_workers not in ("", "0"):
+        from modules.monte_carlo_pool import MonteCarloPool
+        app.state.engine_pool = MonteCarloPool(
+            workers=None if engine_workers == "auto" else int(engine_workers),
+            config_dir=os.path.dirname(os.path.abspath(tax_config_path)),
+        )
+
+    # Engine work runs on a bounded executor off the event loop: at most
+    # ENGINE_MAX_IN_FLIGHT jobs at once, ENGINE_MAX_QUEUE more waiting up to
+    # ENGINE_QUEUE_TIMEOUT seconds, the rest rejected with 503 + Retry-After
+    from api.utils.admission import AdmissionController
+    app.state.admission = AdmissionController(
+        max_in_flight=int(os.environ.get("ENGINE_MAX_IN_FLIGHT", os.cpu_count() or 2)),
+        max_queue=int(os.environ.get("ENGINE_MAX_QUEUE", 32)),
+        queue_timeout=float(os.environ.get("ENGINE_QUEUE_TIMEOUT", 10)),
+    )
+
+    # Result cache for /run-simulation: RESULT_CACHE_ENTRIES=0 disables it,
+    # RESULT_CACHE_DIR adds a disk tier that survives restarts
+    cache_entries = int(os.environ.get("RESULT_CACHE_ENTRIES", 512))
+    if cache_entries > 0:
+        from api.utils.result_cache import ResultCache
+        app.state.result_cache = ResultCache(
+            max_entries=cache_entries,
+            ttl_seconds=float(os.environ.get("RESULT_CACHE_TTL", 3600)),
+            max_bytes=int(float(os.environ.get("RESULT_CACHE_MB", 64)) * 1024 * 1024),
+            disk_dir=os.environ.get("RESULT_CACHE_DIR") or None,
+            disk_max_bytes=int(float(os.environ.get("RESULT_CACHE_DISK_MB", 512)) * 1024 * 1024),
+        )
+
+    # Year-boundary checkpoints of recent what-if runs (?what_if=1), so re-runs that only
+    # change late-life parameters resume mid-plan: CHECKPOINT_RUNS=0 disables them
+    checkpoint_runs = int(os.environ.get("CHECKPOINT_RUNS", 32))
+    if checkpoint_runs > 0:
+        from modules.checkpoints import CheckpointStore
+        app.state.checkpoints = CheckpointStore(max_runs=checkpoint_runs)
+
     yield
 
+    app.state.admission.shutdown()
+    if hasattr(app.state, "engine_pool"):
+        app.state.engine_pool.shutdown()
     logger.info("👋 Shutting down Retirement Simulation API")
 
 # Initialize FastAPI app
@@ -158,9 +202,10 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # Import and register routers
 try:
-    from api.routes import simulation, optimization, monte_carlo
+    from api.routes import simulation, batch, optimization, monte_carlo
 
     app.include_router(simulation.router, prefix="/api", tags=["simulation"])
+    app.include_router(batch.router, prefix="/api", tags=["simulation"])
     app.include_router(optimization.router, prefix="/api", tags=["optimization"])
     app.include_router(monte_carlo.router, prefix="/api", tags=["monte-carlo"])
 
@@ -182,6 +227,7 @@ async def root():
         "endpoints": {
             "health": "/api/health",
             "simulation": "/api/run-simulation",
+            "batch_simulation": "/api/run-simulation/batch",
             "composition": "/api/analyze-composition",
             "optimization": "/api/optimize-strategy",
             "monte_carlo": "/api/monte-carlo"
@@ -198,7 +244,13 @@ async def health_check(request: Request):
         - status: "ok" if service is healthy
         - tax_config_loaded: True if tax configuration loaded successfully
         - version: API version
+        - tax_cache: Shared tax cache hit/miss/eviction counters
+        - admission: Engine queue depth, in-flight jobs, wait times and rejections
+        - result_cache: Simulation result cache hit rate, size and evictions
+        - checkpoints: Stored runs and years reused by what-if re-runs
     """
+    from modules.tax_engine import get_tax_cache_stats
+
     tax_cfg_loaded = hasattr(request.app.state, "tax_cfg")
 
     return {
@@ -207,7 +259,11 @@ async def health_check(request: Request):
         "version": "1.0.0",
         "environment": ENVIRONMENT,
         "tax_config_loaded": tax_cfg_loaded,
-        "ready": tax_cfg_loaded
+        "ready": tax_cfg_loaded,
+        "tax_cache": get_tax_cache_stats(),
+        "admission": request.app.state.admission.stats() if hasattr(request.app.state, "admission") else None,
+        "result_cache": request.app.state.result_cache.stats() if hasattr(request.app.state, "result_cache") else None,
+        "checkpoints": request.app.state.checkpoints.stats() if hasattr(request.app.state, "checkpoints") else None,
     }
 
 # Readiness probe (K8s/Railway)
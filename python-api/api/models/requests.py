@@ -345,4 +345,9 @@ class MonteCarloRequest(BaseModel):
         default=None,
         description="Random seed for reproducibility"
     )
+    include_trials: bool = Field(
+        default=False,
+        description="Include per-trial results in the response"
+    )
+
 # Reloading API to pick up pension changes Sat Feb 14 18:53:25 MST 2026
@@ -467,6 +467,15 @@ class CompositionResponse(BaseModel):
     strategy_details: dict[str, Any]
 
 
+class CandidateTiming(BaseModel):
+    """Where one optimization candidate's time went."""
+
+    queue_ms: float  # Submitted to started
+    simulate_ms: float  # Simulation run time (0 when shared)
+    years_simulated: int
+    shared: bool = False  # Reused the simulation of an equivalent candidate
+
+
 class OptimizationCandidate(BaseModel):
     """One candidate from optimization."""
 
@@ -484,6 +493,8 @@ class OptimizationCandidate(BaseModel):
 
     score: float
 
+    timing: CandidateTiming | None = None
+
 
 class OptimizationResponse(BaseModel):
     """Response from optimization endpoint."""
@@ -496,6 +507,9 @@ class OptimizationResponse(BaseModel):
 
     optimization_criteria: str
     candidates_tested: int
+    candidates_pruned: int = 0  # Stopped early: could no longer beat the best candidate
+    simulations_run: int = 0
+    elapsed_ms: float = 0.0
 
     warnings: list[str] = Field(default_factory=list)
     error: str | None = None
@@ -538,5 +552,10 @@ class MonteCarloResponse(BaseModel):
         description="Detailed trials (optional, can be large)"
     )
 
+    assumptions: list[str] = Field(
+        default_factory=list,
+        description="How the trials approximate a full simulation of each return sequence"
+    )
+
     warnings: list[str] = Field(default_factory=list)
     error: str | None = None
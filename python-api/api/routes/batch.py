@@ -0,0 +1,252 @@
+"""
+Batch simulation endpoint.
+
+Nightly recomputes (and recomputes after a tax config change) used to loop
+HTTP calls to /run-simulation. POST /run-simulation/batch takes the whole
+set in one request, as a JSON array or as NDJSON, and streams back one
+NDJSON line per household as soon as it finishes.
+
+NDJSON bodies are parsed line by line as they arrive, so the first results
+stream back while the rest of the body is still being sent, and at most a
+window of items is held in memory. Starlette's StreamingResponse listens for
+the client disconnect on the same receive channel from the start, which
+would swallow body chunks still to come; _BatchResponse only starts
+listening once the body has been read. A JSON array is parsed up front.
+
+Items are validated and simulated on the engine pool when ENGINE_WORKERS is
+set (each worker renders its own result line), otherwise on the engine
+threads through the admission controller. A bad item produces an error line;
+the rest of the batch carries on.
+"""
+
+from types import SimpleNamespace
+from time import perf_counter
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+
+from api.models.requests import HouseholdInput
+from api.routes.simulation import _run_simulation
+from api.utils.admission import run_engine
+from modules.engine_pool import worker_tax_config
+from modules.strategy_grid import JOBS_PER_WORKER
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+# Items in flight without an engine pool (one runs while the next waits for a slot)
+THREAD_WINDOW = 2
+
+
+class _BadItem:
+    """Placeholder for an input line that is not valid JSON"""
+
+    def __init__(self, error: str):
+        self.error = error
+
+
+def _line(content: Dict[str, Any]) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _error_line(index: int, status: int, error: Any) -> Tuple[int, bytes]:
+    return status, _line({"index": index, "status": status, "error": error})
+
+
+def _batch_item(index: int, payload: Any, state) -> Tuple[int, bytes]:
+    """Validate, simulate and render one item: (status, result line)"""
+    try:
+        household_input = HouseholdInput.model_validate(payload)
+    except ValidationError as e:
+        return _error_line(index, 422, jsonable_encoder(e.errors(include_url=False)))
+
+    try:
+        response = _run_simulation(household_input, state)
+        return 200, _line({"index": index, "status": 200, "result": jsonable_encoder(response)})
+    except HTTPException as e:
+        return _error_line(index, e.status_code, e.detail)
+    except Exception as e:
+        logger.error(f"❌ Batch item {index} failed: {e}", exc_info=True)
+        return _error_line(index, 500, str(e))
+
+
+def _worker_batch_item(index: int, payload: Any, version: str, tax_cfg: Optional[Dict]) -> Tuple[int, bytes]:
+    """_batch_item on an engine pool worker, with the worker-resident tax config"""
+    return _batch_item(index, payload, SimpleNamespace(tax_cfg=worker_tax_config(version, tax_cfg)))
+
+
+class _BatchResponse(StreamingResponse):
+    """
+    NDJSON StreamingResponse that leaves the receive channel to the request
+    body reader until `body_read` is set, then listens for the disconnect.
+    """
+
+    def __init__(self, content, body_read: asyncio.Event):
+        super().__init__(content, media_type="application/x-ndjson")
+        self.body_read = body_read
+
+    async def listen_for_disconnect(self, receive) -> None:
+        await self.body_read.wait()
+        await super().listen_for_disconnect(receive)
+
+
+async def _ndjson_items(request: Request, body_read: asyncio.Event) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    (index, item) per non-blank NDJSON line, parsed as the body arrives
+    (invalid JSON becomes a _BadItem). Sets body_read once the body is done.
+    """
+    index = 0
+    partial = b""  # Start of a line whose end has not arrived yet
+    try:
+        async for chunk in request.stream():
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield index, _parse(line)
+                    index += 1
+        if partial.strip():
+            yield index, _parse(partial)
+    finally:
+        body_read.set()
+
+
+def _parse(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return _BadItem(f"Invalid JSON: {e}")
+
+
+async def _array_body(request: Request) -> list:
+    try:
+        items = json.loads(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of households (or an NDJSON stream)")
+    return items
+
+
+@router.post("/run-simulation/batch")
+async def run_simulation_batch(request: Request):
+    """
+    Run many simulations in one request, streaming results as NDJSON.
+
+    **Request Body:**
+    - A JSON array of `HouseholdInput` objects, or
+    - NDJSON (`Content-Type: application/x-ndjson`), one `HouseholdInput`
+      per line
+
+    **Response:** `application/x-ndjson`, one line per item in completion order:
+    - `{"index": i, "status": 200, "result": SimulationResponse}`
+    - `{"index": i, "status": 400|422|503|500, "error": ...}` for an item that
+      could not be simulated (503 items can be retried later)
+
+    A final `{"done": true, ...}` line reports item and error counts and the
+    elapsed time; a stream without it was cut short.
+    """
+    if not hasattr(request.app.state, "tax_cfg"):
+        raise HTTPException(
+            status_code=503,
+            detail="Tax configuration not loaded. Service not ready."
+        )
+
+    body_read = asyncio.Event()
+    items: Union[list, AsyncIterator[Tuple[int, Any]]]
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_TYPES:
+        items = _ndjson_items(request, body_read)
+    else:
+        # Parsed up front so a malformed array is a plain 400, not a broken stream
+        items = await _array_body(request)
+        body_read.set()
+
+    tax_cfg = request.app.state.tax_cfg
+    pool = getattr(request.app.state, "engine_pool", None)
+    admission = getattr(request.app.state, "admission", None)
+    # Items only need the tax config: they never touch the result cache or what-if checkpoints
+    item_state = SimpleNamespace(tax_cfg=tax_cfg)
+
+    async def run_item(index: int, payload: Any) -> Tuple[int, bytes]:
+        if isinstance(payload, _BadItem):
+            return _error_line(index, 400, payload.error)
+        try:
+            if pool is None:
+                return await run_engine(request, _batch_item, index, payload, item_state)
+            if admission is None:
+                return await asyncio.wrap_future(
+                    pool.submit(_worker_batch_item, index, payload, *pool.config_arg(tax_cfg))
+                )
+            async with admission.slot():
+                return await asyncio.wrap_future(
+                    pool.submit(_worker_batch_item, index, payload, *pool.config_arg(tax_cfg))
+                )
+        except HTTPException as e:
+            return _error_line(index, e.status_code, e.detail)
+        except Exception as e:
+            logger.error(f"❌ Batch item {index} failed: {e}", exc_info=True)
+            return _error_line(index, 500, str(e))
+
+    window = pool.workers * JOBS_PER_WORKER if pool is not None else THREAD_WINDOW
+
+    async def results():
+        t0 = perf_counter()
+        count = errors = 0
+        pending = set()
+        listed = iter(enumerate(items)) if isinstance(items, list) else None
+        reading = None  # Task parsing the next NDJSON line while results come in
+        exhausted = False
+
+        try:
+            while True:
+                # Keep the window full: list items at once, stream lines one read at a time
+                while not exhausted and reading is None and len(pending) < window:
+                    if listed is None:
+                        reading = asyncio.ensure_future(items.__anext__())
+                    else:
+                        item = next(listed, None)
+                        if item is None:
+                            exhausted = True
+                        else:
+                            pending.add(asyncio.ensure_future(run_item(*item)))
+                if reading is None and not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending | {reading} - {None}, return_when=asyncio.FIRST_COMPLETED)
+                if reading in done:
+                    done.discard(reading)
+                    try:
+                        pending.add(asyncio.ensure_future(run_item(*reading.result())))
+                    except StopAsyncIteration:
+                        exhausted = True
+                    except ClientDisconnect:
+                        logger.info("📦 Batch client disconnected while sending the body")
+                        return
+                    reading = None
+
+                pending.difference_update(done)
+                for task in done:
+                    status, line = task.result()
+                    count += 1
+                    errors += status != 200
+                    yield line
+        finally:
+            # Client went away: stop whatever has not started
+            for task in pending | {reading} - {None}:
+                task.cancel()
+
+        elapsed_ms = (perf_counter() - t0) * 1000.0
+        logger.info(f"📦 Batch complete: {count} items, {errors} errors in {elapsed_ms:.0f} ms")
+        yield _line({"done": True, "items": count, "errors": errors, "elapsed_ms": round(elapsed_ms, 1)})
+
+    return _BatchResponse(results(), body_read)
@@ -4,9 +4,12 @@ Monte Carlo simulation endpoints.
 Provides REST API for probabilistic analysis with variable returns.
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 from api.models.requests import MonteCarloRequest
 from api.models.responses import MonteCarloResponse, MonteCarloTrial
+from api.utils.admission import run_engine
+from api.utils.converters import api_household_to_internal
+from modules.monte_carlo import TRIAL_ASSUMPTIONS, run_monte_carlo
 import logging
 
 router = APIRouter()
@@ -21,8 +24,6 @@ async def monte_carlo_simulation(
     """
     Run Monte Carlo simulation with variable returns.
 
-    **TODO**: Full implementation coming in Phase 2.
-
     **Purpose:**
     - Test plan resilience under market volatility
     - Calculate probability of success
@@ -30,41 +31,101 @@ async def monte_carlo_simulation(
     - Provide confidence intervals for outcomes
 
     **Process:**
-    1. Runs N simulations with randomized returns
-    2. Returns vary based on mean and std deviation
+    1. Runs the deterministic simulation once to fix the withdrawal plan
+    2. Replays it against N sequences of random annual returns
+       (mean and std deviation in %), batched in NumPy shards that run on
+       the engine pool when ENGINE_WORKERS is set
     3. Aggregates results to show probability distribution
     4. Calculates percentiles (10th, 50th, 90th)
 
+    Trials replay the plan rather than re-simulating it: withdrawals and
+    benefits stay the plan's. The response lists these approximations in
+    `assumptions`.
+
     **Returns:**
     - Success rate across all trials
     - Median outcomes (estate, tax, years funded)
     - Percentile analysis
     - Best and worst case results
-    - Optional: Detailed trial-by-trial results
+    - Optional: Detailed trial-by-trial results (`include_trials`)
     """
+    try:
+        logger.info(
+            f"🎲 Monte Carlo requested: "
+            f"num_trials={request_data.num_trials}, "
+            f"return={request_data.return_mean}±{request_data.return_std}%"
+        )
+
+        if not hasattr(request.app.state, "tax_cfg"):
+            raise HTTPException(
+                status_code=503,
+                detail="Tax configuration not loaded. Service not ready."
+            )
+
+        tax_cfg = request.app.state.tax_cfg
+        options = dict(
+            num_trials=request_data.num_trials,
+            return_mean=request_data.return_mean,
+            return_std=request_data.return_std,
+            success_threshold=request_data.success_threshold,
+            seed=request_data.seed,
+        )
+        pool = getattr(request.app.state, "engine_pool", None)
+
+        def run():
+            household = api_household_to_internal(request_data.household, tax_cfg)
+            if pool is not None:
+                # Shards run across the worker pool; same trials as in-process for a given seed
+                return pool.run(household, tax_cfg, **options)
+            return run_monte_carlo(household, tax_cfg, **options)
+
+        # Engine work runs on the admission-controlled threads, off the event loop
+        result = await run_engine(request, run)
+
+        trials = None
+        if request_data.include_trials:
+            trials = [
+                MonteCarloTrial(
+                    trial_number=i + 1,
+                    success=bool(result.success[i]),
+                    years_funded=int(result.years_funded[i]),
+                    final_estate=float(result.final_estate[i]),
+                    total_tax=float(result.total_tax[i]),
+                    max_drawdown=float(result.max_drawdown[i]),
+                )
+                for i in range(result.num_trials)
+            ]
+
+        warnings = []
+        if result.success_rate < 0.75:
+            warnings.append(
+                f"⚠️ Plan succeeds in only {result.success_rate:.0%} of trials. "
+                f"Consider reducing spending or adjusting the withdrawal strategy."
+            )
+
+        return MonteCarloResponse(
+            success=True,
+            message=f"Monte Carlo simulation completed: {result.num_trials} trials over {result.years_planned} years",
+            num_trials=result.num_trials,
+            trials=trials,
+            assumptions=TRIAL_ASSUMPTIONS,
+            warnings=warnings,
+            **result.summary(),
+        )
+
+    except HTTPException:
+        raise
+
+    except ValueError as e:
+        logger.error(f"❌ Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid input: {str(e)}"
+        )
 
-    logger.info(
-        f"🎲 Monte Carlo requested: "
-        f"num_trials={request_data.num_trials}, "
-        f"return={request_data.return_mean}±{request_data.return_std}%"
-    )
-
-    # TODO: Implement full Monte Carlo logic
-    # For now, return placeholder response
-
-    return MonteCarloResponse(
-        success=True,
-        message="Monte Carlo endpoint not yet fully implemented. Returning placeholder.",
-        num_trials=request_data.num_trials,
-        success_rate=0.85,
-        median_estate=1500000,
-        median_tax=450000,
-        median_years_funded=28,
-        percentile_10_estate=1000000,
-        percentile_50_estate=1500000,
-        percentile_90_estate=2000000,
-        worst_case_estate=500000,
-        best_case_estate=3000000,
-        trials=None,  # Don't include detailed trials in placeholder
-        warnings=["⚠️ This endpoint is under development. Full implementation coming soon."]
-    )
+    except Exception as e:
+        logger.error(f"❌ Monte Carlo simulation failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Monte Carlo simulation failed: {str(e)}"
+        )
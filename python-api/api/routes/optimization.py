@@ -5,15 +5,40 @@ Provides REST API for strategy optimization.
 Tests multiple strategies and parameters to find the best outcome.
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 from api.models.requests import OptimizationRequest
-from api.models.responses import OptimizationResponse, OptimizationCandidate
+from api.models.responses import CandidateTiming, OptimizationResponse, OptimizationCandidate
+from api.utils.admission import run_engine
+from api.utils.converters import api_household_to_internal
+from modules.strategy_grid import GridCandidate, run_grid_search
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _to_candidate(rank: int, c: GridCandidate) -> OptimizationCandidate:
+    m = c.metrics
+    return OptimizationCandidate(
+        rank=rank,
+        strategy=c.strategy,
+        split_fraction=c.split_fraction,
+        hybrid_topup=c.hybrid_topup,
+        success_pct=c.success_rate * 100.0,
+        underfunded_years=m.years_simulated - m.years_funded,
+        cumulative_tax=m.total_tax,
+        legacy_gross=m.gross_legacy,
+        legacy_after_tax=m.after_tax_legacy,
+        score=c.score,
+        timing=CandidateTiming(
+            queue_ms=c.queue_ms,
+            simulate_ms=c.simulate_ms,
+            years_simulated=m.years_simulated,
+            shared=c.shared,
+        ),
+    )
+
+
 @router.post("/optimize-strategy", response_model=OptimizationResponse)
 async def optimize_strategy(
     request_data: OptimizationRequest,
@@ -22,55 +47,105 @@ async def optimize_strategy(
     """
     Optimize withdrawal strategy for household.
 
-    **TODO**: Full implementation coming in Phase 2.
-
     **Purpose:**
     - Test multiple withdrawal strategies
     - Test different RRIF income split percentages
     - Test different hybrid top-up amounts
     - Rank results by selected optimization criteria
 
+    **Process:**
+    1. Builds the full strategy × split fraction × hybrid top-up grid
+    2. Runs metrics-only simulations, in parallel on the engine pool when
+       ENGINE_WORKERS is set; combinations that only differ in top-up for a
+       non-hybrid strategy share one simulation
+    3. Stops each simulation as soon as it can no longer beat the best
+       finished candidate (not possible for `legacy`)
+
     **Optimization Criteria:**
-    - `balance`: Weighted score (legacy, tax, success)
+    - `balance`: Weighted score (funding, tax, benefits, legacy)
     - `legacy`: Maximize after-tax estate
-    - `tax_efficiency`: Minimize lifetime taxes
+    - `tax_efficiency`: Minimize lifetime taxes (including tax at death)
     - `success_rate`: Maximize years funded
 
     **Returns:**
-    - Ranked list of strategy candidates
+    - Ranked list of strategy candidates, each with a timing breakdown
     - Best candidate based on criteria
     - Detailed metrics for each candidate
+    - Counts of candidates tested and stopped early
     """
+    try:
+        logger.info(
+            f"🎯 Optimization requested: "
+            f"{len(request_data.strategies)} strategies, "
+            f"{len(request_data.split_fractions)} splits, "
+            f"{len(request_data.hybrid_topups)} top-ups, "
+            f"optimize_for={request_data.optimize_for}"
+        )
 
-    logger.info(
-        f"🎯 Optimization requested: "
-        f"{len(request_data.strategies)} strategies, "
-        f"{len(request_data.split_fractions)} splits, "
-        f"optimize_for={request_data.optimize_for}"
-    )
+        if not hasattr(request.app.state, "tax_cfg"):
+            raise HTTPException(
+                status_code=503,
+                detail="Tax configuration not loaded. Service not ready."
+            )
 
-    # TODO: Implement full optimization logic
-    # For now, return placeholder response
-
-    placeholder_candidate = OptimizationCandidate(
-        rank=1,
-        strategy="corporate-optimized",
-        split_fraction=0.0,
-        hybrid_topup=0.0,
-        success_pct=100.0,
-        underfunded_years=0,
-        cumulative_tax=500000,
-        legacy_gross=2000000,
-        legacy_after_tax=1500000,
-        score=0.95
-    )
+        tax_cfg = request.app.state.tax_cfg
+        pool = getattr(request.app.state, "engine_pool", None)
 
-    return OptimizationResponse(
-        success=True,
-        message="Optimization endpoint not yet fully implemented. Returning placeholder.",
-        candidates=[placeholder_candidate],
-        best_candidate=placeholder_candidate,
-        optimization_criteria=request_data.optimize_for,
-        candidates_tested=1,
-        warnings=["⚠️ This endpoint is under development. Full implementation coming soon."]
-    )
+        def search():
+            household = api_household_to_internal(request_data.household, tax_cfg)
+            return run_grid_search(
+                household,
+                tax_cfg,
+                request_data.strategies,
+                request_data.split_fractions,
+                request_data.hybrid_topups,
+                request_data.optimize_for,
+                pool,
+            )
+
+        # The search waits on the pool (or simulates in-process), so keep it off the event loop
+        result = await run_engine(request, search)
+
+        candidates = [_to_candidate(i + 1, c) for i, c in enumerate(result.candidates)]
+        best = candidates[0] if candidates else None
+
+        warnings = []
+        if best is not None and best.success_pct < 100.0:
+            warnings.append(
+                f"⚠️ No tested combination funds every year (best: {best.success_pct:.0f}%). "
+                f"Consider reducing spending."
+            )
+
+        return OptimizationResponse(
+            success=True,
+            message=(
+                f"Tested {result.candidates_tested} combinations "
+                f"({result.simulations_run} simulations, {len(result.pruned)} stopped early) "
+                f"in {result.elapsed_ms:.0f} ms"
+            ),
+            candidates=candidates,
+            best_candidate=best,
+            optimization_criteria=request_data.optimize_for,
+            candidates_tested=result.candidates_tested,
+            candidates_pruned=len(result.pruned),
+            simulations_run=result.simulations_run,
+            elapsed_ms=result.elapsed_ms,
+            warnings=warnings,
+        )
+
+    except HTTPException:
+        raise
+
+    except ValueError as e:
+        logger.error(f"❌ Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid input: {str(e)}"
+        )
+
+    except Exception as e:
+        logger.error(f"❌ Optimization failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Optimization failed: {str(e)}"
+        )
@@ -8,8 +8,13 @@ Provides REST API for:
 """
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 from api.models.requests import HouseholdInput
 from api.models.responses import SimulationResponse, CompositionResponse
+from api.utils.admission import run_engine
+from api.utils.result_cache import simulation_cache_key
+from api.utils.wire_format import ROW_FORMAT, WireFormat, negotiate
 from api.utils.converters import (
     api_household_to_internal,
     dataframe_to_year_results,
@@ -19,20 +24,61 @@ from api.utils.converters import (
     calculate_spending_analysis,
     extract_key_assumptions,
     extract_chart_data,
+    ShapedResults,
     get_strategy_display_name,
 )
-from modules.simulation import simulate
+from modules.simulation import simulate, simulate_what_if
+from modules import trace
 from utils.asset_analyzer import AssetAnalyzer
 import logging
+import os
+import time
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Simulation trace channels to log at debug level, e.g. SIM_TRACE_CHANNELS="withdrawals,gis" or "all"
+SIM_TRACE_CHANNELS = trace.parse_channels(os.environ.get("SIM_TRACE_CHANNELS"))
+
+# Time allowed for testing alternative strategies when a plan has gaps (seconds)
+AUTO_OPTIMIZE_TIMEOUT = float(os.environ.get("AUTO_OPTIMIZE_TIMEOUT", "2.0"))
+
+
+def _simulate_checkpointed(household, tax_cfg, checkpoints):
+    """
+    Run simulate(), resuming from a stored run of the same plan when one exists.
+
+    What-if requests re-post the plan with only late-life parameters changed,
+    so the years before the first affected one are reused from that run.
+    """
+    if checkpoints is None:
+        return simulate(household, tax_cfg)
+    run = simulate_what_if(household, tax_cfg, base=checkpoints.get(household, tax_cfg))
+    checkpoints.put(run, tax_cfg)
+    if run.years_reused:
+        logger.info(f"⏩ Resumed at year {run.years_reused} of {len(run.df)} from a stored run")
+    return run.df
+
+
+def _simulate_with_trace(household, tax_cfg, checkpoints=None):
+    """Run simulate(), collecting trace records when SIM_TRACE_CHANNELS is set"""
+    if not SIM_TRACE_CHANNELS:
+        return _simulate_checkpointed(household, tax_cfg, checkpoints)
+
+    with trace.collect(SIM_TRACE_CHANNELS) as collector:
+        df = _simulate_checkpointed(household, tax_cfg, checkpoints)
+    for record in collector.records:
+        logger.debug("trace %s", record)
+    if collector.dropped:
+        logger.debug(f"trace: {collector.dropped} records dropped")
+    return df
+
 
 @router.post("/run-simulation", response_model=SimulationResponse)
 async def run_simulation(
     household_input: HouseholdInput,
-    request: Request
+    request: Request,
+    what_if: bool = False,
 ):
     """
     Run retirement simulation for household.
@@ -59,6 +105,15 @@ async def run_simulation(
     - `composition_analysis`: Asset breakdown and recommendations
     - `warnings`: Non-fatal issues detected
 
+    **Compact format:** `?format=columnar` (or `Accept: application/vnd.columnar+json`)
+    sends `year_by_year` and `chart_data.data_points` as
+    `{"columns": [...], "rows": n, "data": {column: [values]}}`; add
+    `&precision=N` to round their floats to N decimal places.
+
+    **What-if re-runs:** `?what_if=1` records year-boundary checkpoints of the
+    run and resumes from a stored run of the same plan when only late-life
+    parameters (spending phases, phase end ages, end age) changed.
+
     **Example:**
     ```json
     {
@@ -77,6 +132,48 @@ async def run_simulation(
     }
     ```
     """
+    wire = negotiate(request)
+
+    # Identical plans are served from the result cache without touching the engine
+    cache = getattr(request.app.state, "result_cache", None)
+    cache_key = None
+    if cache is not None and hasattr(request.app.state, "tax_cfg"):
+        cache_key = simulation_cache_key(household_input, request.app.state.tax_cfg, wire.variant)
+        if cache.disk_dir is not None:
+            # A disk-tier lookup reads files, so it runs on a worker thread
+            body = await run_in_threadpool(cache.get, cache_key)
+        else:
+            body = cache.get(cache_key)
+        if body is not None:
+            logger.info(f"⚡ Simulation served from cache ({cache_key[:12]})")
+            return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT", **wire.headers})
+
+    # Conversion, simulation and response assembly are CPU-bound: run them on the
+    # engine threads so the event loop stays free for other requests
+    return await run_engine(request, _run_simulation, household_input, request.app.state, cache_key, wire, what_if)
+
+
+def _render_response(state, response: SimulationResponse, wire: WireFormat, cache_key: str | None) -> Response:
+    """Render the response once in the requested format, caching the body when cache_key is set"""
+    body = wire.render(response)
+    headers = dict(wire.headers)
+    if cache_key is not None:
+        state.result_cache.put(cache_key, body)
+        headers["X-Cache"] = "MISS"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _run_simulation(household_input: HouseholdInput, state, cache_key: str | None = None,
+                    wire: WireFormat = ROW_FORMAT, what_if: bool = False):
+    """
+    Simulate one household and assemble its SimulationResponse.
+
+    `state` is the app state (tax_cfg, and optionally engine_pool, checkpoints
+    and result_cache); batch workers pass a stand-in holding only tax_cfg.
+    Checkpoints are only recorded (and resumed from) for what-if requests.
+    The response is rendered here (off the event loop) when it is cached or
+    not in the default row format.
+    """
     try:
         logger.info(
             f"📊 Simulation requested: "
@@ -86,13 +183,13 @@ async def run_simulation(
         )
 
         # Get tax config from app state
-        if not hasattr(request.app.state, "tax_cfg"):
+        if not hasattr(state, "tax_cfg"):
             raise HTTPException(
                 status_code=503,
                 detail="Tax configuration not loaded. Service not ready."
             )
 
-        tax_cfg = request.app.state.tax_cfg
+        tax_cfg = state.tax_cfg
 
         # DEBUG: Check API input balances
         logger.debug(f"🔎 API Input Received:")
@@ -147,9 +244,7 @@ async def run_simulation(
                 warnings=["All account balances are currently $0. Please fill in your financial information in the Input tab."]
             )
 
-        # IMPORTANT: Analyze composition BEFORE running simulation
-        # The simulation modifies the household object in place, depleting balances
-        logger.debug("Analyzing asset composition (before simulation)")
+        logger.debug("Analyzing asset composition")
 
         # DEBUG: Inspect household object before AssetAnalyzer
         logger.debug(f"🔍 DEBUG: About to call AssetAnalyzer.analyze()")
@@ -179,13 +274,16 @@ async def run_simulation(
             f"years={household.end_age - household.p1.start_age}"
         )
 
-        df = simulate(household, tax_cfg)
+        checkpoints = getattr(state, "checkpoints", None) if what_if else None
+        df = _simulate_with_trace(household, tax_cfg, checkpoints)
 
         logger.info(f"✅ Simulation complete: {len(df)} years simulated")
 
         # US-044: Auto-optimize strategy if funding gaps exist
         optimization_result = None
         original_strategy = household.strategy
+        # Only deterministic responses are cached: not ones cut short by the optimizer deadline
+        cacheable = True
 
         # Check if we should attempt auto-optimization
         # Only optimize if there are funding gaps
@@ -208,13 +306,19 @@ async def run_simulation(
 
             logger.info("🔍 Funding gaps detected - evaluating alternative strategies")
 
+            # Alternatives run concurrently on the engine pool when there is one;
+            # whatever has finished by the deadline decides the suggestion
+            deadline = time.monotonic() + AUTO_OPTIMIZE_TIMEOUT
             optimization_result = find_best_alternative_strategy(
-                household=household_input,  # Use original input (not modified household)
+                household=household,  # simulate() leaves it untouched, so reuse the converted household
                 tax_cfg=tax_cfg,
                 original_df=df,
                 original_strategy=original_strategy,
-                simulate_func=lambda h, t: simulate(api_household_to_internal(h, t), t)
+                simulate_func=simulate,
+                pool=getattr(state, "engine_pool", None),
+                deadline=deadline,
             )
+            cacheable = time.monotonic() < deadline
 
             # If optimization found better strategy, prepare suggestion
             # (Don't auto-switch - let user decide)
@@ -228,8 +332,9 @@ async def run_simulation(
 
         # Convert results to API models
         logger.debug("Converting results to API format")
-        year_by_year = dataframe_to_year_results(df)
-        summary = calculate_simulation_summary(df)
+        shaped = ShapedResults(df)
+        year_by_year = dataframe_to_year_results(df, shaped)
+        summary = calculate_simulation_summary(df, shaped)
         composition_data = {
             "tfsa_pct": composition.tfsa_pct,
             "rrif_pct": composition.rrif_pct,
@@ -272,14 +377,9 @@ async def run_simulation(
 
         # Calculate estate summary and 5-year plan
         logger.debug("Calculating estate summary and 5-year plan")
-        estate_summary = calculate_estate_summary(df, household)
-        five_year_plan = extract_five_year_plan(df)
+        estate_summary = calculate_estate_summary(df, household, shaped)
+        five_year_plan = extract_five_year_plan(df, shaped)
 
-        # Debug: Log pension values in 5-year plan
-        print("\n===== DEBUG: 5-YEAR PLAN PENSION VALUES =====")
-        for year_plan in five_year_plan[:5]:
-            print(f"Year {year_plan.year} (Age P1={year_plan.age_p1}): employer_pension_p1=${year_plan.employer_pension_p1:,.2f}")
-        print("=============================================\n")
 
         # Check if intelligent estate tax optimization is active
         if "rrif-frontload" in household.strategy.lower():
@@ -302,9 +402,9 @@ async def run_simulation(
 
         # Calculate new PDF report data
         logger.debug("Calculating spending analysis, key assumptions, and chart data")
-        spending_analysis = calculate_spending_analysis(df, summary)
+        spending_analysis = calculate_spending_analysis(df, summary, shaped)
         key_assumptions = extract_key_assumptions(household_input, df)
-        chart_data = extract_chart_data(df)
+        chart_data = extract_chart_data(df, shaped)
 
         # Extract AI-powered insights (if generated)
         strategy_insights = None
@@ -380,19 +480,8 @@ async def run_simulation(
             f"health_score={summary.health_score}/100 ({summary.health_rating})"
         )
 
-        # DEBUG: Check pension values right before returning response
-        import json
-        import time
-        timestamp = time.strftime("%H:%M:%S")
-        if year_by_year and len(year_by_year) > 0:
-            first_year = year_by_year[0]
-            print(f"\n🔴 [{timestamp}] DEBUG BEFORE RESPONSE: Year {first_year.year} employer_pension_p1 = {first_year.employer_pension_p1}")
-            # Also check what JSON serialization produces
-            first_year_dict = first_year.model_dump() if hasattr(first_year, 'model_dump') else first_year.__dict__
-            print(f"🔴 DEBUG SERIALIZED: employer_pension_p1 in dict = {first_year_dict.get('employer_pension_p1', 'NOT FOUND')}")
-            print(f"🔴 DEBUG JSON: {json.dumps({'employer_pension_p1': first_year_dict.get('employer_pension_p1', 0)})}")
 
-        return SimulationResponse(
+        response = SimulationResponse(
             success=True,
             message=f"Simulation completed successfully. {summary.years_funded}/{summary.years_simulated} years funded.",
             household_input=household_input.model_dump(),
@@ -408,6 +497,10 @@ async def run_simulation(
             optimization_result=optimization_result,
             warnings=warnings
         )
+        if wire.columnar or (cache_key is not None and cacheable):
+            return _render_response(state, response, wire, cache_key if cacheable else None)
+        return response
+
 
     except ValueError as e:
         logger.error(f"❌ Validation error: {str(e)}")
@@ -478,6 +571,11 @@ async def analyze_composition(
     }
     ```
     """
+    # Conversion and analysis run on the engine threads like /run-simulation
+    return await run_engine(request, _analyze_composition, household_input, request)
+
+
+def _analyze_composition(household_input: HouseholdInput, request: Request):
     try:
         logger.info(
             f"🔍 Composition analysis requested: "
@@ -0,0 +1,144 @@
+"""
+Admission control for CPU-bound engine work.
+
+Route handlers are async, but simulate() and the response assembly around it
+are synchronous CPU work. Run directly in a handler they block the event
+loop, so one long simulation stalls every other request on the worker,
+health checks included.
+
+AdmissionController runs that work on a dedicated thread pool and bounds it:
+at most `max_in_flight` jobs run at once, up to `max_queue` more wait (each
+for at most `queue_timeout` seconds), and anything beyond that is rejected
+straight away with 503 and a Retry-After estimate. Queue depth, wait times
+and rejections are reported by stats() for /api/health.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict
+import asyncio
+import functools
+import logging
+import math
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    Bounded executor for engine work.
+
+    Args:
+        max_in_flight: Jobs allowed to run at once (also the thread count)
+        max_queue: Jobs allowed to wait for a slot; more are rejected
+        queue_timeout: Seconds a job may wait for a slot before it is rejected
+    """
+
+    def __init__(self, max_in_flight: int = 4, max_queue: int = 32, queue_timeout: float = 10.0):
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.max_queue = max(int(max_queue), 0)
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="engine")
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._in_flight = 0
+        self._queued = 0
+
+        self._admitted = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._completed = 0
+
+    def _reject(self, reason: str) -> HTTPException:
+        self._rejected += 1
+        # Time for the queue ahead to drain, from the average job time so far
+        avg_run = self._run_total / self._completed if self._completed else 1.0
+        retry_after = max(1, math.ceil(avg_run * (self._queued + 1) / self.max_in_flight))
+        logger.warning(
+            f"🚦 Engine busy ({reason}): in_flight={self._in_flight}, queued={self._queued}, "
+            f"retry_after={retry_after}s"
+        )
+        return HTTPException(
+            status_code=503,
+            detail=f"Server busy ({reason}). Please retry shortly.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one in-flight slot, waiting in the queue if none is free.
+
+        Raises:
+            HTTPException: 503 with Retry-After if the queue is full or the
+                wait exceeds queue_timeout
+        """
+        if self._slots.locked() and self._queued >= self.max_queue:
+            raise self._reject("queue full")
+
+        self._queued += 1
+        t0 = perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("queue timeout")
+        finally:
+            self._queued -= 1
+
+        waited = perf_counter() - t0
+        self._admitted += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the engine threads once admitted"""
+        async with self.slot():
+            t0 = perf_counter()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(fn, *args, **kwargs)
+                )
+            finally:
+                self._run_total += perf_counter() - t0
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Current load and wait-time counters"""
+        return {
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(1000 * self._wait_total / self._admitted, 2) if self._admitted else 0.0,
+            "max_wait_ms": round(1000 * self._wait_max, 2),
+            "avg_run_ms": round(1000 * self._run_total / self._completed, 2) if self._completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_engine(request: Request, fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run engine work for a request through app.state.admission.
+
+    Falls back to Starlette's shared thread pool (unbounded admission) when
+    no controller is configured, so the event loop is never blocked.
+    """
+    admission = getattr(request.app.state, "admission", None)
+    if admission is None:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    return await admission.run(fn, *args, **kwargs)
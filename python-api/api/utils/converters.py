@@ -4,7 +4,6 @@ Convert between API models (Pydantic) and internal models (dataclasses).
 This module bridges the REST API layer with the existing simulation engine.
 """
 
-import sys
 from api.models.requests import PersonInput, HouseholdInput
 from api.models.responses import (
     YearResult,
@@ -18,10 +17,14 @@ from api.models.responses import (
     TaxableComponent,
 )
 from modules.models import Person, Household
+from modules.result_columns import frame_aggregates
 from modules.benefits import gis_benefit
-import pandas as pd
+from typing import Optional
 import logging
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,12 +42,11 @@ def api_person_to_internal(api_person: PersonInput) -> Person:
     Returns:
         Person dataclass for simulation engine
     """
-    # DEBUG: Log pension data coming in
-    import sys
+    # Pension data coming in
     if api_person.pension_incomes:
-        print(f"🔍 CONVERTER DEBUG: Received {len(api_person.pension_incomes)} pension_incomes", file=sys.stderr)
+        logger.debug(f"🔍 CONVERTER: Received {len(api_person.pension_incomes)} pension_incomes")
         for i, pension in enumerate(api_person.pension_incomes):
-            print(f"   Pension {i}: {pension}", file=sys.stderr)
+            logger.debug(f"   Pension {i}: {pension}")
 
     # Calculate total corporate balance from both main balance and buckets
     # This ensures corporate funds in buckets are included in withdrawal calculations
@@ -56,12 +58,11 @@ def api_person_to_internal(api_person: PersonInput) -> Person:
     )
 
     # Debug logging for corporate balance calculation
-    print(f"🏢 CONVERTER: {api_person.name} corporate balance calculation:", file=sys.stderr)
-    print(f"   Main balance: ${api_person.corporate_balance:,.0f}", file=sys.stderr)
-    print(f"   Cash bucket: ${api_person.corp_cash_bucket:,.0f}", file=sys.stderr)
-    print(f"   GIC bucket: ${api_person.corp_gic_bucket:,.0f}", file=sys.stderr)
-    print(f"   Invest bucket: ${api_person.corp_invest_bucket:,.0f}", file=sys.stderr)
-    print(f"   TOTAL: ${total_corporate:,.0f}", file=sys.stderr)
+    logger.debug(
+        f"🏢 CONVERTER: {api_person.name} corporate balance: main ${api_person.corporate_balance:,.0f}, "
+        f"cash ${api_person.corp_cash_bucket:,.0f}, GIC ${api_person.corp_gic_bucket:,.0f}, "
+        f"invest ${api_person.corp_invest_bucket:,.0f}, total ${total_corporate:,.0f}"
+    )
 
     return Person(
         name=api_person.name,
@@ -217,189 +218,264 @@ def api_household_to_internal(
     )
 
 
-def dataframe_to_year_results(df: pd.DataFrame) -> list[YearResult]:
+class ShapedResults:
+    """
+    Columns the response sections are built from, derived once per simulation.
+
+    The section builders below used to walk the DataFrame row by row
+    (iterrows, .iloc) once per section, resolving the column-name fallbacks
+    for every cell. ShapedResults resolves each column once, computes the
+    combined columns (household totals, non-reg distributions, taxable
+    income, ...) with array arithmetic, and each section is emitted from
+    those arrays. Whole-plan totals and final-year values come from the
+    SimulationAggregates simulate() accumulated while it ran. Build one per
+    DataFrame and pass it to every builder; a builder called without one
+    shapes the frame itself.
+
+    Args:
+        df: Pandas DataFrame from simulate()
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.n = len(df)
+        self._columns: dict = {}
+        col = self.col
+
+        self.year = self.ints('year')
+        self.age_p1 = self.ints('age_p1')
+        self.age_p2 = self.ints('age_p2')
+
+        # Household totals (P1 + P2)
+        self.cpp_total = col('cpp_p1') + col('cpp_p2')
+        self.oas_total = col('oas_p1') + col('oas_p2')
+        self.gis_total = col('gis_p1') + col('gis_p2')
+        self.pension_total = col('pension_income_p1') + col('pension_income_p2')
+        self.other_income_total = col('other_income_p1') + col('other_income_p2')
+        self.rrif_balance = col('end_rrif_p1') + col('end_rrif_p2')
+        self.tfsa_balance = col('end_tfsa_p1') + col('end_tfsa_p2')
+        self.nonreg_balance = col('end_nonreg_p1') + col('end_nonreg_p2')
+        self.corporate_balance = col('corp_p1', 'end_corp_p1') + col('corp_p2', 'end_corp_p2')
+        self.rrif_withdrawal = col('withdraw_rrif_p1') + col('withdraw_rrif_p2')
+        self.rrsp_withdrawal = col('withdraw_rrsp_p1') + col('withdraw_rrsp_p2')
+        self.nonreg_withdrawal = col('withdraw_nonreg_p1') + col('withdraw_nonreg_p2')
+        self.tfsa_withdrawal = col('withdraw_tfsa_p1') + col('withdraw_tfsa_p2')
+        self.corporate_withdrawal = col('withdraw_corp_p1') + col('withdraw_corp_p2')
+
+        # Non-registered distributions (passive income: interest, dividends, capital gains)
+        self.nonreg_distributions_p1 = (
+            col('nr_interest_p1') + col('nr_elig_div_p1') + col('nr_nonelig_div_p1') + col('nr_capg_dist_p1')
+        )
+        self.nonreg_distributions_p2 = (
+            col('nr_interest_p2') + col('nr_elig_div_p2') + col('nr_nonelig_div_p2') + col('nr_capg_dist_p2')
+        )
+        self.nonreg_distributions = (
+            col('nr_interest_p1') + col('nr_interest_p2') +
+            col('nr_elig_div_p1') + col('nr_elig_div_p2') +
+            col('nr_nonelig_div_p1') + col('nr_nonelig_div_p2') +
+            col('nr_capg_dist_p1') + col('nr_capg_dist_p2')
+        )
+
+        self.spending_target = col('spend_target_after_tax')
+        self.total_tax = col('total_tax_after_split', 'total_tax')
+
+        # Plan totals and final-year values, as accumulated by simulate()
+        self.aggregates = frame_aggregates(df)
+
+    def col(self, *names: str) -> np.ndarray:
+        """First of `names` present in the frame as a float array, else zeros"""
+        values = self._columns.get(names)
+        if values is None:
+            for name in names:
+                if name in self.df.columns:
+                    values = self.df[name].to_numpy(dtype=np.float64)
+                    break
+            else:
+                values = np.zeros(self.n)
+            self._columns[names] = values
+        return values
+
+    def ints(self, name: str) -> np.ndarray:
+        """Integer column (missing values and a missing column read as 0)"""
+        if name not in self.df.columns:
+            return np.zeros(self.n, dtype=np.int64)
+        column = self.df[name]
+        if column.dtype == object:
+            column = column.fillna(0)
+        return column.to_numpy(dtype=np.int64)
+
+    def flags(self, *names: str, default: bool = False) -> np.ndarray:
+        """First of `names` present in the frame as a bool array, else `default`"""
+        for name in names:
+            if name in self.df.columns:
+                return self.df[name].to_numpy(dtype=bool)
+        return np.full(self.n, default)
+
+    def total(self, *names: str) -> float:
+        """Sum over all years of each named column present (NaN years skipped)"""
+        return sum(float(np.nansum(self.col(name))) for name in names if name in self.df.columns)
+
+    @staticmethod
+    def emit(model, columns: dict, rows: Optional[int] = None) -> list:
+        """
+        One `model` per year from a {field: column} mapping.
+
+        Arrays are converted to Python values in one call per column; a year
+        that fails validation is logged and left out.
+        """
+        names = list(columns)
+        values = [c[:rows].tolist() if isinstance(c, np.ndarray) else c[:rows] for c in columns.values()]
+        results = []
+        for row in zip(*values):
+            try:
+                results.append(model(**dict(zip(names, row))))
+            except Exception as e:
+                logger.warning(f"Error converting year {row[0]} to {model.__name__}: {e}")
+        return results
+
+
+def dataframe_to_year_results(df: pd.DataFrame, shaped: Optional[ShapedResults] = None) -> list[YearResult]:
     """
     Convert simulation DataFrame to list of YearResult models.
 
     Args:
         df: Pandas DataFrame from simulate() function
+        shaped: ShapedResults for df, if already built
 
     Returns:
         List of YearResult Pydantic models for API response
     """
-
-    # Debug: Check if pension_income_p1 column exists in DataFrame
-    if 'pension_income_p1' in df.columns:
-        pension_values = df['pension_income_p1'].unique()
-        print(f"DEBUG: Found pension_income_p1 column with unique values: {pension_values}")
-        # Check first 5 years specifically
-        for year in df['year'].head(5):
-            year_row = df[df['year'] == year].iloc[0]
-            pension_val = year_row.get('pension_income_p1', 0)
-            print(f"DEBUG: Year {year} - pension_income_p1 = {pension_val}")
-        # Check year 2033 specifically for Rafael (age 67)
-        year_2033 = df[df['year'] == 2033]
-        if not year_2033.empty:
-            print(f"DEBUG: Year 2033 pension_income_p1 = {year_2033['pension_income_p1'].values[0]}")
+    if shaped is None:
+        shaped = ShapedResults(df)
+    col = shaped.col
+
+    # Withdrawals (handle various column naming conventions)
+    tfsa_withdrawal_p1 = col('withdraw_tfsa_p1', 'tfsa_withdrawal_p1')
+    tfsa_withdrawal_p2 = col('withdraw_tfsa_p2', 'tfsa_withdrawal_p2')
+    rrif_withdrawal_p1 = col('withdraw_rrif_p1', 'rrif_withdrawal_p1')
+    rrif_withdrawal_p2 = col('withdraw_rrif_p2', 'rrif_withdrawal_p2')
+    nonreg_withdrawal_p1 = col('withdraw_nonreg_p1', 'nonreg_withdrawal_p1')
+    nonreg_withdrawal_p2 = col('withdraw_nonreg_p2', 'nonreg_withdrawal_p2')
+    corporate_withdrawal_p1 = col('withdraw_corp_p1', 'corporate_withdrawal_p1')
+    corporate_withdrawal_p2 = col('withdraw_corp_p2', 'corporate_withdrawal_p2')
+
+    # Total withdrawals - use the value from the DataFrame or calculate from components
+    if 'total_withdrawals' in df.columns:
+        total_withdrawals = col('total_withdrawals')
     else:
-        print("DEBUG: pension_income_p1 column NOT found in DataFrame")
-        print(f"DEBUG: Available columns: {df.columns.tolist()}")
-
-    results = []
-
-    for idx, row in df.iterrows():
-        try:
-            # CRITICAL FIX: Convert row to dict and ensure pension columns are included
-            # iterrows() returns a Series, convert to dict for manipulation
-            row_dict = row.to_dict() if hasattr(row, 'to_dict') else dict(row)
-
-            # Force-add pension columns from DataFrame if they exist but are missing from row
-            if 'pension_income_p1' in df.columns:
-                row_dict['pension_income_p1'] = float(df.loc[idx, 'pension_income_p1'])
-            if 'pension_income_p2' in df.columns:
-                row_dict['pension_income_p2'] = float(df.loc[idx, 'pension_income_p2'])
-
-            # Use row_dict instead of row for the rest of the processing
-            row = row_dict
-
-            # DEBUG: Check what's in the row for pension_income_p1
-            if idx == 0:  # First year only
-                print(f"DEBUG CONVERTER ROW: Year {row.get('year', 'N/A')}")
-                print(f"  pension_income_p1 in row: {row.get('pension_income_p1', 'NOT FOUND')}")
-                print(f"  Will map to employer_pension_p1: {float(row.get('pension_income_p1', 0))}")
-
-            results.append(YearResult(
-                year=int(row.get('year', 0)),
-                age_p1=int(row.get('age_p1', 0)),
-                age_p2=int(row.get('age_p2', 0)) if row.get('age_p2') is not None else 0,
-
-                # Government benefits - Inflows
-                cpp_p1=float(row.get('cpp_p1', 0)),
-                cpp_p2=float(row.get('cpp_p2', 0)),
-                oas_p1=float(row.get('oas_p1', 0)),
-                oas_p2=float(row.get('oas_p2', 0)),
-                gis_p1=float(row.get('gis_p1', 0)),
-                gis_p2=float(row.get('gis_p2', 0)),
-                oas_clawback_p1=float(row.get('oas_clawback_p1', 0)),
-                oas_clawback_p2=float(row.get('oas_clawback_p2', 0)),
-                # DEBUG: Detailed pension mapping
-                employer_pension_p1=float(row.get('pension_income_p1', 0)),
-                employer_pension_p2=float(row.get('pension_income_p2', 0)),
-
-                # DEBUG: Log pension values for first year
-                # Additional debug for pension mapping
-
-                # Withdrawals (handle various column naming conventions)
-                tfsa_withdrawal_p1=float(row.get('withdraw_tfsa_p1', row.get('tfsa_withdrawal_p1', 0))),
-                tfsa_withdrawal_p2=float(row.get('withdraw_tfsa_p2', row.get('tfsa_withdrawal_p2', 0))),
-                rrif_withdrawal_p1=float(row.get('withdraw_rrif_p1', row.get('rrif_withdrawal_p1', 0))),
-                rrif_withdrawal_p2=float(row.get('withdraw_rrif_p2', row.get('rrif_withdrawal_p2', 0))),
-                nonreg_withdrawal_p1=float(row.get('withdraw_nonreg_p1', row.get('nonreg_withdrawal_p1', 0))),
-                nonreg_withdrawal_p2=float(row.get('withdraw_nonreg_p2', row.get('nonreg_withdrawal_p2', 0))),
-                corporate_withdrawal_p1=float(row.get('withdraw_corp_p1', row.get('corporate_withdrawal_p1', 0))),
-                corporate_withdrawal_p2=float(row.get('withdraw_corp_p2', row.get('corporate_withdrawal_p2', 0))),
-
-                # Total withdrawals - use the value from the DataFrame or calculate from components
-                total_withdrawals=float(row.get('total_withdrawals',
-                    float(row.get('withdraw_tfsa_p1', row.get('tfsa_withdrawal_p1', 0))) +
-                    float(row.get('withdraw_tfsa_p2', row.get('tfsa_withdrawal_p2', 0))) +
-                    float(row.get('withdraw_rrif_p1', row.get('rrif_withdrawal_p1', 0))) +
-                    float(row.get('withdraw_rrif_p2', row.get('rrif_withdrawal_p2', 0))) +
-                    float(row.get('withdraw_nonreg_p1', row.get('nonreg_withdrawal_p1', 0))) +
-                    float(row.get('withdraw_nonreg_p2', row.get('nonreg_withdrawal_p2', 0))) +
-                    float(row.get('withdraw_corp_p1', row.get('corporate_withdrawal_p1', 0))) +
-                    float(row.get('withdraw_corp_p2', row.get('corporate_withdrawal_p2', 0)))
-                )),
-
-                # Non-registered distributions (passive income)
-                nonreg_distributions=float(
-                    row.get('nr_interest_p1', 0) + row.get('nr_interest_p2', 0) +
-                    row.get('nr_elig_div_p1', 0) + row.get('nr_elig_div_p2', 0) +
-                    row.get('nr_nonelig_div_p1', 0) + row.get('nr_nonelig_div_p2', 0) +
-                    row.get('nr_capg_dist_p1', 0) + row.get('nr_capg_dist_p2', 0)
-                ),
-
-                # TFSA contributions (ONLY regular contributions from Non-Reg, NOT surplus reinvestments)
-                # Surplus reinvestments are internal allocations, not outflows
-                tfsa_contribution_p1=float(row.get('contrib_tfsa_p1', 0)),
-                tfsa_contribution_p2=float(row.get('contrib_tfsa_p2', 0)),
-
-                # Surplus reinvestments (these are NOT outflows, just internal allocations)
-                tfsa_reinvest_p1=float(row.get('reinvest_tfsa_p1', 0)),
-                tfsa_reinvest_p2=float(row.get('reinvest_tfsa_p2', 0)),
-                reinvest_nonreg_p1=float(row.get('reinvest_nonreg_p1', 0)),
-                reinvest_nonreg_p2=float(row.get('reinvest_nonreg_p2', 0)),
-
-                # Starting balances - NEW FIELDS
-                rrsp_start_p1=float(row.get('start_rrsp_p1', 0)),
-                rrsp_start_p2=float(row.get('start_rrsp_p2', 0)),
-                rrif_start_p1=float(row.get('start_rrif_p1', 0)),
-                rrif_start_p2=float(row.get('start_rrif_p2', 0)),
-                tfsa_start_p1=float(row.get('start_tfsa_p1', 0)),
-                tfsa_start_p2=float(row.get('start_tfsa_p2', 0)),
-                nonreg_start_p1=float(row.get('start_nonreg_p1', 0)),
-                nonreg_start_p2=float(row.get('start_nonreg_p2', 0)),
-                corporate_start_p1=float(row.get('start_corp_p1', 0)),
-                corporate_start_p2=float(row.get('start_corp_p2', 0)),
-
-                # RRSP to RRIF conversion tracking - NEW FIELDS
-                rrsp_to_rrif_p1=float(row.get('rrsp_to_rrif_p1', 0)),
-                rrsp_to_rrif_p2=float(row.get('rrsp_to_rrif_p2', 0)),
-
-                # RRIF frontload tracking for RRIF-Frontload strategy - NEW FIELDS
-                rrif_frontload_exceeded_p1=bool(row.get('rrif_frontload_exceeded_p1', False)),
-                rrif_frontload_exceeded_p2=bool(row.get('rrif_frontload_exceeded_p2', False)),
-                rrif_frontload_pct_p1=float(row.get('rrif_frontload_pct_p1', 0)),
-                rrif_frontload_pct_p2=float(row.get('rrif_frontload_pct_p2', 0)),
-
-                # RRSP ending balances - NEW FIELDS
-                rrsp_end_p1=float(row.get('end_rrsp_p1', 0)),
-                rrsp_end_p2=float(row.get('end_rrsp_p2', 0)),
-
-                # Ending balances (existing fields)
-                tfsa_balance_p1=float(row.get('end_tfsa_p1', row.get('tfsa_balance_p1', 0))),
-                tfsa_balance_p2=float(row.get('end_tfsa_p2', row.get('tfsa_balance_p2', 0))),
-                rrif_balance_p1=float(row.get('end_rrif_p1', row.get('rrif_balance_p1', 0))),
-                rrif_balance_p2=float(row.get('end_rrif_p2', row.get('rrif_balance_p2', 0))),
-                nonreg_balance_p1=float(row.get('end_nonreg_p1', row.get('nonreg_balance_p1', 0))),
-                nonreg_balance_p2=float(row.get('end_nonreg_p2', row.get('nonreg_balance_p2', 0))),
-                corporate_balance_p1=float(row.get('corp_p1', row.get('end_corp_p1', 0))),
-                corporate_balance_p2=float(row.get('corp_p2', row.get('end_corp_p2', 0))),
-                total_value=float(row.get('total_value', row.get('net_worth_end', 0))),
-
-                # Tax
-                taxable_income_p1=float(row.get('taxable_inc_p1', row.get('taxable_income_p1', 0))),
-                taxable_income_p2=float(row.get('taxable_inc_p2', row.get('taxable_income_p2', 0))),
-                total_tax_p1=float(row.get('tax_after_split_p1', row.get('tax_p1', 0))),
-                total_tax_p2=float(row.get('tax_after_split_p2', row.get('tax_p2', 0))),
-                total_tax=float(row.get('total_tax_after_split', row.get('total_tax', 0))),
-                marginal_rate_p1=float(row.get('marginal_rate_p1', row.get('marginal_p1', 0))),
-                marginal_rate_p2=float(row.get('marginal_rate_p2', row.get('marginal_p2', 0))),
-
-                # Spending
-                spending_need=float(row.get('spend_target_after_tax', row.get('spending_need', 0))),
-                spending_met=float(row.get('spend_target_after_tax', row.get('spending_met', 0))),
-                spending_gap=float(row.get('underfunded_after_tax', row.get('spending_gap', 0))),
-
-                # Status
-                plan_success=bool(row.get('plan_success', row.get('success', True))),
-                failure_reason=row.get('failure_reason', None),
-            ))
-        except Exception as e:
-            import traceback
-            logger.warning(f"Error converting row {row.get('year', '?')}: {e}")
-            logger.warning(f"Traceback: {traceback.format_exc()}")
-            continue
-
-    return results
-
-
-def calculate_simulation_summary(df: pd.DataFrame) -> SimulationSummary:
+        total_withdrawals = (
+            tfsa_withdrawal_p1 + tfsa_withdrawal_p2 + rrif_withdrawal_p1 + rrif_withdrawal_p2 +
+            nonreg_withdrawal_p1 + nonreg_withdrawal_p2 + corporate_withdrawal_p1 + corporate_withdrawal_p2
+        )
+
+    failure_reason = df['failure_reason'].tolist() if 'failure_reason' in df.columns else [None] * shaped.n
+
+    return shaped.emit(YearResult, {
+        'year': shaped.year,
+        'age_p1': shaped.age_p1,
+        'age_p2': shaped.age_p2,
+
+        # Government benefits - Inflows
+        'cpp_p1': col('cpp_p1'),
+        'cpp_p2': col('cpp_p2'),
+        'oas_p1': col('oas_p1'),
+        'oas_p2': col('oas_p2'),
+        'gis_p1': col('gis_p1'),
+        'gis_p2': col('gis_p2'),
+        'oas_clawback_p1': col('oas_clawback_p1'),
+        'oas_clawback_p2': col('oas_clawback_p2'),
+        'employer_pension_p1': col('pension_income_p1'),
+        'employer_pension_p2': col('pension_income_p2'),
+
+        # Withdrawals
+        'tfsa_withdrawal_p1': tfsa_withdrawal_p1,
+        'tfsa_withdrawal_p2': tfsa_withdrawal_p2,
+        'rrif_withdrawal_p1': rrif_withdrawal_p1,
+        'rrif_withdrawal_p2': rrif_withdrawal_p2,
+        'nonreg_withdrawal_p1': nonreg_withdrawal_p1,
+        'nonreg_withdrawal_p2': nonreg_withdrawal_p2,
+        'corporate_withdrawal_p1': corporate_withdrawal_p1,
+        'corporate_withdrawal_p2': corporate_withdrawal_p2,
+        'total_withdrawals': total_withdrawals,
+
+        # Non-registered distributions (passive income)
+        'nonreg_distributions': shaped.nonreg_distributions,
+
+        # TFSA contributions (ONLY regular contributions from Non-Reg, NOT surplus reinvestments)
+        # Surplus reinvestments are internal allocations, not outflows
+        'tfsa_contribution_p1': col('contrib_tfsa_p1'),
+        'tfsa_contribution_p2': col('contrib_tfsa_p2'),
+
+        # Surplus reinvestments (these are NOT outflows, just internal allocations)
+        'tfsa_reinvest_p1': col('reinvest_tfsa_p1'),
+        'tfsa_reinvest_p2': col('reinvest_tfsa_p2'),
+        'reinvest_nonreg_p1': col('reinvest_nonreg_p1'),
+        'reinvest_nonreg_p2': col('reinvest_nonreg_p2'),
+
+        # Starting balances
+        'rrsp_start_p1': col('start_rrsp_p1'),
+        'rrsp_start_p2': col('start_rrsp_p2'),
+        'rrif_start_p1': col('start_rrif_p1'),
+        'rrif_start_p2': col('start_rrif_p2'),
+        'tfsa_start_p1': col('start_tfsa_p1'),
+        'tfsa_start_p2': col('start_tfsa_p2'),
+        'nonreg_start_p1': col('start_nonreg_p1'),
+        'nonreg_start_p2': col('start_nonreg_p2'),
+        'corporate_start_p1': col('start_corp_p1'),
+        'corporate_start_p2': col('start_corp_p2'),
+
+        # RRSP to RRIF conversion tracking
+        'rrsp_to_rrif_p1': col('rrsp_to_rrif_p1'),
+        'rrsp_to_rrif_p2': col('rrsp_to_rrif_p2'),
+
+        # RRIF frontload tracking for RRIF-Frontload strategy
+        'rrif_frontload_exceeded_p1': shaped.flags('rrif_frontload_exceeded_p1'),
+        'rrif_frontload_exceeded_p2': shaped.flags('rrif_frontload_exceeded_p2'),
+        'rrif_frontload_pct_p1': col('rrif_frontload_pct_p1'),
+        'rrif_frontload_pct_p2': col('rrif_frontload_pct_p2'),
+
+        # RRSP ending balances
+        'rrsp_end_p1': col('end_rrsp_p1'),
+        'rrsp_end_p2': col('end_rrsp_p2'),
+
+        # Ending balances (existing fields)
+        'tfsa_balance_p1': col('end_tfsa_p1', 'tfsa_balance_p1'),
+        'tfsa_balance_p2': col('end_tfsa_p2', 'tfsa_balance_p2'),
+        'rrif_balance_p1': col('end_rrif_p1', 'rrif_balance_p1'),
+        'rrif_balance_p2': col('end_rrif_p2', 'rrif_balance_p2'),
+        'nonreg_balance_p1': col('end_nonreg_p1', 'nonreg_balance_p1'),
+        'nonreg_balance_p2': col('end_nonreg_p2', 'nonreg_balance_p2'),
+        'corporate_balance_p1': col('corp_p1', 'end_corp_p1'),
+        'corporate_balance_p2': col('corp_p2', 'end_corp_p2'),
+        'total_value': col('total_value', 'net_worth_end'),
+
+        # Tax
+        'taxable_income_p1': col('taxable_inc_p1', 'taxable_income_p1'),
+        'taxable_income_p2': col('taxable_inc_p2', 'taxable_income_p2'),
+        'total_tax_p1': col('tax_after_split_p1', 'tax_p1'),
+        'total_tax_p2': col('tax_after_split_p2', 'tax_p2'),
+        'total_tax': shaped.total_tax,
+        'marginal_rate_p1': col('marginal_rate_p1', 'marginal_p1'),
+        'marginal_rate_p2': col('marginal_rate_p2', 'marginal_p2'),
+
+        # Spending
+        'spending_need': col('spend_target_after_tax', 'spending_need'),
+        'spending_met': col('spend_target_after_tax', 'spending_met'),
+        'spending_gap': col('underfunded_after_tax', 'spending_gap'),
+
+        # Status
+        'plan_success': shaped.flags('plan_success', 'success', default=True),
+        'failure_reason': failure_reason,
+    })
+
+
+def calculate_simulation_summary(df: pd.DataFrame, shaped: Optional[ShapedResults] = None) -> SimulationSummary:
     """
     Calculate summary statistics from simulation DataFrame.
 
     Args:
         df: Pandas DataFrame from simulate() function
+        shaped: ShapedResults for df, if already built
 
     Returns:
         SimulationSummary with aggregated metrics
@@ -423,66 +499,33 @@ def calculate_simulation_summary(df: pd.DataFrame) -> SimulationSummary:
             total_underfunding=0,
         )
 
-    years_simulated = len(df)
-    # Use plan_success field to count years where spending was fully met (not just net worth > 0)
-    if 'plan_success' in df.columns:
-        years_funded = len(df[df['plan_success'] == True])
-    elif 'net_worth_end' in df.columns:
-        years_funded = len(df[df['net_worth_end'] > 0])
-    else:
-        years_funded = years_simulated
+    if shaped is None:
+        shaped = ShapedResults(df)
+    totals = shaped.aggregates
+
+    years_simulated = totals.years_simulated
+    # Years where spending was fully met (plan_success), not just net worth > 0
+    years_funded = totals.years_funded
     # Calculate success rate as a percentage (0-100) not a decimal (0-1)
     success_rate = (years_funded / years_simulated * 100) if years_simulated > 0 else 0.0
 
     # === Government Benefits Totals ===
-    total_cpp = 0.0
-    total_oas = 0.0
-    total_gis = 0.0
-    total_oas_clawback = 0.0
-
-    if 'cpp_p1' in df.columns:
-        total_cpp += df['cpp_p1'].sum()
-    if 'cpp_p2' in df.columns:
-        total_cpp += df['cpp_p2'].sum()
-    if 'oas_p1' in df.columns:
-        total_oas += df['oas_p1'].sum()
-    if 'oas_p2' in df.columns:
-        total_oas += df['oas_p2'].sum()
-    if 'gis_p1' in df.columns:
-        total_gis += df['gis_p1'].sum()
-    if 'gis_p2' in df.columns:
-        total_gis += df['gis_p2'].sum()
-    if 'oas_clawback_p1' in df.columns:
-        total_oas_clawback += df['oas_clawback_p1'].sum()
-    if 'oas_clawback_p2' in df.columns:
-        total_oas_clawback += df['oas_clawback_p2'].sum()
-
-    total_inflows = total_cpp + total_oas + total_gis
-    total_government_benefits = total_cpp + total_oas + total_gis
+    total_cpp = totals.total_cpp
+    total_oas = totals.total_oas
+    total_gis = totals.total_gis
+    total_oas_clawback = totals.total_oas_clawback
+
+    total_inflows = totals.total_benefits
+    total_government_benefits = totals.total_benefits
     avg_annual_benefits = total_government_benefits / years_simulated if years_simulated > 0 else 0.0
 
     # === Withdrawals by Source ===
-    total_rrif_withdrawn = 0.0
-    total_nonreg_withdrawn = 0.0
-    total_tfsa_withdrawn = 0.0
-    total_corporate_withdrawn = 0.0
-
-    for person in ['p1', 'p2']:
-        rrif_col = f'withdraw_rrif_{person}'
-        nonreg_col = f'withdraw_nonreg_{person}'
-        tfsa_col = f'withdraw_tfsa_{person}'
-        corp_col = f'withdraw_corp_{person}'
-
-        if rrif_col in df.columns:
-            total_rrif_withdrawn += df[rrif_col].sum()
-        if nonreg_col in df.columns:
-            total_nonreg_withdrawn += df[nonreg_col].sum()
-        if tfsa_col in df.columns:
-            total_tfsa_withdrawn += df[tfsa_col].sum()
-        if corp_col in df.columns:
-            total_corporate_withdrawn += df[corp_col].sum()
-
-    total_withdrawals = total_rrif_withdrawn + total_nonreg_withdrawn + total_tfsa_withdrawn + total_corporate_withdrawn
+    total_rrif_withdrawn = totals.total_rrif_withdrawn
+    total_nonreg_withdrawn = totals.total_nonreg_withdrawn
+    total_tfsa_withdrawn = totals.total_tfsa_withdrawn
+    total_corporate_withdrawn = totals.total_corporate_withdrawn
+
+    total_withdrawals = totals.total_withdrawals
 
     # Calculate percentages
     rrif_pct = (total_rrif_withdrawn / total_withdrawals * 100) if total_withdrawals > 0 else 0.0
@@ -491,38 +534,19 @@ def calculate_simulation_summary(df: pd.DataFrame) -> SimulationSummary:
     corporate_pct = (total_corporate_withdrawn / total_withdrawals * 100) if total_withdrawals > 0 else 0.0
 
     # === Tax Analysis ===
-    total_tax_paid = (
-        df['total_tax_after_split'].sum()
-        if 'total_tax_after_split' in df.columns
-        else df['total_tax'].sum() if 'total_tax' in df.columns
-        else 0
-    )
+    total_tax_paid = totals.total_tax
+    highest_annual_tax = totals.highest_annual_tax
+    lowest_annual_tax = totals.lowest_annual_tax
 
-    tax_col = 'total_tax_after_split' if 'total_tax_after_split' in df.columns else 'total_tax'
-    if tax_col in df.columns:
-        highest_annual_tax = df[tax_col].max()
-        lowest_annual_tax = df[tax_col].min()
-    else:
-        highest_annual_tax = 0.0
-        lowest_annual_tax = 0.0
-
-    # Use spend_target_after_tax for spending
-    total_spending = (
-        df['spend_target_after_tax'].sum()
-        if 'spend_target_after_tax' in df.columns
-        else 0
-    )
+    total_spending = totals.total_spending
 
     # Tax efficiency: lower is better (tax as % of total income + withdrawals)
     total_income_and_withdrawals = total_inflows + total_withdrawals
     tax_efficiency_rate = (total_tax_paid / total_income_and_withdrawals * 100) if total_income_and_withdrawals > 0 else 0.0
 
     # === Net Worth Analysis ===
-    first_row = df.iloc[0]
-    final_row = df.iloc[-1]
-
-    initial_net_worth = float(first_row.get('net_worth_start', first_row.get('net_worth_end', 0)))
-    final_net_worth = float(final_row.get('net_worth_end', 0))
+    initial_net_worth = totals.initial_net_worth
+    final_net_worth = totals.final_net_worth
     final_estate_gross = final_net_worth
 
     net_worth_change_pct = 0.0
@@ -536,13 +560,11 @@ def calculate_simulation_summary(df: pd.DataFrame) -> SimulationSummary:
     else:
         net_worth_trend = "Stable"
 
-    # Use after_tax_legacy if available, otherwise estimate at 75%
-    final_estate_after_tax = float(final_row.get('after_tax_legacy', final_estate_gross * 0.75))
+    final_estate_after_tax = totals.after_tax_legacy
 
     # Tax rates
-    total_income_cols = ['taxable_inc_p1', 'taxable_inc_p2']
-    if all(col in df.columns for col in total_income_cols):
-        total_income = df[total_income_cols].sum().sum()
+    if 'taxable_inc_p1' in df.columns and 'taxable_inc_p2' in df.columns:
+        total_income = shaped.total('taxable_inc_p1', 'taxable_inc_p2')
         avg_effective_tax_rate = (
             (total_tax_paid / total_income)
             if total_income > 0
@@ -552,41 +574,16 @@ def calculate_simulation_summary(df: pd.DataFrame) -> SimulationSummary:
         avg_effective_tax_rate = 0.0
 
     avg_marginal_rate = (
-        df['marginal_rate_p1'].mean()
+        float(np.nanmean(shaped.col('marginal_rate_p1')))
         if 'marginal_rate_p1' in df.columns
         else 0.0
     )
 
-    # Find first failure
-    failure_col = 'plan_success' if 'plan_success' in df.columns else 'success'
-    if failure_col in df.columns:
-        failure_rows = df[df[failure_col] == False]
-        first_failure_year = (
-            int(failure_rows.iloc[0]['year'])
-            if len(failure_rows) > 0
-            else None
-        )
-    else:
-        first_failure_year = None
-
-    # Underfunding - ignore microscopic rounding errors (< $1)
-    ROUNDING_THRESHOLD = 1.0  # Ignore gaps less than $1
+    first_failure_year = totals.first_failure_year
 
-    if 'spending_gap' in df.columns:
-        # Only count years with meaningful gaps (> $1)
-        total_underfunded_years = len(df[df['spending_gap'] > ROUNDING_THRESHOLD])
-        # Only sum meaningful gaps
-        total_underfunding = df[df['spending_gap'] > ROUNDING_THRESHOLD]['spending_gap'].sum()
-    else:
-        # Try underfunded_after_tax column
-        if 'underfunded_after_tax' in df.columns:
-            # Only count years with meaningful gaps (> $1)
-            total_underfunded_years = len(df[df['underfunded_after_tax'] > ROUNDING_THRESHOLD])
-            # Only sum meaningful gaps
-            total_underfunding = df[df['underfunded_after_tax'] > ROUNDING_THRESHOLD]['underfunded_after_tax'].sum()
-        else:
-            total_underfunded_years = 0
-            total_underfunding = 0
+    # Underfunding - gaps under UNDERFUNDING_THRESHOLD ($1) are rounding and not counted
+    total_underfunded_years = totals.underfunded_years
+    total_underfunding = totals.underfunded_total
 
     # === Health Score Calculation ===
     health_score, health_rating, health_criteria = calculate_health_score(
@@ -806,13 +803,14 @@ def calculate_health_score(
     return score, rating, criteria
 
 
-def calculate_estate_summary(df: pd.DataFrame, household) -> EstateSummary:
+def calculate_estate_summary(df: pd.DataFrame, household, shaped: Optional[ShapedResults] = None) -> EstateSummary:
     """
     Calculate estate summary from final simulation year.
 
     Args:
         df: Simulation DataFrame
         household: Household object with account info
+        shaped: ShapedResults for df, if already built
 
     Returns:
         EstateSummary with death tax projections, taxable components, and tips
@@ -825,14 +823,16 @@ def calculate_estate_summary(df: pd.DataFrame, household) -> EstateSummary:
             effective_tax_rate_at_death=0,
         )
 
-    final_row = df.iloc[-1]
+    if shaped is None:
+        shaped = ShapedResults(df)
+
+    totals = shaped.aggregates
 
     # Get final balances
-    rrif_balance = float(final_row.get('end_rrif_p1', 0)) + float(final_row.get('end_rrif_p2', 0))
-    tfsa_balance = float(final_row.get('end_tfsa_p1', 0)) + float(final_row.get('end_tfsa_p2', 0))
-    nonreg_balance = float(final_row.get('end_nonreg_p1', 0)) + float(final_row.get('end_nonreg_p2', 0))
-    corporate_balance = float(final_row.get('corp_p1', final_row.get('end_corp_p1', 0))) + \
-                        float(final_row.get('corp_p2', final_row.get('end_corp_p2', 0)))
+    rrif_balance = totals.final_rrif
+    tfsa_balance = totals.final_tfsa
+    nonreg_balance = totals.final_nonreg
+    corporate_balance = totals.final_corporate
 
     gross_estate_value = rrif_balance + tfsa_balance + nonreg_balance + corporate_balance
 
@@ -933,123 +933,95 @@ def calculate_estate_summary(df: pd.DataFrame, household) -> EstateSummary:
     )
 
 
-def extract_five_year_plan(df: pd.DataFrame) -> list[FiveYearPlanYear]:
+def extract_five_year_plan(df: pd.DataFrame, shaped: Optional[ShapedResults] = None) -> list[FiveYearPlanYear]:
     """
     Extract first 5 years of simulation as detailed withdrawal plan.
 
     Args:
         df: Simulation DataFrame
+        shaped: ShapedResults for df, if already built
 
     Returns:
         List of FiveYearPlanYear for first 5 years
     """
     if df.empty:
         return []
-
-    plan = []
-    years_to_extract = min(5, len(df))
-
-    # Debug: Check pension columns in DataFrame for 5-year plan
-    print(f"DEBUG extract_five_year_plan: DataFrame has {len(df)} rows")
-    if 'pension_income_p1' in df.columns:
-        print(f"DEBUG: pension_income_p1 column exists in DataFrame for 5-year plan")
-    else:
-        print(f"DEBUG: pension_income_p1 column NOT found in DataFrame for 5-year plan")
-
-    for i in range(years_to_extract):
-        row = df.iloc[i]
-
-        # Get income sources
-        cpp_p1 = float(row.get('cpp_p1', 0))
-        cpp_p2 = float(row.get('cpp_p2', 0))
-        oas_p1 = float(row.get('oas_p1', 0))
-        oas_p2 = float(row.get('oas_p2', 0))
-        pension_p1 = float(row.get('pension_income_p1', 0))
-        pension_p2 = float(row.get('pension_income_p2', 0))
-
-        # Debug logging for pension values
-        year = int(row.get('year', 0))
-        age_p1 = int(row.get('age_p1', 0))
-        print(f"DEBUG 5-year: Year {year} (age {age_p1}) - pension_income_p1 raw value = {row.get('pension_income_p1', 'NOT_FOUND')}, converted = {pension_p1}")
-        rental_p1 = float(row.get('rental_income_p1', 0))
-        rental_p2 = float(row.get('rental_income_p2', 0))
-        other_p1 = float(row.get('other_income_p1', 0))
-        other_p2 = float(row.get('other_income_p2', 0))
-
-        # Get withdrawals by source
-        rrif_p1 = float(row.get('withdraw_rrif_p1', 0))
-        rrif_p2 = float(row.get('withdraw_rrif_p2', 0))
-        nonreg_p1 = float(row.get('withdraw_nonreg_p1', 0))
-        nonreg_p2 = float(row.get('withdraw_nonreg_p2', 0))
-        tfsa_p1 = float(row.get('withdraw_tfsa_p1', 0))
-        tfsa_p2 = float(row.get('withdraw_tfsa_p2', 0))
-        corp_p1 = float(row.get('withdraw_corp_p1', 0))
-        corp_p2 = float(row.get('withdraw_corp_p2', 0))
-
-        # DEBUG: Log corporate withdrawal values
-        if i == 0:  # First year only
-            print(f"DEBUG CONVERTER: Year {year} - withdraw_corp_p1 raw = {row.get('withdraw_corp_p1', 'NOT_FOUND')}, converted = {corp_p1}", file=sys.stderr)
-
-        # Get NonReg distributions (passive income)
-        nonreg_dist_p1 = float(
-            row.get('nr_interest_p1', 0) + row.get('nr_elig_div_p1', 0) +
-            row.get('nr_nonelig_div_p1', 0) + row.get('nr_capg_dist_p1', 0)
-        )
-        nonreg_dist_p2 = float(
-            row.get('nr_interest_p2', 0) + row.get('nr_elig_div_p2', 0) +
-            row.get('nr_nonelig_div_p2', 0) + row.get('nr_capg_dist_p2', 0)
-        )
-
-        # Calculate total withdrawals per person (income + withdrawals)
-        total_p1 = cpp_p1 + oas_p1 + pension_p1 + rental_p1 + other_p1 + rrif_p1 + nonreg_p1 + tfsa_p1 + corp_p1 + nonreg_dist_p1
-        total_p2 = cpp_p2 + oas_p2 + pension_p2 + rental_p2 + other_p2 + rrif_p2 + nonreg_p2 + tfsa_p2 + corp_p2 + nonreg_dist_p2
-
-        spending_target = float(row.get('spend_target_after_tax', 0))
-
-        plan.append(FiveYearPlanYear(
-            year=int(row.get('year', 0)),
-            age_p1=int(row.get('age_p1', 0)),
-            age_p2=int(row.get('age_p2', 0)) if row.get('age_p2') is not None else 0,
-            spending_target=spending_target,
-            spending_target_p1=spending_target / 2,  # Split evenly for now
-            spending_target_p2=spending_target / 2,
-            cpp_p1=cpp_p1,
-            cpp_p2=cpp_p2,
-            oas_p1=oas_p1,
-            oas_p2=oas_p2,
-            employer_pension_p1=pension_p1,
-            employer_pension_p2=pension_p2,
-            rental_income_p1=rental_p1,
-            rental_income_p2=rental_p2,
-            other_income_p1=other_p1,
-            other_income_p2=other_p2,
-            rrif_withdrawal_p1=rrif_p1,
-            rrif_withdrawal_p2=rrif_p2,
-            nonreg_withdrawal_p1=nonreg_p1,
-            nonreg_withdrawal_p2=nonreg_p2,
-            tfsa_withdrawal_p1=tfsa_p1,
-            tfsa_withdrawal_p2=tfsa_p2,
-            corp_withdrawal_p1=corp_p1,
-            corp_withdrawal_p2=corp_p2,
-            nonreg_distributions_p1=nonreg_dist_p1,
-            nonreg_distributions_p2=nonreg_dist_p2,
-            nonreg_distributions_total=nonreg_dist_p1 + nonreg_dist_p2,
-            total_withdrawn_p1=total_p1,
-            total_withdrawn_p2=total_p2,
-            total_withdrawn=total_p1 + total_p2,
-            net_worth_end=float(row.get('net_worth_end', 0)),
-        ))
-
-    return plan
-
-
-def calculate_spending_analysis(df: pd.DataFrame, summary: SimulationSummary) -> SpendingAnalysis:
+    if shaped is None:
+        shaped = ShapedResults(df)
+    col = shaped.col
+
+    # Income sources and withdrawals by person
+    income = {}
+    for person in ('p1', 'p2'):
+        income[person] = {
+            'cpp': col(f'cpp_{person}'),
+            'oas': col(f'oas_{person}'),
+            'pension': col(f'pension_income_{person}'),
+            'rental': col(f'rental_income_{person}'),
+            'other': col(f'other_income_{person}'),
+            'rrif': col(f'withdraw_rrif_{person}'),
+            'nonreg': col(f'withdraw_nonreg_{person}'),
+            'tfsa': col(f'withdraw_tfsa_{person}'),
+            'corp': col(f'withdraw_corp_{person}'),
+        }
+    p1, p2 = income['p1'], income['p2']
+    dist_p1, dist_p2 = shaped.nonreg_distributions_p1, shaped.nonreg_distributions_p2
+
+    # Total withdrawals per person (income + withdrawals)
+    total_p1 = (p1['cpp'] + p1['oas'] + p1['pension'] + p1['rental'] + p1['other'] +
+                p1['rrif'] + p1['nonreg'] + p1['tfsa'] + p1['corp'] + dist_p1)
+    total_p2 = (p2['cpp'] + p2['oas'] + p2['pension'] + p2['rental'] + p2['other'] +
+                p2['rrif'] + p2['nonreg'] + p2['tfsa'] + p2['corp'] + dist_p2)
+
+    spending_target = shaped.spending_target
+
+    return shaped.emit(FiveYearPlanYear, {
+        'year': shaped.year,
+        'age_p1': shaped.age_p1,
+        'age_p2': shaped.age_p2,
+        'spending_target': spending_target,
+        'spending_target_p1': spending_target / 2,  # Split evenly for now
+        'spending_target_p2': spending_target / 2,
+        'cpp_p1': p1['cpp'],
+        'cpp_p2': p2['cpp'],
+        'oas_p1': p1['oas'],
+        'oas_p2': p2['oas'],
+        'employer_pension_p1': p1['pension'],
+        'employer_pension_p2': p2['pension'],
+        'rental_income_p1': p1['rental'],
+        'rental_income_p2': p2['rental'],
+        'other_income_p1': p1['other'],
+        'other_income_p2': p2['other'],
+        'rrif_withdrawal_p1': p1['rrif'],
+        'rrif_withdrawal_p2': p2['rrif'],
+        'nonreg_withdrawal_p1': p1['nonreg'],
+        'nonreg_withdrawal_p2': p2['nonreg'],
+        'tfsa_withdrawal_p1': p1['tfsa'],
+        'tfsa_withdrawal_p2': p2['tfsa'],
+        'corp_withdrawal_p1': p1['corp'],
+        'corp_withdrawal_p2': p2['corp'],
+        'nonreg_distributions_p1': dist_p1,
+        'nonreg_distributions_p2': dist_p2,
+        'nonreg_distributions_total': dist_p1 + dist_p2,
+        'total_withdrawn_p1': total_p1,
+        'total_withdrawn_p2': total_p2,
+        'total_withdrawn': total_p1 + total_p2,
+        'net_worth_end': col('net_worth_end'),
+    }, rows=5)
+
+
+def calculate_spending_analysis(
+    df: pd.DataFrame,
+    summary: SimulationSummary,
+    shaped: Optional[ShapedResults] = None,
+) -> SpendingAnalysis:
     """
     Calculate spending coverage and analysis metrics.
 
     Args:
         df: Simulation DataFrame
         summary: SimulationSummary with pre-calculated totals
+        shaped: ShapedResults for df, if already built
 
     Returns:
         SpendingAnalysis with spending coverage metrics
@@ -1087,7 +1059,9 @@ def calculate_spending_analysis(df: pd.DataFrame, summary: SimulationSummary) ->
 
     # Generate plan status text
     if summary.success_rate >= 1.0:
-        final_age = int(df.iloc[-1].get('age_p1', 95))
+        if shaped is None:
+            shaped = ShapedResults(df)
+        final_age = shaped.aggregates.final_age_p1
         plan_status_text = f"Your plan is fully funded through age {final_age}"
     elif summary.first_failure_year:
         plan_status_text = f"Plan underfunded starting year {summary.first_failure_year}"
@@ -1154,120 +1128,76 @@ def extract_key_assumptions(
     )
 
 
-def extract_chart_data(df: pd.DataFrame) -> ChartData:
+def extract_chart_data(df: pd.DataFrame, shaped: Optional[ShapedResults] = None) -> ChartData:
     """
     Extract pre-computed chart data for frontend visualization.
 
     Args:
         df: Simulation DataFrame
+        shaped: ShapedResults for df, if already built
 
     Returns:
         ChartData with year-by-year data points
     """
     if df.empty:
         return ChartData(data_points=[])
-
-    data_points = []
-
-    for _, row in df.iterrows():
-        # Aggregate government benefits
-        cpp_total = float(row.get('cpp_p1', 0)) + float(row.get('cpp_p2', 0))
-        oas_total = float(row.get('oas_p1', 0)) + float(row.get('oas_p2', 0))
-        gis_total = float(row.get('gis_p1', 0)) + float(row.get('gis_p2', 0))
-        government_benefits_total = cpp_total + oas_total + gis_total
-
-        # Aggregate balances (combined P1+P2)
-        rrif_balance = float(row.get('end_rrif_p1', 0)) + float(row.get('end_rrif_p2', 0))
-        tfsa_balance = float(row.get('end_tfsa_p1', 0)) + float(row.get('end_tfsa_p2', 0))
-        nonreg_balance = float(row.get('end_nonreg_p1', 0)) + float(row.get('end_nonreg_p2', 0))
-        corporate_balance = (
-            float(row.get('corp_p1', row.get('end_corp_p1', 0))) +
-            float(row.get('corp_p2', row.get('end_corp_p2', 0)))
-        )
-        net_worth = float(row.get('net_worth_end', 0))
-
-        # Aggregate withdrawals
-        rrif_withdrawal = float(row.get('withdraw_rrif_p1', 0)) + float(row.get('withdraw_rrif_p2', 0))
-        nonreg_withdrawal = float(row.get('withdraw_nonreg_p1', 0)) + float(row.get('withdraw_nonreg_p2', 0))
-        tfsa_withdrawal = float(row.get('withdraw_tfsa_p1', 0)) + float(row.get('withdraw_tfsa_p2', 0))
-        corporate_withdrawal = float(row.get('withdraw_corp_p1', 0)) + float(row.get('withdraw_corp_p2', 0))
-
-        # Tax data
-        total_tax = float(row.get('total_tax_after_split', row.get('total_tax', 0)))
-        taxable_income_raw = float(row.get('taxable_inc_p1', 0)) + float(row.get('taxable_inc_p2', 0))
-        effective_tax_rate = (total_tax / taxable_income_raw * 100) if taxable_income_raw > 0 else 0
-
-        # Income composition for charts
-        # Taxable income includes: RRSP/RRIF withdrawals, CPP, OAS, NonReg distributions, Corporate dividends, Private pensions, Other income
-        # Tax-free income includes: TFSA withdrawals, GIS
-        rrsp_withdrawal_p1 = float(row.get('withdraw_rrsp_p1', 0))
-        rrsp_withdrawal_p2 = float(row.get('withdraw_rrsp_p2', 0))
-        rrsp_withdrawal = rrsp_withdrawal_p1 + rrsp_withdrawal_p2
-
-        # Get pension and other income (private pensions, employment, business, rental, investment)
-        pension_p1 = float(row.get('pension_income_p1', 0))
-        pension_p2 = float(row.get('pension_income_p2', 0))
-        pension_income_total = pension_p1 + pension_p2
-
-        # Debug logging for pension in taxable income
-        if int(row.get('year', 0)) == 2033:
-            print(f"DEBUG TAXABLE: Year 2033 - pension_income_p1={pension_p1}, pension_income_p2={pension_p2}, total={pension_income_total}")
-
-        other_income_total = float(row.get('other_income_p1', 0)) + float(row.get('other_income_p2', 0))
-
-        # Calculate NonReg distributions (passive income: interest, dividends, capital gains)
-        nonreg_distributions = float(
-            row.get('nr_interest_p1', 0) + row.get('nr_interest_p2', 0) +
-            row.get('nr_elig_div_p1', 0) + row.get('nr_elig_div_p2', 0) +
-            row.get('nr_nonelig_div_p1', 0) + row.get('nr_nonelig_div_p2', 0) +
-            row.get('nr_capg_dist_p1', 0) + row.get('nr_capg_dist_p2', 0)
-        )
-
-        # Calculate taxable income for chart display (all taxable sources)
-        # Includes: RRIF/RRSP withdrawals, CPP, OAS, account withdrawals, pensions, and NonReg distributions
-        taxable_income = (rrif_withdrawal + rrsp_withdrawal + cpp_total + oas_total +
-                         nonreg_withdrawal + corporate_withdrawal +
-                         pension_income_total + other_income_total +
-                         nonreg_distributions)
-
-        # Tax-free income (TFSA + GIS)
-        tax_free_income = tfsa_withdrawal + gis_total
-
-        # Spending data
-        spending_target = float(row.get('spend_target_after_tax', 0))
-        spending_met = float(row.get('spend_target_after_tax', 0)) - float(row.get('underfunded_after_tax', 0))
-        spending_coverage_pct = (spending_met / spending_target * 100) if spending_target > 0 else 100
-
-        data_points.append(ChartDataPoint(
-            year=int(row.get('year', 0)),
-            age_p1=int(row.get('age_p1', 0)),
-            age_p2=int(row.get('age_p2', 0)) if row.get('age_p2') is not None else 0,
-            spending_target=spending_target,
-            spending_met=spending_met,
-            spending_coverage_pct=spending_coverage_pct,
-            rrif_balance=rrif_balance,
-            tfsa_balance=tfsa_balance,
-            nonreg_balance=nonreg_balance,
-            corporate_balance=corporate_balance,
-            net_worth=net_worth,
-            cpp_total=cpp_total,
-            oas_total=oas_total,
-            gis_total=gis_total,
-            government_benefits_total=government_benefits_total,
-            total_tax=total_tax,
-            effective_tax_rate=effective_tax_rate,
-            taxable_income=taxable_income,
-            tax_free_income=tax_free_income,
-            rrif_withdrawal=rrif_withdrawal,
-            nonreg_withdrawal=nonreg_withdrawal,
-            tfsa_withdrawal=tfsa_withdrawal,
-            corporate_withdrawal=corporate_withdrawal,
-            nonreg_distributions=nonreg_distributions,
-            employer_pension_total=pension_income_total,
-            other_income_total=other_income_total,
-        ))
-
-    return ChartData(data_points=data_points)
+    if shaped is None:
+        shaped = ShapedResults(df)
+    col = shaped.col
+
+    government_benefits_total = shaped.cpp_total + shaped.oas_total + shaped.gis_total
+
+    # Tax data
+    taxable_income_raw = col('taxable_inc_p1') + col('taxable_inc_p2')
+    effective_tax_rate = np.divide(
+        shaped.total_tax, taxable_income_raw,
+        out=np.zeros(shaped.n), where=taxable_income_raw > 0,
+    ) * 100
+
+    # Taxable income for chart display (all taxable sources): RRIF/RRSP withdrawals,
+    # CPP, OAS, account withdrawals, private pensions, other income and NonReg distributions
+    taxable_income = (shaped.rrif_withdrawal + shaped.rrsp_withdrawal + shaped.cpp_total + shaped.oas_total +
+                      shaped.nonreg_withdrawal + shaped.corporate_withdrawal +
+                      shaped.pension_total + shaped.other_income_total +
+                      shaped.nonreg_distributions)
+
+    # Tax-free income (TFSA + GIS)
+    tax_free_income = shaped.tfsa_withdrawal + shaped.gis_total
+
+    # Spending data
+    spending_target = shaped.spending_target
+    spending_met = spending_target - col('underfunded_after_tax')
+    coverage = np.divide(spending_met, spending_target, out=np.zeros(shaped.n), where=spending_target > 0)
+    spending_coverage_pct = np.where(spending_target > 0, coverage * 100, 100.0)
+
+    return ChartData(data_points=shaped.emit(ChartDataPoint, {
+        'year': shaped.year,
+        'age_p1': shaped.age_p1,
+        'age_p2': shaped.age_p2,
+        'spending_target': spending_target,
+        'spending_met': spending_met,
+        'spending_coverage_pct': spending_coverage_pct,
+        'rrif_balance': shaped.rrif_balance,
+        'tfsa_balance': shaped.tfsa_balance,
+        'nonreg_balance': shaped.nonreg_balance,
+        'corporate_balance': shaped.corporate_balance,
+        'net_worth': col('net_worth_end'),
+        'cpp_total': shaped.cpp_total,
+        'oas_total': shaped.oas_total,
+        'gis_total': shaped.gis_total,
+        'government_benefits_total': government_benefits_total,
+        'total_tax': shaped.total_tax,
+        'effective_tax_rate': effective_tax_rate,
+        'taxable_income': taxable_income,
+        'tax_free_income': tax_free_income,
+        'rrif_withdrawal': shaped.rrif_withdrawal,
+        'nonreg_withdrawal': shaped.nonreg_withdrawal,
+        'tfsa_withdrawal': shaped.tfsa_withdrawal,
+        'corporate_withdrawal': shaped.corporate_withdrawal,
+        'nonreg_distributions': shaped.nonreg_distributions,
+        'employer_pension_total': shaped.pension_total,
+        'other_income_total': shaped.other_income_total,
+    }))
 
 def get_strategy_display_name(strategy_key: str) -> str:
     """
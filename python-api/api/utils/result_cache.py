@@ -0,0 +1,242 @@
+"""
+Deterministic result cache for /run-simulation.
+
+The same plan posted twice (page reloads, tab switches, the web app
+re-posting a saved profile) produces the same response, so the rendered
+JSON body is cached and served again without running the engine.
+
+Key: SHA-256 of the normalized HouseholdInput (model_dump with defaults
+filled in, keys sorted), the tax config version and the engine version. The
+engine version hashes the API's Python sources, so a deploy that changes
+any engine or response code starts from a clean cache.
+
+Memory tier: LRU bounded by entry count, TTL and a byte budget on the stored
+bodies. Optional disk tier (one file per key under `disk_dir`, bounded by
+TTL and its own byte budget) survives restarts; disk hits are promoted to
+memory. The lock only covers the memory tier: disk reads, writes and trims
+run outside it, so a slow disk never holds up memory hits. With a disk tier
+get() may block on file I/O, so async callers run it on a worker thread.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from time import time
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from modules.tax_schedule import config_version
+
+logger = logging.getLogger(__name__)
+
+_API_ROOT = Path(__file__).resolve().parents[2]
+_SOURCE_DIRS = ("modules", "utils", "api")
+
+# Disk tier: check the byte budget every this many writes
+_DISK_TRIM_EVERY = 32
+
+_engine_version: Optional[str] = None
+
+
+def engine_version() -> str:
+    """Hash of the engine and API sources (computed once per process)"""
+    global _engine_version
+    if _engine_version is None:
+        digest = hashlib.sha1()
+        for directory in _SOURCE_DIRS:
+            for path in sorted((_API_ROOT / directory).rglob("*.py")):
+                digest.update(str(path.relative_to(_API_ROOT)).encode("utf-8"))
+                digest.update(path.read_bytes())
+        _engine_version = digest.hexdigest()
+    return _engine_version
+
+
+def simulation_cache_key(household_input, tax_cfg: Dict, variant: str = "") -> str:
+    """Canonical key for a /run-simulation request (variant: the response format)"""
+    payload = json.dumps(
+        {
+            "household": household_input.model_dump(mode="json"),
+            "tax_config": config_version(tax_cfg),
+            "engine": engine_version(),
+            "variant": variant,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of rendered response bodies.
+
+    Args:
+        max_entries: Most entries kept in memory
+        ttl_seconds: Age after which an entry is discarded (both tiers)
+        max_bytes: Memory budget for stored bodies
+        disk_dir: Directory for the persistent tier (None = memory only)
+        disk_max_bytes: Byte budget for the disk tier
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._counts = {
+            "hits": 0, "disk_hits": 0, "misses": 0, "stores": 0,
+            "evicted_lru": 0, "evicted_ttl": 0, "evicted_memory": 0, "disk_errors": 0,
+        }
+        self._disk_writes = 0
+        # Held (never waited on) while one thread trims the disk tier
+        self._trim_lock = threading.Lock()
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    # ----- memory tier -----
+
+    def _drop(self, key: str, reason: str) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+        self._counts[reason] += 1
+
+    def _insert(self, key: str, created: float, body: bytes) -> None:
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key)[1])
+        self._entries[key] = (created, body)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)), "evicted_lru")
+        while self._bytes > self.max_bytes and self._entries:
+            self._drop(next(iter(self._entries)), "evicted_memory")
+
+    # ----- disk tier (called without self._lock held) -----
+
+    def _disk_error(self, action: str, error: OSError) -> None:
+        with self._lock:
+            self._counts["disk_errors"] += 1
+        logger.warning(f"⚠️ Result cache disk {action} failed: {error}")
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, bytes]]:
+        path = self._disk_path(key)
+        try:
+            created = path.stat().st_mtime
+            if now - created > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return created, path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._disk_error("read", e)
+            return None
+
+    def _disk_put(self, key: str, body: bytes) -> None:
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        except OSError as e:
+            self._disk_error("write", e)
+            return
+        with self._lock:
+            self._disk_writes += 1
+            trim = self._disk_writes % _DISK_TRIM_EVERY == 0
+        # One trim at a time; a write that finds one running skips its turn
+        if trim and self._trim_lock.acquire(blocking=False):
+            try:
+                self._trim_disk()
+            finally:
+                self._trim_lock.release()
+
+    def _trim_disk(self) -> None:
+        """Delete expired files, then the oldest ones until within the disk budget"""
+        now = time()
+        files = []
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                files.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    # ----- public API -----
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached body for key, or None (may read the disk tier: keep off the event loop)"""
+        now = time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._counts["hits"] += 1
+                    return entry[1]
+                self._drop(key, "evicted_ttl")
+            if self.disk_dir is None:
+                self._counts["misses"] += 1
+                return None
+
+        entry = self._disk_get(key, now)
+        with self._lock:
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            self._insert(key, *entry)
+            self._counts["disk_hits"] += 1
+        return entry[1]
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a rendered body under key"""
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._insert(key, time(), body)
+            self._counts["stores"] += 1
+        if self.disk_dir is not None:
+            self._disk_put(key, body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss/eviction counters, hit rate and memory use"""
+        with self._lock:
+            stats = dict(self._counts)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["disk_enabled"] = self.disk_dir is not None
+        return stats
@@ -0,0 +1,144 @@
+"""
+Response wire formats for /run-simulation.
+
+The default response sends `year_by_year` and `chart_data.data_points` as
+lists of per-year objects, so every year repeats ~100 key names. The
+columnar format sends those two sections column-oriented instead:
+
+    {"columns": ["year", "age_p1", ...], "rows": 35, "data": {"year": [...], ...}}
+
+with floats optionally rounded to `precision` decimal places. Everything
+else in the response is unchanged. In both formats a NaN or infinite float
+is sent as null (as pydantic's model_dump_json does), so a response is always
+rendered in the format that was asked for.
+
+Requested with `?format=columnar` (or `Accept: application/vnd.columnar+json`)
+and `&precision=N`. Any other request gets the usual row format.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import json
+import math
+
+import numpy as np
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.columnar+json"
+FORMATS = ("rows", "columnar")
+MAX_PRECISION = 10
+
+# Response sections sent column-oriented
+_COLUMNAR_SECTIONS = ("year_by_year", "chart_data")
+
+
+def _finite(value: Any) -> Any:
+    """value with every NaN/infinite float (at any depth) replaced by None"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _dumps(content: Any) -> bytes:
+    """Compact JSON, as JSONResponse renders it, with non-finite floats as null"""
+    try:
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    except ValueError:
+        # Rare (e.g. a ratio over an empty column): only then walk the content
+        return json.dumps(_finite(content), ensure_ascii=False, allow_nan=False,
+                          separators=(",", ":")).encode("utf-8")
+
+
+def columnar(models: Sequence[BaseModel], precision: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Column-oriented form of a list of models of one type.
+
+    Args:
+        models: Rows (e.g. YearResult), all of the same model class
+        precision: Decimal places to round float columns to (None = as is)
+    """
+    if not models:
+        return {"columns": [], "rows": 0, "data": {}}
+    names: List[str] = list(type(models[0]).model_fields)
+    rows = [m.__dict__ for m in models]
+    data = {name: [row[name] for row in rows] for name in names}
+
+    if precision is not None:
+        # Round every all-float column in one array operation
+        floats = [name for name in names if all(type(v) is float for v in data[name])]
+        if floats:
+            rounded = np.round(np.array([data[name] for name in floats], dtype=np.float64), precision)
+            if precision == 0 and np.isfinite(rounded).all():
+                rounded = rounded.astype(np.int64)
+            data.update(zip(floats, rounded.tolist()))
+    return {"columns": names, "rows": len(rows), "data": data}
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """How a SimulationResponse is rendered"""
+    columnar: bool = False
+    precision: Optional[int] = None
+
+    @property
+    def variant(self) -> str:
+        """Distinguishes cached bodies of the same result in different formats"""
+        if not self.columnar:
+            return ""
+        return f"columnar:{self.precision}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"X-Response-Format": "columnar"} if self.columnar else {}
+
+    def render(self, response: BaseModel) -> bytes:
+        """JSON body for the response in this format"""
+        if not self.columnar:
+            return _dumps(jsonable_encoder(response))
+
+        content = response.model_dump(mode="json", exclude=set(_COLUMNAR_SECTIONS))
+        if response.year_by_year is not None:
+            content["year_by_year"] = columnar(response.year_by_year, self.precision)
+        else:
+            content["year_by_year"] = None
+        if response.chart_data is not None:
+            content["chart_data"] = {"data_points": columnar(response.chart_data.data_points, self.precision)}
+        else:
+            content["chart_data"] = None
+        return _dumps(content)
+
+
+ROW_FORMAT = WireFormat()
+
+
+def negotiate(request: Request) -> WireFormat:
+    """
+    Wire format requested by `format`/`precision` query parameters or the Accept header.
+
+    Raises:
+        HTTPException: 400 for an unknown format or an out-of-range precision
+    """
+    fmt = request.query_params.get("format")
+    if fmt is None:
+        fmt = "columnar" if COLUMNAR_MEDIA_TYPE in request.headers.get("accept", "") else "rows"
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{fmt}'. Valid: {FORMATS}")
+
+    precision = request.query_params.get("precision")
+    if precision is not None:
+        try:
+            precision = int(precision)
+        except ValueError:
+            precision = -1
+        if not 0 <= precision <= MAX_PRECISION:
+            raise HTTPException(status_code=400, detail=f"precision must be an integer from 0 to {MAX_PRECISION}")
+
+    # precision only applies to the columnar sections
+    return WireFormat(columnar=fmt == "columnar", precision=precision if fmt == "columnar" else None)
+
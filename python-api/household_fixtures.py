@@ -0,0 +1,83 @@
+"""
+Household builders shared by the test scripts.
+
+Every builder starts from the same retiree and takes keyword overrides, so a
+test spells out only the fields it exercises. person()/household() build the
+engine's modules.models objects; person_input()/household_input() build the
+API request models that go through api_household_to_internal().
+"""
+
+from api.models.requests import HouseholdInput, PersonInput
+from modules.models import Household, Person
+
+# Single retiree at 65 with registered, TFSA and non-registered savings
+RETIREE = dict(
+    start_age=65, cpp_annual_at_start=12000, oas_annual_at_start=8500,
+    tfsa_balance=100000, rrif_balance=400000, nonreg_balance=300000, nonreg_acb=150000,
+)
+
+# Spouse two years younger with a smaller RRIF and TFSA
+PARTNER = dict(
+    start_age=63, cpp_annual_at_start=7000, oas_annual_at_start=8500,
+    tfsa_balance=80000, rrif_balance=200000,
+)
+
+# Spending that steps down through retirement
+SPENDING = dict(spending_go_go=60000, spending_slow_go=55000, spending_no_go=50000)
+
+
+def flat_spending(amount: float) -> dict:
+    """Spending fields for the same amount in every phase"""
+    return dict(spending_go_go=amount, spending_slow_go=amount, spending_no_go=amount)
+
+
+def person(name: str = "Retiree", **overrides) -> Person:
+    """The shared retiree, with any field overridden"""
+    return Person(name=name, **{**RETIREE, **overrides})
+
+
+def partner(name: str = "Partner", **overrides) -> Person:
+    """The shared spouse, with any field overridden"""
+    return Person(name=name, **{**PARTNER, **overrides})
+
+
+def household(p1: Person = None, p2: Person = None, **overrides) -> Household:
+    """
+    Household of p1 (default: person()) and p2 (default: no partner).
+
+    Overrides replace any Household field; the default is a balanced plan
+    in Ontario from 2025 to age 95.
+    """
+    fields = dict(province="ON", start_year=2025, end_age=95, strategy="balanced", **SPENDING)
+    fields.update(overrides)
+    return Household(
+        p1=p1 if p1 is not None else person(),
+        p2=p2 if p2 is not None else Person(name="", start_age=PARTNER["start_age"]),
+        **fields,
+    )
+
+
+def person_input(name: str = "Retiree", **overrides) -> PersonInput:
+    """The shared retiree as an API PersonInput"""
+    return PersonInput(name=name, **{**RETIREE, **overrides})
+
+
+def partner_input(name: str = "Partner", **overrides) -> PersonInput:
+    """The shared spouse as an API PersonInput"""
+    return PersonInput(name=name, **{**PARTNER, **overrides})
+
+
+def household_input(p1: PersonInput = None, p2: PersonInput = None, **overrides) -> HouseholdInput:
+    """
+    API HouseholdInput of p1 (default: person_input()) and p2.
+
+    Passing p2 makes a couple; without it the partner is left out. Overrides
+    replace any HouseholdInput field.
+    """
+    fields = dict(province="ON", strategy="balanced", include_partner=p2 is not None, **SPENDING)
+    fields.update(overrides)
+    return HouseholdInput(
+        p1=p1 if p1 is not None else person_input(),
+        p2=p2 if p2 is not None else PersonInput(name="", start_age=PARTNER["start_age"]),
+        **fields,
+    )
@@ -0,0 +1,175 @@
+"""
+Year-boundary checkpoints for incremental what-if re-simulation.
+
+The what-if sliders re-post the base plan with only late-life parameters
+changed (spending phases, phase end ages, end age). Every year before the
+first one whose spending target or horizon changes is identical to the base
+run, so simulate_what_if() resumes from the base run's checkpoint for that
+year and only simulates the rest.
+
+A YearCheckpoint is everything the simulation loop carries from one year to
+the next: both people's account state (balances, ACB, buckets, GIC ladder,
+RDTOH/CDA, real estate - all on Person), TFSA room and last year's TFSA
+withdrawals, cumulative tax and the gap-pattern tracker. Checkpoint i is the
+state at the start of simulated year i; a run that reaches its end age also
+records the state after its last year, so a longer end age can continue it.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import hashlib
+import json
+import threading
+
+import pandas as pd
+
+from modules.household_utils import is_couple
+from modules.models import Household, Person
+from modules.tax_schedule import config_version
+
+# Household fields that only change spending targets or the horizon, year by year
+LATE_LIFE_FIELDS = (
+    "spending_go_go", "spending_slow_go", "spending_no_go",
+    "go_go_end_age", "slow_go_end_age", "end_age",
+)
+
+
+@dataclass
+class YearCheckpoint:
+    """Carried simulation state at the start of one year"""
+    index: int  # rows simulated before this year
+    year: int
+    age1: int
+    age2: Optional[int]
+    p1: Person
+    p2: Optional[Person]
+    tfsa_room1: float
+    tfsa_room2: float
+    tfsa_withdraw_last_year1: float
+    tfsa_withdraw_last_year2: float
+    cumulative_retirement_taxes: float
+    previous_year_status: Optional[str]
+    alternating_pattern_count: int
+
+    def __post_init__(self):
+        # Snapshot the people so the running simulation cannot change the checkpoint
+        self.p1 = self.p1.working_copy()
+        self.p2 = self.p2.working_copy() if self.p2 is not None else None
+
+    def people(self):
+        """Fresh working copies of both people to resume from"""
+        return self.p1.working_copy(), (self.p2.working_copy() if self.p2 is not None else None)
+
+
+@dataclass
+class CheckpointedRun:
+    """A frame-mode simulation result with its year-boundary checkpoints"""
+    household: Household
+    tax_version: str
+    df: pd.DataFrame
+    checkpoints: List[YearCheckpoint] = field(default_factory=list)
+    years_reused: int = 0  # prefix rows taken from the base run
+
+
+def _base_spend(hh: Household, max_age: int) -> float:
+    if max_age <= hh.go_go_end_age:
+        return hh.spending_go_go
+    if max_age <= hh.slow_go_end_age:
+        return hh.spending_slow_go
+    return hh.spending_no_go
+
+
+def _spec(hh: Household) -> Dict:
+    """Household inputs, minus the late-life fields, as plain data"""
+    spec = {k: v for k, v in vars(hh).items() if k not in LATE_LIFE_FIELDS and k not in ("p1", "p2")}
+    spec["p1"] = vars(hh.p1)
+    spec["p2"] = vars(hh.p2) if hh.p2 is not None else None
+    return spec
+
+
+def first_affected_year(base: Household, hh: Household) -> int:
+    """
+    Index of the first simulated year in which hh can differ from base.
+
+    0 if anything other than LATE_LIFE_FIELDS differs. Otherwise the first
+    year whose spending target or horizon differs; the year count of the
+    longer plan if neither does.
+    """
+    if _spec(base) != _spec(hh):
+        return 0
+
+    age1 = hh.p1.start_age
+    age2 = hh.p2.start_age if is_couple(hh) else None
+    i = 0
+    while True:
+        a1, a2 = age1 + i, (age2 + i if age2 is not None else None)
+        in_base = a1 <= base.end_age or (a2 is not None and a2 <= base.end_age)
+        in_new = a1 <= hh.end_age or (a2 is not None and a2 <= hh.end_age)
+        if in_base != in_new or not in_new:
+            return i
+        max_age = max(a1, a2) if a2 is not None else a1
+        if _base_spend(base, max_age) != _base_spend(hh, max_age):
+            return i
+        i += 1
+
+
+def resume_point(base: Optional[CheckpointedRun], hh: Household, tax_cfg: Dict) -> Optional[YearCheckpoint]:
+    """Latest checkpoint of base that hh can resume from, or None to run from the start"""
+    if base is None or not base.checkpoints or base.tax_version != config_version(tax_cfg):
+        return None
+    i = min(first_affected_year(base.household, hh), len(base.checkpoints) - 1)
+    return base.checkpoints[i] if i > 0 else None
+
+
+def checkpoint_key(hh: Household, tax_cfg: Dict) -> str:
+    """Key shared by every household that differs from hh only in late-life fields"""
+    payload = json.dumps({"household": _spec(hh), "tax_config": config_version(tax_cfg)},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Most recent checkpointed runs, one per plan (ignoring late-life fields).
+
+    Args:
+        max_runs: Runs kept; the least recently used is dropped first
+    """
+
+    def __init__(self, max_runs: int = 32):
+        self.max_runs = max_runs
+        self._runs: "OrderedDict[str, CheckpointedRun]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.resumed = 0
+        self.years_reused = 0
+        self.years_simulated = 0
+
+    def get(self, hh: Household, tax_cfg: Dict) -> Optional[CheckpointedRun]:
+        key = checkpoint_key(hh, tax_cfg)
+        with self._lock:
+            run = self._runs.get(key)
+            if run is not None:
+                self._runs.move_to_end(key)
+            return run
+
+    def put(self, run: CheckpointedRun, tax_cfg: Dict) -> None:
+        key = checkpoint_key(run.household, tax_cfg)
+        with self._lock:
+            self._runs[key] = run
+            self._runs.move_to_end(key)
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+            if run.years_reused:
+                self.resumed += 1
+            self.years_reused += run.years_reused
+            self.years_simulated += len(run.df) - run.years_reused
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "runs": len(self._runs),
+                "resumed": self.resumed,
+                "years_reused": self.years_reused,
+                "years_simulated": self.years_simulated,
+            }
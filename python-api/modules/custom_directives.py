@@ -0,0 +1,122 @@
+"""
+Custom CSV directives for simulate(custom_df=...).
+
+An advisor's custom plan is a table with one directive per row:
+
+    year, person, account, amount[, field]
+
+- account nonreg / rrif / tfsa / corp: extra withdrawal from that account in
+  that year (negative amounts count as 0; rows add up)
+- account nr_yield: from that year on, set the person's yield `field`
+  (e.g. y_nr_inv_elig_div) to `amount`
+
+person is p1 / p2 (also accepted: 1 / 2 and the legacy names juan / daniela).
+
+CustomDirectives validates the table once and keys it by year, so each
+simulated year is a dict lookup instead of filtering the DataFrame.
+"""
+
+import math
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from modules.models import Person
+
+WITHDRAWAL_ACCOUNTS = ("nonreg", "rrif", "tfsa", "corp")
+YIELD_ACCOUNT = "nr_yield"
+REQUIRED_COLUMNS = ("year", "person", "account", "amount")
+
+PERSON_ALIASES = {
+    "p1": "p1", "1": "p1", "juan": "p1",
+    "p2": "p2", "2": "p2", "daniela": "p2",
+}
+
+# Person fields an nr_yield row may override
+YIELD_FIELDS = frozenset(f.name for f in fields(Person) if f.name.startswith(("yield_", "y_")))
+
+
+def no_withdrawals() -> Dict[str, Dict[str, float]]:
+    """Per-person custom withdrawals for a year without directives"""
+    return {who: {acct: 0.0 for acct in WITHDRAWAL_ACCOUNTS} for who in ("p1", "p2")}
+
+
+def _person(value: Any) -> Optional[str]:
+    """'p1'/'p2' for a person cell (1.0 from a numeric column counts as 1), else None"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return PERSON_ALIASES.get(str(value).strip().lower())
+
+
+def _year(value: Any) -> Optional[int]:
+    try:
+        year = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(year) if year.is_integer() else None
+
+
+def _amount(value: Any) -> Optional[float]:
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        return None
+    return amount if math.isfinite(amount) else None
+
+
+class CustomDirectives:
+    """
+    Custom withdrawal and yield directives, validated and keyed by year.
+
+    Args:
+        custom_df: Directive table (see module docstring)
+
+    Raises:
+        ValueError: Missing columns, or a row with an unknown person, account
+            or yield field, or a non-numeric year or amount (with its row number)
+    """
+
+    def __init__(self, custom_df: pd.DataFrame):
+        missing = [c for c in REQUIRED_COLUMNS if c not in custom_df.columns]
+        if missing:
+            raise ValueError(f"Custom directives are missing columns: {missing}")
+
+        self._withdrawals: Dict[int, Dict[str, Dict[str, float]]] = {}
+        self._yields: Dict[int, List[Tuple[str, str, float]]] = {}
+
+        has_field = "field" in custom_df.columns
+        for row_number, row in enumerate(custom_df.to_dict("records"), start=1):
+            def invalid(problem: str) -> ValueError:
+                return ValueError(f"Custom directive row {row_number}: {problem}")
+
+            year = _year(row["year"])
+            if year is None:
+                raise invalid(f"year must be a whole number, got {row['year']!r}")
+            who = _person(row["person"])
+            if who is None:
+                raise invalid(f"unknown person {row['person']!r} (use p1 or p2)")
+            amount = _amount(row["amount"])
+            if amount is None:
+                raise invalid(f"amount must be a number, got {row['amount']!r}")
+
+            account = str(row["account"]).strip().lower()
+            if account in WITHDRAWAL_ACCOUNTS:
+                withdrawals = self._withdrawals.setdefault(year, no_withdrawals())
+                withdrawals[who][account] += max(amount, 0.0)
+            elif account == YIELD_ACCOUNT:
+                field = str(row["field"]).strip() if has_field else ""
+                if field not in YIELD_FIELDS:
+                    raise invalid(f"nr_yield needs a yield field to override, got {field!r}")
+                self._yields.setdefault(year, []).append((who, field, amount))
+            else:
+                raise invalid(f"unknown account {row['account']!r}. "
+                              f"Valid: {WITHDRAWAL_ACCOUNTS + (YIELD_ACCOUNT,)}")
+
+    def withdrawals(self, year: int) -> Dict[str, Dict[str, float]]:
+        """Custom withdrawals per person ('p1'/'p2') and account for a year"""
+        return self._withdrawals.get(year) or no_withdrawals()
+
+    def yield_overrides(self, year: int) -> List[Tuple[str, str, float]]:
+        """(person, field, value) yield overrides starting in a year, in table order"""
+        return self._yields.get(year, [])
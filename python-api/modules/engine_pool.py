@@ -0,0 +1,132 @@
+"""
+Process pool for CPU-bound engine work.
+
+Each worker loads the bundled tax configs once at startup and compiles their
+tax schedules (and the Quebec tables), so jobs normally ship only a config
+version hash rather than the config itself. A config that is not one of the
+bundled files is sent with every job that uses it; workers do not keep it.
+
+Workers are spawned rather than forked: a forked child could inherit a lock
+(the compiled schedule registry's, a logging handler's) held by another
+thread of the server at fork time and deadlock on its first use.
+
+Jobs return compact results (SimulationMetrics, Monte Carlo arrays), never
+DataFrames, so little crosses the process boundary.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from time import perf_counter, time
+from typing import Dict, Optional, Tuple
+import logging
+import multiprocessing
+import os
+
+from modules.config import load_tax_config
+from modules.models import Household, SimulationMetrics
+from modules.quebec import get_compiled_quebec_tax
+from modules.simulation import simulate
+from modules.tax_schedule import config_version, get_compiled_schedule
+
+logger = logging.getLogger(__name__)
+
+# Tax configs every worker loads and compiles at startup
+TAX_CONFIG_FILES = ("tax_config_canada_2025.json", "tax_config_canada_2026.json")
+
+# Indexing rate compiled ahead of time (the Household default)
+WARM_INFLATION = 0.02
+
+# Worker-resident bundled configs, keyed by config_version()
+_worker_configs: Dict[str, Dict] = {}
+
+
+def _load_configs(config_dir: str) -> Dict[str, Dict]:
+    """Load whichever of TAX_CONFIG_FILES exist in config_dir, keyed by version"""
+    configs = {}
+    for filename in TAX_CONFIG_FILES:
+        path = os.path.join(config_dir, filename)
+        if os.path.exists(path):
+            cfg = load_tax_config(path)
+            configs[config_version(cfg)] = cfg
+    return configs
+
+
+def _init_worker(config_dir: str) -> None:
+    """Pool initializer: load and compile the bundled tax configs once per worker"""
+    _worker_configs.update(_load_configs(config_dir))
+    for cfg in _worker_configs.values():
+        for province in cfg.get("provinces", {}):
+            get_compiled_schedule(cfg, province, WARM_INFLATION)
+    get_compiled_quebec_tax()
+
+
+def worker_tax_config(version: str, tax_cfg: Optional[Dict]) -> Dict:
+    """Inside a worker: the config for a job, from its version or as shipped"""
+    if tax_cfg is None:
+        return _worker_configs[version]
+    return tax_cfg
+
+
+def _worker_metrics(
+    hh: Household,
+    version: str,
+    tax_cfg: Optional[Dict],
+    min_years_funded: Optional[int],
+    max_total_tax: Optional[float],
+) -> Tuple[SimulationMetrics, float, float]:
+    """Metrics-only simulation; also returns the wall-clock start and run time in seconds"""
+    started = time()
+    t0 = perf_counter()
+    metrics = simulate(
+        hh, worker_tax_config(version, tax_cfg), mode="metrics",
+        min_years_funded=min_years_funded, max_total_tax=max_total_tax,
+    )
+    return metrics, started, perf_counter() - t0
+
+
+class EnginePool:
+    """
+    Worker processes with the tax configs resident.
+
+    Args:
+        workers: Number of worker processes (default: all cores)
+        config_dir: Directory holding the TAX_CONFIG_FILES to preload
+    """
+
+    def __init__(self, workers: Optional[int] = None, config_dir: str = "."):
+        self.workers = workers or os.cpu_count() or 1
+        # Versions the workers hold, so known configs are never re-sent
+        self._preloaded = set(_load_configs(config_dir))
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config_dir,),
+        )
+        logger.info(f"⚙️ Engine pool: {self.workers} workers, {len(self._preloaded)} preloaded tax configs")
+
+    def config_arg(self, tax_cfg: Dict) -> Tuple[str, Optional[Dict]]:
+        """(version, config) for a job: the config itself only if workers lack it"""
+        version = config_version(tax_cfg)
+        return version, None if version in self._preloaded else tax_cfg
+
+    def submit(self, fn, *args) -> Future:
+        return self._executor.submit(fn, *args)
+
+    def submit_metrics(
+        self,
+        hh: Household,
+        tax_cfg: Dict,
+        min_years_funded: Optional[int] = None,
+        max_total_tax: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue simulate(hh, tax_cfg, mode="metrics") on a worker.
+
+        The future resolves to (SimulationMetrics, start time, run seconds).
+        """
+        return self._executor.submit(
+            _worker_metrics, hh, *self.config_arg(tax_cfg), min_years_funded, max_total_tax
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,175 @@
+"""
+GIC ladder: a person's GICs indexed by maturity year.
+
+simulate_year() used to walk every GIC in Person.gic_assets each year,
+parse its maturity date string, price the ones maturing and rebuild the
+list of GICs still locked. GICLadder parses each GIC and precomputes its
+compounding factor once, keeps the GICs in maturity-year buckets, and each
+year only touches the ones maturing that year. An auto-renewing GIC
+schedules its next term when it matures, so a renewal chain is extended
+one maturity at a time rather than up front.
+
+Maturities within a year are processed in Person.gic_assets order (renewed
+GICs after the original ones, in the order they renewed), as the
+list-based processing did, so amounts accumulate identically. As before,
+a GIC with no maturity date, or one dated before the first simulated year,
+stays locked.
+"""
+
+from calendar import monthrange
+from datetime import datetime
+from typing import Any, Dict, List
+
+from dateutil.relativedelta import relativedelta
+
+COMPOUNDING_PERIODS = {
+    "annually": 1,
+    "semi-annually": 2,
+    "quarterly": 4,
+    "monthly": 12,
+}
+
+
+def _maturity_year(maturity_date: Any) -> int:
+    """Year of an ISO date string (YYYY-MM-DD...) or date/datetime"""
+    if isinstance(maturity_date, str):
+        return int(maturity_date.split('-')[0])
+    return maturity_date.year
+
+
+def _parse_date(maturity_date: Any) -> Any:
+    """Date of an ISO date string (time of day dropped) or date/datetime"""
+    if isinstance(maturity_date, str):
+        return datetime.fromisoformat(maturity_date.split('T')[0])
+    return maturity_date
+
+
+def _add_months(start: Any, months: Any) -> Any:
+    """start + relativedelta(months=months), without building a relativedelta"""
+    if type(months) is not int:
+        return start + relativedelta(months=months)
+    year, month = divmod(start.month - 1 + months, 12)
+    year += start.year
+    month += 1
+    return start.replace(year=year, month=month, day=min(start.day, monthrange(year, month)[1]))
+
+
+class _Holding:
+    """One GIC in the ladder, with its terms parsed"""
+
+    __slots__ = ("order", "gic", "date", "principal", "annual_rate", "term_months", "factor", "strategy")
+
+    def __init__(self, order: int, gic: Dict[str, Any], factor: float = None, date: Any = None):
+        self.order = order
+        self.gic = gic
+        self.date = date  # Parsed maturity date, when already known
+        self.principal = gic.get('currentValue', 0.0)
+        self.annual_rate = gic.get('gicInterestRate', 0.0)
+        self.term_months = gic.get('gicTermMonths', 12)
+        self.strategy = gic.get('gicReinvestStrategy', 'cash-out')
+        if factor is None:
+            factor = 1.0
+            if self.annual_rate > 0:
+                # FV = P × (1 + r/n)^(n × t)
+                n = COMPOUNDING_PERIODS.get(str(gic.get('gicCompoundingFrequency', 'annually')).lower(), 1)
+                factor = (1 + self.annual_rate / n) ** (n * (self.term_months / 12.0))
+        self.factor = factor
+
+    def maturity_value(self) -> float:
+        if self.principal <= 0:
+            return 0.0
+        if self.annual_rate <= 0:
+            return self.principal  # No interest
+        return self.principal * self.factor
+
+
+class GICLadder:
+    """
+    A person's GICs bucketed by maturity year.
+
+    Args:
+        gic_assets: GIC dicts (gicMaturityDate, currentValue, gicInterestRate as a
+            decimal, gicTermMonths, gicCompoundingFrequency, gicReinvestStrategy)
+    """
+
+    def __init__(self, gic_assets: List[Dict[str, Any]]):
+        self._by_year: Dict[int, List[_Holding]] = {}
+        self._undated: List[_Holding] = []
+        self._next_order = 0
+        for gic in gic_assets:
+            self._add(_Holding(self._next_order, gic))
+
+    def _add(self, holding: _Holding) -> None:
+        self._next_order = holding.order + 1
+        if holding.date is not None:
+            year = holding.date.year
+        else:
+            maturity_date = holding.gic.get('gicMaturityDate')
+            if not maturity_date:
+                self._undated.append(holding)
+                return
+            year = _maturity_year(maturity_date)
+        self._by_year.setdefault(year, []).append(holding)
+
+    def __len__(self) -> int:
+        return len(self._undated) + sum(len(bucket) for bucket in self._by_year.values())
+
+    def mature(self, year: int) -> Dict[str, Any]:
+        """
+        Take out the GICs maturing in `year` and price them.
+
+        Returns:
+            Dict with:
+              - 'reinvestment_instructions': {'action', 'amount'} per matured GIC
+                (plus 'new_gic' for auto-renew, which also goes back on the ladder)
+              - 'total_interest_income': Taxable interest from the matured GICs
+        """
+        result = {'reinvestment_instructions': [], 'total_interest_income': 0.0}
+        maturing = self._by_year.pop(year, None)
+        if not maturing:
+            return result
+
+        for holding in maturing:
+            maturity_value = holding.maturity_value()
+            result['total_interest_income'] += maturity_value - holding.principal  # Taxable in maturity year
+
+            strategy = holding.strategy
+            if strategy == 'auto-renew':
+                # Renew with the same terms for another term
+                old_date = holding.date
+                if old_date is None:
+                    old_date = _parse_date(holding.gic['gicMaturityDate'])
+                new_date = _add_months(old_date, holding.term_months)
+                new_gic = {
+                    **holding.gic,
+                    'gicMaturityDate': new_date.isoformat(),
+                    'currentValue': maturity_value,  # Principal for next term
+                }
+                self._add(_Holding(self._next_order, new_gic, holding.factor, new_date))
+                result['reinvestment_instructions'].append({
+                    'action': 'auto-renew',
+                    'amount': maturity_value,
+                    'new_gic': new_gic,
+                })
+            elif strategy in ('cash-out', 'transfer-to-nonreg', 'transfer-to-tfsa'):
+                result['reinvestment_instructions'].append({
+                    'action': strategy,
+                    'amount': maturity_value,
+                })
+        return result
+
+    def holdings(self) -> List[Dict[str, Any]]:
+        """GICs not yet matured, in Person.gic_assets order"""
+        held: List[_Holding] = list(self._undated)
+        for bucket in self._by_year.values():
+            held.extend(bucket)
+        held.sort(key=lambda holding: holding.order)
+        return [holding.gic for holding in held]
+
+    def copy(self) -> "GICLadder":
+        """Independent ladder in the same state (GIC dicts are shared; they are never modified)"""
+        ladder = GICLadder.__new__(GICLadder)
+        ladder._by_year = {year: list(bucket) for year, bucket in self._by_year.items()}
+        ladder._undated = list(self._undated)
+        ladder._next_order = self._next_order
+        return ladder
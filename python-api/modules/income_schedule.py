@@ -0,0 +1,144 @@
+"""
+Per-person income schedule: CPP/QPP, OAS, employer pensions and other
+income sources as arrays over the simulation years.
+
+These streams depend only on the person's inputs, their age and the
+years since the simulation started, so the simulation compiles them once
+per run instead of re-walking pension_incomes / other_incomes and
+re-indexing CPP/OAS for every person-year. Index k is simulation year
+hh.start_year + k, when the person is start_age + k.
+
+Rental income from real-estate properties (person.rental_income_annual)
+changes with downsizing during the run and is not part of the schedule.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from modules.models import Household, Person
+
+# 2025 QPP/CPP maximum: $17,196 annually (same for both), indexed at 2% per year
+PENSION_MAX_2025 = 17196.0
+PENSION_INDEXING_RATE = 0.02
+
+# 2025 OAS maximum: $8,988 annually, indexed at 2% per year (US-082)
+OAS_MAX_2025 = 8988.0
+OAS_INDEXING_RATE = 0.02
+
+# QPP supplement for low-income Quebec residents: up to $600/year below the 2025 threshold
+QPP_SUPPLEMENT_MAX = 600.0
+QPP_SUPPLEMENT_THRESHOLD = 21768.0
+
+
+def _powers(base: float, exponents: np.ndarray) -> np.ndarray:
+    """base ** e for each exponent, using Python's float pow like the per-year code did
+    (NumPy's vectorized pow can differ in the last bit)"""
+    return np.array([base ** e for e in exponents.tolist()], dtype=float)
+
+
+def rental_end_age(income: Dict[str, Any], person: Person, hh: Household) -> Optional[int]:
+    """
+    End age of an other-income item, defaulting rental income to the downsizing age.
+
+    US-074: rental income without an endAge stops when the person sells the
+    property (downsize_year), if they plan to downsize.
+    """
+    end_age = income.get('endAge')
+    if end_age is None and income.get('type', '') == 'rental':
+        if person.plan_to_downsize and person.downsize_year:
+            end_age = person.start_age + (person.downsize_year - hh.start_year)
+    return end_age
+
+
+class IncomeSchedule:
+    """
+    A person's income streams for each simulation year.
+
+    Attributes:
+        ages: Person's age in each year
+        cpp: CPP/QPP benefit (capped at the legislated maximum, QPP supplement included)
+        oas: OAS benefit before clawback (capped at the legislated maximum)
+        pension: Employer pensions from person.pension_incomes
+        other: Employment, business, rental (Income table), investment and other
+            income from person.other_incomes
+        pension_streams: (pension dict, active mask, amounts) for each pension
+    """
+
+    def __init__(self, person: Person, hh: Household, years: int):
+        self.start_age = person.start_age
+        k = np.arange(years)
+        ages = person.start_age + k
+        self.ages = ages
+        inflation = 1 + hh.general_inflation
+
+        # Inflation adjustment based on years since simulation start (not age difference)
+        growth = _powers(inflation, k)
+        cpp = np.where(
+            ages >= person.cpp_start_age,
+            np.minimum(person.cpp_annual_at_start * growth,
+                       PENSION_MAX_2025 * _powers(1 + PENSION_INDEXING_RATE, k)),
+            0.0,
+        )
+        oas = np.where(
+            ages >= person.oas_start_age,
+            np.minimum(person.oas_annual_at_start * growth,
+                       OAS_MAX_2025 * _powers(1 + OAS_INDEXING_RATE, k)),
+            0.0,
+        )
+        if hh.province == "QC":
+            income_estimate = cpp + oas  # oas is 0 before OAS start age
+            eligible = (cpp > 0) & (ages >= person.cpp_start_age) & (income_estimate < QPP_SUPPLEMENT_THRESHOLD)
+            supplement_rate = np.maximum(0, 1 - income_estimate / QPP_SUPPLEMENT_THRESHOLD)
+            cpp = np.where(eligible, cpp + QPP_SUPPLEMENT_MAX * supplement_rate * growth, cpp)
+        self.cpp = cpp
+        self.oas = oas
+
+        # Pensions are indexed from their own start age
+        self.pension_streams: List[Tuple[Dict[str, Any], np.ndarray, np.ndarray]] = []
+        pension = np.zeros(years)
+        for item in getattr(person, 'pension_incomes', []):
+            start_age = item.get('startAge', 65)
+            end_age = item.get('endAge')  # Optional end age
+            active = ages >= start_age
+            if end_age is not None:
+                active &= ages < end_age
+            amount = item.get('amount', 0.0)
+            if item.get('inflationIndexed', True):
+                amounts = amount * _powers(inflation, ages - start_age)
+            else:
+                amounts = np.full(years, float(amount))
+            amounts = np.where(active, amounts, 0.0)
+            pension += amounts
+            self.pension_streams.append((item, active, amounts))
+        self.pension = pension
+
+        other = np.zeros(years)
+        for item in getattr(person, 'other_incomes', []):
+            start_age = item.get('startAge')
+            end_age = rental_end_age(item, person, hh)
+            # Employment income defaults to current age → CPP start age (proxy for retirement)
+            if item.get('type', '') == 'employment':
+                if start_age is None:
+                    start_age = person.start_age
+                if end_age is None:
+                    end_age = person.cpp_start_age
+
+            active = np.ones(years, dtype=bool)
+            if start_age is not None:
+                active &= ages >= start_age
+            if end_age is not None:
+                active &= ages < end_age
+
+            amount = item.get('amount', 0.0)
+            if item.get('inflationIndexed', True):
+                # Indexed from its start age, or from the simulation start without one
+                amounts = amount * _powers(inflation, ages - start_age if start_age else k)
+            else:
+                amounts = np.full(years, float(amount))
+            other += np.where(active, amounts, 0.0)
+        self.other = other
+
+    def index(self, age: int) -> int:
+        """Index of the year the person is `age`"""
+        return age - self.start_age
@@ -7,12 +7,17 @@ This module defines all dataclasses used throughout the application:
 - Person: Individual with accounts and yields
 - Household: Two people plus shared parameters
 - YearResult: Single year's projection output
+- SimulationAggregates: Whole-plan totals accumulated as a simulation runs
+- SimulationMetrics: Whole-plan outcome from a metrics-only simulation
 """
 
+import copy
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, Optional
 from enum import Enum
 
+from modules.gic_ladder import GICLadder
+
 
 class WithdrawalStrategy(Enum):
     """Available withdrawal optimization strategies."""
@@ -178,6 +183,8 @@ class Person:
 
     # GIC assets (List of dicts from database)
     gic_assets: List[Dict[str, Any]] = field(default_factory=list)
+    # Run state: gic_assets compiled into maturity-year buckets by simulate_year()
+    gic_ladder: Optional[GICLadder] = field(default=None, compare=False, repr=False)
 
     # Pension income sources (List of dicts from database)
     # Each pension: {name, amount, startAge, inflationIndexed, ...}
@@ -195,6 +202,23 @@ class Person:
             self.corp_cash_bucket + self.corp_gic_bucket + self.corp_invest_bucket
         )
 
+    def working_copy(self) -> "Person":
+        """
+        Per-run copy whose balances the simulation can update freely.
+
+        Balances are scalars, so a shallow copy separates them; the
+        list-of-dict inputs are copied one level deep because the engine
+        fills in rental endAge as it runs, and a GIC ladder already in
+        progress is copied so each copy matures its GICs independently.
+        """
+        state = copy.copy(self)
+        state.gic_assets = [dict(g) for g in self.gic_assets]
+        if self.gic_ladder is not None:
+            state.gic_ladder = self.gic_ladder.copy()
+        state.pension_incomes = [dict(p) for p in self.pension_incomes]
+        state.other_incomes = [dict(o) for o in self.other_incomes]
+        return state
+
 
 @dataclass
 class Household:
@@ -235,6 +259,17 @@ class Household:
     gap_tolerance: float = 5000.0  # $5,000 realistic annual tolerance for shortfalls
     stop_on_fail: bool = False
 
+    def working_copy(self) -> "Household":
+        """
+        Per-run copy with fresh Person state, used by simulate() so the
+        caller's household is never modified and can be shared across runs.
+        """
+        state = copy.copy(self)
+        state.p1 = self.p1.working_copy()
+        state.p2 = self.p2.working_copy() if self.p2 is not None else None
+        return state
+
+
 
 @dataclass
 class YearResult:
@@ -440,3 +475,136 @@ class YearResult:
     reinvest_tfsa_p2: float = 0.0  # Surplus reinvested into TFSA
     reinvest_nonreg_p1: float = 0.0  # Surplus reinvested into non-reg (when TFSA full)
     reinvest_nonreg_p2: float = 0.0  # Surplus reinvested into non-reg (when TFSA full)
+
+
+# Spending gaps below this are rounding, not underfunding
+UNDERFUNDING_THRESHOLD = 1.0
+
+# Final-row values set once the run is over (terminal tax and lifetime metrics)
+FINAL_FIELDS = ("terminal_tax", "gross_legacy", "after_tax_legacy", "lifetime_tax_at_death")
+
+
+@dataclass
+class SimulationAggregates:
+    """
+    Whole-plan totals and final-year values, accumulated year by year.
+
+    simulate() calls add_year() with every row it records and set_final() with
+    the terminal tax values, then attaches the result to the frame as
+    df.attrs["aggregates"]. The API summary, estate and spending sections,
+    PlanReliabilityAnalyzer and evaluate_strategy read their totals from here
+    (see frame_aggregates() in result_columns) instead of re-scanning the frame.
+    """
+    years_simulated: int = 0
+    years_funded: int = 0  # Years with plan_success
+    years_with_assets: int = 0  # Years ending with net worth > 0
+    first_year: Optional[int] = None
+    final_year: Optional[int] = None
+    first_failure_year: Optional[int] = None
+    depleted_year: Optional[int] = None  # First year ending with net worth <= 0
+    total_tax: float = 0.0  # Sum of total_tax_after_split
+    highest_annual_tax: float = 0.0
+    lowest_annual_tax: float = 0.0
+    total_cpp: float = 0.0
+    total_oas: float = 0.0
+    total_gis: float = 0.0
+    total_oas_clawback: float = 0.0
+    total_rrif_withdrawn: float = 0.0
+    total_nonreg_withdrawn: float = 0.0
+    total_tfsa_withdrawn: float = 0.0
+    total_corporate_withdrawn: float = 0.0
+    total_spending: float = 0.0  # Sum of spend_target_after_tax
+    total_underfunding: float = 0.0  # Sum of spending_gap
+    underfunded_years: int = 0  # Years with spending_gap over UNDERFUNDING_THRESHOLD
+    underfunded_total: float = 0.0  # Sum of those gaps
+    initial_net_worth: float = 0.0  # First year's net_worth_end
+    final_net_worth: float = 0.0
+    final_age_p1: int = 0
+    final_rrif: float = 0.0  # Household end-of-plan balances
+    final_tfsa: float = 0.0
+    final_nonreg: float = 0.0
+    final_corporate: float = 0.0
+    terminal_tax: float = 0.0
+    gross_legacy: float = 0.0
+    after_tax_legacy: float = 0.0
+    lifetime_tax_at_death: float = 0.0
+
+    def add_year(self, values: Mapping[str, Any]) -> None:
+        """Fold in one year's row (YearResult field names; missing fields count as 0)"""
+        get = values.get
+        year = values["year"]
+        if self.years_simulated == 0:
+            self.first_year = year
+            self.initial_net_worth = get("net_worth_end", 0.0)
+        self.years_simulated += 1
+        self.final_year = year
+
+        if get("plan_success", True):
+            self.years_funded += 1
+        elif self.first_failure_year is None:
+            self.first_failure_year = year
+
+        net_worth = get("net_worth_end", 0.0)
+        if net_worth > 0:
+            self.years_with_assets += 1
+        elif self.depleted_year is None and net_worth <= 0:
+            self.depleted_year = year
+        self.final_net_worth = net_worth
+
+        tax = get("total_tax_after_split", 0.0)
+        self.total_tax += tax
+        if self.years_simulated == 1 or tax > self.highest_annual_tax:
+            self.highest_annual_tax = tax
+        if self.years_simulated == 1 or tax < self.lowest_annual_tax:
+            self.lowest_annual_tax = tax
+
+        self.total_cpp += get("cpp_p1", 0.0) + get("cpp_p2", 0.0)
+        self.total_oas += get("oas_p1", 0.0) + get("oas_p2", 0.0)
+        self.total_gis += get("gis_p1", 0.0) + get("gis_p2", 0.0)
+        self.total_oas_clawback += get("oas_clawback_p1", 0.0) + get("oas_clawback_p2", 0.0)
+        self.total_rrif_withdrawn += get("withdraw_rrif_p1", 0.0) + get("withdraw_rrif_p2", 0.0)
+        self.total_nonreg_withdrawn += get("withdraw_nonreg_p1", 0.0) + get("withdraw_nonreg_p2", 0.0)
+        self.total_tfsa_withdrawn += get("withdraw_tfsa_p1", 0.0) + get("withdraw_tfsa_p2", 0.0)
+        self.total_corporate_withdrawn += get("withdraw_corp_p1", 0.0) + get("withdraw_corp_p2", 0.0)
+        self.total_spending += get("spend_target_after_tax", 0.0)
+
+        gap = get("spending_gap", 0.0)
+        self.total_underfunding += gap
+        if gap > UNDERFUNDING_THRESHOLD:
+            self.underfunded_years += 1
+            self.underfunded_total += gap
+
+        self.final_age_p1 = get("age_p1", 0)
+        self.final_rrif = get("end_rrif_p1", 0.0) + get("end_rrif_p2", 0.0)
+        self.final_tfsa = get("end_tfsa_p1", 0.0) + get("end_tfsa_p2", 0.0)
+        self.final_nonreg = get("end_nonreg_p1", 0.0) + get("end_nonreg_p2", 0.0)
+        self.final_corporate = get("end_corp_p1", 0.0) + get("end_corp_p2", 0.0)
+
+    def set_final(self, **values: float) -> None:
+        """Record FINAL_FIELDS values given for the last row (others are ignored)"""
+        for name in FINAL_FIELDS:
+            if name in values:
+                setattr(self, name, values[name])
+
+    @property
+    def total_benefits(self) -> float:
+        """CPP + OAS + GIS for both persons"""
+        return self.total_cpp + self.total_oas + self.total_gis
+
+    @property
+    def total_withdrawals(self) -> float:
+        """RRIF + non-registered + TFSA + corporate withdrawals for both persons"""
+        return (self.total_rrif_withdrawn + self.total_nonreg_withdrawn +
+                self.total_tfsa_withdrawn + self.total_corporate_withdrawn)
+
+    @property
+    def success_rate(self) -> float:
+        return self.years_funded / self.years_simulated if self.years_simulated > 0 else 0.0
+
+
+@dataclass
+class SimulationMetrics(SimulationAggregates):
+    """Whole-plan outcome of simulate(mode="metrics"), without per-year rows."""
+    strategy: str = ""
+    years_planned: int = 0  # years_simulated is fewer than this if pruned
+    pruned: bool = False  # True if stopped early because the caller's bound became unreachable
@@ -0,0 +1,422 @@
+"""
+Monte Carlo engine - plan resilience under variable returns
+
+Runs the deterministic simulation once, then replays its cash flows against
+randomized annual returns for every trial at once:
+
+1. simulate() fixes the plan: how much leaves (or enters) the portfolio each
+   year, the tax on it, and any spending the plan could not fund.
+2. The plan's own growth is replaced by a random portfolio return drawn from
+   N(return_mean, return_std) for each trial and year.
+3. Balances are advanced year by year as (num_trials,) arrays, so the Python
+   loop runs over years only; the trial dimension is pure NumPy.
+
+Each trial first makes the plan's own draw. Spending the plan left unfunded
+can then be covered only from wealth the trial holds above the plan's own
+end-of-year balance, so assets the plan leaves untouched stay untouched and
+replaying the plan's growth gives back the plan exactly. A year is funded
+when what remains unfunded after tax is within the household's gap
+tolerance. Tax on what a trial withdraws beyond (or short of) the plan's own
+draw is read off a per-year curve priced with progressive_tax_batch() at each
+spouse's plan-year income, and the estate is after tax at the plan's terminal
+tax ratio.
+
+This is an approximation of simulating every trial: withdrawal order,
+CPP/OAS/GIS and the plan's spending are those of the deterministic plan,
+and benefits are not re-tested against a trial's income. TRIAL_ASSUMPTIONS
+lists what the API reports alongside the results.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from modules.household_utils import is_couple
+from modules.models import Household, TaxParams
+from modules.quebec.quebec_tax import get_compiled_quebec_tax
+from modules.simulation import simulate
+from modules.tax_engine import progressive_tax_batch
+from modules.tax_schedule import get_compiled_schedule
+
+logger = logging.getLogger(__name__)
+
+# Highest average tax rate used to gross up unfunded spending
+MAX_GROSS_UP_RATE = 0.6
+
+# Trials per shard. Each shard draws from its own seed spawned from the
+# request seed, so a run is the same whether shards run in one process or
+# across a worker pool of any size.
+SHARD_TRIALS = 250
+
+# How trials differ from a full simulation, reported with every result
+TRIAL_ASSUMPTIONS = [
+    "Trials replay the deterministic plan's withdrawals against random returns; "
+    "they do not re-run the simulation.",
+    "CPP, OAS and GIS amounts are the plan's; GIS is not re-tested against a trial's income.",
+    "Tax on draws above or below the plan is priced at each spouse's plan-year income; "
+    "unfunded spending is grossed up at the plan's average tax rate.",
+    "Final estates are after tax at the plan's own estate-to-gross ratio.",
+]
+
+# Points on each side of zero on the per-year curve of tax against the
+# trial's extra draw. Tax is piecewise linear in income, so a coarse curve
+# interpolates it closely.
+TAX_CURVE_POINTS = 17
+
+
+@dataclass
+class MonteCarloPlan:
+    """Per-year cash flows of the deterministic plan, one entry per year."""
+    start_balance: float
+    draw: np.ndarray        # Net draw from the portfolio (negative = net inflow)
+    end_balance: np.ndarray  # Plan's portfolio after the draw
+    gap: np.ndarray         # Unfunded spending grossed up to a pre-tax draw
+    tax: np.ndarray         # Plan tax
+    tax_rate: np.ndarray    # Average tax rate used to gross up the gap
+    tax_curve: List[Tuple[np.ndarray, np.ndarray]]  # (extra draw, extra tax) points per year
+    estate_ratio: float     # After-tax / gross estate at death
+    gap_tolerance: float
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-trial outcomes, each array shaped (num_trials,)."""
+    success: np.ndarray
+    years_funded: np.ndarray
+    final_estate: np.ndarray
+    total_tax: np.ndarray
+    max_drawdown: np.ndarray
+    years_planned: int
+
+    @property
+    def num_trials(self) -> int:
+        return len(self.success)
+
+    @property
+    def success_rate(self) -> float:
+        return float(self.success.mean()) if self.num_trials else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Success rate, medians and estate percentiles across trials"""
+        p10, p50, p90 = np.percentile(self.final_estate, [10, 50, 90])
+        return {
+            "success_rate": self.success_rate,
+            "median_estate": float(p50),
+            "median_tax": float(np.median(self.total_tax)),
+            "median_years_funded": float(np.median(self.years_funded)),
+            "percentile_10_estate": float(p10),
+            "percentile_50_estate": float(p50),
+            "percentile_90_estate": float(p90),
+            "worst_case_estate": float(self.final_estate.min()),
+            "best_case_estate": float(self.final_estate.max()),
+        }
+
+    @classmethod
+    def concat(cls, results: Sequence["MonteCarloResult"]) -> "MonteCarloResult":
+        """Join shard results back into one result, in shard order"""
+        return cls(
+            success=np.concatenate([r.success for r in results]),
+            years_funded=np.concatenate([r.years_funded for r in results]),
+            final_estate=np.concatenate([r.final_estate for r in results]),
+            total_tax=np.concatenate([r.total_tax for r in results]),
+            max_drawdown=np.concatenate([r.max_drawdown for r in results]),
+            years_planned=results[0].years_planned if results else 0,
+        )
+
+
+def _sum_people(df: pd.DataFrame, prefix: str) -> np.ndarray:
+    total = np.zeros(len(df))
+    for person in ("p1", "p2"):
+        column = f"{prefix}_{person}"
+        if column in df.columns:
+            total += df[column].fillna(0.0).to_numpy(dtype=float)
+    return total
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in df.columns:
+        return np.zeros(len(df))
+    return df[name].fillna(0.0).to_numpy(dtype=float)
+
+
+def _income_buckets(df: pd.DataFrame, person: str, corp_dividend_type: str) -> Dict[str, np.ndarray]:
+    """One spouse's plan income per year, split into progressive_tax() buckets"""
+    corp = _column(df, f"withdraw_corp_{person}")
+    eligible = corp_dividend_type.lower().startswith("elig")
+    return {
+        "ordinary_income": (
+            _column(df, f"nr_interest_{person}") + _column(df, f"pension_income_{person}")
+            + _column(df, f"other_income_{person}")
+        ),
+        "elig_dividends": _column(df, f"nr_elig_div_{person}") + (corp if eligible else 0.0),
+        "nonelig_dividends": _column(df, f"nr_nonelig_div_{person}") + (0.0 if eligible else corp),
+        "cap_gains": _column(df, f"nr_capg_dist_{person}") + _column(df, f"cg_from_sale_{person}"),
+        "pension_income": _column(df, f"withdraw_rrif_{person}") + _column(df, f"cpp_{person}"),
+        "oas_received": _column(df, f"oas_{person}"),
+    }
+
+
+def _batch_tax(fed: TaxParams, prov: TaxParams, province: str, age, income: Dict[str, np.ndarray]) -> np.ndarray:
+    """Federal + provincial tax over arrays of incomes, as tax_for_detailed() splits it"""
+    res_f = progressive_tax_batch(fed, age, **income)
+    if province == "QC":
+        quebec_tax = get_compiled_quebec_tax()
+        taxable_income = (
+            income["ordinary_income"] + income["pension_income"] + income["elig_dividends"]
+            + income["nonelig_dividends"] + income["cap_gains"] * 0.5
+        )
+        provincial_tax = quebec_tax.provincial_tax_batch(
+            taxable_income, age,
+            pension_income=income["pension_income"],
+            eligible_dividends=income["elig_dividends"],
+            non_eligible_dividends=income["nonelig_dividends"],
+        )
+        return res_f["net_tax"] * (1.0 - quebec_tax.abatement_rate) + provincial_tax
+    return res_f["net_tax"] + progressive_tax_batch(prov, age, **income)["net_tax"]
+
+
+def _tax_curve(
+    extra: np.ndarray,
+    taxable_share: float,
+    fed: TaxParams,
+    prov: TaxParams,
+    province: str,
+    people: List[Tuple[int, Dict[str, float], float]],
+) -> np.ndarray:
+    """
+    Household tax change for each extra draw.
+
+    The taxable part of the extra draw is split between spouses by their
+    weights and added to their ordinary income on top of their plan-year
+    income; every spouse and point is priced in one batch call per
+    jurisdiction.
+    """
+    taxable = extra * taxable_share
+    ages = np.repeat([age for age, _, _ in people], len(extra))
+    income = {
+        bucket: np.concatenate([np.full(len(extra), base[bucket]) for _, base, _ in people])
+        for bucket in people[0][1]
+    }
+    # A smaller draw can take back no more than a spouse's ordinary and pension income
+    floor = -(income["ordinary_income"] + income["pension_income"])
+    shares = np.concatenate([taxable * weight for _, _, weight in people])
+    income["ordinary_income"] = income["ordinary_income"] + np.maximum(shares, floor)
+    tax = _batch_tax(fed, prov, province, ages, income).reshape(len(people), len(extra)).sum(axis=0)
+    return tax - tax[extra == 0.0][0]
+
+
+def extract_plan(df: pd.DataFrame, hh: Household, tax_cfg: Dict) -> MonteCarloPlan:
+    """
+    Derive per-year portfolio cash flows from a simulate() DataFrame.
+
+    The net draw is what the plan took out of the portfolio beyond its own
+    growth: start balance + growth - end balance. Replaying those draws with
+    the plan's growth reproduces the plan's balances exactly.
+
+    Args:
+        df: simulate() result for hh
+        hh: The simulated household
+        tax_cfg: Tax configuration the plan was simulated with
+    """
+    start = sum(_sum_people(df, f"start_{acct}") for acct in ("rrsp", "rrif", "tfsa", "nonreg", "corp"))
+    growth = sum(_sum_people(df, f"growth_{acct}") for acct in ("rrif", "tfsa", "nonreg", "corp"))
+    end = _column(df, "net_worth_end")
+    draw = start + growth - end
+
+    tax = _column(df, "total_tax_after_split")
+    income = (
+        _column(df, "total_withdrawals") + _sum_people(df, "cpp") + _sum_people(df, "oas")
+        + _sum_people(df, "gis") + _sum_people(df, "pension_income") + _sum_people(df, "other_income")
+        + _column(df, "nr_dist_tot")
+    )
+    tax_rate = np.clip(np.divide(tax, income, out=np.zeros(len(df)), where=income > 0), 0.0, MAX_GROSS_UP_RATE)
+
+    # Spending the plan left unfunded, grossed up to a pre-tax draw
+    gap = np.maximum(_column(df, "spending_gap"), 0.0)
+    gap_gross = gap / (1.0 - tax_rate)
+
+    # Share of each year's withdrawals that is taxable income; years without
+    # withdrawals use the share over the whole plan
+    withdrawn = _column(df, "total_withdrawals")
+    people = [("p1", hh.p1)] + ([("p2", hh.p2)] if is_couple(hh) else [])
+    taxable_by_person = [
+        _column(df, f"withdraw_rrif_{person}") + _column(df, f"withdraw_corp_{person}")
+        + _column(df, f"cg_from_sale_{person}")
+        for person, _ in people
+    ]
+    taxable = sum(taxable_by_person)
+    overall_share = taxable.sum() / withdrawn.sum() if withdrawn.sum() > 0 else 1.0
+    taxable_share = np.clip(
+        np.divide(taxable, withdrawn, out=np.full(len(df), overall_share), where=withdrawn > 0), 0.0, 1.0
+    )
+
+    buckets = [(person, _income_buckets(df, person, p.corp_dividend_type)) for person, p in people]
+    schedule = get_compiled_schedule(tax_cfg, hh.province, hh.general_inflation, horizon=len(df) + 1)
+    years_since_start = _column(df, "years_since_start").astype(int)
+    tax_curve = []
+    for t in range(len(df)):
+        # A trial draws at most the plan's whole draw less, or the whole gap more
+        extra = np.unique(np.concatenate([
+            np.linspace(-max(draw[t], 0.0), 0.0, TAX_CURVE_POINTS),
+            np.linspace(0.0, gap_gross[t], TAX_CURVE_POINTS),
+        ]))
+        if len(extra) == 1:
+            tax_curve.append((extra, np.zeros(1)))
+            continue
+        fed, prov = schedule.params_for(years_since_start[t])
+        # The extra draw comes from each spouse in proportion to their taxable withdrawals
+        year_people = [
+            (
+                int(df[f"age_{person}"].iloc[t]),
+                {k: float(v[t]) for k, v in income_t.items()},
+                person_taxable[t] / taxable[t] if taxable[t] > 0 else 1.0 / len(people),
+            )
+            for (person, income_t), person_taxable in zip(buckets, taxable_by_person)
+        ]
+        tax_curve.append((extra, _tax_curve(extra, taxable_share[t], fed, prov, hh.province, year_people)))
+
+    gross_legacy = float(df["gross_legacy"].iloc[-1]) if "gross_legacy" in df.columns else 0.0
+    if gross_legacy > 0:
+        estate_ratio = float(df["after_tax_legacy"].iloc[-1]) / gross_legacy
+    else:
+        # Plan ends depleted: tax any surviving estate at the plan's overall average rate
+        estate_ratio = 1.0 - (tax.sum() / income.sum() if income.sum() > 0 else 0.0)
+
+    return MonteCarloPlan(
+        start_balance=float(start[0]) if len(df) else 0.0,
+        draw=draw,
+        end_balance=end,
+        gap=gap_gross,
+        tax=tax,
+        tax_rate=tax_rate,
+        tax_curve=tax_curve,
+        estate_ratio=float(np.clip(estate_ratio, 0.0, 1.0)),
+        gap_tolerance=hh.gap_tolerance,
+    )
+
+
+def run_trials(
+    plan: MonteCarloPlan,
+    returns: np.ndarray,
+    success_threshold: float = 0.0,
+) -> MonteCarloResult:
+    """
+    Replay a plan against a (num_trials, years) matrix of annual returns.
+
+    Args:
+        plan: Cash flows from extract_plan()
+        returns: Annual portfolio returns as fractions (0.06 = 6%)
+        success_threshold: Minimum final portfolio for a trial to count as a success
+
+    Returns:
+        MonteCarloResult with one entry per trial
+    """
+    num_trials, years = returns.shape
+    balance = np.full(num_trials, plan.start_balance)
+    peak = balance.copy()
+    max_drawdown = np.zeros(num_trials)
+    years_funded = np.zeros(num_trials, dtype=np.int64)
+    total_tax = np.zeros(num_trials)
+    all_funded = np.ones(num_trials, dtype=bool)
+
+    for t in range(years):
+        available = balance * (1.0 + returns[:, t])
+        draw = plan.draw[t]
+        withdrawn = np.minimum(available, draw) if draw > 0 else np.full(num_trials, draw)
+        remaining = available - withdrawn
+
+        # The plan's gap can only come out of wealth above the plan's own balance
+        gap_paid = np.minimum(np.maximum(remaining - plan.end_balance[t], 0.0), plan.gap[t])
+        balance = np.maximum(remaining - gap_paid, 0.0)
+
+        rate = plan.tax_rate[t]
+        shortfall = (draw - withdrawn) + (plan.gap[t] - gap_paid)
+        funded = shortfall * (1.0 - rate) <= plan.gap_tolerance
+        extra_draw, extra_tax = plan.tax_curve[t]
+        total_tax += plan.tax[t] + np.interp(gap_paid - (draw - withdrawn), extra_draw, extra_tax)
+
+        years_funded += funded
+        all_funded &= funded
+
+        np.maximum(peak, balance, out=peak)
+        drawdown = np.divide(peak - balance, peak, out=np.zeros(num_trials), where=peak > 0)
+        np.maximum(max_drawdown, drawdown, out=max_drawdown)
+
+    return MonteCarloResult(
+        success=all_funded & (balance >= success_threshold),
+        years_funded=years_funded,
+        final_estate=balance * plan.estate_ratio,
+        total_tax=total_tax,
+        max_drawdown=max_drawdown,
+        years_planned=years,
+    )
+
+
+def shard_seeds(num_trials: int, seed: Optional[int] = None) -> List[Tuple[np.random.SeedSequence, int]]:
+    """
+    Split a run into (SeedSequence, trial count) shards of SHARD_TRIALS.
+
+    The shard layout depends only on num_trials, and the shard seeds only on
+    seed, so results do not depend on how the shards are scheduled.
+    """
+    counts = [SHARD_TRIALS] * (num_trials // SHARD_TRIALS)
+    if num_trials % SHARD_TRIALS:
+        counts.append(num_trials % SHARD_TRIALS)
+    return list(zip(np.random.SeedSequence(seed).spawn(len(counts)), counts))
+
+
+def run_shard(
+    plan: MonteCarloPlan,
+    seed_seq: np.random.SeedSequence,
+    num_trials: int,
+    return_mean: float,
+    return_std: float,
+    success_threshold: float = 0.0,
+) -> MonteCarloResult:
+    """Draw one shard's returns from its own seed and replay the plan against them"""
+    rng = np.random.default_rng(seed_seq)
+    returns = rng.normal(return_mean / 100.0, return_std / 100.0, size=(num_trials, len(plan.draw)))
+    # A portfolio cannot lose more than everything in a year
+    np.maximum(returns, -1.0, out=returns)
+    return run_trials(plan, returns, success_threshold)
+
+
+def run_monte_carlo(
+    hh: Household,
+    tax_cfg: Dict,
+    num_trials: int = 1000,
+    return_mean: float = 6.0,
+    return_std: float = 12.0,
+    success_threshold: float = 0.0,
+    seed: Optional[int] = None,
+) -> MonteCarloResult:
+    """
+    Run a Monte Carlo analysis of a household plan.
+
+    Args:
+        hh: Household to simulate (not modified)
+        tax_cfg: Tax configuration from load_tax_config()
+        num_trials: Number of return sequences
+        return_mean: Mean annual portfolio return in percent
+        return_std: Standard deviation of annual returns in percent
+        success_threshold: Minimum final portfolio for a trial to count as a success
+        seed: Random seed for reproducible trials
+
+    Returns:
+        MonteCarloResult
+    """
+    df = simulate(hh, tax_cfg)
+    plan = extract_plan(df, hh, tax_cfg)
+
+    result = MonteCarloResult.concat([
+        run_shard(plan, seed_seq, n, return_mean, return_std, success_threshold)
+        for seed_seq, n in shard_seeds(num_trials, seed)
+    ])
+    logger.info(
+        f"🎲 Monte Carlo: {num_trials} trials x {len(df)} years, "
+        f"success={result.success_rate:.1%}"
+    )
+    return result
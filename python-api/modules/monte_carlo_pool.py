@@ -0,0 +1,71 @@
+"""
+Process-pool backend for Monte Carlo runs.
+
+run_monte_carlo() works through its trial shards one after another in the
+calling process. MonteCarloPool runs the same shards on a pool of worker
+processes:
+
+1. Workers hold the bundled tax configs (see modules.engine_pool), so jobs
+   normally ship only a config version hash rather than the config itself.
+2. The converted Household goes to a worker once per job; that worker runs
+   the deterministic simulation and returns the compact MonteCarloPlan.
+3. Trial shards are fanned out across the pool and come back as per-trial
+   metric arrays (MonteCarloResult), never DataFrames.
+
+Shards and their seeds come from monte_carlo.shard_seeds(), so a pool of any
+size returns what run_monte_carlo() returns for the same seed. Workers start
+with a cold tax cache, whose whole-dollar keys can shift amounts by cents
+against a warm in-process run.
+"""
+
+from typing import Dict, Optional
+
+from modules.engine_pool import EnginePool, worker_tax_config
+from modules.models import Household
+from modules.monte_carlo import (
+    MonteCarloPlan,
+    MonteCarloResult,
+    extract_plan,
+    run_shard,
+    shard_seeds,
+)
+from modules.simulation import simulate
+
+
+def _worker_plan(hh: Household, version: str, tax_cfg: Optional[Dict]) -> MonteCarloPlan:
+    """Simulate the household once and reduce it to the plan the shards replay"""
+    tax_cfg = worker_tax_config(version, tax_cfg)
+    return extract_plan(simulate(hh, tax_cfg), hh, tax_cfg)
+
+
+def _worker_shard(plan, seed_seq, num_trials, return_mean, return_std, success_threshold) -> MonteCarloResult:
+    """One shard of trials as per-trial metric arrays"""
+    return run_shard(plan, seed_seq, num_trials, return_mean, return_std, success_threshold)
+
+
+class MonteCarloPool(EnginePool):
+    """
+    EnginePool that also runs Monte Carlo jobs.
+
+    Args:
+        workers: Number of worker processes (default: all cores)
+        config_dir: Directory holding the tax configs to preload
+    """
+
+    def run(
+        self,
+        hh: Household,
+        tax_cfg: Dict,
+        num_trials: int = 1000,
+        return_mean: float = 6.0,
+        return_std: float = 12.0,
+        success_threshold: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> MonteCarloResult:
+        """Same arguments and result as run_monte_carlo(), with shards run in parallel"""
+        plan = self.submit(_worker_plan, hh, *self.config_arg(tax_cfg)).result()
+        futures = [
+            self.submit(_worker_shard, plan, seed_seq, n, return_mean, return_std, success_threshold)
+            for seed_seq, n in shard_seeds(num_trials, seed)
+        ]
+        return MonteCarloResult.concat([f.result() for f in futures])
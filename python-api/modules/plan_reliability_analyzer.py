@@ -15,6 +15,9 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from modules.models import SimulationAggregates
+from modules.result_columns import frame_aggregates
+
 
 @dataclass
 class TimeHorizon:
@@ -62,6 +65,7 @@ class PlanReliabilityAnalyzer:
         """
         self.hh = hh
         self.df = df_results
+        self.aggregates = frame_aggregates(df_results) if df_results is not None else SimulationAggregates()
 
         # Calculate key parameters
         self.start_year = hh.start_year
@@ -94,19 +98,17 @@ class PlanReliabilityAnalyzer:
 
     def _calculate_summary_metrics(self) -> Dict:
         """Calculate overall plan summary metrics."""
+        totals = self.aggregates
+
         # Years where net worth stays positive
-        years_funded = len(self.df[self.df['net_worth_end'] > 0])
+        years_funded = totals.years_with_assets
 
         # Overall success rate - percentage of planned years that are funded
         # This gives a more intuitive success rate (e.g., 17/31 years = 54.8% success rate)
         success_rate = (years_funded / self.planned_years * 100) if self.planned_years > 0 else 0
 
         # When does portfolio actually deplete?
-        depleted_year = None
-        for idx, row in self.df.iterrows():
-            if row['net_worth_end'] <= 0:
-                depleted_year = int(row['year'])
-                break
+        depleted_year = totals.depleted_year
 
         # Age at depletion
         if depleted_year:
@@ -128,7 +130,7 @@ class PlanReliabilityAnalyzer:
             'age_p2_at_depletion': age_p2_at_depletion,
             'longevity_gap_years': gap_years,
             'is_plan_viable': years_funded >= self.planned_years,
-            'final_net_worth': float(self.df.iloc[-1]['net_worth_end']) if len(self.df) > 0 else 0,
+            'final_net_worth': totals.final_net_worth if totals.years_simulated > 0 else 0,
         }
 
     def _analyze_time_horizons(self) -> List[Dict]:
@@ -278,13 +280,9 @@ class PlanReliabilityAnalyzer:
     def _analyze_portfolio_depletion(self) -> Dict:
         """Analyze when and how portfolio depletes."""
         # Find depletion point
-        depletion_idx = None
-        for idx, row in self.df.iterrows():
-            if row['net_worth_end'] <= 0:
-                depletion_idx = idx
-                break
+        depletion_year = self.aggregates.depleted_year
 
-        if depletion_idx is None:
+        if depletion_year is None:
             # Portfolio never depletes
             return {
                 'depletes': False,
@@ -294,8 +292,7 @@ class PlanReliabilityAnalyzer:
                 'message': 'Portfolio never depletes (excellent longevity)',
             }
 
-        depletion_row = self.df.iloc[depletion_idx]
-        depletion_year = int(depletion_row['year'])
+        depletion_idx = depletion_year - self.aggregates.first_year
 
         # What happens after depletion?
         remaining_life = self.df[self.df['year'] >= depletion_year]
@@ -314,9 +311,6 @@ class PlanReliabilityAnalyzer:
         else:
             gov_benefits_avg = 0
 
-        # Get first deficit row
-        first_deficit_row = self.df[self.df['net_worth_end'] <= 0].iloc[0] if not self.df[self.df['net_worth_end'] <= 0].empty else None
-
         return {
             'depletes': True,
             'year': depletion_year,
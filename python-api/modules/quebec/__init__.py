@@ -9,11 +9,13 @@ This package contains Quebec-specific implementations for:
 """
 
 from .qpp_calculator import QPPCalculator
-from .quebec_tax import QuebecTaxCalculator
+from .quebec_tax import QuebecTaxCalculator, CompiledQuebecTax, get_compiled_quebec_tax
 from .quebec_benefits import QuebecBenefitsCalculator
 
 __all__ = [
     'QPPCalculator',
     'QuebecTaxCalculator',
+    'CompiledQuebecTax',
+    'get_compiled_quebec_tax',
     'QuebecBenefitsCalculator'
 ]
\ No newline at end of file
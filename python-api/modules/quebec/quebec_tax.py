@@ -14,8 +14,11 @@ Reference: Revenu Québec official documentation
 
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 
+import numpy as np
+
 
 @dataclass
 class QuebecTaxResult:
@@ -519,4 +522,202 @@ class QuebecTaxCalculator:
 
         provincial = self._get_marginal_rate_provincial(taxable_income)
         federal = self._get_marginal_rate_federal(taxable_income) * (1 - self.QUEBEC_ABATEMENT_RATE)
-        return provincial + federal
\ No newline at end of file
+        return provincial + federal
+
+    @classmethod
+    def compile(cls) -> "CompiledQuebecTax":
+        """Snapshot this calculator's parameters as a CompiledQuebecTax."""
+        return CompiledQuebecTax(
+            brackets=tuple((float(limit), float(rate)) for limit, rate in cls.QUEBEC_TAX_BRACKETS_2026),
+            abatement_rate=cls.QUEBEC_ABATEMENT_RATE,
+            basic_credit=cls.QUEBEC_BASIC_PERSONAL_AMOUNT_2026 * 0.14,
+            age_credit_base=float(cls.QUEBEC_AGE_CREDIT_BASE),
+            age_credit_threshold=float(cls.QUEBEC_AGE_CREDIT_REDUCTION_THRESHOLD),
+            age_credit_reduction_rate=cls.QUEBEC_AGE_CREDIT_REDUCTION_RATE,
+            pension_credit_max=float(cls.QUEBEC_PENSION_INCOME_CREDIT_MAX),
+            solidarity_base=(float(cls.SOLIDARITY_BASE_SINGLE), float(cls.SOLIDARITY_BASE_COUPLE)),
+            solidarity_threshold=(float(cls.SOLIDARITY_REDUCTION_THRESHOLD_SINGLE),
+                                  float(cls.SOLIDARITY_REDUCTION_THRESHOLD_COUPLE)),
+            solidarity_reduction_rate=cls.SOLIDARITY_REDUCTION_RATE,
+            work_premium_exemption=(float(cls.WORK_PREMIUM_EXEMPTION_SINGLE),
+                                    float(cls.WORK_PREMIUM_EXEMPTION_COUPLE)),
+            work_premium_max=(float(cls.WORK_PREMIUM_MAX_SINGLE), float(cls.WORK_PREMIUM_MAX_COUPLE)),
+            work_premium_rate=cls.WORK_PREMIUM_RATE,
+            work_premium_threshold=(float(cls.WORK_PREMIUM_REDUCTION_THRESHOLD_SINGLE),
+                                    float(cls.WORK_PREMIUM_REDUCTION_THRESHOLD_COUPLE)),
+            work_premium_reduction_rate=cls.WORK_PREMIUM_REDUCTION_RATE,
+            senior_max=float(cls.SENIOR_ASSISTANCE_MAX),
+            senior_age=cls.SENIOR_ASSISTANCE_AGE,
+            senior_threshold=float(cls.SENIOR_ASSISTANCE_REDUCTION_THRESHOLD),
+            senior_reduction_rate=cls.SENIOR_ASSISTANCE_REDUCTION_RATE,
+        )
+
+
+@dataclass(frozen=True)
+class CompiledQuebecTax:
+    """
+    Quebec provincial tax parameters compiled into flat tuples.
+
+    Computes QuebecTaxResult.total_provincial_tax without building a
+    calculator or a result object, which is what the simulation engine needs
+    inside its withdrawal solvers. Immutable and shared process-wide via
+    get_compiled_quebec_tax(). Single/couple pairs are indexed by is_couple.
+
+    Northern residence and property tax are not modelled by the engine and
+    are taken as zero here.
+    """
+    brackets: Tuple[Tuple[float, float], ...]
+    abatement_rate: float
+    basic_credit: float
+    age_credit_base: float
+    age_credit_threshold: float
+    age_credit_reduction_rate: float
+    pension_credit_max: float
+    solidarity_base: Tuple[float, float]
+    solidarity_threshold: Tuple[float, float]
+    solidarity_reduction_rate: float
+    work_premium_exemption: Tuple[float, float]
+    work_premium_max: Tuple[float, float]
+    work_premium_rate: float
+    work_premium_threshold: Tuple[float, float]
+    work_premium_reduction_rate: float
+    senior_max: float
+    senior_age: int
+    senior_threshold: float
+    senior_reduction_rate: float
+
+    def provincial_tax(
+        self,
+        taxable_income: float,
+        age: int,
+        pension_income: float = 0.0,
+        eligible_dividends: float = 0.0,
+        non_eligible_dividends: float = 0.0,
+        is_couple: bool = False,
+        partner_income: float = 0.0,
+        employment_income: float = 0.0,
+    ) -> float:
+        """
+        Quebec tax after credits, equal to calculate_quebec_tax(...).total_provincial_tax.
+
+        Same arguments as QuebecTaxCalculator.calculate_quebec_tax().
+        """
+        # Bracket tax, summed in the same order as _calculate_provincial_tax
+        tax = 0.0
+        if taxable_income > 0:
+            remaining_income = taxable_income
+            for bracket_limit, rate in self.brackets:
+                if remaining_income <= 0:
+                    break
+                taxable_in_bracket = min(remaining_income, bracket_limit - (taxable_income - remaining_income))
+                tax += taxable_in_bracket * rate
+                remaining_income -= taxable_in_bracket
+            if eligible_dividends > 0:
+                tax -= eligible_dividends * 0.38 * 0.2575
+            if non_eligible_dividends > 0:
+                tax -= non_eligible_dividends * 0.15 * 0.1697
+            tax = max(0, tax)
+
+        credits = self.basic_credit
+        if age >= 65:
+            age_credit_base = self.age_credit_base
+            if taxable_income > self.age_credit_threshold:
+                age_credit_base = max(0, age_credit_base - (taxable_income - self.age_credit_threshold) *
+                                      self.age_credit_reduction_rate)
+            credits += age_credit_base * 0.14
+        if pension_income > 0:
+            credits += min(pension_income, self.pension_credit_max) * 0.14
+
+        c = 1 if is_couple else 0
+        family_income = taxable_income + (partner_income if is_couple else 0)
+
+        solidarity = self.solidarity_base[c]
+        if family_income > self.solidarity_threshold[c]:
+            solidarity = max(0, solidarity - (family_income - self.solidarity_threshold[c]) *
+                             self.solidarity_reduction_rate)
+
+        work_premium = 0
+        if employment_income > 0:
+            eligible_income = max(0, employment_income - self.work_premium_exemption[c])
+            work_premium = min(eligible_income * self.work_premium_rate, self.work_premium_max[c])
+            if family_income > self.work_premium_threshold[c]:
+                work_premium = max(0, work_premium - (family_income - self.work_premium_threshold[c]) *
+                                   self.work_premium_reduction_rate)
+
+        senior = 0
+        if age >= self.senior_age:
+            senior = self.senior_max
+            if family_income > self.senior_threshold:
+                senior = max(0, senior - (family_income - self.senior_threshold) * self.senior_reduction_rate)
+
+        return max(0, tax - credits - solidarity - work_premium - senior)
+
+    def provincial_tax_batch(
+        self,
+        taxable_income,
+        age,
+        pension_income=0.0,
+        eligible_dividends=0.0,
+        non_eligible_dividends=0.0,
+        is_couple=False,
+        partner_income=0.0,
+        employment_income=0.0,
+    ) -> np.ndarray:
+        """
+        Vectorized provincial_tax() over arrays (all arguments broadcast together).
+
+        Returns:
+            ndarray of Quebec tax after credits, matching provincial_tax() to the cent
+        """
+        taxable_income, age, pension_income, eligible_dividends, non_eligible_dividends, \
+            is_couple, partner_income, employment_income = np.broadcast_arrays(
+                np.asarray(taxable_income, dtype=float), np.asarray(age),
+                np.asarray(pension_income, dtype=float), np.asarray(eligible_dividends, dtype=float),
+                np.asarray(non_eligible_dividends, dtype=float), np.asarray(is_couple, dtype=bool),
+                np.asarray(partner_income, dtype=float), np.asarray(employment_income, dtype=float),
+            )
+
+        income = np.maximum(taxable_income, 0.0)
+        tax = np.zeros(income.shape)
+        lower = 0.0
+        for bracket_limit, rate in self.brackets:
+            tax += np.clip(income - lower, 0.0, bracket_limit - lower) * rate
+            lower = bracket_limit
+        tax -= np.where(eligible_dividends > 0, eligible_dividends * 0.38 * 0.2575, 0.0)
+        tax -= np.where(non_eligible_dividends > 0, non_eligible_dividends * 0.15 * 0.1697, 0.0)
+        tax = np.where(taxable_income > 0, np.maximum(tax, 0.0), 0.0)
+
+        age_reduction = np.maximum(taxable_income - self.age_credit_threshold, 0.0) * self.age_credit_reduction_rate
+        credits = (
+            self.basic_credit
+            + np.where(age >= 65, np.maximum(self.age_credit_base - age_reduction, 0.0) * 0.14, 0.0)
+            + np.where(pension_income > 0, np.minimum(pension_income, self.pension_credit_max) * 0.14, 0.0)
+        )
+
+        c = is_couple.astype(int)
+        family_income = taxable_income + np.where(is_couple, partner_income, 0.0)
+
+        def phase_out(amount, threshold, rate):
+            return np.maximum(amount - np.maximum(family_income - threshold, 0.0) * rate, 0.0)
+
+        solidarity = phase_out(np.take(self.solidarity_base, c), np.take(self.solidarity_threshold, c),
+                               self.solidarity_reduction_rate)
+
+        eligible_income = np.maximum(employment_income - np.take(self.work_premium_exemption, c), 0.0)
+        work_premium = np.minimum(eligible_income * self.work_premium_rate, np.take(self.work_premium_max, c))
+        work_premium = np.where(
+            employment_income > 0,
+            phase_out(work_premium, np.take(self.work_premium_threshold, c), self.work_premium_reduction_rate),
+            0.0,
+        )
+
+        senior = np.where(age >= self.senior_age,
+                          phase_out(self.senior_max, self.senior_threshold, self.senior_reduction_rate), 0.0)
+
+        return np.maximum(tax - credits - solidarity - work_premium - senior, 0.0)
+
+
+@lru_cache(maxsize=1)
+def get_compiled_quebec_tax() -> CompiledQuebecTax:
+    """Shared CompiledQuebecTax built once per process from QuebecTaxCalculator."""
+    return QuebecTaxCalculator.compile()
@@ -0,0 +1,250 @@
+"""
+Columnar accumulator for year-by-year simulation output.
+
+simulate() used to build one YearResult dataclass per year, patch lifetime
+metrics back into every row and then convert with
+pd.DataFrame([r.__dict__ for r in rows]). YearResultColumns keeps one NumPy
+array per YearResult field instead, preallocated to the simulation horizon
+and written in place each year, so the DataFrame is assembled straight from
+the arrays without any per-row objects.
+
+Columns, their order and their defaults come from the YearResult dataclass,
+so adding a field there adds a column here.
+
+Both fold every row into a SimulationAggregates as it is appended, so plan
+totals are ready when the run ends (df.attrs["aggregates"] in frame mode).
+
+MetricsAccumulator has the same append/last/set_last/fill interface but keeps
+only running totals, for simulate(mode="metrics") used by strategy searches.
+"""
+
+from dataclasses import fields, MISSING
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.models import FINAL_FIELDS, SimulationAggregates, SimulationMetrics, YearResult
+
+
+def _column_specs() -> List[Tuple[str, Any, Any]]:
+    """(name, dtype, default) for every YearResult field, in declaration order"""
+    specs = []
+    for f in fields(YearResult):
+        if f.type is bool:
+            dtype = np.bool_
+        elif f.type is int:
+            dtype = np.int64
+        elif f.type is float:
+            dtype = np.float64
+        else:
+            dtype = object
+        default = f.default if f.default is not MISSING else dtype(0) if dtype is not object else None
+        specs.append((f.name, dtype, default))
+    return specs
+
+
+_COLUMN_SPECS = _column_specs()
+COLUMNS: Tuple[str, ...] = tuple(name for name, _, _ in _COLUMN_SPECS)
+
+# Set on the final row only, once the run is over
+_TERMINAL_FIELDS = ("terminal_tax", "gross_legacy", "after_tax_legacy")
+
+
+class YearResultColumns:
+    """
+    Preallocated per-column arrays holding one row per simulated year.
+
+    Args:
+        capacity: Expected number of years (grows automatically if exceeded)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(int(capacity), 1)
+        self.n = 0
+        self.aggregates = SimulationAggregates()
+        self.data: Dict[str, np.ndarray] = {
+            name: np.full(self.capacity, default, dtype=dtype)
+            for name, dtype, default in _COLUMN_SPECS
+        }
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, n: int, capacity: int) -> "YearResultColumns":
+        """
+        Columns holding the first n rows of an earlier simulate() frame, to
+        continue from. Terminal-tax fields are reset: they belong to that run's
+        final year.
+        """
+        columns = cls(max(capacity, n))
+        for name, _, default in _COLUMN_SPECS:
+            values = df[name].to_numpy()[:n]
+            if values.dtype == object:
+                columns.data[name] = columns.data[name].astype(object)
+            columns.data[name][:n] = values
+            if name in _TERMINAL_FIELDS:
+                columns.data[name][:n] = default
+        columns.n = n
+        _replay(columns.aggregates, {name: columns.data[name][:n] for name in _AGGREGATE_FIELDS}, n)
+        return columns
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for name, dtype, default in _COLUMN_SPECS:
+            column = self.data[name]
+            grown = np.full(new_capacity, default, dtype=column.dtype)
+            grown[:self.capacity] = column
+            self.data[name] = grown
+        self.capacity = new_capacity
+
+    def _store(self, name: str, i: int, value: Any) -> None:
+        column = self.data[name]
+        if value is None and column.dtype != object:
+            # e.g. age_p2 for single-person households: keep None, as the row dicts did
+            column = column.astype(object)
+            self.data[name] = column
+        column[i] = value
+
+    def append(self, **values: Any) -> None:
+        """Write the next year's row. Fields not given keep their YearResult default."""
+        if self.n >= self.capacity:
+            self._grow()
+        i = self.n
+        data = self.data
+        for name, value in values.items():
+            if name not in data:
+                raise TypeError(f"YearResult has no field '{name}'")
+            self._store(name, i, value)
+        self.n += 1
+        self.aggregates.add_year(values)
+
+    def last(self, name: str) -> Any:
+        """Value of a field in the most recent row"""
+        value = self.data[name][self.n - 1]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def set_last(self, **values: Any) -> None:
+        """Overwrite fields of the most recent row"""
+        for name, value in values.items():
+            self._store(name, self.n - 1, value)
+        self.aggregates.set_final(**values)
+
+    def fill(self, **values: Any) -> None:
+        """Broadcast a value to every row written so far"""
+        for name, value in values.items():
+            self.data[name][:self.n] = value
+        self.aggregates.set_final(**values)
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a column over the rows written so far"""
+        return self.data[name][:self.n]
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame with one column per YearResult field (copies only the used rows)"""
+        if self.n == 0:
+            return pd.DataFrame()
+        return pd.DataFrame({name: self.data[name][:self.n].copy() for name in COLUMNS}, copy=False)
+
+
+# Final-year fields read back by simulate() for the terminal tax calculation
+_LAST_ROW_FIELDS = (
+    "year", "age_p1", "age_p2",
+    "end_rrif_p1", "end_rrif_p2", "end_tfsa_p1", "end_tfsa_p2",
+    "end_nonreg_p1", "end_nonreg_p2", "end_corp_p1", "end_corp_p2",
+    "nonreg_acb_p1", "nonreg_acb_p2", "net_worth_end",
+)
+
+
+class MetricsAccumulator:
+    """
+    Drop-in replacement for YearResultColumns that keeps running totals only.
+
+    Args:
+        strategy: Strategy name recorded on the result
+        years_planned: Number of years the simulation would run to the end age
+        min_years_funded: If set, `pruned` turns True as soon as this many funded
+            years can no longer be reached, so the caller can stop early
+        max_total_tax: If set, `pruned` turns True as soon as the running total
+            tax exceeds it (tax only accumulates, so the final total would too)
+    """
+
+    def __init__(self, strategy: str, years_planned: int, min_years_funded: Optional[int] = None,
+                 max_total_tax: Optional[float] = None):
+        self.metrics = SimulationMetrics(strategy=strategy, years_planned=years_planned)
+        self.min_years_funded = min_years_funded
+        self.max_total_tax = max_total_tax
+        self.pruned = False
+        self._last: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return self.metrics.years_simulated
+
+    def append(self, **values: Any) -> None:
+        m = self.metrics
+        m.add_year(values)
+        self._last = {name: values.get(name, 0.0) for name in _LAST_ROW_FIELDS}
+
+        if self.min_years_funded is not None:
+            remaining = m.years_planned - m.years_simulated
+            self.pruned = m.years_funded + remaining < self.min_years_funded
+        if self.max_total_tax is not None and m.total_tax > self.max_total_tax:
+            self.pruned = True
+
+
+    def last(self, name: str) -> Any:
+        return self._last[name]
+
+    def set_last(self, **values: Any) -> None:
+        self.metrics.set_final(**values)
+
+    def fill(self, **values: Any) -> None:
+        self.metrics.set_final(**values)
+
+    def to_metrics(self) -> SimulationMetrics:
+        self.metrics.pruned = self.pruned
+        return self.metrics
+
+
+# Fields SimulationAggregates.add_year reads
+_AGGREGATE_FIELDS = (
+    "year", "age_p1", "plan_success", "net_worth_end", "total_tax_after_split",
+    "cpp_p1", "cpp_p2", "oas_p1", "oas_p2", "gis_p1", "gis_p2", "oas_clawback_p1", "oas_clawback_p2",
+    "withdraw_rrif_p1", "withdraw_rrif_p2", "withdraw_nonreg_p1", "withdraw_nonreg_p2",
+    "withdraw_tfsa_p1", "withdraw_tfsa_p2", "withdraw_corp_p1", "withdraw_corp_p2",
+    "spend_target_after_tax", "spending_gap",
+    "end_rrif_p1", "end_rrif_p2", "end_tfsa_p1", "end_tfsa_p2",
+    "end_nonreg_p1", "end_nonreg_p2", "end_corp_p1", "end_corp_p2",
+)
+
+
+def _replay(aggregates: SimulationAggregates, columns: Dict[str, Any], n: int) -> None:
+    """Fold n stored rows into aggregates, in order, as add_year saw them during the run"""
+    names = list(columns)
+    values = [c.tolist() if isinstance(c, np.ndarray) else list(c) for c in columns.values()]
+    for row in zip(*values):
+        aggregates.add_year(dict(zip(names, row)))
+
+
+def frame_aggregates(df: pd.DataFrame) -> SimulationAggregates:
+    """
+    SimulationAggregates for a simulate() frame.
+
+    Returns the aggregates simulate() attached to the frame while it ran; a
+    frame without them (or one whose rows no longer match, e.g. a slice) is
+    replayed row by row the same way.
+    """
+    aggregates = df.attrs.get("aggregates")
+    n = len(df)
+    if isinstance(aggregates, SimulationAggregates) and aggregates.years_simulated == n:
+        if n == 0 or (aggregates.first_year == df["year"].iat[0] and aggregates.final_year == df["year"].iat[-1]):
+            return aggregates
+
+    aggregates = SimulationAggregates()
+    if n == 0 or "year" not in df.columns:
+        return aggregates
+    _replay(aggregates, {name: df[name].to_numpy() for name in _AGGREGATE_FIELDS if name in df.columns}, n)
+    final = {name: float(df[name].iat[-1]) for name in FINAL_FIELDS if name in df.columns}
+    aggregates.set_final(**final)
+    return aggregates
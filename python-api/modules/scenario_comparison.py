@@ -188,10 +188,14 @@ class ScenarioComparator:
     def _apply_adjustments_to_household(self, adjustments: Dict):
         """
         Create a modified household object with adjustments applied.
+
+        Only household-level fields change, and simulate() never modifies the
+        household it is given, so a shallow copy shares the Person specs.
         """
-        from copy import deepcopy
+        from copy import copy
+
+        hh_adjusted = copy(self.hh)
 
-        hh_adjusted = deepcopy(self.hh)
 
         # Adjust work years (end age)
         work_years_added = adjustments.get('work_years_added', 0)
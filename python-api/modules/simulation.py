@@ -9,21 +9,30 @@ Core Functions:
 - simulate() - Multi-year household simulation
 """
 
+from dataclasses import replace
 from typing import Dict, List, Tuple, Optional, Any
-import sys
 import pandas as pd
-from modules.models import Person, Household, TaxParams, YearResult
-from modules.config import get_tax_params, index_tax_params
-from modules.tax_engine import progressive_tax
-from modules.withdrawal_strategies import get_strategy, is_hybrid_strategy
+from modules.models import Person, Household, TaxParams, SimulationAggregates
+from modules.result_columns import YearResultColumns, MetricsAccumulator
+from modules.config import index_tax_params
+from modules.tax_schedule import get_compiled_schedule
+from modules.tax_engine import (
+    progressive_tax, compute_taxable_income, marginal_rate_breakpoints, tax_cache_scope,
+)
+from modules.withdrawal_strategies import StrategyPlan, get_strategy_plan
 from modules.tax_optimizer import TaxOptimizer
 from modules.estate_tax_calculator import EstateCalculator
-from modules.quebec.quebec_tax import QuebecTaxCalculator
+from modules.quebec.quebec_tax import get_compiled_quebec_tax
 from modules.quebec.qpp_calculator import QPPCalculator
 from modules.quebec.quebec_benefits import QuebecBenefitsCalculator
 from modules import real_estate
-from modules.gic_calculator import process_gic_maturity_events, get_gic_balance_locked
+from modules.gic_ladder import GICLadder
+from modules.income_schedule import IncomeSchedule
+from modules.custom_directives import CustomDirectives, no_withdrawals
 from modules.household_utils import is_couple, get_participants
+from modules.checkpoints import CheckpointedRun, YearCheckpoint, resume_point
+from modules.tax_schedule import config_version
+from modules import trace
 
 # Import strategy_insights at module level to avoid UnboundLocalError with sys
 try:
@@ -384,14 +393,15 @@ def corp_passive_income(person: Person) -> Dict[str, float]:
         nonelig_div_gen = invest_amount * yield_nonelig
         capg_gen = invest_amount * yield_capg
 
-        # DEBUG: Log first time we see huge numbers
-        if corp_total > 1e12:
-            print(f"DEBUG: HUGE corp balance detected: {corp_total:.0f}", file=sys.stderr)
-            print(f"  Buckets: cash={cash:.0f}, gic={gic:.0f}, invest={invest:.0f}", file=sys.stderr)
-            print(f"  Percentages: cash={cash_pct:.4f}, gic={gic_pct:.4f}, invest={invest_pct:.4f}", file=sys.stderr)
-            print(f"  Amounts: cash={cash_amount:.0f}, gic={gic_amount:.0f}, invest={invest_amount:.0f}", file=sys.stderr)
-            print(f"  Yields: int={yield_int:.4f}, elig={yield_elig:.4f}, nonelig={yield_nonelig:.4f}, capg={yield_capg:.4f}", file=sys.stderr)
-            print(f"  Generated: int={interest_gen:.0f}, elig={elig_div_gen:.0f}, nonelig={nonelig_div_gen:.0f}, capg={capg_gen:.0f}", file=sys.stderr)
+        # Flag implausibly large corporate balances
+        if trace.ACTIVE and corp_total > 1e12:
+            trace.emit("corp", "huge_balance",
+                       corp_total=corp_total, cash=cash, gic=gic, invest=invest,
+                       cash_pct=cash_pct, gic_pct=gic_pct, invest_pct=invest_pct,
+                       yield_int=yield_int, yield_elig=yield_elig,
+                       yield_nonelig=yield_nonelig, yield_capg=yield_capg,
+                       interest=interest_gen, elig_div=elig_div_gen,
+                       nonelig_div=nonelig_div_gen, capg=capg_gen)
 
     # RDTOH tracking: 15% of non-eligible dividends become RDTOH
     rdtoh_add = nonelig_div_gen * 0.15
@@ -503,7 +513,8 @@ def process_gic_maturity_events(
     Process GIC maturity events in the current year.
 
     Checks all GIC assets for maturity in the current year and processes them
-    according to their reinvestment strategy.
+    according to their reinvestment strategy. One-off form of GICLadder.mature();
+    simulate_year() keeps a GICLadder per person for the whole run instead.
 
     Args:
         gic_assets: List of GIC asset dictionaries
@@ -516,98 +527,10 @@ def process_gic_maturity_events(
           - 'reinvestment_instructions': List of dicts with 'action', 'amount', and optional 'new_gic'
           - 'total_interest_income': Total taxable interest from matured GICs
     """
-    from datetime import datetime
-    from dateutil.relativedelta import relativedelta
-
-    result = {
-        'locked_gics': [],
-        'reinvestment_instructions': [],
-        'total_interest_income': 0.0
-    }
-
-    if not gic_assets:
-        return result
-
-    for gic in gic_assets:
-        maturity_date = gic.get('gicMaturityDate')
-        if not maturity_date:
-            # No maturity date - keep as locked
-            result['locked_gics'].append(gic)
-            continue
-
-        # Extract year from maturity date (assuming ISO format YYYY-MM-DD or datetime object)
-        if isinstance(maturity_date, str):
-            maturity_year = int(maturity_date.split('-')[0])
-        else:
-            maturity_year = maturity_date.year
-
-        # Check if GIC matures this year
-        if maturity_year == current_year:
-            principal = gic.get('currentValue', 0.0)
-            annual_rate = gic.get('gicInterestRate', 0.0)
-            term_months = gic.get('gicTermMonths', 12)
-            compounding = gic.get('gicCompoundingFrequency', 'annually')
-            reinvest_strategy = gic.get('gicReinvestStrategy', 'cash-out')
-
-            # Calculate maturity value
-            maturity_value = calculate_gic_maturity_value(
-                principal,
-                annual_rate,
-                term_months,
-                compounding
-            )
-
-            interest_earned = maturity_value - principal
-            result['total_interest_income'] += interest_earned  # Taxable in maturity year
-
-            # Handle reinvestment strategy
-            if reinvest_strategy == 'cash-out':
-                # Transfer full maturity value to non-registered account
-                result['reinvestment_instructions'].append({
-                    'action': 'cash-out',
-                    'amount': maturity_value
-                })
-
-            elif reinvest_strategy == 'auto-renew':
-                # Renew GIC with same terms for another term
-                if isinstance(maturity_date, str):
-                    old_date = datetime.fromisoformat(maturity_date.split('T')[0])
-                else:
-                    old_date = maturity_date
-
-                new_maturity_date = old_date + relativedelta(months=term_months)
-
-                # Create new GIC
-                new_gic = {
-                    **gic,  # Copy all fields
-                    'gicMaturityDate': new_maturity_date.isoformat(),
-                    'currentValue': maturity_value  # Principal for next term
-                }
-
-                result['reinvestment_instructions'].append({
-                    'action': 'auto-renew',
-                    'amount': maturity_value,
-                    'new_gic': new_gic
-                })
-
-            elif reinvest_strategy == 'transfer-to-nonreg':
-                # Transfer to non-registered account
-                result['reinvestment_instructions'].append({
-                    'action': 'transfer-to-nonreg',
-                    'amount': maturity_value
-                })
-
-            elif reinvest_strategy == 'transfer-to-tfsa':
-                # Transfer to TFSA (if room available)
-                result['reinvestment_instructions'].append({
-                    'action': 'transfer-to-tfsa',
-                    'amount': maturity_value
-                })
-
-        else:
-            # GIC not yet matured - keep as locked
-            result['locked_gics'].append(gic)
-
+    ladder = GICLadder(gic_assets)
+    result = ladder.mature(current_year)
+    originals = {id(gic) for gic in gic_assets}
+    result['locked_gics'] = [gic for gic in ladder.holdings() if id(gic) in originals]
     return result
 
 
@@ -631,12 +554,11 @@ def cap_gain_ratio(nonreg_balance: float, nonreg_acb: float) -> float:
     return clamp(1.0 - (nonreg_acb / nonreg_balance), 0.0, 1.0)
 
 
-def tax_for_detailed(
+def _income_components(
     add_nonreg: float,
     add_rrif: float,
     add_corp_dividend: float,
     *,
-    # current person context / cashflow context
     nonreg_balance: float,
     nonreg_acb: float,
     corp_dividend_type: str,
@@ -647,24 +569,18 @@ def tax_for_detailed(
     withdrawals_rrif_base: float,
     cpp_income: float,
     oas_income: float,
-    age: int,
-    fed_params,
-    prov_params,
     rental_income: float = 0.0,
     downsizing_capital_gains: float = 0.0,
     pension_income_total: float = 0.0,
     other_income_total: float = 0.0,
-    province: str = "ON",
 ) -> tuple:
     """
-    Returns household tax components (federal + provincial) for this candidate incremental withdrawal mix.
+    Split a candidate withdrawal mix into the income buckets used by progressive_tax().
 
     Returns:
-        tuple: (total_tax, federal_tax, provincial_tax, federal_oas_clawback, provincial_oas_clawback)
-
-    This mirrors the call signature to progressive_tax(...) but returns detailed breakdown.
+        tuple: (ordinary_income, elig_dividends, nonelig_dividends,
+                cap_gains, pension_income, oas_received)
     """
-
     # capital gains realized when selling extra non-reg principal
     ratio_cg = cap_gain_ratio(nonreg_balance, nonreg_acb)
     cg_from_sale = add_nonreg * ratio_cg  # this is the *cash* capital gain portion
@@ -694,23 +610,77 @@ def tax_for_detailed(
 
     oas_received = float(oas_income)
 
+    return ordinary_income, elig_dividends, nonelig_dividends, cap_gains, pension_income, oas_received
+
+
+def tax_for_detailed(
+    add_nonreg: float,
+    add_rrif: float,
+    add_corp_dividend: float,
+    *,
+    # current person context / cashflow context
+    nonreg_balance: float,
+    nonreg_acb: float,
+    corp_dividend_type: str,
+    nr_interest: float,
+    nr_elig_div: float,
+    nr_nonelig_div: float,
+    nr_capg_dist: float,
+    withdrawals_rrif_base: float,
+    cpp_income: float,
+    oas_income: float,
+    age: int,
+    fed_params,
+    prov_params,
+    rental_income: float = 0.0,
+    downsizing_capital_gains: float = 0.0,
+    pension_income_total: float = 0.0,
+    other_income_total: float = 0.0,
+    province: str = "ON",
+) -> tuple:
+    """
+    Returns household tax components (federal + provincial) for this candidate incremental withdrawal mix.
+
+    Returns:
+        tuple: (total_tax, federal_tax, provincial_tax, federal_oas_clawback, provincial_oas_clawback)
+
+    This mirrors the call signature to progressive_tax(...) but returns detailed breakdown.
+    """
+
+    (ordinary_income, elig_dividends, nonelig_dividends,
+     cap_gains, pension_income, oas_received) = _income_components(
+        add_nonreg, add_rrif, add_corp_dividend,
+        nonreg_balance=nonreg_balance,
+        nonreg_acb=nonreg_acb,
+        corp_dividend_type=corp_dividend_type,
+        nr_interest=nr_interest,
+        nr_elig_div=nr_elig_div,
+        nr_nonelig_div=nr_nonelig_div,
+        nr_capg_dist=nr_capg_dist,
+        withdrawals_rrif_base=withdrawals_rrif_base,
+        cpp_income=cpp_income,
+        oas_income=oas_income,
+        rental_income=rental_income,
+        downsizing_capital_gains=downsizing_capital_gains,
+        pension_income_total=pension_income_total,
+        other_income_total=other_income_total,
+    )
+
     # Check if Quebec resident for special tax treatment
     if province == "QC":
         # Quebec has different tax calculation with federal abatement
-        quebec_calc = QuebecTaxCalculator()
+        quebec_tax = get_compiled_quebec_tax()
 
         # Calculate total taxable income for Quebec
         taxable_income = ordinary_income + pension_income + elig_dividends + nonelig_dividends + (cap_gains * 0.5)
 
-        # Calculate Quebec tax with federal abatement
-        quebec_result = quebec_calc.calculate_quebec_tax(
-            taxable_income=taxable_income,
-            age=age,
-            is_couple=False,  # Single person calculation
+        # Quebec tax after credits (single person calculation)
+        provincial_tax = quebec_tax.provincial_tax(
+            taxable_income,
+            age,
             pension_income=pension_income,
             eligible_dividends=elig_dividends,
             non_eligible_dividends=nonelig_dividends,
-            capital_gains=cap_gains
         )
 
         # Federal tax with Quebec abatement
@@ -727,11 +697,9 @@ def tax_for_detailed(
 
         # Apply Quebec abatement to federal tax
         federal_tax_before_abatement = float(res_f.get("tax", 0.0))
-        quebec_abatement = federal_tax_before_abatement * 0.165  # 16.5% abatement
+        quebec_abatement = federal_tax_before_abatement * quebec_tax.abatement_rate  # 16.5% abatement
         federal_tax = federal_tax_before_abatement - quebec_abatement
 
-        # Use Quebec provincial tax
-        provincial_tax = quebec_result.total_provincial_tax
 
         # OAS clawback (federal only, Quebec doesn't have provincial OAS clawback)
         fed_oas_clawback = float(res_f.get("oas_clawback", 0.0))
@@ -844,6 +812,140 @@ def tax_for(
     return total_tax
 
 
+# Size taxable withdrawals with the original 25-step bisection instead of the
+# closed-form gross-up solver. Kept for cross-checking the two approaches.
+GROSS_UP_USE_BISECTION = False
+
+# Maximum regula falsi refinements inside the bracketing segment
+_GROSS_UP_MAX_REFINE = 12
+
+
+def gross_up_breakpoints(
+    source: str,
+    available: float,
+    add_nonreg: float,
+    add_rrif: float,
+    add_corp_dividend: float,
+    *,
+    age: int,
+    fed_params,
+    prov_params,
+    **income_kwargs,
+) -> List[float]:
+    """
+    Withdrawal amounts from `source` at which the person's marginal tax rate changes.
+
+    Taxable income and pension income are linear in the extra withdrawal, so each
+    taxable-income breakpoint of the federal and provincial schedules (brackets,
+    age amount phase-out, OAS clawback) maps to a single withdrawal amount. The
+    pension credit cap is added for RRIF withdrawals.
+
+    Args:
+        source: "nonreg", "rrif" or "corp"
+        available: Upper bound on the extra withdrawal
+        add_nonreg, add_rrif, add_corp_dividend: Withdrawals already in the mix
+        age: Person's age in this tax year
+        fed_params, prov_params: Indexed tax parameters for the year
+        **income_kwargs: Remaining keyword arguments of _income_components()
+
+    Returns:
+        Sorted withdrawal amounts strictly between 0 and available
+    """
+    def components(x):
+        return _income_components(
+            add_nonreg + (x if source == "nonreg" else 0.0),
+            add_rrif + (x if source == "rrif" else 0.0),
+            add_corp_dividend + (x if source == "corp" else 0.0),
+            **income_kwargs,
+        )
+
+    c0 = components(0.0)
+    c1 = components(1.0)
+    oas_received = c0[5]
+    pension_slope = c1[4] - c0[4]
+
+    points = []
+    for params in (fed_params, prov_params):
+        ti0 = compute_taxable_income(params, *c0)
+        slope = compute_taxable_income(params, *c1) - ti0
+        if slope > 1e-12:
+            for level in marginal_rate_breakpoints(params, age, oas_received):
+                points.append((level - ti0) / slope)
+        if pension_slope > 1e-12:
+            points.append((params.pension_credit_amount - c0[4]) / pension_slope)
+
+    return sorted({x for x in points if 0.0 < x < available})
+
+
+def solve_gross_up(
+    tax_at,
+    available: float,
+    shortfall: float,
+    base_tax: float,
+    breakpoints: List[float],
+    tol: float = 0.01,
+) -> float:
+    """
+    Smallest withdrawal that nets `shortfall` after the tax it triggers.
+
+    Net cash g(x) = x - (tax_at(x) - base_tax) is piecewise linear with kinks at
+    `breakpoints`. The kinks are walked in order until the shortfall is covered,
+    then the root is read off the bracketing segment by linear interpolation.
+    Kinks not in the list (e.g. where credits stop covering gross tax) are
+    resolved with a few Illinois regula falsi steps inside the segment.
+
+    Args:
+        tax_at: Callable returning total tax for an extra withdrawal x
+        available: Upper bound on the withdrawal
+        shortfall: After-tax cash still needed
+        base_tax: Tax on the mix before this withdrawal
+        breakpoints: Sorted kinks of tax_at in (0, available)
+        tol: Acceptable after-tax overshoot (dollars)
+
+    Returns:
+        float: Withdrawal amount; `available` if even the full balance falls short
+    """
+    def net(x):
+        return x - (tax_at(x) - base_tax) - shortfall
+
+    lo, g_lo = 0.0, net(0.0)
+    if g_lo >= 0.0:
+        return 0.0
+
+    hi = g_hi = None
+    for x in list(breakpoints) + [available]:
+        g = net(x)
+        if g >= 0.0:
+            hi, g_hi = x, g
+            break
+        lo, g_lo = x, g
+    if hi is None:
+        return available
+
+    if g_hi <= tol:
+        return hi
+
+    side = 0
+    for _ in range(_GROSS_UP_MAX_REFINE):
+        if hi - lo <= tol:
+            break
+        x = lo + (hi - lo) * (-g_lo) / (g_hi - g_lo)
+        g = net(x)
+        if g >= 0.0:
+            if g <= tol:
+                return x
+            hi, g_hi = x, g
+            if side == 1:
+                g_lo /= 2.0
+            side = 1
+        else:
+            lo, g_lo = x, g
+            if side == -1:
+                g_hi /= 2.0
+            side = -1
+    return hi
+
+
 def calculate_gis(
     net_income: float,
     age: int,
@@ -924,422 +1026,324 @@ def calculate_gis(
         return max_benefit
 
 
-def calculate_gis_optimization_withdrawal(
-    person: Person,
-    after_tax_target: float,
-    age: int,
-    net_income_before_withdrawal: float,
-    gis_config: dict,
-    oas_amount: float,
-    is_couple: bool = False,
-    other_person_gis_income: float = 0.0,
-    account_balances: Dict[str, float] = None,
-    fed_params: TaxParams = None,
-    prov_params: TaxParams = None,
-    nr_interest: float = 0.0,
-    nr_elig_div: float = 0.0,
-    nr_nonelig_div: float = 0.0,
-    nr_capg_dist: float = 0.0,
-    cpp_income: float = 0.0,
-) -> Tuple[Dict[str, float], float, Dict[str, float]]:
+# Sources of GIS-Optimized withdrawals, in tie-break order: when two sources cost
+# the same this year, taxable money goes first and TFSA money is kept
+GIS_ALLOCATION_ORDER = ("rrif", "corp", "nonreg", "tfsa")
+
+# Sources counted dollar for dollar in the GIS income test (see gis_net_income in
+# simulate_year(); non-reg sales and TFSA withdrawals are not)
+GIS_INCOME_SOURCES = ("rrif", "corp")
+
+# Effective cost per TFSA dollar: TFSA room is worth keeping for later years
+TFSA_PREFERENCE_PENALTY = 0.10
+
+# Upper bound on the segments walked per allocation
+_GIS_MAX_SEGMENTS = 48
+
+
+def gis_breakpoints(gis_config: dict) -> List[float]:
     """
-    Calculate GIS-optimized withdrawals to meet after-tax target while minimizing
-    GIS clawback and total tax burden.
+    GIS incomes at which calculate_gis() changes slope for a single person.
 
-    This function models the trade-off between withdrawal sources and their
-    impact on net income, which determines GIS eligibility. It ranks withdrawal
-    sources by "effective cost" (tax + GIS benefit loss) and greedily selects
-    from lowest-cost sources first until the after-tax target is met.
+    The benefit is flat up to the threshold, falls at the clawback rate above
+    it and is zero once fully clawed back.
 
     Args:
-        person: Person object with account balances and tax info
-        after_tax_target: After-tax spending target in dollars
-        age: Person's age (for RRIF minimums and GIS eligibility)
-        net_income_before_withdrawal: Net income before any withdrawals
-        gis_config: GIS configuration (thresholds, rates, max benefits)
-        oas_amount: OAS benefit amount for the year
-        is_couple: Whether person is part of couple (for GIS couple thresholds)
-        other_person_gis_income: Spouse's income for couple GIS test
-        account_balances: Current account balances dict {"nonreg", "rrif", "tfsa", "corp"}
-        fed_params: Federal tax parameters (for marginal rate calculation)
-        prov_params: Provincial tax parameters (for marginal rate calculation)
-        nr_interest: Non-reg interest income (affects marginal rate calculation)
-        nr_elig_div: Non-reg eligible dividend income
-        nr_nonelig_div: Non-reg non-eligible dividend income
-        nr_capg_dist: Non-reg capital gains distribution
-        cpp_income: CPP income (affects marginal rate)
+        gis_config: GIS configuration (same keys and defaults as calculate_gis())
 
     Returns:
-        Tuple of:
-        - Dict with withdrawal amounts: {"nonreg": X, "corp": X, "tfsa": X, "rrif": X}
-        - Effective marginal rate: Weighted average tax rate after GIS impact
-        - Analysis dict with cost breakdown: {"source_costs": {...}, "gis_impact": {...}}
-
-    Algorithm:
-    1. Calculate baseline GIS benefit (before any withdrawal)
-    2. For each withdrawal source, calculate the "effective cost":
-       - Tax rate on that source (varies by income type)
-       - GIS benefit loss from added income
-       - Total: tax_rate + gis_clawback_rate_on_added_income
-    3. Sort sources by effective cost (lowest cost first)
-    4. Greedily select sources in cost order until target is met
-    5. Respect RRIF minimum requirement (must be met regardless of cost)
-    6. Prefer TFSA last (zero tax impact but counts toward GIS income)
+        [threshold, income where GIS reaches zero]
+    """
+    threshold = gis_config.get("threshold_single", 21768)
+    max_benefit = gis_config.get("max_benefit_single", 13265.16)
+    clawback_rate = gis_config.get("clawback_rate", 0.50)
+    if clawback_rate <= 0:
+        return [threshold]
+    return [threshold, threshold + max_benefit / clawback_rate]
+
+
+def _couple_gis_terms(oas: float, spouse_oas: float, gis_config: dict) -> Tuple[float, float, float]:
+    """(combined income threshold, max benefit per person, clawback per combined dollar per person)"""
+    clawback_rate = gis_config.get("clawback_rate", 0.50)
+    if oas > 0 and spouse_oas > 0:
+        # Both spouses have OAS: the clawback is split between them
+        return (gis_config.get("threshold_couple", 28752),  # 2026 threshold
+                gis_config.get("max_benefit_couple", 7956.00),  # 2026 max benefit
+                clawback_rate / 2.0)
+    return (gis_config.get("threshold_couple_one_oas", 52080),  # 2026 threshold
+            gis_config.get("max_benefit_couple", 7956.00),
+            clawback_rate)
+
+
+def couple_gis(gis_income: float, spouse_gis_income: float, oas: float, spouse_oas: float,
+               gis_config: dict) -> Tuple[float, float]:
+    """
+    GIS for each spouse of a couple, from their combined GIS income.
 
-    Example:
-        >>> balances = {"nonreg": 100000, "rrif": 150000, "tfsa": 50000, "corp": 50000}
-        >>> result = calculate_gis_optimization_withdrawal(
-        ...     person=person, after_tax_target=50000, age=70,
-        ...     net_income_before_withdrawal=20000, gis_config=gis_config,
-        ...     oas_amount=7000, account_balances=balances, ...
-        ... )
-        >>> # Result: Withdraws from lower-cost sources first (TFSA, NonReg)
-        >>> # before tapping higher-cost RRIF
+    Both spouses with OAS share the couple threshold and split the clawback;
+    when only one has OAS, that spouse is tested against the one-OAS
+    threshold and the other gets nothing.
+
+    Args:
+        gis_income: This person's GIS income (net income excluding OAS)
+        spouse_gis_income: The spouse's GIS income
+        oas: This person's OAS this year (GIS requires OAS)
+        spouse_oas: The spouse's OAS this year
+        gis_config: GIS configuration (threshold_couple, threshold_couple_one_oas,
+            max_benefit_couple, clawback_rate)
+
+    Returns:
+        (this person's GIS, the spouse's GIS)
     """
+    if oas <= 0 and spouse_oas <= 0:
+        return 0.0, 0.0
+    threshold, max_benefit, clawback = _couple_gis_terms(oas, spouse_oas, gis_config)
+    combined_gis_income = gis_income + spouse_gis_income
+    if combined_gis_income >= threshold:
+        benefit = max(0.0, max_benefit - (combined_gis_income - threshold) * clawback)
+    else:
+        benefit = max_benefit
+    return (benefit if oas > 0 else 0.0), (benefit if spouse_oas > 0 else 0.0)
 
-    if account_balances is None:
-        account_balances = {
-            "nonreg": max(0, getattr(person, "nonreg_balance", 0.0)),
-            "rrif": max(0, getattr(person, "rrif_balance", 0.0)),
-            "tfsa": max(0, getattr(person, "tfsa_balance", 0.0)),
-            "corp": max(0, getattr(person, "corporate_balance", 0.0)),
-        }
 
-    # Step 1: Calculate baseline GIS benefit and threshold
-    baseline_gis = calculate_gis(
-        net_income_before_withdrawal, age, gis_config,
-        oas_amount, is_couple, other_person_gis_income
-    )
+def couple_gis_breakpoints(spouse_gis_income: float, oas: float, spouse_oas: float,
+                           gis_config: dict) -> List[float]:
+    """
+    This person's GIS incomes at which the couple's total GIS (couple_gis())
+    changes slope, given the spouse's GIS income.
+    """
+    if oas <= 0 and spouse_oas <= 0:
+        return []
+    threshold, max_benefit, clawback = _couple_gis_terms(oas, spouse_oas, gis_config)
+    kinks = [threshold] if clawback <= 0 else [threshold, threshold + max_benefit / clawback]
+    return [k - spouse_gis_income for k in kinks]
 
-    # Determine GIS threshold for this person/couple
-    gis_threshold = gis_config.get("threshold_single", 22272)
-    if is_couple:
-        gis_threshold = gis_config.get("threshold_couple", 29424)
-
-    # Calculate "room" before hitting GIS threshold
-    # This is how much taxable income we can add before losing max GIS
-    gis_income_room = max(0.0, gis_threshold - net_income_before_withdrawal)
-
-    # Strategic GIS targeting: If we're eligible for significant GIS,
-    # prioritize staying below threshold to maximize benefits
-    # BUT: Never sacrifice retirement funding for GIS preservation
-    # First objective is ALWAYS to fund retirement, then optimize for GIS
-    preserve_gis = baseline_gis > 5000  # If getting >$5k GIS, prefer low-tax sources
-
-    # Step 2: Calculate effective cost per dollar for each source
-    withdrawal_costs = {}
-    cost_breakdown = {}
-
-    # Helper: Calculate marginal tax rate for a test income increase
-    def estimate_marginal_tax_rate_for_source(
-        source: str, test_income: float, person_obj: Person,
-        fed: TaxParams, prov: TaxParams
-    ) -> float:
-        """
-        Estimate marginal tax rate for a $1 withdrawal from specified source.
-        Uses simplified calculation based on source type.
-        """
-        if test_income <= 0:
-            return 0.0
-
-        # Different income types have different tax treatment
-        if source == "tfsa":
-            # TFSA: Zero tax on withdrawal
-            return 0.0
-        elif source == "nonreg":
-            # NonReg: Tax only on capital gains portion (50% inclusion rate)
-            # ACB ratio determines gain percentage
-            acb_ratio = person_obj.nonreg_acb / max(person_obj.nonreg_balance, 1.0)
-            gain_ratio = max(0.0, 1.0 - acb_ratio)
-            # Tax on capital gain: 50% inclusion × marginal rate
-            # Estimate marginal rate at ~40% for moderate income retiree
-            estimated_marginal = 0.40
-            return gain_ratio * 0.50 * estimated_marginal
-        elif source == "rrif":
-            # RRIF: 100% taxable as ordinary income
-            # Estimate marginal rate ~40-45% for moderate income retiree
-            return 0.42
-        elif source == "corp":
-            # Corp: Depends on dividend type (eligible/non-eligible)
-            div_type = getattr(person_obj, "corp_dividend_type", "non-eligible")
-            if div_type == "eligible":
-                # Eligible dividend: Lower tax due to dividend tax credit
-                return 0.30
-            else:
-                # Non-eligible: Higher tax
-                return 0.38
-        else:
-            return 0.0
-
-    # Calculate cost for each source
-    for source in ["tfsa", "nonreg", "corp", "rrif"]:
-        available = account_balances.get(source, 0.0)
-
-        if available <= 0:
-            withdrawal_costs[source] = float('inf')  # Mark as unavailable
-            cost_breakdown[source] = {
-                "marginal_tax_rate": 0.0,
-                "gis_clawback_rate": 0.0,
-                "total_effective_cost": float('inf'),
-                "available": 0.0
-            }
-            continue
 
-        # Estimate marginal tax rate for this source
-        marginal_tax_rate = estimate_marginal_tax_rate_for_source(
-            source, test_income=net_income_before_withdrawal + 1.0, person_obj=person,
-            fed=fed_params, prov=prov_params
-        )
+def allocate_gis_withdrawals(
+    shortfall: float,
+    available: Dict[str, float],
+    *,
+    tax_at,
+    base_tax: float,
+    tax_breakpoints,
+    gis_at,
+    gis_income: float,
+    gis_kinks: List[float] = (),
+    minimum: Optional[Dict[str, float]] = None,
+    tol: float = 0.01,
+) -> Tuple[Dict[str, float], float, Dict[str, Any]]:
+    """
+    Cheapest withdrawal mix that nets `shortfall` after tax, counting lost GIS as a cost.
 
-        # Calculate GIS benefit loss from withdrawing from this source
-        # Different sources add different amounts to taxable income:
-        # - TFSA: $0 (not income)
-        # - NonReg: Only capital gains (50% inclusion)
-        # - RRIF: 100% (fully taxable)
-        # - Corp: Dividend amount (varies by type)
-
-        # Calculate how much THIS source adds to taxable income per $1 withdrawn
-        if source == "tfsa":
-            # TFSA: No income addition
-            income_addition_per_dollar = 0.0
-        elif source == "nonreg":
-            # NonReg: Only the capital gains portion counts
-            acb_ratio = person.nonreg_acb / max(person.nonreg_balance, 1.0)
-            gain_ratio = max(0.0, 1.0 - acb_ratio)
-            # Capital gains have 50% inclusion rate
-            income_addition_per_dollar = gain_ratio * 0.50
-        elif source == "rrif":
-            # RRIF: 100% of withdrawal is income
-            income_addition_per_dollar = 1.0
-        elif source == "corp":
-            # Corp: Dividend amount (assume it equals the withdrawal)
-            income_addition_per_dollar = 1.0
-        else:
-            income_addition_per_dollar = 0.0
+    Used by the GIS-Optimized (minimize-income) strategy. Tax is piecewise
+    linear in each source between the kinks of the indexed tax schedule
+    (gross_up_breakpoints()), and the GIS lost is piecewise linear in GIS
+    income (gis_breakpoints()). The allocator walks these segments: each step
+    prices the next segment of every source as
 
-        # Test: What happens if we add the appropriate income amount?
-        test_net_income = net_income_before_withdrawal + income_addition_per_dollar
-        test_gis = calculate_gis(
-            test_net_income, age, gis_config, oas_amount, is_couple, other_person_gis_income
-        )
-        gis_loss_per_dollar = max(0.0, baseline_gis - test_gis)
-
-        # Total effective cost per dollar
-        # = tax paid + GIS benefit lost
-        # = marginal_tax_rate + gis_loss_per_dollar
-        total_cost = marginal_tax_rate + gis_loss_per_dollar
-
-        # TFSA preference: Add a penalty to defer TFSA withdrawal until necessary
-        # TFSA should be the last resort for spending, not the first choice
-        # Even though TFSA has 0% tax, it's valuable to preserve for future flexibility
-        if source == "tfsa":
-            # Add 10% effective cost penalty to TFSA to make it less attractive than NonReg/Corp
-            # This defers TFSA use until other sources are depleted
-            total_cost += 0.10
-
-        withdrawal_costs[source] = total_cost
-        cost_breakdown[source] = {
-            "marginal_tax_rate": marginal_tax_rate,
-            "gis_clawback_rate": gis_loss_per_dollar,
-            "tfsa_preference_penalty": 0.10 if source == "tfsa" else 0.0,
-            "total_effective_cost": total_cost,
-            "available": available
-        }
+        (extra tax + GIS lost + TFSA preference penalty) / after-tax cash raised
 
-    # Step 3: Sort sources by cost (lowest cost first)
-    sorted_sources = sorted(withdrawal_costs.items(), key=lambda x: x[1])
+    and extends the cheapest one. Once the segments that keep GIS are used
+    up the walk carries on into the ones that claw it back (TFSA first, as
+    it is not GIS income), until the shortfall is met or every source is
+    exhausted. The segment that covers the rest of the shortfall is solved
+    for the exact amount with solve_gross_up(), so the mix nets the
+    shortfall against the real tax function with no separate gross-up pass.
+    Equal costs are broken in GIS_ALLOCATION_ORDER.
 
-    # Step 4: Enforce RRIF minimum - must be met FIRST
-    rrif_min = rrif_minimum(account_balances.get("rrif", 0.0), age)
+    Args:
+        shortfall: After-tax cash to raise
+        available: Room left per source {"nonreg", "rrif", "tfsa", "corp"}
+        tax_at: Callable (nonreg, rrif, corp) -> total tax with these extra withdrawals
+        base_tax: tax_at(0, 0, 0)
+        tax_breakpoints: Callable (source, room, nonreg, rrif, corp) -> sorted extra
+            withdrawals from `source` in (0, room) where the marginal tax rate changes
+        gis_at: Callable GIS income -> GIS benefit (for a couple, the household's
+            GIS given the spouse's income, see couple_gis())
+        gis_income: GIS income before the extra withdrawals
+        gis_kinks: GIS incomes at which gis_at changes slope
+        minimum: Extra withdrawals taken before any pricing (e.g. the RRIF minimum)
+        tol: Acceptable after-tax shortfall (dollars)
 
-    # Step 5: Greedily select sources in cost order while respecting GIS thresholds
-    withdrawals = {"nonreg": 0.0, "rrif": 0.0, "tfsa": 0.0, "corp": 0.0}
-    remaining_needed = after_tax_target
-    total_tax = 0.0
-    gis_impact_details = {}
-    current_income_addition = 0.0  # Track how much income we've added
+    Returns:
+        Tuple of:
+        - Extra withdrawals {"nonreg", "rrif", "tfsa", "corp"}
+        - Total tax on the resulting mix
+        - Analysis: {"raised", "unmet", "gis_before", "gis_after", "gis_loss",
+          "segments": [(source, amount, cost per after-tax dollar), ...]}
 
-    # FIRST PASS: Enforce RRIF minimum (mandatory by law, non-negotiable)
-    if rrif_min > 0.001 and account_balances.get("rrif", 0.0) >= rrif_min:
-        withdrawals["rrif"] = rrif_min
-        rrif_after_tax_value = rrif_min * (1.0 - withdrawal_costs.get("rrif", 0.50))
-        remaining_needed -= rrif_after_tax_value
-        current_income_addition += rrif_min  # RRIF is 100% taxable income
-
-    # SECOND PASS: Prioritize TFSA if we're trying to preserve GIS
-    # TFSA doesn't add to taxable income, so it's ideal for staying below threshold
-    if preserve_gis and remaining_needed > 0 and account_balances.get("tfsa", 0) > 0:
-        tfsa_available = account_balances.get("tfsa", 0.0)
-        # Use TFSA FIRST to meet needs without triggering GIS clawback
-        tfsa_to_use = min(tfsa_available, remaining_needed * 1.05)  # Account for minimal tax
-        if tfsa_to_use > 0:
-            withdrawals["tfsa"] = tfsa_to_use
-            remaining_needed -= tfsa_to_use  # TFSA is tax-free
-            # Note: TFSA does NOT add to current_income_addition (it's not taxable)
-
-    # THIRD PASS: Greedy withdrawal from remaining sources, respecting GIS threshold
-    for source, cost_per_dollar in sorted_sources:
-        if remaining_needed <= 0.001 or cost_per_dollar == float('inf'):
+    Examples:
+        >>> extra, tax, analysis = allocate_gis_withdrawals(
+        ...     10000, {"rrif": 50000, "tfsa": 20000}, tax_at=..., base_tax=0.0,
+        ...     tax_breakpoints=..., gis_at=..., gis_income=18000,
+        ...     gis_kinks=gis_breakpoints(gis_config))
+        >>> # RRIF up to the GIS threshold (no tax, no GIS lost), then TFSA
+    """
+    extra = {source: 0.0 for source in GIS_ALLOCATION_ORDER}
+    for source, amount in (minimum or {}).items():
+        extra[source] = clamp(amount, 0.0, max(available.get(source, 0.0), 0.0))
+
+    def taxable_mix(source="", amount=0.0):
+        # (nonreg, rrif, corp) extra withdrawals, optionally with `amount` more from `source`
+        return (extra["nonreg"] + (amount if source == "nonreg" else 0.0),
+                extra["rrif"] + (amount if source == "rrif" else 0.0),
+                extra["corp"] + (amount if source == "corp" else 0.0))
+
+    def raised(tax: float) -> float:
+        return sum(extra.values()) - (tax - base_tax)
+
+    tax = tax_at(*taxable_mix()) if extra["rrif"] or extra["corp"] or extra["nonreg"] else base_tax
+    gis_before = gis_at(gis_income)
+    segments = []
+
+    def cheapest_segment():
+        # Price the next linear segment of each source: (source, cost, length, tax, net)
+        best = None
+        for source in GIS_ALLOCATION_ORDER:
+            room = available.get(source, 0.0) - extra[source]
+            if room <= tol:
+                continue
+            if source == "tfsa":
+                length, seg_tax, gis_lost = room, tax, 0.0
+            else:
+                kinks = tax_breakpoints(source, room, *taxable_mix())
+                length = kinks[0] if kinks else room
+                gis_lost = 0.0
+                if source in GIS_INCOME_SOURCES:
+                    income = gis_income + extra["rrif"] + extra["corp"]
+                    length = min([length] + [k - income for k in gis_kinks if k - income > tol])
+                    gis_lost = gis_at(income) - gis_at(income + length)
+                seg_tax = tax_at(*taxable_mix(source, length))
+            net = length - (seg_tax - tax)
+            if net <= tol:
+                continue
+            penalty = TFSA_PREFERENCE_PENALTY * length if source == "tfsa" else 0.0
+            cost = (seg_tax - tax + gis_lost + penalty) / net
+            if best is None or cost < best[1] - 1e-9:
+                best = (source, cost, length, seg_tax, net)
+                if cost <= 1e-9:
+                    break  # Free money: later sources can at best tie
+        return best
+
+    for _ in range(_GIS_MAX_SEGMENTS):
+        need = shortfall - raised(tax)
+        if need <= tol:
             break
 
-        # Skip TFSA if we already used it in SECOND PASS
-        if source == "tfsa" and withdrawals["tfsa"] > 0:
-            continue
+        best = cheapest_segment()
+        if best is None:
+            break  # Every source is exhausted
+        source, cost, length, seg_tax, net = best
 
-        # Skip RRIF if we already met the minimum
-        if source == "rrif" and withdrawals["rrif"] >= rrif_min:
-            # Only tap RRIF for additional funds beyond minimum if needed
-            available = max(0.0, account_balances.get("rrif", 0.0) - withdrawals["rrif"])
-        else:
-            available = account_balances.get(source, 0.0) - withdrawals.get(source, 0.0)
+        if net > need:
+            # Last segment: smallest amount that nets what is still needed
+            if source == "tfsa":
+                length = need
+            else:
+                known = {0.0: tax, length: seg_tax}
 
-        if available <= 0.001:
-            continue
+                def tax_along(x):
+                    if x not in known:
+                        known[x] = tax_at(*taxable_mix(source, x))
+                    return known[x]
 
-        # Estimate how much we need from this source
-        # accounting for tax impact
-        cost = withdrawal_costs.get(source, 1.0)
+                length = solve_gross_up(tax_along, length, need, tax, [], tol)
+                seg_tax = tax_along(length)
 
-        # Handle edge case where cost is >= 1.0 (negative net after-tax)
-        if cost >= 1.0:
-            # This source produces net loss; skip it if we have alternatives
-            if remaining_needed <= 0:
-                continue
-            # If we absolutely need funds, take what we can
-            withdraw_amount = min(available, remaining_needed)
-        else:
-            # Normal case: withdrawal amount scaled for tax/GIS impact
-            withdraw_amount = min(available, remaining_needed / (1.0 - cost))
+        extra[source] += length
+        tax = seg_tax
+        segments.append((source, length, cost))
 
-        # GIS THRESHOLD GUIDANCE: Track income impact but NEVER limit withdrawals
-        # if it means underfunding retirement. First objective is to FUND RETIREMENT.
-        # GIS optimization is SECONDARY and only used for choosing between sources.
-        #
-        # The old logic would REFUSE to withdraw enough money if it exceeded GIS threshold,
-        # leaving retirement underfunded. This violated the fundamental principle:
-        # "the first objective is to fund retirement" - user feedback 2026-01-25
-        #
-        # New logic: Just track the GIS impact for reporting, but always meet spending needs
-        if preserve_gis and source != "tfsa":  # TFSA doesn't count toward income
-            # Calculate how much income this withdrawal would add (for tracking only)
-            if source == "nonreg":
-                acb_ratio = person.nonreg_acb / max(person.nonreg_balance, 1.0)
-                gain_ratio = max(0.0, 1.0 - acb_ratio)
-                income_per_dollar = gain_ratio * 0.50  # Capital gains: 50% inclusion
-            elif source == "rrif":
-                income_per_dollar = 1.0  # 100% taxable
-            elif source == "corp":
-                income_per_dollar = 1.0  # Dividend income
-            else:
-                income_per_dollar = 0.0
+    gis_after = gis_at(gis_income + extra["rrif"] + extra["corp"])
+    unmet = shortfall - raised(tax)
+    analysis = {
+        "raised": raised(tax),
+        "unmet": unmet if unmet > tol else 0.0,
+        "gis_before": gis_before,
+        "gis_after": gis_after,
+        "gis_loss": max(0.0, gis_before - gis_after),
+        "segments": segments,
+    }
+    return extra, tax, analysis
 
-            # Track income addition for reporting/analysis purposes
-            income_this_would_add = withdraw_amount * income_per_dollar
-            remaining_gis_room = max(0.0, gis_income_room - current_income_addition)
 
-            # NOTE: We do NOT limit withdraw_amount here anymore
-            # The withdrawal order is already optimized (TFSA first when preserve_gis=True)
-            # to minimize GIS impact. But we will NEVER refuse to withdraw if needed
-            # to meet the spending target, even if it costs GIS benefits.
-            # Funding retirement comes FIRST, GIS optimization comes SECOND.
+def estimated_gis_withdrawals(
+    person: Person,
+    shortfall: float,
+    age: int,
+    net_income: float,
+    gis_config: dict,
+    oas: float,
+    balances: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    GIS-Optimized withdrawals in the order used before allocate_gis_withdrawals().
 
-        if withdraw_amount < 0.01:
-            continue
+    Each source is priced once, at an estimated marginal tax rate (RRIF 42%,
+    corporate dividends 30% eligible / 38% non-eligible, 40% on the taxable
+    half of a non-reg gain) plus the GIS lost on its first dollar, plus
+    TFSA_PREFERENCE_PENALTY for TFSA money. After the RRIF minimum, TFSA money
+    goes first while GIS is over $5,000, then the other sources cheapest
+    first, each grossed up by its estimated cost.
 
-        withdrawals[source] += withdraw_amount
-
-        # Track income addition for GIS threshold management
-        if source == "nonreg":
-            acb_ratio = person.nonreg_acb / max(person.nonreg_balance, 1.0)
-            gain_ratio = max(0.0, 1.0 - acb_ratio)
-            current_income_addition += withdraw_amount * gain_ratio * 0.50
-        elif source == "rrif":
-            current_income_addition += withdraw_amount
-        elif source == "corp":
-            current_income_addition += withdraw_amount
-        # TFSA does not add to income
-
-        # Update remaining needed after-tax amount
-        # After-tax impact = withdrawal - (tax + GIS loss)
-        estimated_after_tax_received = withdraw_amount * (1.0 - cost)
-        remaining_needed -= estimated_after_tax_received
-
-        # Track cost details
-        if source not in gis_impact_details:
-            gis_impact_details[source] = {
-                "withdrawn": 0.0,
-                "tax_cost": 0.0,
-                "gis_loss": 0.0
-            }
+    Kept as the fallback plan (StrategyPlan.gis_walk=False): the segment walk
+    prices one year at a time, and this cruder order can leave later years
+    better funded. simulate() runs a GIS-Optimized plan this way as well when
+    the walk leaves years unfunded.
 
-        est_tax_cost = withdraw_amount * cost_breakdown[source]["marginal_tax_rate"]
-        est_gis_loss = withdraw_amount * cost_breakdown[source]["gis_clawback_rate"]
-
-        gis_impact_details[source]["withdrawn"] += withdraw_amount
-        gis_impact_details[source]["tax_cost"] += est_tax_cost
-        gis_impact_details[source]["gis_loss"] += est_gis_loss
-
-    # Step 6: Calculate final GIS benefit after all withdrawals
-    # CRITICAL: Only certain withdrawals add to taxable income (GIS income test)
-    # - TFSA: Does NOT add to income (tax-free)
-    # - NonReg: Only capital gains portion adds (at 50% inclusion rate)
-    # - RRIF: 100% adds to income
-    # - Corp: Dividend amount adds to income
-
-    # Calculate the income addition from each source
-    income_from_nonreg = 0.0
-    if withdrawals["nonreg"] > 0:
-        acb_ratio = person.nonreg_acb / max(person.nonreg_balance, 1.0)
-        gain_ratio = max(0.0, 1.0 - acb_ratio)
-        # Capital gains: 50% inclusion rate
-        income_from_nonreg = withdrawals["nonreg"] * gain_ratio * 0.50
-
-    income_from_rrif = withdrawals["rrif"]  # 100% taxable
-    income_from_corp = withdrawals["corp"]  # Dividend income (100% of amount)
-    income_from_tfsa = 0.0  # TFSA does NOT count as income
-
-    # Total taxable income addition
-    total_income_addition = income_from_nonreg + income_from_rrif + income_from_corp + income_from_tfsa
-
-    final_net_income = net_income_before_withdrawal + total_income_addition
-    final_gis = calculate_gis(
-        final_net_income, age, gis_config, oas_amount, is_couple, other_person_gis_income
-    )
-    gis_benefit_loss = max(0.0, baseline_gis - final_gis)
+    Args:
+        person: Person drawing (for the non-reg ACB and corporate dividend type)
+        shortfall: After-tax cash to raise
+        age: Person's age
+        net_income: Income for the GIS test before these withdrawals
+        gis_config: GIS configuration (see calculate_gis())
+        oas: OAS this year (GIS requires OAS)
+        balances: Balances {"nonreg", "rrif", "tfsa", "corp"}
 
-    # Create analysis result
-    analysis = {
-        "source_costs": cost_breakdown,
-        "gis_impact": {
-            "baseline_gis": baseline_gis,
-            "final_gis": final_gis,
-            "gis_loss": gis_benefit_loss,
-            "net_income_before": net_income_before_withdrawal,
-            "net_income_after": final_net_income,
-            "gis_threshold": gis_threshold,
-            "gis_income_room": gis_income_room,
-            "income_added": current_income_addition,
-            "stayed_below_threshold": final_net_income < gis_threshold,
-            "preserve_gis_mode": preserve_gis,
-        },
-        "withdrawal_details": gis_impact_details,
-    }
+    Returns:
+        Withdrawals {"nonreg", "rrif", "tfsa", "corp"}, including the RRIF minimum
+    """
+    gis_before = calculate_gis(net_income, age, gis_config, oas)
+    gain_ratio = max(0.0, 1.0 - person.nonreg_acb / max(person.nonreg_balance, 1.0))
+    corp_rate = 0.30 if getattr(person, "corp_dividend_type", "non-eligible") == "eligible" else 0.38
+
+    # (estimated marginal tax rate, GIS income per dollar) by source, in tie-break order
+    rates = {"tfsa": (0.0, 0.0), "nonreg": (gain_ratio * 0.50 * 0.40, gain_ratio * 0.50),
+             "corp": (corp_rate, 1.0), "rrif": (0.42, 1.0)}
+    costs = {}
+    for source, (tax_rate, income_rate) in rates.items():
+        if balances.get(source, 0.0) > 0:
+            gis_lost = max(0.0, gis_before - calculate_gis(net_income + income_rate, age, gis_config, oas))
+            costs[source] = tax_rate + gis_lost + (TFSA_PREFERENCE_PENALTY if source == "tfsa" else 0.0)
 
-    # Calculate effective marginal rate (weighted by amount withdrawn from each source)
-    total_withdrawal = sum(withdrawals.values())
-    if total_withdrawal > 0.001:
-        weighted_cost = 0.0
-        for s in ["nonreg", "rrif", "tfsa", "corp"]:
-            if s in withdrawals and withdrawals[s] > 0.001:
-                cost = withdrawal_costs.get(s, 0.0)
-                # Skip infinite costs in weighted average
-                if cost != float('inf') and not (cost != cost):  # Check for NaN
-                    weighted_cost += withdrawals[s] * cost
-        effective_rate = min(1.0, max(0.0, weighted_cost / total_withdrawal))
-    else:
-        effective_rate = 0.0
+    withdrawals = {"nonreg": 0.0, "rrif": 0.0, "tfsa": 0.0, "corp": 0.0}
+    need = shortfall
 
-    return withdrawals, effective_rate, analysis
+    # RRIF minimum first (mandatory)
+    rrif_min = rrif_minimum(balances.get("rrif", 0.0), age)
+    if rrif_min > 0.001 and balances.get("rrif", 0.0) >= rrif_min:
+        withdrawals["rrif"] = rrif_min
+        need -= rrif_min * (1.0 - costs["rrif"])
+
+    # TFSA money is not GIS income: use it first while GIS is worth keeping
+    if gis_before > 5000 and need > 0 and balances.get("tfsa", 0.0) > 0:
+        withdrawals["tfsa"] = min(balances["tfsa"], need * 1.05)
+        need -= withdrawals["tfsa"]
+
+    for source in sorted(costs, key=costs.get):
+        if need <= 0.001:
+            break
+        room = balances[source] - withdrawals[source]
+        if (source == "tfsa" and withdrawals["tfsa"] > 0) or room <= 0.001:
+            continue
+        cost = costs[source]
+        amount = min(room, need if cost >= 1.0 else need / (1.0 - cost))
+        if amount < 0.01:
+            continue
+        withdrawals[source] += amount
+        need -= amount * (1.0 - cost)
+
+    return withdrawals
 
 
 def recompute_tax(age, rrif_amt, add_rrif_delta, taxd, person, wself, fed_params, prov_params, info_dict=None) -> tuple[float, float, float, float, float]:
@@ -1408,53 +1412,25 @@ def recompute_tax(age, rrif_amt, add_rrif_delta, taxd, person, wself, fed_params
     return total, fed_tax, prov_tax, bpa_credit_combined, age_credit_combined
 
 
-def _get_strategy_order(strategy_name: str) -> List[str]:
-    """
-    Get the withdrawal order for a given strategy name.
-
-    Used as a fallback when TaxOptimizer is disabled or fails.
-    """
-    if strategy_name == "NonReg->RRIF->Corp->TFSA":
-        return ["nonreg", "rrif", "corp", "tfsa"]
-    elif strategy_name == "RRIF->Corp->NonReg->TFSA":
-        return ["rrif", "corp", "nonreg", "tfsa"]
-    elif strategy_name.startswith("Hybrid"):
-        return ["nonreg", "corp", "tfsa"]  # already added RRIF top-up
-    elif strategy_name == "Corp->RRIF->NonReg->TFSA":
-        return ["corp", "rrif", "nonreg", "tfsa"]
-    elif "rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name:
-        # RRIF-Frontload: Tax optimization strategy with strategic gap-filling
-        # RRIF is pre-withdrawn at FIXED frontload amount (15% before OAS, 8% after)
-        # IMPORTANT: "rrif" is NOT in the order - no additional RRIF beyond frontload
-        # Gap-filling order: Corp (tax credits) → NonReg (capital gains) → TFSA (preserve)
-        # This maintains RRIF tax optimization while ensuring retirement can be funded
-        return ["corp", "nonreg", "tfsa"]  # Note: No "rrif" - frontload is fixed
-    elif "Balanced" in strategy_name or "tax efficiency" in strategy_name.lower():
-        # For balanced strategy: prioritize Corp (tax-credited), then RRIF (100% taxable at death - deplete early!),
-        # then NonReg (ACB-protected), then TFSA (preserve for last)
-        # RRIF is placed SECOND (after Corp) because it's 100% fully taxable when inherited at death.
-        # Better to deplete RRIF during life than leave it for death tax shock.
-        # NonReg is placed THIRD because ACB protection means most of it is not taxable.
-        return ["corp", "rrif", "nonreg", "tfsa"]  # RRIF second (after Corp), before NonReg, TFSA last
-    elif "corporate-optimized" in strategy_name.lower() or "Corporate Optimized" in strategy_name:
-        # Corporate-Optimized: Prioritize corporate withdrawals (eligible dividends get tax credits)
-        # Then RRIF (fully taxable, deplete early), then NonReg (capital gains), then TFSA (preserve)
-        return ["corp", "rrif", "nonreg", "tfsa"]
-    else:
-        return ["nonreg", "rrif", "corp", "tfsa"]
-
-
 def simulate_year(person: Person, age: int, after_tax_target: float,
                   fed: TaxParams, prov: TaxParams,
                   rrsp_to_rrif: bool, custom_withdraws: Dict[str, float],
                   strategy_name: str, hybrid_topup_amt: float, hh: Household, year: int = None,
                   tfsa_room: float = 0.0, tax_optimizer: "TaxOptimizer" = None,
-                  pension_income: float = 0.0, other_income: float = 0.0) -> Tuple[Dict[str, float], Dict[str, float],Dict[str, float]]:
-                  
-    
+                  pension_income: float = 0.0, other_income: float = 0.0,
+                  income: Optional[IncomeSchedule] = None,
+                  plan: Optional[StrategyPlan] = None,
+                  spouse_gis: Optional[Tuple[float, float]] = None) -> Tuple[Dict[str, float], Dict[str, float],Dict[str, float]]:
+
     """
       One year for a single person. Decides withdrawals to hit an after-tax target, 
       computes taxes, updates ACB impacts, and reports baseline distributions. 
+      CPP/OAS, pensions and other income come from `income`, the person's
+      IncomeSchedule for the run (compiled here if not given). Strategy
+      behaviour comes from `plan` (get_strategy_plan(strategy_name) if not given).
+
+      GIS-Optimized only: `spouse_gis` is the spouse's (GIS income, OAS) for a
+      couple, so lost GIS is priced on combined income.
     
     Returns:
         - withdrawals: Dict with keys ("nonreg", "rrif", "tfsa", "corp")
@@ -1462,6 +1438,9 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         - info: Dict with realized capital gains, corp refund, distributions and corporate passive components
     """
 
+    if plan is None:
+        plan = get_strategy_plan(strategy_name)
+
     # --- safety inits so we never hit UnboundLocalError ---
     tfsa_withdraw: float = 0.0
     realized_cg: float = 0.0
@@ -1492,14 +1471,14 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     years_since_start = max(0, (year if year is not None else hh.start_year) - hh.start_year)
     current_year = (year if year is not None else hh.start_year)
 
-    # Process GIC maturity events at start of year
-    gic_assets = getattr(person, 'gic_assets', [])
-    if gic_assets:
-        gic_result = process_gic_maturity_events(
-            gic_assets=gic_assets,
-            current_year=current_year,
-            simulation_age=age
-        )
+    # Process GIC maturity events at start of year. The person's GICs are
+    # compiled into a ladder on first use; each year only touches the GICs
+    # maturing that year.
+    gic_ladder = getattr(person, 'gic_ladder', None)
+    if gic_ladder is None and getattr(person, 'gic_assets', None):
+        gic_ladder = person.gic_ladder = GICLadder(person.gic_assets)
+    if gic_ladder is not None:
+        gic_result = gic_ladder.mature(current_year)
 
         # Handle matured GIC funds according to reinvestment strategy
         for instruction in gic_result["reinvestment_instructions"]:
@@ -1528,145 +1507,36 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
                 person.nonreg_balance += amount
 
             elif action == "auto-renew":
-                # New GIC already added to gic_assets list in the instruction
+                # New GIC already put back on the ladder for its next term
                 pass
 
-        # Update person's GIC assets list (remove matured, keep locked)
-        person.gic_assets = gic_result["locked_gics"] + [
-            instr.get("new_gic")
-            for instr in gic_result["reinvestment_instructions"]
-            if instr.get("new_gic") is not None
-        ]
-
-    # Determine if Quebec resident for QPP vs CPP
-    is_quebec = hh.province == "QC"
-
-    cpp = 0.0
-    if age >= person.cpp_start_age:
-        cpp_uncapped = person.cpp_annual_at_start * ((1 + hh.general_inflation) ** years_since_start)
-
-        # Cap at legislated maximum
-        # 2025 QPP/CPP maximum: $17,196 annually (same for both), indexed at 2% per year
-        # QPP has higher contribution rate but same max benefit
-        pension_max_2025 = 17196.0
-        pension_indexing_rate = 0.02
-        years_since_2025 = years_since_start  # Assumes simulation starts in 2025
-        pension_max_current_year = pension_max_2025 * ((1 + pension_indexing_rate) ** years_since_2025)
-
-        cpp = min(cpp_uncapped, pension_max_current_year)
-
-    # DEBUG: Log if CPP is unexpectedly 0 (only if person should be eligible)
-    if person.cpp_annual_at_start > 0 and cpp == 0 and age >= person.cpp_start_age:
-        print(f"DEBUG simulate_year(): {person.name} CPP unexpectedly 0! "
-              f"cpp_annual_at_start={person.cpp_annual_at_start}, cpp_start_age={person.cpp_start_age}, age={age}")
-
-    oas = 0.0
-    if age >= person.oas_start_age:
-        oas_uncapped = person.oas_annual_at_start * ((1 + hh.general_inflation) ** years_since_start)
-
-        # Cap OAS at legislated maximum (US-082)
-        # 2025 OAS maximum: $8,988 annually, indexed at 2% per year
-        oas_max_2025 = 8988.0
-        oas_indexing_rate = 0.02
-        years_since_2025 = years_since_start  # Assumes simulation starts in 2025
-        oas_max_current_year = oas_max_2025 * ((1 + oas_indexing_rate) ** years_since_2025)
-
-        oas = min(oas_uncapped, oas_max_current_year)
-
-    # Add QPP supplement for low-income Quebec residents if applicable
-    # This must be done AFTER OAS is calculated since it depends on total income
-    if is_quebec and cpp > 0 and age >= person.cpp_start_age:
-        # Simple QPP supplement calculation (more detailed in quebec module)
-        # Maximum $600/year for very low income
-        # FIX: Only include oas if it's defined (person has reached OAS age)
-        total_income_estimate = cpp + (oas if age >= person.oas_start_age else 0)  # Simple estimate
-        if total_income_estimate < 21768:  # 2025 threshold
-            supplement_rate = max(0, 1 - (total_income_estimate / 21768))
-            qpp_supplement = 600 * supplement_rate * ((1 + hh.general_inflation) ** years_since_start)
-            cpp += qpp_supplement
+    # CPP/QPP (with any QPP supplement), OAS, pensions and other income for this year
+    if income is None:
+        income = IncomeSchedule(person, hh, years_since_start + 1)
+    cpp = float(income.cpp[years_since_start])
+    oas = float(income.oas[years_since_start])
+
+    # Flag if CPP is unexpectedly 0 (only if person should be eligible)
+    if trace.ACTIVE and person.cpp_annual_at_start > 0 and cpp == 0 and age >= person.cpp_start_age:
+        trace.emit("pension", "cpp_unexpectedly_zero", person=person.name, age=age,
+                   cpp_annual_at_start=person.cpp_annual_at_start, cpp_start_age=person.cpp_start_age)
 
     # Get rental income from real estate properties
     rental_income = real_estate.get_rental_income(person)
 
-    # Process pension incomes (check startAge)
-    pension_income_total = 0.0
-    pension_incomes = getattr(person, 'pension_incomes', [])
-
-    # DEBUG: Check if pension_incomes is reaching simulation
-    if not pension_incomes:
-        print(f"DEBUG: No pension_incomes found for {person.name} at age {age}")
-
-    # DEBUG: Log pension data
-    if pension_incomes:
-        print(f"DEBUG: Found {len(pension_incomes)} pension(s) for {person.name}")
-        for pension in pension_incomes:
-            print(f"  - Pension: {pension}")
-    for pension in pension_incomes:
-        pension_start_age = pension.get('startAge', 65)
-        pension_end_age = pension.get('endAge')  # Optional end age
-
-        # Check if pension is active based on age range
-        is_active = age >= pension_start_age
-        if pension_end_age is not None and age >= pension_end_age:
-            is_active = False
-
-        if is_active:
-            # Pension has started and is still active
-            annual_amount = pension.get('amount', 0.0)
-            is_indexed = pension.get('inflationIndexed', True)
-            print(f"  DEBUG: Pension active - amount=${annual_amount}, inflationIndexed={is_indexed}, age range={pension_start_age}-{pension_end_age or 'no end'}")
-
-            # Apply inflation indexing if enabled
-            if is_indexed:
-                years_since_pension_start = age - pension_start_age
-                annual_amount *= ((1 + hh.general_inflation) ** years_since_pension_start)
-                print(f"  DEBUG: After inflation adjustment (years={years_since_pension_start}): ${annual_amount}")
-            else:
-                print(f"  DEBUG: Pension not indexed - keeping flat amount=${annual_amount}")
-
-            pension_income_total += annual_amount
-            print(f"  DEBUG: Total pension income so far: ${pension_income_total}")
-
-    # Process other income sources (employment, business, rental from Income table, investment, other)
-    other_income_total = 0.0
-    other_incomes = getattr(person, 'other_incomes', [])
-    for income_item in other_incomes:  # Changed to avoid shadowing the function parameter
-        income_type = income_item.get('type', '')
-        income_start_age = income_item.get('startAge')
-        income_end_age = income_item.get('endAge')
-
-        # Special handling for employment income: defaults to current age → retirement age
-        if income_type == 'employment':
-            if income_start_age is None:
-                income_start_age = person.start_age  # Default to person's starting age
-            if income_end_age is None:
-                # Default to CPP start age as proxy for retirement age
-                income_end_age = person.cpp_start_age
-
-        # Check if income is active this year
-        is_active = True
-
-        # Check start age: income hasn't started yet
-        if income_start_age is not None and age < income_start_age:
-            is_active = False
-
-        # Check end age: income has already ended
-        if income_end_age is not None and age >= income_end_age:
-            is_active = False
-
-        if is_active:
-            annual_amount = income_item.get('amount', 0.0)
-
-            # Apply inflation indexing if enabled
-            if income_item.get('inflationIndexed', True):
-                if income_start_age:
-                    years_since_start = age - income_start_age
-                    annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
-                else:
-                    # No start age - use years since simulation start
-                    annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
+    pension_income_total = float(income.pension[years_since_start])
+    if trace.ACTIVE:
+        running_total = 0.0
+        for pension, active, amounts in income.pension_streams:
+            if active[years_since_start]:
+                running_total += amounts[years_since_start]
+                trace.emit("pension", "pension_active", person=person.name, age=age,
+                           base_amount=pension.get('amount', 0.0), amount=float(amounts[years_since_start]),
+                           indexed=pension.get('inflationIndexed', True), start_age=pension.get('startAge', 65),
+                           end_age=pension.get('endAge'), total=float(running_total))
 
-            other_income_total += annual_amount
+    # Other income sources (employment, business, rental from Income table, investment, other)
+    other_income_total = float(income.other[years_since_start])
 
     # Add rental income from real estate properties (retrieved earlier)
     other_income_total += rental_income
@@ -1696,7 +1566,7 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     nr_capg_dist    = nr_dist["capg_dist"]
 
     # --- Add GIC interest income to non-registered interest ---
-    if gic_assets:
+    if gic_ladder is not None:
         gic_interest_income = gic_result.get('total_interest_income', 0.0)
         nr_interest += gic_interest_income
 
@@ -1728,25 +1598,9 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # This strategy frontloads RRIF withdrawals to reduce RRIF balance before OAS clawback risk
     # Priority: 15% RRIF (before OAS) or 8% RRIF (after OAS), then Corp -> NonReg -> TFSA
 
-    # DEBUG: Log the strategy being used
-    print(f"🎲 STRATEGY CHECK [{person.name}] Age {age}:", file=sys.stderr)
-    print(f"   Strategy name: '{strategy_name}'", file=sys.stderr)
-    print(f"   Is RRIF-frontload? {('rrif-frontload' in strategy_name.lower() or 'RRIF-Frontload' in strategy_name)}", file=sys.stderr)
-
-    if "rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name:
-        # Debug OAS age comparison
-        print(f"DEBUG OAS CHECK [{person.name}] Age {age} vs OAS start {person.oas_start_age}: "
-              f"{'BEFORE' if age < person.oas_start_age else 'AFTER'} OAS",
-              file=sys.stderr)
-
-        # Determine frontload percentage based on whether person has started OAS
-        # IMPORTANT: The year OAS starts is considered "AFTER OAS" for clawback purposes
-        # Use < not <= so that age 65 with OAS start 65 gets 8%, not 15%
-        # This is conservative - OAS clawback risk exists from age 65 onward
-        if age < person.oas_start_age:
-            frontload_pct = 0.15  # Phase 1: Before OAS starts (e.g., ages 65-69 if OAS at 70)
-        else:
-            frontload_pct = 0.08  # Phase 2: At/after OAS starts (e.g., age 70+ if OAS at 70, or age 65+ if OAS at 65)
+    if plan.rrif_frontload:
+        # 15% before OAS starts, 8% from the year OAS starts (OAS clawback risk)
+        frontload_pct = plan.frontload_pct(age, person.oas_start_age)
 
         # Calculate frontload target (percentage of RRIF balance)
         rrif_frontload_target = person.rrif_balance * frontload_pct
@@ -1758,13 +1612,6 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         # regardless of whether it's needed for spending. The whole point is to reduce RRIF early
         # for tax efficiency, even if it creates surplus cash.
 
-        print(f"✅ RRIF-FRONTLOAD STRATEGY [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"   Frontload {int(frontload_pct*100)}% = ${rrif_frontload_target:,.0f}", file=sys.stderr)
-        print(f"   After-tax target: ${after_tax_target:,.0f}", file=sys.stderr)
-        print(f"   Pension income: ${pension_income_total:,.0f}", file=sys.stderr)
-        print(f"   Other income: ${other_income_total:,.0f}", file=sys.stderr)
-        print(f"   CPP: ${cpp:,.0f}, OAS: ${oas:,.0f}", file=sys.stderr)
-
         # Cap at available RRIF balance
         rrif_frontload_target = min(rrif_frontload_target, person.rrif_balance)
 
@@ -1772,22 +1619,15 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         rrif_min_initial = rrif_frontload_target
         rrif_min_deferred = 0.0  # Don't enforce minimum again (already included in frontload)
 
-        # Always log for debugging
-        print(f"\n🎯 RRIF FRONTLOAD TARGET SET Year {year} [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"   RRIF balance: ${person.rrif_balance:,.0f}", file=sys.stderr)
-        print(f"   Frontload %: {int(frontload_pct*100)}%", file=sys.stderr)
-        print(f"   Frontload amount: ${rrif_frontload_target:,.0f}", file=sys.stderr)
-        print(f"   Setting rrif_min_initial = ${rrif_min_initial:,.0f}", file=sys.stderr)
-        print(f"   (This is the amount that will be withdrawn from RRIF)", file=sys.stderr)
-
-        if rrif_frontload_target > 1e-6:
-            print(f"DEBUG RRIF-FRONTLOAD [{person.name}] Age {age}: "
-                  f"{'BEFORE' if age < person.oas_start_age else 'AFTER'} OAS, "
-                  f"RRIF target = ${rrif_frontload_target:,.0f}",
-                  file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("rrif", "frontload_target", person=person.name, age=age, year=year,
+                       before_oas=age < person.oas_start_age, frontload_pct=frontload_pct,
+                       rrif_balance=person.rrif_balance, target=rrif_frontload_target,
+                       after_tax_target=after_tax_target, pension_income=pension_income_total,
+                       other_income=other_income_total, cpp=cpp, oas=oas)
     # For non-Balanced strategies, start with zero and let strategy order determine it
     # For Balanced strategy, defer RRIF minimum enforcement until after other logic
-    elif "Balanced" in strategy_name or "tax efficiency" in strategy_name.lower():
+    elif plan.defer_rrif_minimum:
         rrif_min_deferred = rrif_min  # Enforce minimum for Balanced strategy at the end
         rrif_min_initial = 0.0
     else:
@@ -1797,12 +1637,6 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # -----  Base withdrawals: Start with zero (strategy will fill) + any custom CSV. -----
     withdrawals = {"nonreg": 0.0, "rrif": rrif_min_initial, "tfsa": 0.0, "corp": 0.0}
 
-    # DEBUG: Log initial RRIF withdrawal for frontload strategy
-    if ("rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name):
-        print(f"📍 RRIF WITHDRAWAL INITIAL [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"   withdrawals['rrif'] = ${withdrawals['rrif']:,.0f}", file=sys.stderr)
-        print(f"   rrif_min_initial = ${rrif_min_initial:,.0f}", file=sys.stderr)
-
     for k in withdrawals.keys():
         if custom_withdraws.get(k, 0.0) > 0:
             withdrawals[k] += custom_withdraws[k]
@@ -1828,7 +1662,7 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         max_possible = max(rrif_balance - rrif_min_now, 0.0)
         return min(topup, max_possible)
 
-    if strategy_name.startswith("Hybrid"):
+    if plan.hybrid_topup:
         extra_up = apply_hybrid_topup(person.rrif_balance, rrif_min, hybrid_topup_amt)
         withdrawals["rrif"] += extra_up
 
@@ -1886,36 +1720,15 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     base_after_tax = pre_tax_cash + withdrawals["nonreg"] + withdrawals["corp"] + withdrawals["tfsa"] - base_tax
     shortfall = max(after_tax_target - base_after_tax, 0.0)
 
-    # DEBUG: For RRIF-frontload strategy, log the shortfall calculation
-    if ("rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name) and (year >= 2031 and year <= 2033):
-        print(f"\n🔍 SHORTFALL CALCULATION [{person.name}] Age {age} Year {year}:", file=sys.stderr)
-        print(f"   Pre-tax cash: ${pre_tax_cash:,.0f} (CPP + OAS + RRIF + Pension + Other + NonReg passive)", file=sys.stderr)
-        print(f"   + NonReg withdrawal: ${withdrawals['nonreg']:,.0f}", file=sys.stderr)
-        print(f"   + Corp withdrawal: ${withdrawals['corp']:,.0f}", file=sys.stderr)
-        print(f"   + TFSA withdrawal: ${withdrawals['tfsa']:,.0f}", file=sys.stderr)
-        print(f"   - Tax: ${base_tax:,.0f}", file=sys.stderr)
-        print(f"   = Base after-tax: ${base_after_tax:,.0f}", file=sys.stderr)
-        print(f"   After-tax target: ${after_tax_target:,.0f}", file=sys.stderr)
-        print(f"   SHORTFALL: ${shortfall:,.0f}", file=sys.stderr)
-
-    # DEBUG: Log pension impact on withdrawals
-    if pension_income_total > 0:
-        print(f"  DEBUG PENSION IMPACT [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"    Pension income: ${pension_income_total:,.0f}", file=sys.stderr)
-        print(f"    Other income: ${other_income_total:,.0f}", file=sys.stderr)
-        print(f"    Pre-tax cash (with pension): ${pre_tax_cash:,.0f}", file=sys.stderr)
-        print(f"    After-tax target: ${after_tax_target:,.0f}", file=sys.stderr)
-        print(f"    Base after-tax: ${base_after_tax:,.0f}", file=sys.stderr)
-        print(f"    Shortfall: ${shortfall:,.0f} (should be reduced by pension)", file=sys.stderr)
-
-    # ===== GIS-OPTIMIZED STRATEGY: Use special withdrawal calculation =====
-    gis_opt_effective_rate = 0.0
-    gis_opt_analysis = {}
-
-    if ("GIS-Optimized" in strategy_name or "minimize-income" in strategy_name.lower() or "minimize_income" in strategy_name.lower()) and shortfall > 1e-6:
-        # For GIS-optimized strategy, use sophisticated withdrawal optimization
-        # that minimizes GIS clawback while meeting spending targets
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "base_shortfall", person=person.name, age=age, year=year,
+                   pre_tax_cash=pre_tax_cash, nonreg=withdrawals["nonreg"], corp=withdrawals["corp"],
+                   tfsa=withdrawals["tfsa"], rrif=withdrawals["rrif"], base_tax=base_tax,
+                   base_after_tax=base_after_tax, after_tax_target=after_tax_target,
+                   shortfall=shortfall, pension_income=pension_income_total,
+                   other_income=other_income_total)
 
+    if plan.gis_optimized and shortfall > 1e-6:
         # Get GIS configuration from tax parameters
         gis_config = getattr(fed, 'gis_config', {
             "threshold_single": 22272,
@@ -1925,70 +1738,105 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
             "clawback_rate": 0.50,
         })
 
-        # Call GIS optimization function
-        # NOTE: Include RRIF minimum already withdrawn in the income baseline,
-        # so GIS optimization understands the full income picture
-        gis_opt_withdrawals, gis_opt_effective_rate, gis_opt_analysis = calculate_gis_optimization_withdrawal(
-            person=person,
-            after_tax_target=shortfall,
-            age=age,
-            net_income_before_withdrawal=(cpp + oas + nr_interest + nr_elig_div + nr_nonelig_div + nr_capg_dist + withdrawals["rrif"]),
-            gis_config=gis_config,
-            oas_amount=oas,
-            is_couple=False,
-            other_person_gis_income=0.0,
-            account_balances={
-                "nonreg": person.nonreg_balance,
-                "rrif": person.rrif_balance,
-                "tfsa": person.tfsa_balance,
-                "corp": corporate_balance_start,
-            },
-            fed_params=fed,
-            prov_params=prov,
-            nr_interest=nr_interest,
-            nr_elig_div=nr_elig_div,
-            nr_nonelig_div=nr_nonelig_div,
-            nr_capg_dist=nr_capg_dist,
-            cpp_income=cpp,
+    # ===== GIS-OPTIMIZED STRATEGY, fallback plan: sources ranked by estimated cost =====
+    if plan.gis_optimized and not plan.gis_walk and shortfall > 1e-6:
+        # Only runs when simulate() compares the walk's plan against this one
+        gis_opt_withdrawals = estimated_gis_withdrawals(
+            person, shortfall, age,
+            cpp + oas + nr_interest + nr_elig_div + nr_nonelig_div + nr_capg_dist + withdrawals["rrif"],
+            gis_config, oas,
+            {"nonreg": person.nonreg_balance, "rrif": person.rrif_balance,
+             "tfsa": person.tfsa_balance, "corp": corporate_balance_start},
         )
+        for k in withdrawals:
+            withdrawals[k] += gis_opt_withdrawals[k]
 
-        # Apply GIS-optimized withdrawals
-        withdrawals["nonreg"] += gis_opt_withdrawals.get("nonreg", 0.0)
-        withdrawals["rrif"] += gis_opt_withdrawals.get("rrif", 0.0)
-        withdrawals["tfsa"] += gis_opt_withdrawals.get("tfsa", 0.0)
-        withdrawals["corp"] += gis_opt_withdrawals.get("corp", 0.0)
-
-        # CRITICAL FIX: Recalculate shortfall after GIS withdrawals
-        # The GIS optimization function tries its best to meet the target, but may fail
-        # if accounts run low or costs are prohibitive. We MUST recalculate the shortfall
-        # to verify that the target was actually met.
-        #
-        # Calculate new tax based on updated withdrawals
+        # The estimate may miss the target: recheck it, and the top-up order below covers the rest
         new_after_tax = pre_tax_cash + withdrawals["nonreg"] + withdrawals["corp"] + withdrawals["tfsa"] - base_tax
         shortfall = max(after_tax_target - new_after_tax, 0.0)
 
+    # ===== GIS-OPTIMIZED STRATEGY: Minimum-cost withdrawal mix =====
+    elif plan.gis_optimized and shortfall > 1e-6:
+        # Raise the shortfall at the lowest tax + GIS lost, priced against this
+        # year's indexed tax schedule and the GIS clawback schedule
+        income_kwargs = dict(
+            nonreg_balance=person.nonreg_balance,
+            nonreg_acb=getattr(person, "nonreg_acb", 0.0),
+            corp_dividend_type=getattr(person, "corp_dividend_type", "non-eligible"),
+            nr_interest=nr_interest, nr_elig_div=nr_elig_div,
+            nr_nonelig_div=nr_nonelig_div, nr_capg_dist=nr_capg_dist,
+            withdrawals_rrif_base=withdrawals["rrif"],
+            cpp_income=cpp, oas_income=oas,
+            rental_income=rental_income,
+            downsizing_capital_gains=downsizing_capgains,
+            pension_income_total=pension_income_total,
+            other_income_total=other_income_total,
+        )
+
+        def gis_tax_at(add_nonreg, add_rrif, add_corp):
+            # Same mix and province as base_tax, plus the extra withdrawals
+            return tax_for_detailed(
+                withdrawals["nonreg"] + add_nonreg, add_rrif, withdrawals["corp"] + add_corp,
+                age=age, fed_params=fed, prov_params=prov, province=hh.province, **income_kwargs,
+            )[0]
+
+        def gis_tax_breakpoints(source, room, add_nonreg, add_rrif, add_corp):
+            return gross_up_breakpoints(
+                source, room, withdrawals["nonreg"] + add_nonreg, add_rrif, withdrawals["corp"] + add_corp,
+                age=int(age), fed_params=fed, prov_params=prov, **income_kwargs,
+            )
+
+        # GIS income as simulate_year() tests it below (OAS excluded)
+        gis_income_base = (nr_interest + nr_elig_div + nr_nonelig_div + nr_capg_dist * 0.5 +
+                           withdrawals["rrif"] + withdrawals["corp"] + cpp +
+                           pension_income_total + other_income_total)
+
+        if spouse_gis is not None:
+            # Couple: the household's GIS, given the spouse's GIS income
+            spouse_gis_income, spouse_oas = spouse_gis
+            gis_at = lambda income: sum(couple_gis(income, spouse_gis_income, oas, spouse_oas, gis_config))
+            gis_kinks = couple_gis_breakpoints(spouse_gis_income, oas, spouse_oas, gis_config)
+        else:
+            gis_at = lambda income: calculate_gis(income, age, gis_config, oas)
+            gis_kinks = gis_breakpoints(gis_config)
+
+        gis_opt_withdrawals, base_tax, gis_opt_analysis = allocate_gis_withdrawals(
+            shortfall,
+            {
+                "nonreg": person.nonreg_balance - withdrawals["nonreg"],
+                "rrif": person.rrif_balance - withdrawals["rrif"],
+                "tfsa": person.tfsa_balance - withdrawals["tfsa"],
+                "corp": corporate_balance_start - withdrawals["corp"],
+            },
+            tax_at=gis_tax_at,
+            base_tax=base_tax,
+            tax_breakpoints=gis_tax_breakpoints,
+            gis_at=gis_at,
+            gis_income=gis_income_base,
+            gis_kinks=gis_kinks,
+            minimum={"rrif": rrif_min - withdrawals["rrif"]},  # RRIF minimum is mandatory
+        )
+
+        # Apply GIS-optimized withdrawals; base_tax is now the tax on the new mix
+        for k in withdrawals:
+            withdrawals[k] += gis_opt_withdrawals[k]
+        shortfall = gis_opt_analysis["unmet"]
+
+        if trace.ACTIVE:
+            trace.emit("gis", "allocation", person=person.name, age=age, year=year,
+                       extra=dict(gis_opt_withdrawals), tax=base_tax, unmet=shortfall,
+                       gis_before=gis_opt_analysis["gis_before"], gis_after=gis_opt_analysis["gis_after"],
+                       segments=len(gis_opt_analysis["segments"]))
+
     # ----- Decide Order for topping up to meet the shortfall  -----
     # PHASE 5a: Call TaxOptimizer to get intelligent withdrawal order
     # The optimizer will return a withdrawal order that minimizes lifetime taxes
     # (retirement + death), taking into account GIS/OAS clawback, TFSA strategic placement, etc.
-    order = _get_strategy_order(strategy_name)  # Default fallback
-
-    # For certain strategies, preserve the specific order designed for tax efficiency
-    # Don't let TaxOptimizer override these carefully designed orders
-    preserve_order_strategies = [
-        "rrif-frontload",
-        "corporate-optimized",
-        "Corporate Optimized"
-    ]
-
-    should_preserve_order = any(s in strategy_name for s in preserve_order_strategies) or \
-                           "corporate" in strategy_name.lower() and "optimized" in strategy_name.lower()
-
-    if should_preserve_order:
-        # Keep the strategy-specific order
-        if shortfall > 1e-6:
-            print(f"  Using {strategy_name} specific order: {order}", file=sys.stderr)
-    elif tax_optimizer is not None:
+    order = list(plan.base_order)  # Default fallback
+
+    # Strategies with carefully designed orders (RRIF-Frontload, Corporate Optimized)
+    # keep them; the TaxOptimizer doesn't override
+    if not plan.preserve_order and tax_optimizer is not None:
         try:
             optimizer_plan = tax_optimizer.optimize_withdrawals(
                 person=person,
@@ -2000,34 +1848,30 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
             # Use optimizer order if it returned a valid list
             if optimizer_order and len(optimizer_order) > 0:
                 order = optimizer_order
-                if shortfall > 1e-6:
-                            print(f"  TaxOptimizer selected order: {order}", file=sys.stderr)
         except Exception as e:
             # Fallback to strategy-based order on any optimizer error
-            print(f"  WARNING: TaxOptimizer failed ({str(e)}), falling back to strategy order", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "optimizer_failed", person=person.name, year=year, error=str(e))
 
-    if "GIS-Optimized" in strategy_name or "minimize-income" in strategy_name.lower() or "minimize_income" in strategy_name.lower():
-        # GIS optimization already handled withdrawals above
-        # BUT: Only skip the withdrawal loop if GIS optimization actually met the target
-        # If there's still a shortfall, we MUST continue with the fallback withdrawal order
+    if plan.gis_optimized:
+        # The GIS allocation already raised the shortfall, unless every source ran out:
+        # only then fall back to the withdrawal order below
         if shortfall < 1e-6:
             order = []  # Skip the loop below only if target was met
-        else:
+        elif trace.ACTIVE:
             # GIS optimization didn't meet target - continue with strategy order to fill gap
-            print(f"  WARNING: GIS optimization left ${shortfall:,.0f} shortfall, using fallback order", file=sys.stderr)
+            trace.emit("gis", "optimization_shortfall", person=person.name, age=age, year=year, shortfall=shortfall)
 
     if corporate_balance_start <= 1e-9:
         order = [x for x in order if x != "corp"]
 
-    # DEBUG: Log initial shortfall and available balances
-    if shortfall > 1e-6:
-        print(f"\nDEBUG WITHDRAWAL [{person.name}] Age {age} Year {year if year else '?'}:", file=sys.stderr)
-        print(f"  Strategy: {strategy_name}", file=sys.stderr)
-        print(f"  After-tax target: ${after_tax_target:,.0f}", file=sys.stderr)
-        print(f"  Base after-tax: ${base_after_tax:,.0f}", file=sys.stderr)
-        print(f"  Initial shortfall: ${shortfall:,.0f}", file=sys.stderr)
-        print(f"  Order: {order}", file=sys.stderr)
-        print(f"  Starting balances: RRIF=${person.rrif_balance:,.0f} CORP=${corporate_balance_start:,.0f} NONREG=${person.nonreg_balance:,.0f} TFSA=${person.tfsa_balance:,.0f}", file=sys.stderr)
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "shortfall_loop_start", person=person.name, age=age, year=year,
+                   strategy=strategy_name, shortfall=shortfall, order=list(order),
+                   rrif_balance=person.rrif_balance, corp_balance=corporate_balance_start,
+                   nonreg_balance=person.nonreg_balance, tfsa_balance=person.tfsa_balance,
+                   rrif_taken=withdrawals["rrif"], nonreg_taken=withdrawals["nonreg"],
+                   tfsa_taken=withdrawals["tfsa"])
 
     extra = {"nonreg": 0.0, "rrif": 0.0, "corp": 0.0, "tfsa": 0.0}
 
@@ -2037,44 +1881,15 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     oas_cur   = oas
     rrif_base = withdrawals["rrif"]
 
-    # Special handling for RRIF-frontload: strategic gap filling
-    if ("rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name):
-        if shortfall > 1e-6:
-            print(f"\n📊 RRIF-FRONTLOAD STRATEGY [{person.name}] Age {age} Year {year}:", file=sys.stderr)
-            print(f"   ✓ RRIF frontload withdrawal: ${withdrawals['rrif']:,.0f} ({'15%' if age < person.oas_start_age else '8%'} - FIXED)", file=sys.stderr)
-            print(f"   ⚠️ Shortfall exists: ${shortfall:,.0f}", file=sys.stderr)
-            print(f"   ℹ️ Will attempt to fill gap from: Corp → NonReg → TFSA", file=sys.stderr)
-            print(f"   ℹ️ NO additional RRIF withdrawals beyond frontload percentage", file=sys.stderr)
-
-    print(f"\n🔍 SHORTFALL LOOP START [{person.name}] Age {age} Year {year}:", file=sys.stderr)
-    print(f"   Initial shortfall: ${shortfall:,.0f}", file=sys.stderr)
-    print(f"   Withdrawal order: {order if order else '[] (no gap filling)'}", file=sys.stderr)
-    print(f"   Current balances: RRIF=${person.rrif_balance:,.0f}, NonReg=${person.nonreg_balance:,.0f}, TFSA=${person.tfsa_balance:,.0f}", file=sys.stderr)
-    print(f"   Already withdrawn: RRIF=${withdrawals['rrif']:,.0f}, NonReg=${withdrawals['nonreg']:,.0f}, TFSA=${withdrawals['tfsa']:,.0f}", file=sys.stderr)
-
-    # Skip the loop entirely if order is empty (e.g., RRIF-frontload pure strategy)
-    if not order:
-        if shortfall > 1e-6:
-            print(f"   ⚠️ Withdrawal order is empty - no gap filling will be attempted", file=sys.stderr)
-
-    # DEBUG: Log if we're entering the loop
-    if shortfall > 1e-6 and order:
-        print(f"   🔄 Entering withdrawal loop with order: {order}, corporate_balance_start=${corporate_balance_start:,.0f}", file=sys.stderr)
-
     for k in order:
         if shortfall <= 1e-6:
-            print(f"   ✅ Shortfall covered! Breaking loop.", file=sys.stderr)
             break
 
         # CRITICAL FIX: For RRIF-Frontload strategy, ensure RRIF is NEVER processed in gap-filling
         # This prevents any additional RRIF withdrawals beyond the frontload percentage
-        if ("rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name) and k == "rrif":
-            print(f"   ⚠️ SKIPPING RRIF in gap-filling (RRIF-Frontload enforces fixed % only)", file=sys.stderr)
+        if plan.rrif_frontload and k == "rrif":
             continue
 
-        print(f"\n   💰 Processing account: {k.upper()}", file=sys.stderr)
-        print(f"      Remaining shortfall: ${shortfall:,.0f}", file=sys.stderr)
-
         # For Balanced strategy: RRIF comes SECOND (after Corp) to deplete it before NonReg
         # This is intentional: RRIF is 100% taxable at death, so better to use it during life
         # Don't skip RRIF - let it be used in its proper priority position
@@ -2091,12 +1906,13 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
             corp_other_avail = max(corporate_balance_start - (withdrawals["corp"] + extra["corp"]) - corp_cda_avail, 0.0)
             available = corp_cda_avail + corp_other_avail
 
-            # DEBUG: Log corporate availability
-            if shortfall > 1e-6:
-                print(f"      CORP DEBUG: corporate_balance_start=${corporate_balance_start:,.0f}, CDA=${corp_cda_avail:,.0f}, other=${corp_other_avail:,.0f}, total available=${available:,.0f}", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("corp", "corp_available", person=person.name, year=year,
+                           corp_balance=corporate_balance_start, cda=corp_cda_avail,
+                           other=corp_other_avail, available=available)
 
             # For Balanced strategy, record that we should prefer CDA
-            if "Balanced" in strategy_name or "tax efficiency" in strategy_name.lower():
+            if plan.cda_first:
                 # Track CDA separately for later tax calculation
                 person._corp_cda_preferred = getattr(person, "corp_cda_balance", 0.0) > 1e-9
         elif k == "nonreg":
@@ -2108,11 +1924,10 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
 
             available = max(person.nonreg_balance - (withdrawals["nonreg"] + extra["nonreg"]), 0.0)
 
-            print(f"      NonReg: balance=${person.nonreg_balance:,.0f}, already_withdrawn=${withdrawals['nonreg']:,.0f}, extra=${extra['nonreg']:,.0f}, available=${available:,.0f}", file=sys.stderr)
-
-            # For Balanced strategy, provide DEBUG info about ACB timing
-            if available > 1e-6 and ("Balanced" in strategy_name or "tax efficiency" in strategy_name.lower()):
-                    print(f"DEBUG ACB [{person.name}]: ACB_ratio={acb_ratio:.1%}, gains_tax_rate~={gains_tax_rate:.1%}, available=${available:,.0f}", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "nonreg_available", person=person.name, year=year,
+                           balance=person.nonreg_balance, acb_ratio=acb_ratio,
+                           gains_tax_rate=gains_tax_rate, available=available)
         elif k == "tfsa":
             # TFSA guard: Check if TFSA should be used based on withdrawal order
             # If TFSA is first in the order (e.g., for OAS optimization), allow it
@@ -2130,9 +1945,9 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
 
                 # If other sources can cover the shortfall, skip TFSA to avoid circular flow
                 if other_sources_available >= shortfall * 1.3:  # 1.3x for tax gross-up
-                    if year >= 2040 and year <= 2042:
-                        print(f"  CIRCULAR PREVENTION: Skipping TFSA withdrawal (room=${tfsa_room:,.0f}, "
-                              f"other sources=${other_sources_available:,.0f})", file=sys.stderr)
+                    if trace.ACTIVE:
+                        trace.emit("withdrawals", "tfsa_skipped_circular", person=person.name, year=year,
+                                   tfsa_room=tfsa_room, other_sources=other_sources_available)
                     continue
 
             # Check if TFSA is first in the withdrawal order
@@ -2144,37 +1959,28 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
                 corp_left   = max(corporate_balance_start - (withdrawals["corp"] + extra["corp"]), 0.0)
                 nonreg_left = max(person.nonreg_balance - (withdrawals["nonreg"] + extra["nonreg"]), 0.0)
 
-                # DEBUG: Log TFSA guard check
-                if shortfall > 1e-6:
-                        print(f"  TFSA guard check - rrif_left=${rrif_left:,.0f} corp_left=${corp_left:,.0f} nonreg_left=${nonreg_left:,.0f}", file=sys.stderr)
-
                 # Only use TFSA if ALL other sources that come before TFSA are depleted
                 if (nonreg_left > 1e-9) or (rrif_left > 1e-9) or (corp_left > 1e-9):
                     # Skip TFSA for now; other sources still have funds
-                    if shortfall > 1e-6:
-                                print(f"  -> Skipping TFSA (other sources have funds: rrif_left=${rrif_left:,.0f}, nonreg_left=${nonreg_left:,.0f}, corp_left=${corp_left:,.0f})", file=sys.stderr)
+                    if trace.ACTIVE:
+                        trace.emit("withdrawals", "tfsa_guarded", person=person.name, year=year,
+                                   rrif_left=rrif_left, corp_left=corp_left, nonreg_left=nonreg_left)
                     continue
             available = max(person.tfsa_balance - (withdrawals["tfsa"] + extra["tfsa"]), 0.0)
         else:
             available = 0.0
 
         if available <= 0.0:
-            if shortfall > 1e-6 and k != "tfsa":
-                    print(f"  {k.upper()}: available=${available:,.0f} (skipping, no funds)", file=sys.stderr)
             continue
 
-        # DEBUG: Log withdrawal source being processed
-        if shortfall > 1e-6:
-            print(f"  {k.upper()}: available=${available:,.0f}, shortfall=${shortfall:,.0f}", file=sys.stderr)
-
         # TFSA is tax-free: just take what you need and continue
         if k == "tfsa":
             take = min(shortfall, available)
             extra["tfsa"] += take
             shortfall -= take
-            # DEBUG: Log TFSA withdrawal
-            if take > 1e-6:
-                    print(f"  -> TFSA withdrawal: ${take:,.0f}", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "topup", person=person.name, year=year, source=k,
+                           available=available, take=take, shortfall_left=shortfall)
             continue
 
         # --- For taxable sources (nonreg / rrif / corp), compute tax-aware sizing ---
@@ -2210,41 +2016,71 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
                 other_income_total   = other_income_total,    # Employment, business, investment income from outer scope
             )
 
-        # Binary search: find the minimum withdrawal needed to net the shortfall after tax
-        lo, hi = 0.0, available
-        for _ in range(25):
-            mid = (lo + hi) / 2.0
-            # CRITICAL FIX: Pass the TOTAL withdrawal amounts (base + extra + mid), not just extra
-            # This ensures correct marginal tax calculation on cumulative withdrawals
-            t_guess = person_tax_for(
-                withdrawals["nonreg"] + extra["nonreg"] + (mid if k == "nonreg" else 0.0),
-                withdrawals["rrif"]   + extra["rrif"]   + (mid if k == "rrif"   else 0.0),
-                withdrawals["corp"]   + extra["corp"]   + (mid if k == "corp"   else 0.0),
-                person=person, age=age_cur, fed_params=fed, prov_params=prov,
-                cpp_income=cpp_cur, oas_income=oas_cur,
+        # Size the withdrawal so it nets the shortfall after the tax it triggers.
+        # CRITICAL FIX: Tax is evaluated on the TOTAL withdrawal amounts (base + extra + x),
+        # not just extra, so marginal rates reflect cumulative withdrawals.
+        add_nonreg_cur = withdrawals["nonreg"] + extra["nonreg"]
+        add_rrif_cur = withdrawals["rrif"] + extra["rrif"]
+        add_corp_cur = withdrawals["corp"] + extra["corp"]
+
+        if GROSS_UP_USE_BISECTION:
+            # Binary search: find the minimum withdrawal needed to net the shortfall after tax
+            lo, hi = 0.0, available
+            for _ in range(25):
+                mid = (lo + hi) / 2.0
+                # CRITICAL FIX: Pass the TOTAL withdrawal amounts (base + extra + mid), not just extra
+                # This ensures correct marginal tax calculation on cumulative withdrawals
+                t_guess = person_tax_for(
+                    withdrawals["nonreg"] + extra["nonreg"] + (mid if k == "nonreg" else 0.0),
+                    withdrawals["rrif"]   + extra["rrif"]   + (mid if k == "rrif"   else 0.0),
+                    withdrawals["corp"]   + extra["corp"]   + (mid if k == "corp"   else 0.0),
+                    person=person, age=age_cur, fed_params=fed, prov_params=prov,
+                    cpp_income=cpp_cur, oas_income=oas_cur,
+                    nr_interest=nr_interest, nr_elig_div=nr_elig_div,
+                    nr_nonelig_div=nr_nonelig_div, nr_capg_dist=nr_capg_dist,
+                    rrif_base_already_taken=0.0,  # Already included in withdrawals["rrif"]
+                )
+                # Net cash after tax from withdrawing 'mid' amount
+                # The tax delta is t_guess minus the tax on just the BASE withdrawals
+                after_tax_mid = mid - (t_guess - base_tax)
+                if after_tax_mid >= shortfall:
+                    hi = mid
+                else:
+                    lo = mid
+        else:
+            def tax_at(x, k=k):
+                return person_tax_for(
+                    add_nonreg_cur + (x if k == "nonreg" else 0.0),
+                    add_rrif_cur + (x if k == "rrif" else 0.0),
+                    add_corp_cur + (x if k == "corp" else 0.0),
+                    person=person, age=age_cur, fed_params=fed, prov_params=prov,
+                    cpp_income=cpp_cur, oas_income=oas_cur,
+                    nr_interest=nr_interest, nr_elig_div=nr_elig_div,
+                    nr_nonelig_div=nr_nonelig_div, nr_capg_dist=nr_capg_dist,
+                    rrif_base_already_taken=0.0,  # Already included in withdrawals["rrif"]
+                )
+
+            kinks = gross_up_breakpoints(
+                k, available, add_nonreg_cur, add_rrif_cur, add_corp_cur,
+                age=int(age_cur), fed_params=fed, prov_params=prov,
+                nonreg_balance=float(getattr(person, "nonreg_balance", 0.0)),
+                nonreg_acb=float(getattr(person, "nonreg_acb", 0.0)),
+                corp_dividend_type=str(getattr(person, "corp_dividend_type", "non-eligible")),
                 nr_interest=nr_interest, nr_elig_div=nr_elig_div,
                 nr_nonelig_div=nr_nonelig_div, nr_capg_dist=nr_capg_dist,
-                rrif_base_already_taken=0.0,  # Already included in withdrawals["rrif"]
+                withdrawals_rrif_base=0.0,
+                cpp_income=cpp_cur, oas_income=oas_cur,
+                rental_income=rental_income,
+                downsizing_capital_gains=downsizing_capgains,
+                pension_income_total=pension_income_total,
+                other_income_total=other_income_total,
             )
-            # Net cash after tax from withdrawing 'mid' amount
-            # The tax delta is t_guess minus the tax on just the BASE withdrawals
-            after_tax_mid = mid - (t_guess - base_tax)
-            if after_tax_mid >= shortfall:
-                hi = mid
-            else:
-                lo = mid
+            hi = solve_gross_up(tax_at, available, shortfall, base_tax, kinks)
 
         # Take the minimum amount needed, but don't exceed available
         take = min(hi, available)
         if take > 1e-9:
             extra[k] += take
-            # DEBUG: Log withdrawal amount
-            if shortfall > 1e-6:
-                    print(f"  -> {k.upper()} withdrawal: ${take:,.0f} (after-tax cost)", file=sys.stderr)
-        else:
-            # DEBUG: Why no withdrawal?
-            if shortfall > 1e-6:
-                print(f"  -> {k.upper()} NO WITHDRAWAL: take=${take:.2f}, hi=${hi:.2f}, available=${available:.2f}", file=sys.stderr)
 
         # CRITICAL FIX: Recompute tax and shortfall AFTER EVERY withdrawal attempt
         # This was incorrectly indented inside the if take > 1e-9 block, causing the loop to exit prematurely
@@ -2274,27 +2110,24 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         shortfall = max(after_tax_target - new_after_tax, 0.0)
         base_tax = t_new
 
-# -----  Apply the extra withdrawals decided above -----
-    # DEBUG: See what's in extra before applying
-    if sum(extra.values()) > 1e-6 or year == 2026:
-        print(f"   📦 EXTRA dict before applying: {extra}", file=sys.stderr)
-        print(f"   📦 WITHDRAWALS before: {withdrawals}", file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("withdrawals", "topup", person=person.name, year=year, source=k,
+                       available=available, take=max(take, 0.0), shortfall_left=shortfall)
 
+# -----  Apply the extra withdrawals decided above -----
     for k in extra:
         withdrawals[k] += extra[k]
 
-    # DEBUG: See what's in withdrawals after applying
-    if sum(extra.values()) > 1e-6 or year == 2026:
-        print(f"   📦 WITHDRAWALS after applying extra: {withdrawals}", file=sys.stderr)
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "extra_applied", person=person.name, year=year,
+                   extra=dict(extra), withdrawals=dict(withdrawals), unmet=shortfall)
 
     # -----  Enforce deferred RRIF minimum for Balanced strategy -----
     # If using Balanced strategy, enforce the CRA RRIF minimum as last resort
     # CRITICAL FIX: Skip this for RRIF-Frontload strategy
     if rrif_min_deferred > 1e-9:
         # Check if this is RRIF-Frontload strategy
-        if "rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name:
-            print(f"   ℹ️ Skipping deferred RRIF minimum enforcement (RRIF-Frontload strategy)", file=sys.stderr)
-        else:
+        if not plan.rrif_frontload:
             rrif_total_so_far = withdrawals["rrif"]
             if rrif_total_so_far < rrif_min_deferred:
                 rrif_shortfall = rrif_min_deferred - rrif_total_so_far
@@ -2314,7 +2147,7 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # But it should be enforced AFTER the strategy order is applied,
     # not before, so that strategies like NonReg->RRIF work correctly
     # EXCEPTION: RRIF-Frontload strategy already enforces the minimum as part of its frontload target
-    if "rrif-frontload" not in strategy_name.lower():
+    if not plan.rrif_frontload:
         if withdrawals["rrif"] < rrif_min and person.rrif_balance > 0:
             rrif_shortfall_to_min = min(rrif_min - withdrawals["rrif"], person.rrif_balance)
             withdrawals["rrif"] += rrif_shortfall_to_min
@@ -2333,7 +2166,7 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
 
     # ----- CDA Tracking: Update CDA balance when withdrawing Corp (Balanced Strategy optimization) ----
     # When withdrawing from corporate account, prioritize CDA (zero-tax) before paid-up capital
-    if withdrawals["corp"] > 1e-9 and ("Balanced" in strategy_name or "tax efficiency" in strategy_name.lower()):
+    if withdrawals["corp"] > 1e-9 and plan.cda_first:
         corp_cda_bal = getattr(person, "corp_cda_balance", 0.0)
         corp_cda_withdrawn = min(withdrawals["corp"], corp_cda_bal)
         corp_other_withdrawn = withdrawals["corp"] - corp_cda_withdrawn
@@ -2342,9 +2175,9 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         person.corp_cda_balance = max(corp_cda_bal - corp_cda_withdrawn, 0.0)
         person.corp_paid_up_capital = max(getattr(person, "corp_paid_up_capital", 0.0) - corp_other_withdrawn, 0.0)
 
-        # DEBUG: Log CDA withdrawal
-        if corp_cda_withdrawn > 1e-6:
-            print(f"DEBUG CDA [{person.name}]: Withdrew ${corp_cda_withdrawn:,.0f} from CDA (zero-tax), ${corp_other_withdrawn:,.0f} from paid-up capital", file=sys.stderr)
+        if trace.ACTIVE and corp_cda_withdrawn > 1e-6:
+            trace.emit("corp", "cda_withdrawal", person=person.name, year=year,
+                       cda=corp_cda_withdrawn, paid_up_capital=corp_other_withdrawn)
     else:
         # Non-Balanced strategy: just deduct from paid-up capital
         person.corp_paid_up_capital = max(getattr(person, "corp_paid_up_capital", 0.0) - withdrawals["corp"], 0.0)
@@ -2358,10 +2191,6 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # CRITICAL: GIS requires receiving OAS (oas > 0) but OAS is EXCLUDED from income test
     # This fix complies with official CRA guidelines
 
-    # Debug: Check types
-    print(f"DEBUG in simulate_year: pension_income type: {type(pension_income)}, value: {pension_income}", file=sys.stderr)
-    print(f"DEBUG in simulate_year: other_income type: {type(other_income)}, value: {other_income}", file=sys.stderr)
-
     gis_net_income = (nr_interest + nr_elig_div + nr_nonelig_div + nr_capg_dist * 0.5 +  # Capital gains 50% inclusion
                       withdrawals["rrif"] + withdrawals["corp"] + cpp +  # Account withdrawals and CPP
                       pension_income + other_income)  # CRITICAL FIX: Include employer pension and other income!
@@ -2372,13 +2201,11 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # Here, we calculate as if single to get the basic benefit amount.
     gis_benefit = calculate_gis(gis_net_income, age, fed.gis_config if hasattr(fed, 'gis_config') else {}, oas, is_couple=False)
 
-    # DEBUG: Log GIS calculation when values are non-zero
-    if gis_benefit > 0 or gis_net_income > 15000:
-        print(f"DEBUG GIS [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"  nr_interest={nr_interest:.0f}, nr_elig_div={nr_elig_div:.0f}, nr_capg_dist={nr_capg_dist:.0f}", file=sys.stderr)
-        print(f"  rrif_wd={withdrawals['rrif']:.0f}, corp_wd={withdrawals['corp']:.0f}", file=sys.stderr)
-        print(f"  cpp={cpp:.0f}, oas={oas:.0f}", file=sys.stderr)
-        print(f"  GIS_NET_INCOME={gis_net_income:.0f}, GIS_BENEFIT={gis_benefit:.0f}", file=sys.stderr)
+    if trace.ACTIVE:
+        trace.emit("gis", "individual_gis", person=person.name, age=age, year=year,
+                   net_income=gis_net_income, benefit=gis_benefit, rrif=withdrawals["rrif"],
+                   corp=withdrawals["corp"], cpp=cpp, oas=oas, pension_income=pension_income,
+                   other_income=other_income)
 
     # -----  REINVEST SURPLUS: Handle excess withdrawals beyond spending need -----
     # STRATEGY: Protect TFSA as emergency fund
@@ -2409,13 +2236,10 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     # Calculate surplus: how much exceeds the spending target
     surplus = max(total_after_tax_cash - after_tax_target, 0.0)
 
-    # DEBUG: Log surplus calculation for problematic years
-    if year and year >= 2031 and year <= 2035:
-        print(f"\n💰 SURPLUS CALC [{person.name}] Year {year}:", file=sys.stderr)
-        print(f"   Total after-tax cash: ${total_after_tax_cash:,.0f}", file=sys.stderr)
-        print(f"   After-tax target: ${after_tax_target:,.0f}", file=sys.stderr)
-        print(f"   Raw surplus: ${total_after_tax_cash - after_tax_target:,.0f}", file=sys.stderr)
-        print(f"   Surplus (max 0): ${surplus:,.0f}", file=sys.stderr)
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "surplus", person=person.name, year=year,
+                   after_tax_cash=total_after_tax_cash, after_tax_target=after_tax_target,
+                   surplus=surplus)
 
     # NOTE: Surplus reinvestment happens AFTER all withdrawals and growth are applied
     # (see lines ~1863-1985 below) to avoid double-applying growth to reinvested amounts.
@@ -2424,14 +2248,6 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     tfsa_room_for_reinvest = tfsa_room if tfsa_room > 1e-6 else 0.0
 
     #----- Build tax detail and info dicts -----
-    # DEBUG: Log tax calculation values
-    dist_sum = nr_interest + nr_elig_div + nr_nonelig_div
-    if abs(base_tax - dist_sum) < 0.01 and dist_sum > 1:
-        print(f"⚠️  WARNING in simulate_year(): base_tax ({base_tax:.2f}) equals distribution sum ({dist_sum:.2f})")
-        print(f"    This indicates the tax calculation may be using distributions instead of proper tax_for()")
-        print(f"    nr_interest={nr_interest:.2f}, nr_elig_div={nr_elig_div:.2f}, nr_nonelig_div={nr_nonelig_div:.2f}")
-        print(f"    withdrawals: rrif={withdrawals['rrif']:.2f}, nonreg={withdrawals['nonreg']:.2f}, corp={withdrawals['corp']:.2f}")
-
     # ----- CRITICAL FIX: Recalculate FINAL tax after all withdrawals are determined -----
     # The base_tax was calculated early with only initial withdrawals, but we may have added
     # more withdrawals during the shortfall loop. Need to recalculate with FINAL withdrawals.
@@ -2464,21 +2280,12 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
     )
     final_oas_clawback = final_fed_oas_clawback + final_prov_oas_clawback
 
-    # DEBUG: Log if final tax differs significantly from base tax
-    if abs(final_tax - base_tax) > 100 and (year >= 2031 and year <= 2033):
-        print(f"\n⚠️ TAX RECALCULATION [{person.name}] Age {age} Year {year}:", file=sys.stderr)
-        print(f"   Initial tax (base_tax): ${base_tax:,.0f}", file=sys.stderr)
-        print(f"   Final tax (after all withdrawals): ${final_tax:,.0f}", file=sys.stderr)
-        print(f"   Difference: ${final_tax - base_tax:,.0f}", file=sys.stderr)
-        print(f"   Final withdrawals: RRIF=${withdrawals['rrif']:,.0f}, NonReg=${withdrawals['nonreg']:,.0f}, TFSA=${withdrawals['tfsa']:,.0f}", file=sys.stderr)
-
-    # DEBUG: Log final RRIF withdrawal for RRIF-frontload strategy
-    if ("rrif-frontload" in strategy_name.lower() or "RRIF-Frontload" in strategy_name):
-        print(f"🏁 FINAL RRIF WITHDRAWAL [{person.name}] Age {age}:", file=sys.stderr)
-        print(f"   RRIF balance start: ${person.rrif_balance:,.0f}", file=sys.stderr)
-        print(f"   RRIF withdrawn: ${withdrawals['rrif']:,.0f}", file=sys.stderr)
-        print(f"   Percentage: {(withdrawals['rrif'] / person.rrif_balance * 100 if person.rrif_balance > 0 else 0):.1f}%", file=sys.stderr)
-        print(f"   Expected: {'15%' if age < person.oas_start_age else '8%'}", file=sys.stderr)
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "final_tax", person=person.name, age=age, year=year,
+                   base_tax=base_tax, final_tax=final_tax, rrif=withdrawals["rrif"],
+                   nonreg=withdrawals["nonreg"], corp=withdrawals["corp"], tfsa=withdrawals["tfsa"])
+        trace.emit("rrif", "final_withdrawal", person=person.name, age=age, year=year,
+                   rrif_balance=person.rrif_balance, rrif_withdrawn=withdrawals["rrif"])
 
     tax_detail = {"tax": final_tax, "oas": oas, "cpp": cpp, "gis": gis_benefit,
                   "oas_clawback": final_oas_clawback,  # NEW: OAS clawback amount (using final calculation)
@@ -2517,9 +2324,6 @@ def simulate_year(person: Person, age: int, after_tax_target: float,
         "oas_clawback": base_oas_clawback,  # NEW: OAS clawback for this person
     }
 
-    # DEBUG: Log what we're returning in withdrawals
-    print(f"  rrif_wd={withdrawals['rrif']:.0f}, corp_wd={withdrawals['corp']:.0f}", file=sys.stderr)
-
     return withdrawals, tax_detail, info
 
 
@@ -2619,10 +2423,159 @@ def calculate_terminal_tax(
     return est_final_tax, gross_legacy, after_tax_legacy
 
 
+def _drawable_savings(person: Person) -> float:
+    """RRIF, RRSP, TFSA, non-registered and corporate balances"""
+    return (person.rrif_balance + person.rrsp_balance + person.tfsa_balance +
+            person.nonreg_balance + person.corporate_balance)
+
+
+def _hand_over_need(info: Dict[str, Any], amount: float) -> None:
+    """Move `amount` of a person's unmet after-tax target to the spouse who raised it"""
+    if amount > 1e-6:
+        info["after_tax_target"] -= amount
+        info["unmet_after_tax"] = max(info["unmet_after_tax"] - amount, 0.0)
+
+
 # ------------------------------ Multi-year Sim --------------------------
-def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = None):
-    fed, prov = get_tax_params(tax_cfg, hh.province)
-    rows: List[YearResult] = []
+SIMULATION_MODES = ("frame", "metrics")
+
+
+def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = None,
+             mode: str = "frame", min_years_funded: Optional[int] = None,
+             max_total_tax: Optional[float] = None):
+    """
+    Run the multi-year household simulation.
+
+    Tax evaluations are memoized in a per-simulation scope on top of the shared
+    progressive_tax cache, so repeated evaluations within a year cost O(1).
+
+    The household is treated as a read-only spec: balances evolve on a
+    per-run working copy (Household.working_copy()), so one converted
+    household can be simulated any number of times without copying it first.
+
+    A GIS-Optimized (minimize-income) plan that leaves years unfunded is run
+    a second time with sources ranked by estimated cost instead of the
+    segment walk (see _best_plan_run()), and the better plan is returned.
+
+    Args:
+        hh: Household to simulate (not modified)
+        tax_cfg: Tax configuration from load_tax_config()
+        custom_df: Optional custom withdrawal directives (see modules/custom_directives.py);
+            raises ValueError if a row is invalid
+        mode: "frame" returns the year-by-year DataFrame, with the plan totals
+            as a SimulationAggregates in df.attrs["aggregates"]. "metrics"
+            returns a SimulationMetrics with plan totals only (no per-year
+            rows, no insights), for strategy searches.
+        min_years_funded: Metrics mode only. Stop as soon as this many funded
+            years can no longer be reached; the result has pruned=True.
+        max_total_tax: Metrics mode only. Stop as soon as the running total
+            tax exceeds this amount; the result has pruned=True.
+
+    Returns:
+        pd.DataFrame (mode="frame") or SimulationMetrics (mode="metrics")
+    """
+    if mode not in SIMULATION_MODES:
+        raise ValueError(f"Unknown simulation mode '{mode}'. Valid: {SIMULATION_MODES}")
+
+    def run(plan):
+        work = hh.working_copy()
+        return work, _simulate(work, tax_cfg, custom_df, mode, min_years_funded, max_total_tax, plan=plan)
+
+    with tax_cache_scope():
+        return _best_plan_run(hh, tax_cfg, run)
+
+
+def simulate_what_if(hh: Household, tax_cfg: Dict, base: Optional[CheckpointedRun] = None) -> CheckpointedRun:
+    """
+    Frame-mode simulate() that records year-boundary checkpoints.
+
+    When base is an earlier run of the same plan that differs from hh only in
+    late-life parameters (spending phases, phase end ages, end age), the
+    simulation resumes from base's checkpoint for the first year the change
+    can affect and reuses base's rows before it. The result is identical to
+    simulate(hh, tax_cfg).
+
+    Args:
+        hh: Household to simulate (not modified)
+        tax_cfg: Tax configuration from load_tax_config()
+        base: Previous result of simulate_what_if() to resume from, if any
+
+    Returns:
+        CheckpointedRun with the DataFrame and this run's checkpoints
+    """
+    # A GIS-Optimized base run may have kept either plan (_best_plan_run()), and a
+    # late-life change can flip which one wins: those always run from the start
+    start = resume_point(base, hh, tax_cfg) if not get_strategy_plan(hh.strategy).gis_optimized else None
+
+    def run(plan):
+        work = hh.working_copy()
+        checkpoints = list(base.checkpoints[:start.index]) if start is not None else []
+        df = _simulate(work, tax_cfg, checkpoints=checkpoints, plan=plan,
+                       resume_from=start, prefix=base.df if start is not None else None)
+        return work, CheckpointedRun(
+            household=hh,
+            tax_version=config_version(tax_cfg),
+            df=df,
+            checkpoints=checkpoints,
+            years_reused=start.index if start is not None else 0,
+        )
+
+    with tax_cache_scope():
+        return _best_plan_run(hh, tax_cfg, run)
+
+
+def _plan_aggregates(result) -> SimulationAggregates:
+    """Plan totals of a _simulate() result, frame or metrics, or of a CheckpointedRun"""
+    if isinstance(result, CheckpointedRun):
+        result = result.df
+    return result.attrs["aggregates"] if isinstance(result, pd.DataFrame) else result
+
+
+def _best_plan_run(hh: Household, tax_cfg: Dict, run):
+    """
+    Result of run(plan) for the household's StrategyPlan, or for its fallback if that does better.
+
+    run(plan) returns (the run's working copy, result). The GIS-Optimized
+    segment walk prices one year at a time, so it can spend TFSA and non-reg
+    money that would have kept later years' RRIF draws (and GIS clawback)
+    down. When its plan leaves years unfunded or is pruned, the plan runs
+    again with gis_walk=False (estimated_gis_withdrawals()) and the run with
+    more funded years, then the smaller total gap, is kept. Minimize-income
+    insights are added to the kept frame only.
+    """
+    plan = get_strategy_plan(hh.strategy)
+    work, result = run(plan)
+    if not plan.gis_optimized:
+        return result
+
+    def outcome(a):
+        return (not getattr(a, "pruned", False), a.years_funded, -a.total_underfunding)
+
+    agg = _plan_aggregates(result)
+    if agg.years_funded < agg.years_simulated or getattr(agg, "pruned", False):
+        fallback_work, fallback = run(replace(plan, gis_walk=False))
+        if outcome(_plan_aggregates(fallback)) > outcome(agg):
+            work, result = fallback_work, fallback
+
+    df = result.df if isinstance(result, CheckpointedRun) else result
+    if isinstance(df, pd.DataFrame):
+        _add_minimize_income_insights(work, df, tax_cfg)
+    return result
+
+
+def _simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = None,
+              mode: str = "frame", min_years_funded: Optional[int] = None,
+              max_total_tax: Optional[float] = None,
+              checkpoints: Optional[List[YearCheckpoint]] = None,
+              resume_from: Optional[YearCheckpoint] = None,
+              prefix: Optional[pd.DataFrame] = None,
+              plan: Optional[StrategyPlan] = None):
+    # Indexed tax params for the whole horizon, compiled once and shared across simulations
+    tax_schedule = get_compiled_schedule(
+        tax_cfg, hh.province, hh.general_inflation,
+        horizon=max(hh.end_age - hh.p1.start_age + 2, 1),
+    )
+    fed, prov = tax_schedule.params_for(0)
 
     # Initialize tax optimization tools
     tax_optimizer = TaxOptimizer(hh, fed, fed.gis_config)  # For optimizing withdrawal sequences
@@ -2660,22 +2613,14 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             error_msg = f"Early RRIF withdrawal validation failed for {person.name}: " + "; ".join(validation_errors)
             raise ValueError(error_msg)
 
-    # US-074: Auto-calculate endAge for rental income linked to downsizing (one-time initialization)
-    for person in get_participants(hh):
-        for other_income in getattr(person, 'other_incomes', []):
-            income_type = other_income.get('type', '')
-            if income_type == 'rental':
-                # Only auto-calculate if endAge is not already set
-                if other_income.get('endAge') is None:
-                    # Check if person has downsizing plan
-                    if person.plan_to_downsize and person.downsize_year:
-                        # Calculate age when property will be sold
-                        years_until_downsize = person.downsize_year - hh.start_year
-                        rental_end_age = person.start_age + years_until_downsize
-                        # Set endAge in the dictionary (persists for all simulation years)
-                        other_income['endAge'] = rental_end_age
-
-    rows = []
+    # One preallocated array per output column, sized to the longest-lived person's horizon.
+    # Metrics mode keeps running totals behind the same interface instead.
+    horizon_years = hh.end_age - min(age1, age2 if age2 is not None else age1) + 1
+    metrics_only = mode == "metrics"
+    if metrics_only:
+        rows = MetricsAccumulator(hh.strategy, horizon_years, min_years_funded, max_total_tax)
+    else:
+        rows = YearResultColumns(horizon_years)
     tfsa_room1 = p1.tfsa_room_start
     tfsa_room2 = p2.tfsa_room_start if p2 else 0.0
 
@@ -2683,7 +2628,50 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
     rrsp_to_rrif1 = (age1 >= 71)
     rrsp_to_rrif2 = (age2 >= 71) if p2 else False
 
+    # What-if re-runs pick up the carried state at a year boundary of an earlier
+    # run (simulate_what_if) and keep that run's rows before it
+    if resume_from is not None:
+        cp = resume_from
+        year, age1, age2 = cp.year, cp.age1, cp.age2
+        p1, p2 = cp.people()
+        hh.p1 = p1
+        if p2 is not None:
+            hh.p2 = p2
+        tfsa_room1, tfsa_room2 = cp.tfsa_room1, cp.tfsa_room2
+        tfsa_withdraw_last_year1 = cp.tfsa_withdraw_last_year1
+        tfsa_withdraw_last_year2 = cp.tfsa_withdraw_last_year2
+        cumulative_retirement_taxes = cp.cumulative_retirement_taxes
+        previous_year_status = cp.previous_year_status
+        alternating_pattern_count = cp.alternating_pattern_count
+        rows = YearResultColumns.from_frame(prefix, cp.index, horizon_years)
+
+    # Withdrawal strategy resolved once per run (order and strategy-specific rules)
+    if plan is None:
+        plan = get_strategy_plan(hh.strategy)
+
+    # Custom CSV directives, validated and keyed by year once per run
+    directives = CustomDirectives(custom_df) if custom_df is not None and not custom_df.empty else None
+
+    # CPP/OAS, pensions and other income by year, compiled once per run
+    # (US-074 rental end ages from downsizing included)
+    income1 = IncomeSchedule(p1, hh, horizon_years)
+    income2 = IncomeSchedule(p2, hh, horizon_years) if p2 else None
+
+    def checkpoint():
+        return YearCheckpoint(
+            index=len(rows), year=year, age1=age1, age2=age2, p1=p1, p2=p2,
+            tfsa_room1=tfsa_room1, tfsa_room2=tfsa_room2,
+            tfsa_withdraw_last_year1=tfsa_withdraw_last_year1,
+            tfsa_withdraw_last_year2=tfsa_withdraw_last_year2,
+            cumulative_retirement_taxes=cumulative_retirement_taxes,
+            previous_year_status=previous_year_status,
+            alternating_pattern_count=alternating_pattern_count,
+        )
+
     while age1 <= hh.end_age or (p2 and age2 <= hh.end_age):
+        if checkpoints is not None:
+            checkpoints.append(checkpoint())
+
         # CRA TFSA RULES: At start of year, add contribution room
         # Room = Annual limit ($7,000 for 2025/2026) + Previous year's withdrawals
         # This correctly implements CRA rules where withdrawals become re-contribution room
@@ -2711,49 +2699,22 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         else:
             target_each = spend/2.0  # Couples split the spending
 
-        # DEBUG: Log spending target calculation
-        if hh.province == "QC" and year >= 2031 and year <= 2035:
-            print(f"DEBUG TARGET CALC [Year {year}]:", file=sys.stderr)
-            print(f"  Base spend: ${base_spend:,.0f}", file=sys.stderr)
-            print(f"  Inflation factor: {infl_factor:.4f}", file=sys.stderr)
-            print(f"  Inflated spend: ${spend:,.0f}", file=sys.stderr)
-            print(f"  Is couple: {household_is_couple}", file=sys.stderr)
-            print(f"  Target each: ${target_each:,.0f}", file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("withdrawals", "spending_target", year=year, base_spend=base_spend,
+                       inflation_factor=infl_factor, spend=spend, target_each=target_each)
        
         #   index tax params for this year using general inflation
-        fed_y  = index_tax_params(fed,  years_since_start, hh.general_inflation)
-        prov_y = index_tax_params(prov, years_since_start, hh.general_inflation)
-
-        # Custom CSV directives
-        cust = {
-            "p1":{"nonreg":0.0,"rrif":0.0,"tfsa":0.0,"corp":0.0},
-            "p2":{"nonreg":0.0,"rrif":0.0,"tfsa":0.0,"corp":0.0}
-        }
-        if custom_df is not None and not custom_df.empty:
-            for _, r in custom_df[custom_df["year"]==year].iterrows():
-                who = "p1" if str(r["person"]).strip().lower() in ["p1","juan","1"] else "p2"
-                acct = str(r["account"]).strip().lower()
-                amt = float(r["amount"])
-                if acct in ["nonreg","rrif","tfsa","corp"]:
-                    cust[who][acct] += max(amt,0.0)
-
-        # ---- NEW: per-year NR yield overrides from CSV (optional) ----
-        if custom_df is not None and not custom_df.empty:
-            nr_rows = custom_df[
-                (custom_df["year"] == year)
-                & (custom_df["account"].astype(str).str.lower() == "nr_yield")
-            ]
-
-            for _, r in nr_rows.iterrows():
-                who = str(r.get("person", "")).strip().lower()
-                field = str(r.get("field", "")).strip()
-                try:
-                    val = float(r.get("amount", 0.0))
-                except Exception:
-                    continue
-                target = p1 if who in ("p1","juan","1") else (p2 if who in ("p2","daniela","2") else None)
-                if target is not None and hasattr(target, field):
-                    setattr(target, field, val)
+        fed_y, prov_y = tax_schedule.params_for(years_since_start)
+
+        # Custom CSV directives: extra withdrawals and per-year NR yield overrides
+        if directives is not None:
+            cust = directives.withdrawals(year)
+            for who, field, value in directives.yield_overrides(year):
+                target = p1 if who == "p1" else p2
+                if target is not None:
+                    setattr(target, field, value)
+        else:
+            cust = no_withdrawals()
 
         # RRSP growth then conversion at 71
         p1.rrsp_balance *= (1 + p1.yield_rrsp_growth)
@@ -2814,124 +2775,20 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         # Previously, pension/other income was only used for tax calculations but never reduced the
         # withdrawal target, causing the simulator to over-withdraw from accounts.
 
-        # Calculate Person 1 pension and other income
-        p1_pension_income = 0.0
-        p1_pension_incomes = getattr(p1, 'pension_incomes', [])
-
-        # DEBUG: Log pension data
-        if year == 2033 and p1_pension_incomes:
-            print(f"DEBUG PENSION: Year {year}, Age {age1}, Found {len(p1_pension_incomes)} pensions", file=sys.stderr)
-            for i, pension in enumerate(p1_pension_incomes):
-                print(f"  Pension {i}: {pension}", file=sys.stderr)
-
-        for pension in p1_pension_incomes:
-            pension_start_age = pension.get('startAge', 65)
-            pension_end_age = pension.get('endAge')  # Optional end age
-
-            # Check if pension is active based on age range
-            is_active = age1 >= pension_start_age
-            if pension_end_age is not None and age1 >= pension_end_age:
-                is_active = False
-
-            if is_active:
-                annual_amount = pension.get('amount', 0.0)
-                is_indexed = pension.get('inflationIndexed', True)
-
-                if is_indexed:
-                    years_since_pension_start = age1 - pension_start_age
-                    annual_amount *= ((1 + hh.general_inflation) ** years_since_pension_start)
-
-                p1_pension_income += annual_amount
-
-                # DEBUG: Log calculation
-                if year == 2033:
-                    print(f"  -> Pension: Age {age1} >= Start {pension_start_age}, Indexed={is_indexed}, Amount: ${annual_amount:,.0f}, Total: ${p1_pension_income:,.0f}", file=sys.stderr)
-
-        p1_other_income = 0.0
-        p1_other_incomes = getattr(p1, 'other_incomes', [])
-        for income_item in p1_other_incomes:  # Changed variable name to avoid shadowing
-            income_type = income_item.get('type', '')
-            income_start_age = income_item.get('startAge')
-            income_end_age = income_item.get('endAge')
-
-            if income_type == 'employment':
-                if income_start_age is None:
-                    income_start_age = p1.start_age
-                if income_end_age is None:
-                    income_end_age = p1.cpp_start_age
-
-            is_active = True
-            if income_start_age is not None and age1 < income_start_age:
-                is_active = False
-            if income_end_age is not None and age1 >= income_end_age:
-                is_active = False
-
-            if is_active:
-                annual_amount = income_item.get('amount', 0.0)
-                if income_item.get('inflationIndexed', True):
-                    if income_start_age:
-                        years_since_start = age1 - income_start_age
-                        annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
-                    else:
-                        annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
-                p1_other_income += annual_amount
+        # Person 1 pension and other income
+        p1_pension_income = float(income1.pension[years_since_start])
+        p1_other_income = float(income1.other[years_since_start])
 
         # Add rental income for Person 1
         p1_rental_income = real_estate.get_rental_income(p1)
         p1_other_income += p1_rental_income
 
-        # Calculate Person 2 pension and other income
+        # Person 2 pension and other income
         p2_pension_income = 0.0
-        if p2 and age2 is not None:
-            p2_pension_incomes = getattr(p2, 'pension_incomes', [])
-            for pension in p2_pension_incomes:
-                pension_start_age = pension.get('startAge', 65)
-                pension_end_age = pension.get('endAge')  # Optional end age
-
-                # Check if pension is active based on age range
-                is_active = age2 >= pension_start_age
-                if pension_end_age is not None and age2 >= pension_end_age:
-                    is_active = False
-
-                if is_active:
-                    annual_amount = pension.get('amount', 0.0)
-                    is_indexed = pension.get('inflationIndexed', True)
-
-                    if is_indexed:
-                        years_since_pension_start = age2 - pension_start_age
-                        annual_amount *= ((1 + hh.general_inflation) ** years_since_pension_start)
-
-                    p2_pension_income += annual_amount
-
         p2_other_income = 0.0
         if p2 and age2 is not None:
-            p2_other_incomes = getattr(p2, 'other_incomes', [])
-            for income_item in p2_other_incomes:  # Changed variable name to avoid shadowing
-                income_type = income_item.get('type', '')
-                income_start_age = income_item.get('startAge')
-                income_end_age = income_item.get('endAge')
-
-                if income_type == 'employment':
-                    if income_start_age is None:
-                        income_start_age = p2.start_age
-                    if income_end_age is None:
-                        income_end_age = p2.cpp_start_age
-
-                is_active = True
-                if income_start_age is not None and age2 < income_start_age:
-                    is_active = False
-                if income_end_age is not None and age2 >= income_end_age:
-                    is_active = False
-
-                if is_active:
-                    annual_amount = income_item.get('amount', 0.0)
-                    if income_item.get('inflationIndexed', True):
-                        if income_start_age:
-                            years_since_start = age2 - income_start_age
-                            annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
-                        else:
-                            annual_amount *= ((1 + hh.general_inflation) ** years_since_start)
-                    p2_other_income += annual_amount
+            p2_pension_income = float(income2.pension[years_since_start])
+            p2_other_income = float(income2.other[years_since_start])
 
         # Add rental income for Person 2
         p2_rental_income = 0.0
@@ -2990,7 +2847,7 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             target_p2_adjusted += planned_tfsa_p2
 
         # Strategy-specific adjustments for TFSA contributions
-        if hh.strategy and "rrif-frontload" in hh.strategy.lower():
+        if plan.rrif_frontload:
             # SMART TFSA CONTRIBUTION STRATEGY FOR RRIF-FRONTLOAD
             # Adjust contributions based on age and OAS/CPP status
             # Determine contribution amounts based on age and benefit status
@@ -3034,61 +2891,65 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
                 target_p2_adjusted += planned_tfsa_p2
 
-        # Debug logging for TFSA planning
-        if year >= 2031 and year <= 2035 and (planned_tfsa_p1 > 0 or planned_tfsa_p2 > 0):
-            strategy_name = hh.strategy if hh.strategy else "default"
-            print(f"\n💡 TFSA PLANNING Year {year} [{strategy_name}]:", file=sys.stderr)
-            print(f"   Planned TFSA P1: ${planned_tfsa_p1:,.0f} (room: ${tfsa_room1:,.0f})", file=sys.stderr)
-            print(f"   Planned TFSA P2: ${planned_tfsa_p2:,.0f} (room: ${tfsa_room2:,.0f})", file=sys.stderr)
-            print(f"   Adjusted target P1: ${target_p1_adjusted:,.0f} (includes ${planned_tfsa_p1:,.0f} TFSA)", file=sys.stderr)
-            print(f"   Adjusted target P2: ${target_p2_adjusted:,.0f} (includes ${planned_tfsa_p2:,.0f} TFSA)", file=sys.stderr)
-
-        # Debug: Check types before calling simulate_year
-        print(f"DEBUG: Type of p1_pension_income: {type(p1_pension_income)}, value: {p1_pension_income}", file=sys.stderr)
-        print(f"DEBUG: Type of p1_other_income: {type(p1_other_income)}, value: {p1_other_income}", file=sys.stderr)
-
-        # DEBUG: Track alternating pattern issue
-        if hh.province == "QC" and year >= 2031 and year <= 2040:
-            print(f"\n🔍 ALTERNATING PATTERN DEBUG - Year {year}, Age {age1}:", file=sys.stderr)
-            print(f"   Target (after-tax): ${target_p1_adjusted:,.0f}", file=sys.stderr)
-            print(f"   Original target_each: ${target_each:,.0f}", file=sys.stderr)
-            print(f"   Mortgage payment p1: ${mortgage_p1:,.0f}", file=sys.stderr)
-            print(f"   P1 RRIF balance: ${p1.rrif_balance:,.0f}", file=sys.stderr)
-            print(f"   P1 TFSA balance: ${p1.tfsa_balance:,.0f}", file=sys.stderr)
+        if trace.ACTIVE and (planned_tfsa_p1 > 0 or planned_tfsa_p2 > 0):
+            trace.emit("withdrawals", "tfsa_planning", year=year, strategy=hh.strategy,
+                       planned_tfsa_p1=planned_tfsa_p1, planned_tfsa_p2=planned_tfsa_p2,
+                       tfsa_room_p1=tfsa_room1, tfsa_room_p2=tfsa_room2,
+                       target_p1=target_p1_adjusted, target_p2=target_p2_adjusted)
 
         # Then call simulate_year with fed_y/prov_y (not the base fed/prov):
-        w1, t1, info1 = simulate_year(
-            p1, age1, target_p1_adjusted, fed_y, prov_y, rrsp_to_rrif1, cust["p1"],
-            hh.strategy, hh.hybrid_rrif_topup_per_person, hh, year, tfsa_room1, tax_optimizer,
-            p1_pension_income, p1_other_income
+        def year_p1(target, **gis_kw):
+            return simulate_year(
+                p1, age1, target, fed_y, prov_y, rrsp_to_rrif1, cust["p1"],
+                hh.strategy, hh.hybrid_rrif_topup_per_person, hh, year, tfsa_room1, tax_optimizer,
+                p1_pension_income, p1_other_income, income1, plan, **gis_kw
             )
 
-        # DEBUG: Check what withdrawals were returned
-        if year <= 2026:
-            print(f"DEBUG W1 RETURNED: Year {year}, w1={w1}", file=sys.stderr)
+        def year_p2(target, **gis_kw):
+            return simulate_year(
+                p2, age2, target, fed_y, prov_y, rrsp_to_rrif2, cust["p2"],
+                hh.strategy, hh.hybrid_rrif_topup_per_person, hh, year, tfsa_room2, tax_optimizer,
+                p2_pension_income, p2_other_income, income2, plan, **gis_kw
+            )
+
+        if plan.gis_optimized and plan.gis_walk and household_is_couple:
+            # GIS-Optimized couple: GIS is priced on combined income. The spouse with
+            # less saved runs first and hands what they cannot raise to the other
+            # spouse's year, whose allocator then prices it at the couple's marginal
+            # cost (couple_gis_breakpoints() at the first spouse's actual GIS income)
+            oas_y1 = float(income1.oas[years_since_start])
+            oas_y2 = float(income2.oas[years_since_start])
+            if _drawable_savings(p2) < _drawable_savings(p1):
+                # Before p1 has run, its GIS income is estimated from fixed income and the RRIF minimum
+                gis_income_est1 = (float(income1.cpp[years_since_start]) + p1_pension_income + p1_other_income +
+                                   rrif_minimum(p1.rrif_balance, age1))
+                w2, t2, info2 = year_p2(target_p2_adjusted, spouse_gis=(gis_income_est1, oas_y1))
+                carry2 = info2["unmet_after_tax"]  # p2 ran out
+                w1, t1, info1 = year_p1(target_p1_adjusted + carry2, spouse_gis=(info2["gis_net_income"], oas_y2))
+                _hand_over_need(info2, carry2)
+                carry1 = 0.0
+            else:
+                gis_income_est2 = (float(income2.cpp[years_since_start]) + p2_pension_income + p2_other_income +
+                                   rrif_minimum(p2.rrif_balance, age2))
+                w1, t1, info1 = year_p1(target_p1_adjusted, spouse_gis=(gis_income_est2, oas_y2))
+                carry1 = info1["unmet_after_tax"]  # p1 ran out
+                w2, t2, info2 = year_p2(target_p2_adjusted + carry1, spouse_gis=(info1["gis_net_income"], oas_y1))
+                _hand_over_need(info1, carry1)
+                carry2 = 0.0
+
+            if trace.ACTIVE:
+                trace.emit("gis", "couple_cover", year=year, p1_to_p2=carry1, p2_to_p1=carry2,
+                           unmet_p1=info1["unmet_after_tax"], unmet_p2=info2["unmet_after_tax"])
+        else:
+            w1, t1, info1 = year_p1(target_p1_adjusted)
 
         info1["pension_income_p1"] = p1_pension_income
         info1["other_income_p1"] = p1_other_income
 
-        # DEBUG: Track alternating pattern - what was withdrawn?
-        if hh.province == "QC" and year >= 2031 and year <= 2040:
-            total_withdrawals = sum(w1.values()) + sum(w2.values() if household_is_couple else {})
-            print(f"   WITHDRAWALS: RRIF=${w1['rrif']:,.0f}, TFSA=${w1['tfsa']:,.0f}, NonReg=${w1['nonreg']:,.0f}, Corp=${w1['corp']:,.0f}", file=sys.stderr)
-            print(f"   Total withdrawals: ${total_withdrawals:,.0f}", file=sys.stderr)
-            print(f"   CPP: ${t1['cpp']:,.0f}, OAS: ${t1['oas']:,.0f}, GIS: ${t1.get('gis', 0):,.0f}", file=sys.stderr)
-
-        # DEBUG: Log pension income being added to info1
-        if year == 2033:
-            print(f"🎯 DEBUG info1 assignment: p1_pension_income=${p1_pension_income:,.0f} -> info1['pension_income_p1']", file=sys.stderr)
-            print(f"   Verifying: info1['pension_income_p1'] = {info1.get('pension_income_p1', 'NOT SET')}", file=sys.stderr)
-
         # Only simulate person 2 if this is a couple
         if household_is_couple:
-            w2, t2, info2 = simulate_year(
-                p2, age2, target_p2_adjusted, fed_y, prov_y, rrsp_to_rrif2, cust["p2"],
-                hh.strategy, hh.hybrid_rrif_topup_per_person, hh, year, tfsa_room2, tax_optimizer,
-                p2_pension_income, p2_other_income
-            )
+            if not (plan.gis_optimized and plan.gis_walk):
+                w2, t2, info2 = year_p2(target_p2_adjusted)
             # FIX: Add pension and other income to info2 with correct column names
             info2["pension_income_p2"] = p2_pension_income
             info2["other_income_p2"] = p2_other_income
@@ -3141,85 +3002,16 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         # Use household utilities to properly detect couple vs single
         is_couple_household = household_is_couple
 
-        if is_couple_household and oas_p1_current > 0 and oas_p2_current > 0:
-            # ===== CASE 1: BOTH SPOUSES HAVE OAS =====
-            # Each person receives GIS based on couple threshold and combined income
-            gis_income_p1 = float(info1.get("gis_net_income", 0.0))
-            gis_income_p2 = float(info2.get("gis_net_income", 0.0))
-            oas_p1 = float(info1.get("oas", 0.0))
-            oas_p2 = float(info2.get("oas", 0.0))
-            combined_gis_income = gis_income_p1 + gis_income_p2
-
-            # Get GIS config
-            gis_config = fed_y.gis_config if hasattr(fed_y, 'gis_config') else {}
-            couple_threshold = gis_config.get("threshold_couple", 28752)  # 2026 threshold
-            max_benefit_per_person = gis_config.get("max_benefit_couple", 7956.00)  # 2026 max benefit
-            clawback_rate = gis_config.get("clawback_rate", 0.50)
-
-            if year >= 2025:
-                    print(f"DEBUG HH GIS CASE1 (Both OAS) [{year}]: P1_income=${gis_income_p1:,.0f} P2_income=${gis_income_p2:,.0f} Combined=${combined_gis_income:,.0f} threshold=${couple_threshold:,.0f}", file=sys.stderr)
-
-            # Apply couple clawback logic
-            if combined_gis_income >= couple_threshold:
-                total_clawback = (combined_gis_income - couple_threshold) * clawback_rate
-                clawback_per_person = total_clawback / 2.0
-                gis_benefit = max(0.0, max_benefit_per_person - clawback_per_person)
-                if year >= 2025:
-                    print(f"DEBUG HH GIS CASE1 CLAWBACK [{year}]: excess=${combined_gis_income - couple_threshold:,.0f} gis_benefit=${gis_benefit:,.2f}", file=sys.stderr)
-            else:
-                gis_benefit = max_benefit_per_person
-                if year >= 2025:
-                    print(f"DEBUG HH GIS CASE1 BELOW_THRESHOLD [{year}]: gis_benefit=${gis_benefit:,.2f}", file=sys.stderr)
-
-            t1["gis"] = gis_benefit
-            t2["gis"] = gis_benefit
-
-        elif is_couple_household and (oas_p1_current > 0 or oas_p2_current > 0):
-            # ===== CASE 2: ONLY ONE SPOUSE HAS OAS =====
-            # One spouse can receive GIS independently, the other cannot
-            gis_income_p1 = float(info1.get("gis_net_income", 0.0))
-            gis_income_p2 = float(info2.get("gis_net_income", 0.0))
-            combined_gis_income = gis_income_p1 + gis_income_p2
-
-            # Get GIS config
+        if is_couple_household and (oas_p1_current > 0 or oas_p2_current > 0):
+            # ===== CASES 1-2: COUPLE, ONE OR BOTH SPOUSES WITH OAS =====
+            # Both with OAS: each gets GIS on the couple threshold, clawback split
+            # between them. One with OAS: only that spouse gets GIS, tested against
+            # the one-OAS threshold. Either way, on combined GIS income.
             gis_config = fed_y.gis_config if hasattr(fed_y, 'gis_config') else {}
-            one_oas_threshold = gis_config.get("threshold_couple_one_oas", 52080)  # 2026 threshold
-            max_benefit_couple = gis_config.get("max_benefit_couple", 7956.00)  # 2026 max benefit
-            clawback_rate = gis_config.get("clawback_rate", 0.50)
-
-            if year >= 2025:
-                    print(f"DEBUG HH GIS CASE2 (One OAS) [{year}]: P1_income=${gis_income_p1:,.0f} (OAS=${oas_p1_current:,.0f}) P2_income=${gis_income_p2:,.0f} (OAS=${oas_p2_current:,.0f}) Combined=${combined_gis_income:,.0f} threshold=${one_oas_threshold:,.0f}", file=sys.stderr)
-
-            # Person 1 (check if receiving OAS this year)
-            if oas_p1_current > 0:
-                if combined_gis_income >= one_oas_threshold:
-                    total_clawback = (combined_gis_income - one_oas_threshold) * clawback_rate
-                    gis_p1 = max(0.0, max_benefit_couple - total_clawback)
-                    if year >= 2025:
-                        print(f"DEBUG HH GIS CASE2 P1 CLAWBACK [{year}]: excess=${combined_gis_income - one_oas_threshold:,.0f} gis_p1=${gis_p1:,.2f}", file=sys.stderr)
-                else:
-                    gis_p1 = max_benefit_couple
-                    if year >= 2025:
-                        print(f"DEBUG HH GIS CASE2 P1 BELOW_THRESHOLD [{year}]: gis_p1=${gis_p1:,.2f}", file=sys.stderr)
-                t1["gis"] = gis_p1
-            else:
-                t1["gis"] = 0.0
-
-            # Person 2 (check if receiving OAS this year)
-            if oas_p2_current > 0:
-                # Same logic as person 1
-                if combined_gis_income >= one_oas_threshold:
-                    total_clawback = (combined_gis_income - one_oas_threshold) * clawback_rate
-                    gis_p2 = max(0.0, max_benefit_couple - total_clawback)
-                    if year >= 2025:
-                        print(f"DEBUG HH GIS CASE2 P2 CLAWBACK [{year}]: excess=${combined_gis_income - one_oas_threshold:,.0f} gis_p2=${gis_p2:,.2f}", file=sys.stderr)
-                else:
-                    gis_p2 = max_benefit_couple
-                    if year >= 2025:
-                        print(f"DEBUG HH GIS CASE2 P2 BELOW_THRESHOLD [{year}]: gis_p2=${gis_p2:,.2f}", file=sys.stderr)
-                t2["gis"] = gis_p2
-            else:
-                t2["gis"] = 0.0
+            t1["gis"], t2["gis"] = couple_gis(
+                float(info1.get("gis_net_income", 0.0)), float(info2.get("gis_net_income", 0.0)),
+                oas_p1_current, oas_p2_current, gis_config,
+            )
 
         elif not is_couple_household and oas_p1_current > 0:
             # ===== CASE 3: SINGLE PERSON WITH OAS =====
@@ -3260,28 +3052,22 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             max_benefit_single = gis_config.get("max_benefit_single", 13265.16)  # 2026 max benefit
             clawback_rate = gis_config.get("clawback_rate", 0.50)
 
-            if year >= 2025:
-                print(f"DEBUG HH GIS CASE3 (Single) [{year}]: P1_income=${gis_income_p1:,.0f} threshold=${single_threshold:,.0f}", file=sys.stderr)
-                if abs(gis_income_p1_actual - gis_income_p1_original) > 1:
-                    print(f"  GIS income recalculation: Original=${gis_income_p1_original:,.0f}, Actual=${gis_income_p1_actual:,.0f}, Using=${gis_income_p1:,.0f}", file=sys.stderr)
-                    print(f"    Components: CPP=${cpp_p1:,.0f}, RRIF=${rrif_withdrawal_p1:,.0f}, Corp=${corp_withdrawal_p1:,.0f}", file=sys.stderr)
-
             # Apply single person clawback logic
             if gis_income_p1 >= single_threshold:
                 clawback = (gis_income_p1 - single_threshold) * clawback_rate
                 gis_benefit = max(0.0, max_benefit_single - clawback)
-                if year >= 2025:
-                    print(f"DEBUG HH GIS CASE3 CLAWBACK [{year}]: excess=${gis_income_p1 - single_threshold:,.0f} gis_benefit=${gis_benefit:,.2f}", file=sys.stderr)
             else:
                 gis_benefit = max_benefit_single
-                if year >= 2025:
-                    print(f"DEBUG HH GIS CASE3 BELOW_THRESHOLD [{year}]: gis_benefit=${gis_benefit:,.2f}", file=sys.stderr)
 
             t1["gis"] = gis_benefit
             t2["gis"] = 0.0  # p2 doesn't exist for single person
 
-        if year >= 2025:
-            print(f"DEBUG HH GIS FINAL [{year}]: t1[gis]=${t1.get('gis', 0):,.2f} t2[gis]=${t2.get('gis', 0):,.2f}", file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("gis", "household_gis", year=year, couple=is_couple_household,
+                       oas_p1=oas_p1_current, oas_p2=oas_p2_current,
+                       gis_income_p1=float(info1.get("gis_net_income", 0.0)),
+                       gis_income_p2=float(info2.get("gis_net_income", 0.0)),
+                       gis_p1=t1.get("gis", 0.0), gis_p2=t2.get("gis", 0.0))
 
         # Household-level funding gap in this year
         # CRITICAL FIX: For married couples sharing finances, calculate gap at household level
@@ -3501,13 +3287,10 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
         # Corporate: subtract dividends paid, add RDTOH refund received in year,
         # then add retained passive income for the year (from corp_info)
-        # DEBUG: Track corporate balance update
-        if year == 2026:
-            corp_before = p1.corporate_balance
-            corp_withdrawal = w1["corp"]
-            corp_refund = info1["corp_refund"]
-            corp_retained = info1.get("corp_retained", 0.0)
-            print(f"   💰 Corp balance update: ${corp_before:,.0f} - ${corp_withdrawal:,.0f} + ${corp_refund:,.0f} + ${corp_retained:,.0f}", file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("corp", "balance_update", person=p1.name, year=year,
+                       balance=p1.corporate_balance, withdrawal=w1["corp"],
+                       refund=info1["corp_refund"], retained=info1.get("corp_retained", 0.0))
 
         # Update corporate balance and buckets proportionally
         # When withdrawing from corporate, reduce buckets proportionally
@@ -3554,14 +3337,6 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         # p1.tfsa_balance currently = (start - withdrawal) * (1 + growth)
         # We need to recalculate as: (start - withdrawal) * (1 + growth) + contributions + surplus
 
-        # Debug logging for TFSA contributions
-        if year >= 2033 and year <= 2034:
-            print(f"\nDEBUG TFSA CONTRIBUTION [{year}]:", file=sys.stderr)
-            print(f"  hh.tfsa_contribution_each: ${hh.tfsa_contribution_each:,.0f}", file=sys.stderr)
-            print(f"  p1.nonreg_balance: ${p1.nonreg_balance:,.0f}", file=sys.stderr)
-            print(f"  tfsa_room1: ${tfsa_room1:,.0f}", file=sys.stderr)
-            print(f"  hh_gap: ${hh_gap:,.2f}", file=sys.stderr)
-
         # CRITICAL FIX: Don't contribute to TFSA if there's a household funding gap
         # Check if household spending is fully funded before allowing TFSA contributions
         if hh_gap > 1e-6:
@@ -3575,40 +3350,19 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
             # For RRIF front-load strategy: Use planned TFSA amounts (already included in withdrawal target)
             # For other strategies: Use traditional approach (contribute from NonReg balance)
-            if hh.strategy and "rrif-frontload" in hh.strategy.lower() and (planned_tfsa_p1 > 0 or planned_tfsa_p2 > 0):
+            if plan.rrif_frontload and (planned_tfsa_p1 > 0 or planned_tfsa_p2 > 0):
                 # RRIF front-load: We already withdrew enough to cover TFSA contributions
                 # Just need to move the cash from wherever it was withdrawn (likely NonReg) to TFSA
                 c1 = min(planned_tfsa_p1, tfsa_room1)
                 c2 = min(planned_tfsa_p2, tfsa_room2)
-
-                if year >= 2031 and year <= 2035 and (c1 > 0 or c2 > 0):
-                    print(f"💰 RRIF FRONT-LOAD TFSA FUNDING Year {year}:", file=sys.stderr)
-                    print(f"   Contributing ${c1:,.0f} to P1 TFSA (planned: ${planned_tfsa_p1:,.0f})", file=sys.stderr)
-                    print(f"   Contributing ${c2:,.0f} to P2 TFSA (planned: ${planned_tfsa_p2:,.0f})", file=sys.stderr)
             else:
                 # Traditional approach: Contribute from NonReg balance
                 c1 = min(hh.tfsa_contribution_each, max(p1.nonreg_balance,0.0), tfsa_room1)
                 c2 = min(hh.tfsa_contribution_each, max(p2.nonreg_balance if p2 else 0, 0.0), tfsa_room2)
 
-                if year >= 2031 and year <= 2035 and (c1 > 0 or c2 > 0):
-                    print(f"💸 TRADITIONAL TFSA CONTRIBUTION Year {year}:", file=sys.stderr)
-                    print(f"   tfsa_contribution_each setting: ${hh.tfsa_contribution_each:,.0f}", file=sys.stderr)
-                    print(f"   P1 NonReg balance: ${p1.nonreg_balance:,.0f}", file=sys.stderr)
-                    print(f"   P1 TFSA room: ${tfsa_room1:,.0f}", file=sys.stderr)
-                    print(f"   Contributing c1: ${c1:,.0f}", file=sys.stderr)
-
             # CRITICAL: Ensure we're not over-contributing
-            if c1 > tfsa_room1:
-                print(f"⛔ CRA VIOLATION PREVENTED Year {year}: Attempted TFSA contribution ${c1:,.0f} exceeds room ${tfsa_room1:,.0f}", file=sys.stderr)
-                c1 = tfsa_room1
-            if c2 > tfsa_room2:
-                print(f"⛔ CRA VIOLATION PREVENTED Year {year}: Attempted TFSA contribution ${c2:,.0f} exceeds room ${tfsa_room2:,.0f}", file=sys.stderr)
-                c2 = tfsa_room2
-
-            # More debug logging after calculation
-            if year >= 2033 and year <= 2034:
-                print(f"  Calculated c1: ${c1:,.0f}", file=sys.stderr)
-                print(f"  Calculated c2: ${c2:,.0f}", file=sys.stderr)
+            c1 = min(c1, tfsa_room1)
+            c2 = min(c2, tfsa_room2)
 
             # REINVEST SURPLUS: Surplus is added AFTER growth but BEFORE year-end balance
             # Get surplus from both people's simulate_year() calls (use household total)
@@ -3622,12 +3376,10 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
         # ENHANCED RRIF FRONT-LOAD STRATEGY WITH TAX-AWARE TFSA CONTRIBUTIONS:
         # Intelligently decide TFSA contributions based on tax situation
-        if hh.strategy and "rrif-frontload" in hh.strategy.lower():
+        if plan.rrif_frontload:
             # Only contribute to TFSA if we have genuine surplus (no funding gap)
             if hh_gap > 1e-6:
                 # There's still a gap - don't contribute to TFSA
-                if year >= 2031 and year <= 2035:
-                    print(f"⚠️ RRIF FRONT-LOAD: Gap exists (${hh_gap:,.2f}), skipping TFSA Year {year}", file=sys.stderr)
                 c1 = 0.0
                 c2 = 0.0
                 surplus_remaining = 0.0
@@ -3670,18 +3422,9 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
                         # Higher tax bracket: Reduce
                         c2 = min(c2 * 0.5, tfsa_room2)
 
-                if year >= 2031 and year <= 2035 and (c1 > 0 or c2 > 0):
-                    print(f"✅ RRIF FRONT-LOAD TAX-AWARE TFSA Year {year}:", file=sys.stderr)
-                    print(f"   P1: Income=${total_income_p1:,.0f}, TFSA=${c1:,.0f}", file=sys.stderr)
-                    print(f"   P2: Income=${total_income_p2:,.0f}, TFSA=${c2:,.0f}", file=sys.stderr)
-                    print(f"   Strategy: Maximize TFSA before OAS, reduce after", file=sys.stderr)
-
-        # Debug logging for surplus allocation
-        if year >= 2033 and year <= 2034 and surplus_for_reinvest > 0:
-            print(f"\nDEBUG SURPLUS ALLOCATION [{year}]:", file=sys.stderr)
-            print(f"  Total surplus for reinvest: ${surplus_for_reinvest:,.0f}", file=sys.stderr)
-            print(f"  Surplus remaining (after front-load check): ${surplus_remaining:,.0f}", file=sys.stderr)
-            print(f"  TFSA room1: ${tfsa_room1:,.0f}, c1: ${c1:,.0f}", file=sys.stderr)
+                if trace.ACTIVE:
+                    trace.emit("rrif", "frontload_tfsa", year=year, income_p1=total_income_p1,
+                               income_p2=total_income_p2, tfsa_p1=c1, tfsa_p2=c2)
 
         # Calculate remaining room after contributions (c1 and c2 use up room)
         remaining_room1 = max(0.0, tfsa_room1 - c1)
@@ -3718,8 +3461,10 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
                 surplus_remaining -= tfsa_reinvest_p2
         elif surplus_remaining > 1e-6 and potential_gap_after_tfsa > 1e-6:
             # Moving surplus to TFSA would create a gap - don't do it
-            print(f"⚠️ TFSA REINVESTMENT BLOCKED Year {year}: Would create ${potential_gap_after_tfsa:,.0f} gap", file=sys.stderr)
-            print(f"   Surplus: ${surplus_for_reinvest:,.0f}, Available: ${household_total_available:,.0f}, Target: ${household_total_target:,.0f}", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "tfsa_reinvest_blocked", year=year,
+                           potential_gap=potential_gap_after_tfsa, surplus=surplus_for_reinvest,
+                           available=household_total_available, target=household_total_target)
             tfsa_reinvest_p1 = 0.0
             tfsa_reinvest_p2 = 0.0
 
@@ -3732,20 +3477,18 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         # CRITICAL CRA COMPLIANCE: Absolutely prevent over-contributions (1% monthly penalty)
         if total_tfsa_contrib_p1 > tfsa_room1 + 1e-6:  # Allow tiny rounding error
             # This should never happen with proper logic, but safety check is critical
-            print(f"⛔ TFSA OVER-CONTRIBUTION BLOCKED Year {year} P1!", file=sys.stderr)
-            print(f"   Attempted: ${total_tfsa_contrib_p1:,.0f} (c1=${c1:,.0f} + reinvest=${tfsa_reinvest_p1:,.0f})", file=sys.stderr)
-            print(f"   Available room: ${tfsa_room1:,.0f}", file=sys.stderr)
-            print(f"   Would trigger 1% monthly CRA penalty = ${(total_tfsa_contrib_p1 - tfsa_room1) * 0.01:,.0f}/month", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "tfsa_overcontribution_blocked", person=p1.name, year=year,
+                           attempted=total_tfsa_contrib_p1, room=tfsa_room1)
             # Force compliance - cap at available room
             total_tfsa_contrib_p1 = tfsa_room1
             tfsa_reinvest_p1 = max(0.0, tfsa_room1 - c1)
             surplus_remaining += (total_tfsa_contrib_p1 - tfsa_room1)  # Return excess to surplus
 
         if p2 and total_tfsa_contrib_p2 > tfsa_room2 + 1e-6:
-            print(f"⛔ TFSA OVER-CONTRIBUTION BLOCKED Year {year} P2!", file=sys.stderr)
-            print(f"   Attempted: ${total_tfsa_contrib_p2:,.0f}", file=sys.stderr)
-            print(f"   Available room: ${tfsa_room2:,.0f}", file=sys.stderr)
-            print(f"   Would trigger 1% monthly CRA penalty = ${(total_tfsa_contrib_p2 - tfsa_room2) * 0.01:,.0f}/month", file=sys.stderr)
+            if trace.ACTIVE:
+                trace.emit("withdrawals", "tfsa_overcontribution_blocked", person=p2.name, year=year,
+                           attempted=total_tfsa_contrib_p2, room=tfsa_room2)
             # Force compliance
             total_tfsa_contrib_p2 = tfsa_room2
             tfsa_reinvest_p2 = max(0.0, tfsa_room2 - c2)
@@ -3764,20 +3507,19 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
         # NonReg: add remaining surplus (fallback when TFSA is full)
         # CRITICAL FIX: Only add to non-reg if there's no spending gap
-        if surplus_remaining > 1e-6:
-            if hh_gap < 1e-6:
-                p1.nonreg_balance += surplus_remaining
-                # Note: ACB stays the same; reinvested amount is added at current market value
-                if year >= 2033 and year <= 2034:
-                            print(f"DEBUG NONREG SURPLUS [{year}]: Added ${surplus_remaining:,.0f} to non-reg, new balance=${p1.nonreg_balance:,.0f}", file=sys.stderr)
-            else:
-                if year >= 2033 and year <= 2034:
-                            print(f"DEBUG NONREG SURPLUS [{year}]: NOT adding ${surplus_remaining:,.0f} to non-reg because hh_gap=${hh_gap:,.2f} > 0", file=sys.stderr)
+        if surplus_remaining > 1e-6 and hh_gap < 1e-6:
+            p1.nonreg_balance += surplus_remaining
+            # Note: ACB stays the same; reinvested amount is added at current market value
+
+        if trace.ACTIVE:
+            trace.emit("withdrawals", "surplus_allocation", year=year, surplus=surplus_for_reinvest,
+                       tfsa_contrib_p1=c1, tfsa_contrib_p2=c2, tfsa_reinvest_p1=tfsa_reinvest_p1,
+                       tfsa_reinvest_p2=tfsa_reinvest_p2, nonreg_reinvest=surplus_remaining if hh_gap < 1e-6 else 0.0,
+                       hh_gap=hh_gap)
 
         # Store this year's TFSA withdrawals for next year's room calculation
         tfsa_withdraw_last_year1 = w1["tfsa"]
         tfsa_withdraw_last_year2 = w2["tfsa"]
-        total_withdrawals = sum(w1.values()) + sum(w2.values())
 
         # Calculate net worth AFTER contributions/surplus are added
         # (to properly reflect what's been invested for next year's growth)
@@ -3837,11 +3579,6 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         other_income_p1 = float(info1.get("other_income_p1", 0.0))
         other_income_p2 = float(info2.get("other_income_p2", 0.0))
 
-        # DEBUG: Log extraction from info1
-        if year == 2033:
-            print(f"📊 DEBUG YearResult extraction: info1.get('pension_income_p1') = ${pension_income_p1:,.0f}", file=sys.stderr)
-            print(f"   Will be passed to YearResult as pension_income_p1=${pension_income_p1:,.0f}", file=sys.stderr)
-
         _calc_total = (tax1_fed + tax1_prov) + (tax2_fed + tax2_prov)
         # Use relative tolerance check for final validation (accounts for floating-point precision at any scale)
         assert _rel_tol_check(total_tax_after_split, _calc_total), \
@@ -3860,14 +3597,6 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             w2["nonreg"] + w2["rrif"] + w2["tfsa"] + w2["corp"]
         )
 
-        # DEBUG: Track RRIF withdrawals for gap analysis
-        if year >= 2031 and year <= 2035:
-            print(f"\n💸 ACTUAL WITHDRAWALS Year {year}:", file=sys.stderr)
-            print(f"   P1 RRIF: ${w1['rrif']:,.0f}", file=sys.stderr)
-            print(f"   P2 RRIF: ${w2['rrif']:,.0f}", file=sys.stderr)
-            print(f"   Total RRIF: ${w1['rrif'] + w2['rrif']:,.0f}", file=sys.stderr)
-            print(f"   Total account withdrawals: ${total_account_withdrawals:,.0f}", file=sys.stderr)
-
         # Non-registered distributions (automatic yield distributions)
         nr_distributions_total = nr_tot_house
 
@@ -3883,19 +3612,6 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             total_account_withdrawals + nr_distributions_total - total_tax_after_split
         )
 
-        # DEBUG: Log the components
-        if year >= 2031 and year <= 2033:
-            print(f"\n💰 TOTAL AVAILABLE AFTER TAX CALC Year {year}:", file=sys.stderr)
-            print(f"   CPP: ${cpp_total:,.0f}", file=sys.stderr)
-            print(f"   OAS: ${oas_total:,.0f}", file=sys.stderr)
-            print(f"   GIS: ${gis_total:,.0f}", file=sys.stderr)
-            print(f"   Pension: ${pension_income_total:,.0f}", file=sys.stderr)
-            print(f"   Other Income: ${other_income_total:,.0f}", file=sys.stderr)
-            print(f"   Account Withdrawals: ${total_account_withdrawals:,.0f}", file=sys.stderr)
-            print(f"   NR Distributions: ${nr_distributions_total:,.0f}", file=sys.stderr)
-            print(f"   Total Tax: ${total_tax_after_split:,.0f}", file=sys.stderr)
-            print(f"   = Total Available After Tax: ${total_available_after_tax:,.0f}", file=sys.stderr)
-
         # CRITICAL FIX: Only regular TFSA contributions (c1, c2) reduce available spending cash
         # Surplus reinvestments (tfsa_reinvest_p1, tfsa_reinvest_p2) come from SURPLUS, not spending money
         regular_tfsa_contributions = c1 + c2  # Only regular contributions reduce spending ability
@@ -3924,14 +3640,14 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
         # CRITICAL FIX: Update hh_gap with actual gap after TFSA contributions
         # This ensures the gap shown to users reflects reality
-        if year >= 2031 and year <= 2035:
-            print(f"\n🔍 GAP RECALCULATION Year {year}:", file=sys.stderr)
-            print(f"   Original target: ${original_target_total:,.0f}", file=sys.stderr)
-            print(f"   Total available after tax: ${total_available_after_tax:,.0f}", file=sys.stderr)
-            print(f"   TFSA contributions (total_tfsa_contrib_p1={total_tfsa_contrib_p1:,.0f}, total_tfsa_contrib_p2={total_tfsa_contrib_p2:,.0f}): ${total_tfsa_contributions:,.0f}", file=sys.stderr)
-            print(f"   Net available after TFSA: ${net_available_after_tfsa:,.0f}", file=sys.stderr)
-            print(f"   Actual spending gap: ${actual_spending_gap:,.0f}", file=sys.stderr)
-            print(f"   🔍 DEBUG: c1={c1:,.0f}, c2={c2:,.0f}, tfsa_reinvest_p1={tfsa_reinvest_p1:,.0f}, tfsa_reinvest_p2={tfsa_reinvest_p2:,.0f}", file=sys.stderr)
+        if trace.ACTIVE:
+            trace.emit("withdrawals", "household_gap", year=year, target=original_target_total,
+                       cpp=cpp_total, oas=oas_total, gis=gis_total, pension=pension_income_total,
+                       other_income=other_income_total, account_withdrawals=total_account_withdrawals,
+                       nr_distributions=nr_distributions_total, tax=total_tax_after_split,
+                       available_after_tax=total_available_after_tax,
+                       tfsa_contributions=total_tfsa_contributions,
+                       net_available=net_available_after_tfsa, gap=actual_spending_gap)
 
         hh_gap = actual_spending_gap
         is_fail = hh_gap > hh.gap_tolerance
@@ -3949,22 +3665,18 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
 
         # VALIDATION: Log warning if we have a gap but significant assets remain
         # This indicates a problem with the withdrawal strategy
-        if actual_is_underfunded and total_assets_remaining > 10000:
-            print(f"⚠️ ILLOGICAL GAP WARNING - Year {year}:", file=sys.stderr)
-            print(f"   Spending gap: ${actual_spending_gap:,.0f}", file=sys.stderr)
-            print(f"   Assets remaining: ${total_assets_remaining:,.0f}", file=sys.stderr)
-            print(f"   Total withdrawals: ${total_account_withdrawals:,.0f}", file=sys.stderr)
-            print(f"   This suggests a withdrawal strategy issue - assets exist but weren't withdrawn!", file=sys.stderr)
+        if trace.ACTIVE and actual_is_underfunded and total_assets_remaining > 10000:
+            trace.emit("withdrawals", "gap_with_assets", year=year, gap=actual_spending_gap,
+                       assets_remaining=total_assets_remaining,
+                       account_withdrawals=total_account_withdrawals)
 
         # Detect alternating pattern
         current_year_status = "Gap" if actual_is_underfunded else "OK"
         if previous_year_status is not None and current_year_status != previous_year_status:
             alternating_pattern_count += 1
-            if alternating_pattern_count >= 3:  # 3+ alternations suggests a pattern
-                print(f"🚨 ALTERNATING PATTERN DETECTED - Year {year}:", file=sys.stderr)
-                print(f"   Pattern count: {alternating_pattern_count} alternations", file=sys.stderr)
-                print(f"   Previous year: {previous_year_status}, Current year: {current_year_status}", file=sys.stderr)
-                print(f"   This indicates a systematic issue with withdrawal strategy!", file=sys.stderr)
+            if trace.ACTIVE and alternating_pattern_count >= 3:  # 3+ alternations suggests a pattern
+                trace.emit("withdrawals", "alternating_gap", year=year, count=alternating_pattern_count,
+                           previous=previous_year_status, current=current_year_status)
         previous_year_status = current_year_status
 
         # Calculate RRSP to RRIF conversion amounts (difference between start and end RRSP after growth)
@@ -3989,7 +3701,7 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         rrif_frontload_pct_p2 = 0.0
 
         # Check if using RRIF-Frontload strategy
-        if "rrif-frontload" in hh.strategy.lower():
+        if plan.rrif_frontload:
             # For P1
             if rrif_start1 > 0 and w1["rrif"] > 0:
                 # Calculate actual withdrawal percentage
@@ -4001,7 +3713,9 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
                 # Check if exceeded (with 0.5% tolerance for rounding)
                 if rrif_frontload_pct_p1 > expected_pct_p1 + 0.5:
                     rrif_frontload_exceeded_p1 = True
-                    print(f"DEBUG: RRIF frontload exceeded for P1 - Age {age1}, Withdrew {rrif_frontload_pct_p1:.1f}%, Expected {expected_pct_p1}%", file=sys.stderr)
+                    if trace.ACTIVE:
+                        trace.emit("rrif", "frontload_exceeded", person=p1.name, age=age1, year=year,
+                                   pct=rrif_frontload_pct_p1, expected_pct=expected_pct_p1)
 
             # For P2
             if p2 and rrif_start2 > 0 and w2["rrif"] > 0:
@@ -4014,9 +3728,14 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
                 # Check if exceeded (with 0.5% tolerance for rounding)
                 if rrif_frontload_pct_p2 > expected_pct_p2 + 0.5:
                     rrif_frontload_exceeded_p2 = True
-                    print(f"DEBUG: RRIF frontload exceeded for P2 - Age {age2}, Withdrew {rrif_frontload_pct_p2:.1f}%, Expected {expected_pct_p2}%", file=sys.stderr)
+                    if trace.ACTIVE:
+                        trace.emit("rrif", "frontload_exceeded", person=p2.name, age=age2, year=year,
+                                   pct=rrif_frontload_pct_p2, expected_pct=expected_pct_p2)
 
-        rows.append(YearResult(
+        # Update cumulative retirement taxes for this year
+        cumulative_retirement_taxes += total_tax_after_split
+
+        rows.append(
             year=year, age_p1=age1, age_p2=age2, years_since_start=years_since_start,
             spend_target_after_tax=spend,
             # base taxes + per person after split
@@ -4132,7 +3851,7 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             cash_buffer_flow=buffer_flow_year,  # Surplus/deficit for this year
             cash_buffer_end=buffer_end_year,    # Cumulative buffer at end of year
             # Lifetime tax tracking
-            tax_accumulated=cumulative_retirement_taxes,  # Will be updated below after append
+            tax_accumulated=cumulative_retirement_taxes,  # Cumulative retirement taxes including this year
             lifetime_tax_at_death=0.0,  # Will be calculated at end of simulation
             lifetime_tax_efficiency=0.0,  # Will be calculated at end of simulation
 
@@ -4140,16 +3859,16 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             spending_gap=actual_spending_gap,  # Dollar amount of unmet spending (0 if fully funded)
             is_underfunded=actual_is_underfunded,  # True if gap exceeds tolerance
             plan_success=not actual_is_underfunded,  # True if year is fully funded
-        ))
-
-        # Update cumulative retirement taxes for this year
-        cumulative_retirement_taxes += total_tax_after_split
-        # Update the tax_accumulated field in the row we just appended
-        rows[-1].tax_accumulated = cumulative_retirement_taxes
+        )
 
         # Stop if underfunded and stop_on_fail is set
         if hh.stop_on_fail and is_fail:
             break
+
+        # Metrics mode: stop once the caller's bound (funded years, total tax) is out of reach
+
+        if metrics_only and rows.pruned:
+            break
          
         year += 1
         age1 += 1
@@ -4164,25 +3883,29 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
             if age1 > hh.end_age:
                 break
 
-    # ===== NEW: Calculate terminal tax at death =====
-    if len(rows) > 0:
-        last_row = rows[-1]
+    # A run that reached its end age (rather than stopping on a failed year)
+    # also records the state after its last year, for a longer end age to continue
+    if checkpoints is not None and len(rows) > 0 and year > rows.last("year"):
+        checkpoints.append(checkpoint())
 
+    # ===== NEW: Calculate terminal tax at death =====
+    # (skipped for pruned metrics runs: the plan did not reach its end)
+    if len(rows) > 0 and not (metrics_only and rows.pruned):
         # Get the final year values for terminal tax calculation
-        final_year = last_row.year
-        final_age_p1 = last_row.age_p1
-        final_age_p2 = last_row.age_p2
-
-        final_rrif_p1 = last_row.end_rrif_p1
-        final_rrif_p2 = last_row.end_rrif_p2
-        final_tfsa_p1 = last_row.end_tfsa_p1
-        final_tfsa_p2 = last_row.end_tfsa_p2
-        final_nonreg_p1 = last_row.end_nonreg_p1
-        final_nonreg_p2 = last_row.end_nonreg_p2
-        final_corp_p1 = last_row.end_corp_p1
-        final_corp_p2 = last_row.end_corp_p2
-        final_nonreg_acb_p1 = last_row.nonreg_acb_p1
-        final_nonreg_acb_p2 = last_row.nonreg_acb_p2
+        final_year = rows.last("year")
+        final_age_p1 = rows.last("age_p1")
+        final_age_p2 = rows.last("age_p2")
+
+        final_rrif_p1 = rows.last("end_rrif_p1")
+        final_rrif_p2 = rows.last("end_rrif_p2")
+        final_tfsa_p1 = rows.last("end_tfsa_p1")
+        final_tfsa_p2 = rows.last("end_tfsa_p2")
+        final_nonreg_p1 = rows.last("end_nonreg_p1")
+        final_nonreg_p2 = rows.last("end_nonreg_p2")
+        final_corp_p1 = rows.last("end_corp_p1")
+        final_corp_p2 = rows.last("end_corp_p2")
+        final_nonreg_acb_p1 = rows.last("nonreg_acb_p1")
+        final_nonreg_acb_p2 = rows.last("nonreg_acb_p2")
 
         # Calculate terminal tax at death using the household tax parameters
         terminal_tax, gross_legacy, after_tax_legacy = calculate_terminal_tax(
@@ -4205,9 +3928,7 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         )
 
         # Add terminal tax columns to the last row
-        last_row.terminal_tax = terminal_tax
-        last_row.gross_legacy = gross_legacy
-        last_row.after_tax_legacy = after_tax_legacy
+        rows.set_last(terminal_tax=terminal_tax, gross_legacy=gross_legacy, after_tax_legacy=after_tax_legacy)
 
         # Calculate lifetime tax metrics for all rows
         # Total lifetime tax = cumulative retirement taxes + death taxes
@@ -4219,41 +3940,28 @@ def simulate(hh: Household, tax_cfg: Dict, custom_df: Optional[pd.DataFrame] = N
         else:
             lifetime_tax_efficiency = 0.0
 
-        # Update all rows with these lifetime metrics
-        for row in rows:
-            row.lifetime_tax_at_death = lifetime_tax_at_death
-            row.lifetime_tax_efficiency = lifetime_tax_efficiency
-
-    # Convert to DataFrame
-    df = pd.DataFrame([r.__dict__ for r in rows])
-
-    # DEBUG: Check if pension_income_p1 is in DataFrame
-    if 'pension_income_p1' in df.columns:
-        print(f"✅ DEBUG: pension_income_p1 IS in DataFrame columns", file=sys.stderr)
-        if len(df) > 0:
-            print(f"   First year pension_income_p1: ${df.iloc[0]['pension_income_p1']:,.0f}", file=sys.stderr)
-            # Check if any year has pension > 0
-            pension_years = df[df['pension_income_p1'] > 0]
-            print(f"   Years with pension > 0: {len(pension_years)}/{len(df)}", file=sys.stderr)
-    else:
-        print(f"❌ DEBUG: pension_income_p1 NOT FOUND in DataFrame columns!", file=sys.stderr)
-        print(f"   Available columns: {list(df.columns)[:10]}...", file=sys.stderr)
-
-    # Generate AI-powered insights for minimize-income strategy
-    # Do this check using the strategy stored in the original household object
-    strategy_check = hh.strategy if hasattr(hh, 'strategy') else ""
-
-    if "minimize-income" in strategy_check.lower() or "minimize_income" in strategy_check.lower() or "GIS-Optimized" in strategy_check:
-        # Use the module-level import to avoid UnboundLocalError
-        if generate_minimize_income_insights is not None:
-            # Note: We need to calculate feasibility BEFORE generating insights
-            # But the household p1/p2 balances have been modified during simulation
-            # So we pass None for feasibility and let it calculate based on simulation results
-            insights = generate_minimize_income_insights(hh, df, tax_cfg, gis_feasibility=None)
-
-            # Add insights as metadata to DataFrame
-            df.attrs['strategy_insights'] = insights
-            if 'gis_feasibility' in insights:
-                df.attrs['gis_feasibility'] = insights.get('gis_feasibility')
+        # Broadcast lifetime metrics to every year
+        rows.fill(lifetime_tax_at_death=lifetime_tax_at_death, lifetime_tax_efficiency=lifetime_tax_efficiency)
+
+    if metrics_only:
+        return rows.to_metrics()
 
+    # Convert to DataFrame; plan totals were accumulated as the rows went in
+    df = rows.to_frame()
+    df.attrs['aggregates'] = rows.aggregates
     return df
+
+
+def _add_minimize_income_insights(hh: Household, df: pd.DataFrame, tax_cfg: Dict) -> None:
+    """Attach the minimize-income insights for a finished run (hh: its working copy)"""
+    # Use the module-level import to avoid UnboundLocalError
+    if generate_minimize_income_insights is not None:
+        # Note: We need to calculate feasibility BEFORE generating insights
+        # But the household p1/p2 balances have been modified during simulation
+        # So we pass None for feasibility and let it calculate based on simulation results
+        insights = generate_minimize_income_insights(hh, df, tax_cfg, gis_feasibility=None)
+
+        # Add insights as metadata to DataFrame
+        df.attrs['strategy_insights'] = insights
+        if 'gis_feasibility' in insights:
+            df.attrs['gis_feasibility'] = insights.get('gis_feasibility')
@@ -0,0 +1,253 @@
+"""
+Strategy grid search - rank strategy x RRIF split x hybrid top-up combinations
+
+Backs POST /api/optimize-strategy. Every combination of the requested
+strategies, income_split_rrif_fraction values and hybrid_rrif_topup_per_person
+values is a candidate, ranked on one criterion:
+
+- balance: the four-principle score of find_best_alternative_strategy
+  (funding 50, tax 30, benefits 15, estate 5 points)
+- legacy: after-tax estate
+- tax_efficiency: lifetime tax (retirement tax plus tax at death)
+- success_rate: share of years funded, then after-tax estate
+
+Candidates run as metrics-only simulations. Two things keep large grids fast:
+
+1. Top-ups are only applied for strategies whose name starts with "Hybrid"
+   (see simulate_year), so candidates that differ only in top-up share one
+   simulation.
+2. Each simulation is bounded by the best finished candidate so far and
+   stops as soon as it can no longer match it (simulate(min_years_funded=...,
+   max_total_tax=...)). The after-tax estate has no bound that holds part-way
+   through a plan, so legacy searches run every candidate to the end.
+
+With an EnginePool the simulations run in parallel, a couple per worker at a
+time so later submissions get tighter bounds; without one they run here.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass, replace
+from time import perf_counter, time
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+from modules.models import Household, SimulationMetrics
+from modules.simulation import simulate
+from modules.strategy_optimizer import evaluate_strategy, score_evaluations, score_funding
+
+logger = logging.getLogger(__name__)
+
+OPTIMIZE_FOR = ("balance", "legacy", "tax_efficiency", "success_rate")
+
+# Most points a candidate can get besides funding (tax 30 + benefits 15 + estate 5)
+MAX_NON_FUNDING_POINTS = 50.0
+
+# Simulations kept in flight per pool worker
+JOBS_PER_WORKER = 2
+
+
+@dataclass
+class GridCandidate:
+    """One strategy/split/top-up combination and its outcome."""
+    strategy: str
+    split_fraction: float
+    hybrid_topup: float
+    metrics: Optional[SimulationMetrics] = None
+    score: float = 0.0
+    queue_ms: float = 0.0     # Submitted to started
+    simulate_ms: float = 0.0  # Simulation run time
+    shared: bool = False      # Outcome taken from an equivalent candidate's simulation
+
+    @property
+    def pruned(self) -> bool:
+        return self.metrics is not None and self.metrics.pruned
+
+    @property
+    def success_rate(self) -> float:
+        m = self.metrics
+        return m.years_funded / m.years_simulated if m.years_simulated else 0.0
+
+    @property
+    def lifetime_tax(self) -> float:
+        return self.metrics.total_tax + self.metrics.terminal_tax
+
+
+@dataclass
+class GridSearchResult:
+    """Ranked finished candidates plus the ones stopped early."""
+    candidates: List[GridCandidate]
+    pruned: List[GridCandidate]
+    optimize_for: str
+    simulations_run: int
+    elapsed_ms: float
+
+    @property
+    def candidates_tested(self) -> int:
+        return len(self.candidates) + len(self.pruned)
+
+    @property
+    def best(self) -> Optional[GridCandidate]:
+        return self.candidates[0] if self.candidates else None
+
+
+def _simulation_key(strategy: str, split_fraction: float, hybrid_topup: float) -> Tuple:
+    """Candidates with the same key produce the same simulation"""
+    return (strategy, split_fraction, hybrid_topup if strategy.startswith("Hybrid") else None)
+
+
+def _standing(c: GridCandidate, optimize_for: str):
+    """How a finished candidate compares on the criterion, for bounding (higher wins)"""
+    if optimize_for == "success_rate":
+        return (c.success_rate, c.metrics.after_tax_legacy)
+    if optimize_for == "tax_efficiency":
+        return -c.lifetime_tax
+    if optimize_for == "legacy":
+        return c.metrics.after_tax_legacy
+    return score_funding(c.success_rate)
+
+
+def _bounds(best: Optional[GridCandidate], optimize_for: str, hh: Household) -> Dict:
+    """simulate() bounds under which a run stops once it cannot match `best`"""
+    if best is None:
+        return {}
+    if optimize_for == "tax_efficiency":
+        # Terminal tax only adds to the running total
+        return {"max_total_tax": best.lifetime_tax}
+    if optimize_for == "legacy" or hh.stop_on_fail:
+        # stop_on_fail ends plans early, so funded years are not comparable part-way
+        return {}
+    if optimize_for == "success_rate":
+        return {"min_years_funded": best.metrics.years_funded}
+
+    # balance: a candidate's score is at least its funding points and at most
+    # those plus MAX_NON_FUNDING_POINTS, so it needs enough funded years to reach
+    # the best funding points seen so far
+    years = best.metrics.years_planned
+    target = score_funding(best.success_rate)
+    for funded in range(years + 1):
+        if score_funding(funded / years) + MAX_NON_FUNDING_POINTS >= target:
+            return {"min_years_funded": funded}
+    return {}
+
+
+def _rank(finished: List[GridCandidate], optimize_for: str) -> List[GridCandidate]:
+    """Score finished candidates (0-1) and sort them best first (ties keep grid order)"""
+    if not finished:
+        return []
+
+    if optimize_for == "balance":
+        evaluations = [evaluate_strategy(c.metrics, c.strategy) for c in finished]
+        score_evaluations(evaluations)
+        for c, e in zip(finished, evaluations):
+            c.score = e.score / 100.0
+        return sorted(finished, key=lambda c: -c.score)
+
+    if optimize_for == "success_rate":
+        for c in finished:
+            c.score = c.success_rate
+        return sorted(finished, key=lambda c: (-c.success_rate, -c.metrics.after_tax_legacy))
+
+    if optimize_for == "legacy":
+        values = [c.metrics.after_tax_legacy for c in finished]
+        sign = 1.0
+    else:
+        values = [c.lifetime_tax for c in finished]
+        sign = -1.0
+    low, high = min(values), max(values)
+    spread = high - low if high > low else 1.0
+    for c, value in zip(finished, values):
+        c.score = (value - low) / spread if sign > 0 else (high - value) / spread
+    return sorted(finished, key=lambda c: -c.score)
+
+
+def run_grid_search(
+    household: Household,
+    tax_cfg: Dict,
+    strategies: Sequence[str],
+    split_fractions: Sequence[float],
+    hybrid_topups: Sequence[float],
+    optimize_for: str = "balance",
+    pool=None,
+) -> GridSearchResult:
+    """
+    Evaluate and rank every strategy x split fraction x top-up combination.
+
+    Args:
+        household: Internal Household spec (not modified)
+        tax_cfg: Tax configuration from load_tax_config()
+        strategies: Strategy names to test
+        split_fractions: income_split_rrif_fraction values to test
+        hybrid_topups: hybrid_rrif_topup_per_person values to test
+        optimize_for: One of OPTIMIZE_FOR
+        pool: Optional EnginePool to run simulations on
+
+    Returns:
+        GridSearchResult with finished candidates ranked best first
+
+    Raises:
+        ValueError: If optimize_for is unknown
+    """
+    if optimize_for not in OPTIMIZE_FOR:
+        raise ValueError(f"Unknown optimization criterion '{optimize_for}'. Valid: {OPTIMIZE_FOR}")
+
+    t_start = perf_counter()
+    grid = [
+        GridCandidate(strategy, float(split), float(topup))
+        for strategy in strategies for split in split_fractions for topup in hybrid_topups
+    ]
+
+    # One simulation per distinct key, shared by every candidate with that key
+    groups: Dict[Tuple, List[GridCandidate]] = {}
+    for c in grid:
+        groups.setdefault(_simulation_key(c.strategy, c.split_fraction, c.hybrid_topup), []).append(c)
+    jobs = deque(
+        (key, replace(household, strategy=first.strategy, income_split_rrif_fraction=first.split_fraction,
+                      hybrid_rrif_topup_per_person=first.hybrid_topup))
+        for key, (first, *_) in groups.items()
+    )
+
+    best: Optional[GridCandidate] = None
+
+    def record(key: Tuple, metrics: SimulationMetrics, queue_ms: float, simulate_ms: float) -> None:
+        nonlocal best
+        first, *rest = groups[key]
+        first.metrics, first.queue_ms, first.simulate_ms = metrics, queue_ms, simulate_ms
+        for c in rest:
+            c.metrics, c.shared = metrics, True
+        if not metrics.pruned and (best is None or _standing(first, optimize_for) > _standing(best, optimize_for)):
+            best = first
+
+    if pool is None:
+        while jobs:
+            key, hh = jobs.popleft()
+            queue_ms = (perf_counter() - t_start) * 1000
+            t0 = perf_counter()
+            metrics = simulate(hh, tax_cfg, mode="metrics", **_bounds(best, optimize_for, household))
+            record(key, metrics, queue_ms, (perf_counter() - t0) * 1000)
+    else:
+        in_flight = {}
+        while jobs or in_flight:
+            while jobs and len(in_flight) < pool.workers * JOBS_PER_WORKER:
+                key, hh = jobs.popleft()
+                future = pool.submit_metrics(hh, tax_cfg, **_bounds(best, optimize_for, household))
+                in_flight[future] = (key, time())
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, submitted = in_flight.pop(future)
+                metrics, started, run_seconds = future.result()
+                record(key, metrics, max(started - submitted, 0.0) * 1000, run_seconds * 1000)
+
+    finished = [c for c in grid if not c.pruned]
+    result = GridSearchResult(
+        candidates=_rank(finished, optimize_for),
+        pruned=[c for c in grid if c.pruned],
+        optimize_for=optimize_for,
+        simulations_run=len(groups),
+        elapsed_ms=(perf_counter() - t_start) * 1000,
+    )
+    logger.info(
+        f"🎯 Grid search: {result.candidates_tested} candidates, {result.simulations_run} simulations, "
+        f"{len(result.pruned)} pruned, {result.elapsed_ms:.0f} ms"
+    )
+    return result
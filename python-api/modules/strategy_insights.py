@@ -189,10 +189,9 @@ def generate_minimize_income_insights(
         # Extract starting RRIF balances from first year of simulation
         first_year = simulation_results.iloc[0]
 
-        # Create temporary household copy with starting balances
-        # This is needed because household object has been modified during simulation
-        import copy
-        household_copy = copy.deepcopy(household)
+        # Working copy with starting balances (the caller's household is left as is)
+        household_copy = household.working_copy()
+
 
         # Set RRIF balances from first year (these include RRSP converted to RRIF)
         if 'end_rrif_p1' in first_year:
@@ -9,13 +9,23 @@ respecting the core optimization principles:
 4. Estate (maximize legacy) - Priority 4
 """
 
+import math
+import time
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import wait
+
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
 import logging
 
+from modules.models import SimulationAggregates, SimulationMetrics
+from modules.result_columns import frame_aggregates
+
 logger = logging.getLogger(__name__)
 
+# Require at least 2% improvement in success rate (roughly 1 year in a 20-25 year plan)
+MIN_IMPROVEMENT = 0.02
+
 
 @dataclass
 class StrategyEvaluation:
@@ -56,8 +66,31 @@ class StrategyEvaluation:
         )
 
 
+def score_funding(success_rate: float) -> float:
+    """
+    Funding points (0-50) for a success rate.
+
+    Uses proportional scoring below 75% so success rate improvements are
+    captured even when all strategies are below 75%.
+    """
+    if success_rate >= 1.0:
+        return 50.0  # Perfect funding
+    elif success_rate >= 0.95:
+        return 45.0  # Near-perfect (1-2 years of minor gaps)
+    elif success_rate >= 0.90:
+        return 40.0  # Good (3-4 years of gaps)
+    elif success_rate >= 0.75:
+        return 25.0  # Acceptable (significant gaps)
+    else:
+        # Below 75%: Use proportional scoring (0-50 points)
+        # In this range, EVERY additional year funded matters enormously
+        # So we give full 50-point range to ensure funding dominates
+        return success_rate * (50.0 / 0.75)  # 0% = 0pts, 75% = 50pts
+
+
 def evaluate_strategy(
-    df: pd.DataFrame,
+
+    df: Union[pd.DataFrame, SimulationMetrics],
     strategy_name: str,
     original_eval: Optional['StrategyEvaluation'] = None
 ) -> StrategyEvaluation:
@@ -83,8 +116,17 @@ def evaluate_strategy(
        - After-tax legacy
        - 5 pts: Highest legacy
        - 0 pts: Lowest legacy
+
+    Accepts either the year-by-year DataFrame from simulate() or the
+    SimulationMetrics returned by simulate(..., mode="metrics"); both are
+    scored from the same SimulationAggregates totals.
     """
-    if df.empty:
+    if isinstance(df, SimulationAggregates):
+        metrics = df
+    else:
+        metrics = frame_aggregates(df)
+
+    if metrics.years_simulated == 0:
         logger.warning(f"Empty dataframe for strategy {strategy_name}")
         return StrategyEvaluation(
             strategy_name=strategy_name,
@@ -104,60 +146,20 @@ def evaluate_strategy(
             total_underfunding=0.0
         )
 
-    # Extract metrics from dataframe
-    total_years = len(df)
-    years_funded = int(df['plan_success'].sum()) if 'plan_success' in df.columns else 0
-    success_rate = years_funded / total_years if total_years > 0 else 0.0
-
-    # Tax metrics
-    total_tax_paid = float(df['total_tax'].sum()) if 'total_tax' in df.columns else 0.0
-
-    # Benefits (CPP + OAS + GIS for both persons)
-    benefit_cols = [
-        'cpp_p1', 'cpp_p2', 'oas_p1', 'oas_p2',
-        'gis_p1', 'gis_p2'
-    ]
-    total_benefits = 0.0
-    for col in benefit_cols:
-        if col in df.columns:
-            total_benefits += float(df[col].sum())
-
-    # Estate - get from last row
-    last_row = df.iloc[-1]
-    after_tax_legacy = float(last_row.get('after_tax_legacy', 0.0))
-
-    # Gap analysis
-    if 'plan_success' in df.columns:
-        has_gaps = not df['plan_success'].all()
-        if has_gaps:
-            first_failure_idx = df[df['plan_success'] == False].index[0]
-            first_failure_year = int(df.loc[first_failure_idx, 'year'])
-        else:
-            first_failure_year = None
-    else:
-        has_gaps = False
-        first_failure_year = None
-
-    total_underfunding = float(df['spending_gap'].sum()) if 'spending_gap' in df.columns else 0.0
+    total_years = metrics.years_simulated
+    years_funded = metrics.years_funded
+    success_rate = metrics.success_rate
+    total_tax_paid = float(metrics.total_tax)
+    total_benefits = float(metrics.total_benefits)
+    after_tax_legacy = float(metrics.after_tax_legacy)
+    has_gaps = years_funded < total_years
+    first_failure_year = metrics.first_failure_year
+    total_underfunding = float(metrics.total_underfunding)
 
     # === SCORING ===
 
     # 1. Funding Score (50 points max) - HIGHEST PRIORITY
-    # Use proportional scoring to ensure success rate improvements are captured
-    # even when all strategies are below 75%
-    if success_rate >= 1.0:
-        funding_score = 50.0  # Perfect funding
-    elif success_rate >= 0.95:
-        funding_score = 45.0  # Near-perfect (1-2 years of minor gaps)
-    elif success_rate >= 0.90:
-        funding_score = 40.0  # Good (3-4 years of gaps)
-    elif success_rate >= 0.75:
-        funding_score = 25.0  # Acceptable (significant gaps)
-    else:
-        # Below 75%: Use proportional scoring (0-50 points)
-        # In this range, EVERY additional year funded matters enormously
-        # So we give full 50-point range to ensure funding dominates
-        funding_score = success_rate * (50.0 / 0.75)  # 0% = 0pts, 75% = 50pts
+    funding_score = score_funding(success_rate)
 
     # 2. Tax Score (30 points max) - Will be normalized later
     # Lower tax is better, so we'll compare against other strategies
@@ -212,12 +214,132 @@ def evaluate_strategy(
     )
 
 
+def score_evaluations(evaluations: List[StrategyEvaluation]) -> None:
+    """
+    Complete the scores of a set of evaluations in place.
+
+    Tax, benefits and estate points are relative: each is spread between the
+    lowest and highest value among the evaluations. With a single evaluation
+    the score stays at its funding score.
+    """
+    if len(evaluations) > 1:
+        # Check if ALL strategies are in critical failure mode (<75% success)
+        # In this case, ONLY funding matters - tax/benefits/estate are irrelevant
+        all_below_75 = all(e.success_rate < 0.75 for e in evaluations)
+
+        if all_below_75:
+            # Critical failure mode: ONLY funding score matters
+            # Set tax/benefits/estate to 0 for all strategies
+            for eval in evaluations:
+                eval.tax_score = 0.0
+                eval.benefits_score = 0.0
+                eval.estate_score = 0.0
+                eval.score = eval.funding_score
+            logger.info("⚠️ All strategies <75% success - using FUNDING-ONLY scoring")
+        else:
+            # Normal mode: Consider all 4 principles
+            # Tax score (30 pts): Lower is better
+            min_tax = min(e.total_tax_paid for e in evaluations)
+            max_tax = max(e.total_tax_paid for e in evaluations)
+            tax_range = max_tax - min_tax if max_tax > min_tax else 1.0
+
+            # Benefits score (15 pts): Higher is better
+            min_benefits = min(e.total_benefits for e in evaluations)
+            max_benefits = max(e.total_benefits for e in evaluations)
+            benefits_range = max_benefits - min_benefits if max_benefits > min_benefits else 1.0
+
+            # Estate score (5 pts): Higher is better
+            min_estate = min(e.after_tax_legacy for e in evaluations)
+            max_estate = max(e.after_tax_legacy for e in evaluations)
+            estate_range = max_estate - min_estate if max_estate > min_estate else 1.0
+
+            for eval in evaluations:
+                # Tax: 30 pts for lowest, 0 pts for highest
+                if tax_range > 0:
+                    eval.tax_score = 30.0 * (1.0 - (eval.total_tax_paid - min_tax) / tax_range)
+                else:
+                    eval.tax_score = 30.0
+
+                # Benefits: 15 pts for highest, 0 pts for lowest
+                if benefits_range > 0:
+                    eval.benefits_score = 15.0 * ((eval.total_benefits - min_benefits) / benefits_range)
+                else:
+                    eval.benefits_score = 15.0
+
+                # Estate: 5 pts for highest, 0 pts for lowest
+                if estate_range > 0:
+                    eval.estate_score = 5.0 * ((eval.after_tax_legacy - min_estate) / estate_range)
+                else:
+                    eval.estate_score = 5.0
+
+                # Calculate total score
+                eval.score = (eval.funding_score + eval.tax_score +
+                             eval.benefits_score + eval.estate_score)
+
+
+def _run_alternatives(
+    household,
+    tax_cfg: Dict,
+    strategies: List[str],
+    min_years_funded: int,
+    simulate_func,
+    pool,
+    deadline: Optional[float],
+) -> Tuple[List[Tuple[str, SimulationMetrics]], List[str]]:
+    """
+    Metrics-only runs of each alternative strategy: concurrently on `pool`,
+    otherwise in sequence in this thread.
+
+    Returns:
+        ([(strategy, metrics)] for runs that finished, in priority order,
+         [strategies not evaluated before the deadline])
+    """
+    finished = []
+    timed_out = []
+
+    if pool is not None:
+        futures = {
+            strategy: pool.submit_metrics(
+                replace(household, strategy=strategy), tax_cfg, min_years_funded=min_years_funded
+            )
+            for strategy in strategies
+        }
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        wait(list(futures.values()), timeout=timeout)
+        for strategy, future in futures.items():
+            if not future.done():
+                future.cancel()
+                timed_out.append(strategy)
+                continue
+            try:
+                finished.append((strategy, future.result()[0]))
+            except Exception as e:
+                logger.error(f"❌ Failed to test strategy {strategy}: {e}")
+        return finished, timed_out
+
+    for strategy in strategies:
+        if deadline is not None and time.monotonic() >= deadline:
+            timed_out.append(strategy)
+            continue
+        try:
+            # Same household spec with the alternative strategy
+            metrics = simulate_func(
+                replace(household, strategy=strategy), tax_cfg, mode="metrics", min_years_funded=min_years_funded
+            )
+            finished.append((strategy, metrics))
+        except Exception as e:
+            logger.error(f"❌ Failed to test strategy {strategy}: {e}")
+    return finished, timed_out
+
+
 def find_best_alternative_strategy(
     household,
     tax_cfg: Dict,
     original_df: pd.DataFrame,
     original_strategy: str,
-    simulate_func
+    simulate_func,
+    pool=None,
+    deadline: Optional[float] = None,
 ) -> Optional[Dict]:
     """
     Find the best alternative strategy if the original has funding gaps.
@@ -228,6 +350,27 @@ def find_best_alternative_strategy(
     3. nonreg-first - Capital gains favorable
     4. rrif-first - Only as last resort (highest tax impact)
 
+    household is the internal Household spec; each alternative is a shallow
+    copy with only the strategy changed, since simulate() does not modify it.
+
+    Alternatives are run with simulate_func(household, tax_cfg, mode="metrics",
+    min_years_funded=N), where N is the fewest funded years that could still
+    pass the switch criteria below. Candidates that cannot reach N stop early
+    and are left out of the scoring.
+
+    With an EnginePool (`pool`) every alternative is submitted at once and
+    they run concurrently on its workers; simulate_func is then unused.
+    `deadline` is a time.monotonic() timestamp: alternatives not finished by
+    then are dropped (cancelled if they have not started) and the decision
+    is made from those that did finish. Without a pool, alternatives run one
+    after another here and those not started by the deadline are skipped.
+
+    Concurrency therefore depends on the pool, which the API creates only when
+    ENGINE_WORKERS is set. There is deliberately no thread fan-out without it:
+    the engine is pure Python and holds the GIL, so threads run the
+    alternatives no faster than in sequence (4 metrics runs took 61 ms on 4
+    threads against 46 ms in sequence).
+
     Returns:
         Dict with optimization results if better strategy found, None otherwise
     """
@@ -264,19 +407,35 @@ def find_best_alternative_strategy(
 
     evaluations = [original_eval]
 
-    # Test each alternative
-    for alt_strategy in alternative_strategies:
-        try:
-            logger.info(f"🧪 Testing strategy: {alt_strategy}")
+    # Fewest funded years an alternative needs to be worth switching to:
+    # a MIN_IMPROVEMENT gain in success rate, or no gaps at all
+    total_years = original_eval.total_years
+    min_years_funded = min(
+        total_years,
+        math.ceil(original_eval.years_funded + MIN_IMPROVEMENT * total_years - 1e-9)
+    )
 
-            # Create copy of household with new strategy using Pydantic v2 model_copy
-            household_copy = household.model_copy(deep=True, update={'strategy': alt_strategy})
+    # Run the alternatives (totals only, stopping once a candidate can't qualify)
+    alt_results, timed_out = _run_alternatives(
+        household, tax_cfg, alternative_strategies, min_years_funded, simulate_func, pool, deadline
+    )
+    if timed_out:
+        logger.warning(f"⏱️ Deadline reached before evaluating: {', '.join(timed_out)}")
+
+    # Evaluate each alternative that finished, in priority order
+    for alt_strategy, alt_metrics in alt_results:
+        try:
+            logger.info(f"🧪 Evaluating strategy: {alt_strategy}")
 
-            # Run simulation
-            alt_df = simulate_func(household_copy, tax_cfg)
+            if alt_metrics.pruned:
+                logger.info(
+                    f"   Pruned after {alt_metrics.years_simulated} years: "
+                    f"cannot reach {min_years_funded}/{total_years} funded years"
+                )
+                continue
 
             # Evaluate
-            alt_eval = evaluate_strategy(alt_df, alt_strategy, original_eval)
+            alt_eval = evaluate_strategy(alt_metrics, alt_strategy, original_eval)
             evaluations.append(alt_eval)
 
             logger.info(
@@ -291,59 +450,7 @@ def find_best_alternative_strategy(
             continue
 
     # Normalize scores across all evaluations
-    if len(evaluations) > 1:
-        # Check if ALL strategies are in critical failure mode (<75% success)
-        # In this case, ONLY funding matters - tax/benefits/estate are irrelevant
-        all_below_75 = all(e.success_rate < 0.75 for e in evaluations)
-
-        if all_below_75:
-            # Critical failure mode: ONLY funding score matters
-            # Set tax/benefits/estate to 0 for all strategies
-            for eval in evaluations:
-                eval.tax_score = 0.0
-                eval.benefits_score = 0.0
-                eval.estate_score = 0.0
-                eval.score = eval.funding_score
-            logger.info("⚠️ All strategies <75% success - using FUNDING-ONLY scoring")
-        else:
-            # Normal mode: Consider all 4 principles
-            # Tax score (30 pts): Lower is better
-            min_tax = min(e.total_tax_paid for e in evaluations)
-            max_tax = max(e.total_tax_paid for e in evaluations)
-            tax_range = max_tax - min_tax if max_tax > min_tax else 1.0
-
-            # Benefits score (15 pts): Higher is better
-            min_benefits = min(e.total_benefits for e in evaluations)
-            max_benefits = max(e.total_benefits for e in evaluations)
-            benefits_range = max_benefits - min_benefits if max_benefits > min_benefits else 1.0
-
-            # Estate score (5 pts): Higher is better
-            min_estate = min(e.after_tax_legacy for e in evaluations)
-            max_estate = max(e.after_tax_legacy for e in evaluations)
-            estate_range = max_estate - min_estate if max_estate > min_estate else 1.0
-
-            for eval in evaluations:
-                # Tax: 30 pts for lowest, 0 pts for highest
-                if tax_range > 0:
-                    eval.tax_score = 30.0 * (1.0 - (eval.total_tax_paid - min_tax) / tax_range)
-                else:
-                    eval.tax_score = 30.0
-
-                # Benefits: 15 pts for highest, 0 pts for lowest
-                if benefits_range > 0:
-                    eval.benefits_score = 15.0 * ((eval.total_benefits - min_benefits) / benefits_range)
-                else:
-                    eval.benefits_score = 15.0
-
-                # Estate: 5 pts for highest, 0 pts for lowest
-                if estate_range > 0:
-                    eval.estate_score = 5.0 * ((eval.after_tax_legacy - min_estate) / estate_range)
-                else:
-                    eval.estate_score = 5.0
-
-                # Calculate total score
-                eval.score = (eval.funding_score + eval.tax_score +
-                             eval.benefits_score + eval.estate_score)
+    score_evaluations(evaluations)
 
     # Find best strategy (highest score)
     best = max(evaluations, key=lambda e: e.score)
@@ -366,7 +473,6 @@ def find_best_alternative_strategy(
     #       OR: Best strategy provides meaningful improvement (>=10% better success rate)
     # 3. Tax increase is acceptable (<10%)
 
-    MIN_IMPROVEMENT = 0.02  # Require at least 2% improvement in success rate (roughly 1 year in a 20-25 year plan)
 
     improvement = best.success_rate - original_eval.success_rate
     meaningful_improvement = improvement >= MIN_IMPROVEMENT
@@ -415,6 +521,8 @@ def find_best_alternative_strategy(
             'estate_change_pct': best.estate_increase_pct,
             'score_improvement': best.score - original_eval.score,
             'gaps_eliminated': original_eval.total_years - original_eval.years_funded,
+            'alternatives_evaluated': len(alt_results),
+            'alternatives_timed_out': timed_out,
         }
     else:
         if best.strategy_name == original_strategy:
@@ -7,10 +7,20 @@ This module handles all federal and provincial tax calculations:
 - OAS clawback recovery
 - Dividend grossup and credit treatment
 - Capital gains inclusion rates
+- Vectorized batch evaluation (progressive_tax_batch)
 """
 
+import hashlib
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, List
 from collections import OrderedDict
+
+import numpy as np
+
 from modules.models import TaxParams, Bracket
 
 
@@ -258,11 +268,209 @@ def capital_gains_inclusion(amount: float, over_250k: bool = False) -> Dict[str,
     }
 
 
+def compute_taxable_income(
+    params: TaxParams,
+    ordinary_income: float = 0.0,
+    elig_dividends: float = 0.0,
+    nonelig_dividends: float = 0.0,
+    cap_gains: float = 0.0,
+    pension_income: float = 0.0,
+    oas_received: float = 0.0,
+) -> float:
+    """
+    Compute taxable income exactly as progressive_tax() assembles it.
+
+    Dividends are grossed up with the params' grossup rates and capital
+    gains are included at 50%.
+
+    Args:
+        params: TaxParams with dividend grossup rates
+        ordinary_income, elig_dividends, nonelig_dividends, cap_gains,
+        pension_income, oas_received: Same meaning as in progressive_tax()
+
+    Returns:
+        Taxable income (dollars)
+    """
+    return (
+        ordinary_income +
+        pension_income +
+        oas_received +
+        elig_dividends * (1 + params.dividend_grossup_eligible) +
+        nonelig_dividends * (1 + params.dividend_grossup_noneligible) +
+        capital_gains_inclusion(cap_gains)['includable_amount']
+    )
+
+
+def marginal_rate_breakpoints(
+    params: TaxParams,
+    age: int,
+    oas_received: float = 0.0,
+) -> List[float]:
+    """
+    Taxable-income levels at which the marginal rate of progressive_tax() changes.
+
+    Between two consecutive breakpoints net tax is linear in taxable income
+    (for a fixed income mix), apart from the point where credits exceed
+    gross tax. Breakpoints come from:
+    - Bracket thresholds
+    - Age amount phase-out start and the level where the age amount reaches zero
+    - OAS clawback threshold and the level where the full OAS is recovered
+
+    Args:
+        params: TaxParams with brackets and credit parameters
+        age: Person's age (age amount only applies at 65+)
+        oas_received: OAS amount received (clawback only applies if > 0)
+
+    Returns:
+        Sorted list of positive taxable-income breakpoints (dollars)
+    """
+    points = [b.threshold for b in params.brackets if b.threshold]
+
+    if age >= 65 and params.age_amount > 0:
+        points.append(params.age_amount_phaseout_start)
+        if params.age_amount_phaseout_rate > 0:
+            points.append(
+                params.age_amount_phaseout_start
+                + params.age_amount / params.age_amount_phaseout_rate
+            )
+
+    if oas_received > 0 and params.oas_clawback_rate > 0:
+        points.append(params.oas_clawback_threshold)
+        points.append(params.oas_clawback_threshold + oas_received / params.oas_clawback_rate)
+
+    return sorted(p for p in points if p > 0)
+
+
 # Tax calculation cache for performance optimization
-# Key: (params_id, age, rounded_income_tuple)
+# Key: (params_content_hash, age, rounded_income_tuple)
 # Value: tax calculation result
+#
+# The cache is process-wide and shared by every request and thread, so it is
+# guarded by a lock. Params are identified by their *content* (see
+# _params_fingerprint), which lets indexed params for the same year hit across
+# simulations and can never return another object's result after id() reuse.
 _tax_cache: OrderedDict = OrderedDict()
-_tax_cache_max_size = 1024
+_tax_cache_max_size = int(os.environ.get("TAX_CACHE_MAX_SIZE", 8192))
+_tax_cache_lock = threading.Lock()
+_tax_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "scoped_hits": 0}
+
+# Per-simulation cache installed by tax_cache_scope(); None outside a scope
+_scoped_tax_cache: ContextVar = ContextVar("scoped_tax_cache", default=None)
+
+# id(params) -> (weakref to params, content hash). Entries are dropped when the
+# params object is garbage collected, so a recycled id() never maps to stale content.
+_params_fingerprints: Dict[int, tuple] = {}
+
+
+class _TaxCacheScope:
+    """Results cached by one tax_cache_scope(), and the hits it served"""
+    __slots__ = ("results", "hits")
+
+    def __init__(self):
+        self.results: Dict[tuple, Dict[str, float]] = {}
+        self.hits = 0
+
+
+def _params_fingerprint(params: TaxParams) -> str:
+    """
+    Return a hash identifying the content of a TaxParams.
+
+    TaxParams must be treated as read-only once they have been used for a tax
+    calculation; the fingerprint is computed once per object. Nothing is kept
+    per distinct content, so configs seen once do not accumulate.
+    """
+    entry = _params_fingerprints.get(id(params))
+    if entry is not None and entry[0]() is params:
+        return entry[1]
+
+    gis_items = tuple(sorted(
+        (k, v) for k, v in (params.gis_config or {}).items() if k != "notes"
+    ))
+    content = (
+        tuple((b.threshold, b.rate) for b in params.brackets),
+        params.bpa_amount, params.bpa_rate,
+        params.pension_credit_amount, params.pension_credit_rate,
+        params.age_amount, params.age_amount_phaseout_start, params.age_amount_phaseout_rate,
+        params.oas_clawback_threshold, params.oas_clawback_rate,
+        params.dividend_grossup_eligible, params.dividend_grossup_noneligible,
+        params.dividend_credit_rate_eligible, params.dividend_credit_rate_noneligible,
+        gis_items,
+    )
+
+    fingerprint = hashlib.sha1(repr(content).encode("utf-8")).hexdigest()
+    with _tax_cache_lock:
+        key = id(params)
+        ref = weakref.ref(params, lambda _, key=key: _params_fingerprints.pop(key, None))
+        _params_fingerprints[key] = (ref, fingerprint)
+    return fingerprint
+
+
+def configure_tax_cache(max_size: int) -> None:
+    """
+    Set the maximum number of entries in the shared tax cache.
+
+    The default comes from the TAX_CACHE_MAX_SIZE environment variable (8192).
+    Shrinking the cache evicts least recently used entries immediately.
+    """
+    global _tax_cache_max_size
+    with _tax_cache_lock:
+        _tax_cache_max_size = max(int(max_size), 0)
+        while len(_tax_cache) > _tax_cache_max_size:
+            _tax_cache.popitem(last=False)
+            _tax_cache_stats["evictions"] += 1
+
+
+def clear_tax_cache() -> None:
+    """Empty the shared tax cache and reset its counters."""
+    with _tax_cache_lock:
+        _tax_cache.clear()
+        for name in _tax_cache_stats:
+            _tax_cache_stats[name] = 0
+
+
+def get_tax_cache_stats() -> Dict[str, float]:
+    """
+    Snapshot of the shared tax cache counters for instrumentation.
+
+    Returns:
+        Dict with hits, misses, evictions, scoped_hits (served by a
+        tax_cache_scope), size, max_size and hit_rate
+    """
+    with _tax_cache_lock:
+        stats = dict(_tax_cache_stats)
+        stats["size"] = len(_tax_cache)
+        stats["max_size"] = _tax_cache_max_size
+    lookups = stats["hits"] + stats["misses"] + stats["scoped_hits"]
+    stats["hit_rate"] = (stats["hits"] + stats["scoped_hits"]) / lookups if lookups else 0.0
+    return stats
+
+
+@contextmanager
+def tax_cache_scope():
+    """
+    Cache progressive_tax() results for the duration of one simulation.
+
+    Inside the scope, repeated evaluations are served from a private dict
+    without taking the shared cache lock; first evaluations still go through
+    (and populate) the shared cache. Its hits are added to the shared
+    scoped_hits counter when the scope exits. Scopes are per thread/task
+    (contextvars) and nest by reusing the outer scope.
+
+    Usage:
+        with tax_cache_scope():
+            df = simulate(hh, tax_cfg)
+    """
+    if _scoped_tax_cache.get() is not None:
+        yield
+        return
+    scope = _TaxCacheScope()
+    token = _scoped_tax_cache.set(scope)
+    try:
+        yield
+    finally:
+        _scoped_tax_cache.reset(token)
+        with _tax_cache_lock:
+            _tax_cache_stats["scoped_hits"] += scope.hits
 
 
 def _make_cache_key(
@@ -278,12 +486,13 @@ def _make_cache_key(
     """
     Create a hashable cache key for tax calculations.
 
-    Uses id(params) to identify the tax configuration (federal vs provincial)
-    and rounds float values to nearest dollar to reduce cache misses from
-    tiny float differences while maintaining accuracy.
+    Uses the content fingerprint of params to identify the tax configuration
+    (federal vs provincial, and the indexed year) and rounds float values to
+    nearest dollar to reduce cache misses from tiny float differences while
+    maintaining accuracy.
     """
     return (
-        id(params),
+        _params_fingerprint(params),
         age,
         round(ordinary_income),
         round(elig_dividends),
@@ -363,10 +572,26 @@ def progressive_tax(
         cap_gains, pension_income, oas_received
     )
 
-    if cache_key in _tax_cache:
-        # Move to end (LRU) and return cached result
-        _tax_cache.move_to_end(cache_key)
-        return _tax_cache[cache_key]
+    scoped = _scoped_tax_cache.get()
+    if scoped is not None:
+        cached = scoped.results.get(cache_key)
+        if cached is not None:
+            # Private to this scope: added to the shared counters when it exits
+            scoped.hits += 1
+            return cached
+
+    with _tax_cache_lock:
+        cached = _tax_cache.get(cache_key)
+        if cached is not None:
+            # Move to end (LRU) and return cached result
+            _tax_cache.move_to_end(cache_key)
+            _tax_cache_stats["hits"] += 1
+        else:
+            _tax_cache_stats["misses"] += 1
+    if cached is not None:
+        if scoped is not None:
+            scoped.results[cache_key] = cached
+        return cached
 
     # Ensure all inputs are floats (defensive programming)
     ordinary_income = float(ordinary_income) if ordinary_income is not None else 0.0
@@ -472,9 +697,197 @@ def progressive_tax(
     }
 
     # Store in cache and maintain max size
-    _tax_cache[cache_key] = result
-    if len(_tax_cache) > _tax_cache_max_size:
-        # Remove oldest entry (FIFO from front)
-        _tax_cache.popitem(last=False)
+    if scoped is not None:
+        scoped.results[cache_key] = result
+    with _tax_cache_lock:
+        _tax_cache[cache_key] = result
+        while len(_tax_cache) > _tax_cache_max_size:
+            # Remove least recently used entry (front)
+            _tax_cache.popitem(last=False)
+            _tax_cache_stats["evictions"] += 1
 
     return result
+
+
+def _bracket_table(brackets: List[Bracket]):
+    """
+    Lower bounds, rates and cumulative tax at each lower bound for vectorized use.
+
+    Mirrors apply_tax_brackets(): the first bracket starts at 0 regardless of
+    its threshold, and brackets after a None threshold are unreachable.
+    """
+    lowers = [0.0]
+    rates = []
+    for i, bracket in enumerate(brackets):
+        rates.append(bracket.rate)
+        if i + 1 < len(brackets):
+            next_threshold = brackets[i + 1].threshold
+            if next_threshold is None:
+                break
+            lowers.append(float(next_threshold))
+
+    lowers = np.array(lowers[:len(rates)], dtype=float)
+    rates = np.array(rates, dtype=float)
+    cumulative = np.zeros(len(rates), dtype=float)
+    if len(rates) > 1:
+        cumulative[1:] = np.cumsum(np.diff(lowers) * rates[:-1])
+    return lowers, rates, cumulative
+
+
+def apply_tax_brackets_batch(taxable_income: np.ndarray, brackets: List[Bracket]) -> np.ndarray:
+    """
+    Vectorized apply_tax_brackets() over an array of taxable incomes.
+
+    Brackets are located with np.searchsorted over the bracket lower bounds
+    and tax is read off the cumulative tax at each lower bound.
+
+    Args:
+        taxable_income: Array of taxable incomes
+        brackets: List of Bracket objects with threshold and rate
+
+    Returns:
+        Array of tax before credits (dollars)
+    """
+    income = np.asarray(taxable_income, dtype=float)
+    if not brackets:
+        return np.zeros_like(income)
+
+    lowers, rates, cumulative = _bracket_table(brackets)
+    idx = np.searchsorted(lowers, income, side="left") - 1
+    idx = np.clip(idx, 0, len(rates) - 1)
+    tax = cumulative[idx] + (income - lowers[idx]) * rates[idx]
+    return np.where(income > 0, np.maximum(tax, 0.0), 0.0)
+
+
+def progressive_tax_batch(
+    params: TaxParams,
+    age,
+    ordinary_income=0.0,
+    elig_dividends=0.0,
+    nonelig_dividends=0.0,
+    cap_gains=0.0,
+    pension_income=0.0,
+    oas_received=0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized progressive_tax() over arrays of incomes and ages.
+
+    All income arguments and age may be scalars or arrays; they are broadcast
+    together. Every field returned by progressive_tax() is returned as an
+    array of the broadcast shape, computed with the same formulas (and in the
+    same order of operations) so results match the scalar function to the cent.
+    Results are not cached.
+
+    Args:
+        params: TaxParams with brackets and credit parameters
+        age: Age or array of ages
+        ordinary_income, elig_dividends, nonelig_dividends, cap_gains,
+        pension_income, oas_received: Same meaning as in progressive_tax()
+
+    Returns:
+        Dict with the same keys as progressive_tax(), each an ndarray
+
+    Examples:
+        >>> result = progressive_tax_batch(params, 70, ordinary_income=np.array([30000, 60000]))
+        >>> result['net_tax'].shape
+        (2,)
+    """
+    age, ordinary_income, elig_dividends, nonelig_dividends, cap_gains, pension_income, oas_received = (
+        np.broadcast_arrays(
+            np.asarray(age),
+            *(np.nan_to_num(np.asarray(v, dtype=float)) for v in (
+                ordinary_income, elig_dividends, nonelig_dividends,
+                cap_gains, pension_income, oas_received,
+            ))
+        )
+    )
+
+    # Step 1: Dividend grossup and credits
+    elig_gross = elig_dividends * (1 + params.dividend_grossup_eligible)
+    elig_credit = elig_gross * params.dividend_credit_rate_eligible
+    nonelig_gross = nonelig_dividends * (1 + params.dividend_grossup_noneligible)
+    nonelig_credit = nonelig_gross * params.dividend_credit_rate_noneligible
+
+    # Step 2: Capital gains inclusion
+    cg_includable = cap_gains * capital_gains_inclusion(1.0)['inclusion_rate']
+
+    # Step 3: Taxable income
+    taxable_income = (
+        ordinary_income +
+        pension_income +
+        oas_received +
+        elig_gross +
+        nonelig_gross +
+        cg_includable
+    )
+
+    # Step 4: Brackets
+    gross_tax = apply_tax_brackets_batch(taxable_income, params.brackets)
+
+    # Step 5: Credits
+    div_credits = elig_credit + nonelig_credit
+
+    bpa_credit = params.bpa_amount * params.bpa_rate
+    pension_credit = np.minimum(pension_income, params.pension_credit_amount) * params.pension_credit_rate
+    if params.age_amount > 0:
+        reduction = (taxable_income - params.age_amount_phaseout_start) * params.age_amount_phaseout_rate
+        age_amount = np.where(
+            taxable_income > params.age_amount_phaseout_start,
+            np.maximum(0.0, params.age_amount - reduction),
+            params.age_amount,
+        )
+        age_credit = np.where(age >= 65, age_amount * params.bpa_rate, 0.0)
+    else:
+        age_credit = np.zeros_like(taxable_income)
+    nonref_credits = bpa_credit + pension_credit + age_credit
+
+    total_credits = div_credits + nonref_credits
+    tax_after_credits = np.maximum(gross_tax - total_credits, 0.0)
+
+    # Step 6: OAS clawback
+    clawback = np.minimum(
+        (taxable_income - params.oas_clawback_threshold) * params.oas_clawback_rate,
+        oas_received,
+    )
+    oas_clawback = np.where(
+        (oas_received > 0) & (taxable_income > params.oas_clawback_threshold),
+        clawback,
+        0.0,
+    )
+
+    # Step 7: Final tax
+    net_tax = tax_after_credits + oas_clawback
+
+    # Step 8: Rates and per-income-type effective tax
+    total_income = (
+        ordinary_income + pension_income + oas_received +
+        elig_dividends + nonelig_dividends + cap_gains
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_rate = np.where(total_income > 0, net_tax / total_income, 0.0)
+
+    marginal_rate = params.brackets[-1].rate if params.brackets else 0.0
+
+    tax_on_elig_div = np.where(
+        elig_dividends > 0, np.maximum(elig_gross * marginal_rate - elig_credit, 0.0), 0.0
+    )
+    tax_on_nonelig_div = np.where(
+        nonelig_dividends > 0, np.maximum(nonelig_gross * marginal_rate - nonelig_credit, 0.0), 0.0
+    )
+    tax_on_cg = np.where(cap_gains > 0, cg_includable * marginal_rate, 0.0)
+
+    return {
+        'taxable_income': taxable_income,
+        'gross_tax': gross_tax,
+        'tax_on_ordinary': apply_tax_brackets_batch(ordinary_income, params.brackets),
+        'tax_on_elig_div': tax_on_elig_div,
+        'tax_on_nonelig_div': tax_on_nonelig_div,
+        'tax_on_cg': tax_on_cg,
+        'total_before_credits': gross_tax,
+        'total_credits': total_credits,
+        'tax_after_credits': tax_after_credits,
+        'oas_clawback': oas_clawback,
+        'net_tax': net_tax,
+        'marginal_rate': np.full(taxable_income.shape, marginal_rate),
+        'effective_rate': effective_rate,
+    }
@@ -0,0 +1,253 @@
+"""
+Compiled, horizon-wide tax parameter schedules.
+
+simulate() needs federal and provincial TaxParams indexed for every year of
+the projection. Building them with index_tax_params() each year allocates new
+TaxParams/Bracket objects and a new GIS dict per year, and get_tax_params()
+re-parses the province config on every simulation.
+
+This module compiles the whole horizon once per (config version, province,
+inflation rate) into NumPy arrays, materializes one TaxParams pair per year
+from those arrays, and keeps the result in a process-wide registry shared by
+every request (and, per process, every worker). Years therefore map to stable
+TaxParams objects, which the tax engine can cache on.
+
+Values are bit-identical to index_tax_params() for every year.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from modules.config import get_tax_params, index_tax_params
+from modules.models import TaxParams, Bracket
+
+
+# Years compiled per schedule (covers start age 50 to end age 100 plus terminal year)
+DEFAULT_HORIZON_YEARS = 60
+
+# Maximum number of compiled schedules kept in the registry (LRU)
+REGISTRY_MAX_SIZE = 64
+
+# GIS dollar amounts indexed by CRA each year, in array column order
+GIS_INDEXED_KEYS = (
+    ("threshold_single", 21768),
+    ("threshold_couple", 28752),
+    ("threshold_couple_one_oas", 52080),
+    ("threshold_couple_no_oas", 52080),
+    ("max_benefit_single", 13265.16),
+    ("max_benefit_couple", 7956.00),
+)
+
+
+@dataclass
+class CompiledTaxSide:
+    """Indexed parameters for one jurisdiction, one row per year since start."""
+    thresholds: np.ndarray            # (years, n_brackets); NaN where threshold is None
+    rates: np.ndarray                 # (n_brackets,)
+    bpa_amount: np.ndarray            # (years,)
+    age_amount: np.ndarray            # (years,)
+    age_amount_phaseout_start: np.ndarray  # (years,)
+    oas_clawback_threshold: np.ndarray     # (years,)
+    gis: np.ndarray                   # (years, len(GIS_INDEXED_KEYS)); empty if no GIS config
+
+
+def config_version(cfg: Dict) -> str:
+    """
+    Content hash identifying a tax config dict.
+
+    Two configs with the same content share compiled schedules regardless of
+    which request or worker loaded them.
+    """
+    payload = json.dumps(cfg, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def _compile_side(base: TaxParams, factors: np.ndarray) -> CompiledTaxSide:
+    """Index one jurisdiction's parameters for every year at once."""
+    base_thresholds = np.array(
+        [np.nan if b.threshold is None else float(b.threshold) for b in base.brackets],
+        dtype=float,
+    )
+    if base.gis_config:
+        base_gis = np.array(
+            [float(base.gis_config.get(key, default)) for key, default in GIS_INDEXED_KEYS],
+            dtype=float,
+        )
+    else:
+        base_gis = np.zeros(0, dtype=float)
+
+    column = factors[:, None]
+    return CompiledTaxSide(
+        thresholds=base_thresholds[None, :] * column,
+        rates=np.array([b.rate for b in base.brackets], dtype=float),
+        bpa_amount=base.bpa_amount * factors,
+        age_amount=base.age_amount * factors,
+        age_amount_phaseout_start=base.age_amount_phaseout_start * factors,
+        oas_clawback_threshold=base.oas_clawback_threshold * factors,
+        gis=base_gis[None, :] * column,
+    )
+
+
+def _materialize(base: TaxParams, side: CompiledTaxSide, year: int) -> TaxParams:
+    """Build the TaxParams for one compiled year (mirrors index_tax_params)."""
+    thresholds = side.thresholds[year]
+    brackets = [
+        Bracket(threshold=None if np.isnan(t) else float(t), rate=b.rate)
+        for t, b in zip(thresholds, base.brackets)
+    ]
+
+    gis_config = {}
+    if base.gis_config:
+        gis_row = side.gis[year]
+        gis_config = {key: float(gis_row[i]) for i, (key, _) in enumerate(GIS_INDEXED_KEYS)}
+        gis_config["clawback_rate"] = base.gis_config.get("clawback_rate", 0.50)
+        gis_config["employment_exemption_1"] = base.gis_config.get("employment_exemption_1", 5000.0)
+        gis_config["employment_exemption_2_rate"] = base.gis_config.get("employment_exemption_2_rate", 0.50)
+        if "notes" in base.gis_config:
+            gis_config["notes"] = base.gis_config["notes"]
+
+    return TaxParams(
+        brackets=brackets,
+        bpa_amount=float(side.bpa_amount[year]),
+        bpa_rate=base.bpa_rate,
+        pension_credit_amount=base.pension_credit_amount,  # Not indexed
+        pension_credit_rate=base.pension_credit_rate,
+        age_amount=float(side.age_amount[year]),
+        age_amount_phaseout_start=float(side.age_amount_phaseout_start[year]),
+        age_amount_phaseout_rate=base.age_amount_phaseout_rate,
+        oas_clawback_threshold=float(side.oas_clawback_threshold[year]),
+        oas_clawback_rate=base.oas_clawback_rate,
+        dividend_grossup_eligible=base.dividend_grossup_eligible,
+        dividend_grossup_noneligible=base.dividend_grossup_noneligible,
+        dividend_credit_rate_eligible=base.dividend_credit_rate_eligible,
+        dividend_credit_rate_noneligible=base.dividend_credit_rate_noneligible,
+        gis_config=gis_config,
+    )
+
+
+class CompiledTaxSchedule:
+    """
+    Federal and provincial tax parameters for every year of a projection.
+
+    Year 0 (and every year when inflation is zero) returns the unindexed base
+    params, exactly like index_tax_params(). The returned TaxParams are shared
+    between simulations and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        fed: TaxParams,
+        prov: TaxParams,
+        inflation: float,
+        horizon: int = DEFAULT_HORIZON_YEARS,
+        version: str = "",
+        province: str = "",
+    ):
+        self.fed = fed
+        self.prov = prov
+        self.inflation = inflation
+        self.horizon = horizon
+        self.version = version
+        self.province = province
+
+        # Python's ** per year so factors match index_tax_params() to the bit
+        self.factors = np.array([(1.0 + inflation) ** y for y in range(horizon)], dtype=float)
+        self.fed_table = _compile_side(fed, self.factors)
+        self.prov_table = _compile_side(prov, self.factors)
+
+        self._years: List[Tuple[TaxParams, TaxParams]] = [(fed, prov)]
+        for year in range(1, horizon):
+            if inflation == 0.0:
+                self._years.append((fed, prov))
+            else:
+                self._years.append((
+                    _materialize(fed, self.fed_table, year),
+                    _materialize(prov, self.prov_table, year),
+                ))
+
+    @property
+    def key(self) -> Tuple[str, str, float]:
+        return (self.version, self.province, self.inflation)
+
+    def params_for(self, years_since_start: int) -> Tuple[TaxParams, TaxParams]:
+        """
+        Indexed (federal, provincial) params for a year of the projection.
+
+        Years beyond the compiled horizon fall back to index_tax_params().
+        """
+        if years_since_start <= 0:
+            return self._years[0]
+        if years_since_start < self.horizon:
+            return self._years[years_since_start]
+        return (
+            index_tax_params(self.fed, years_since_start, self.inflation),
+            index_tax_params(self.prov, years_since_start, self.inflation),
+        )
+
+
+_registry: "OrderedDict[Tuple[str, str, float], CompiledTaxSchedule]" = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def get_compiled_schedule(
+    cfg: Dict,
+    province: str,
+    inflation: float,
+    horizon: int = DEFAULT_HORIZON_YEARS,
+) -> CompiledTaxSchedule:
+    """
+    Fetch (compiling on first use) the tax schedule for a config/province/inflation.
+
+    Args:
+        cfg: Config dict from load_tax_config()
+        province: Province code (AB, BC, ON, QC, etc.)
+        inflation: Annual indexing rate (e.g. 0.02)
+        horizon: Minimum number of years that must be compiled
+
+    Returns:
+        Shared CompiledTaxSchedule
+
+    Raises:
+        Same errors as get_tax_params() for invalid configs or provinces
+    """
+    if cfg is None or not isinstance(cfg, dict):
+        # Let get_tax_params raise its usual, descriptive error
+        get_tax_params(cfg, province)
+
+    key = (config_version(cfg), province, float(inflation))
+
+    with _registry_lock:
+        schedule = _registry.get(key)
+        if schedule is not None and schedule.horizon >= horizon:
+            _registry.move_to_end(key)
+            return schedule
+
+    fed, prov = get_tax_params(cfg, province)
+    schedule = CompiledTaxSchedule(
+        fed, prov, float(inflation),
+        horizon=max(horizon, DEFAULT_HORIZON_YEARS),
+        version=key[0], province=province,
+    )
+
+    with _registry_lock:
+        existing = _registry.get(key)
+        if existing is not None and existing.horizon >= horizon:
+            # Another thread compiled it first; keep a single shared instance
+            _registry.move_to_end(key)
+            return existing
+        _registry[key] = schedule
+        while len(_registry) > REGISTRY_MAX_SIZE:
+            _registry.popitem(last=False)
+    return schedule
+
+
+def clear_schedule_registry() -> None:
+    """Drop all compiled schedules (e.g. after reloading tax config files)."""
+    with _registry_lock:
+        _registry.clear()
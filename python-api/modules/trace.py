@@ -0,0 +1,133 @@
+"""
+Structured trace facility for the simulation engine.
+
+Replaces the unconditional debug prints in the year loop. Call sites guard
+every record with a single module-level boolean, so when nobody is tracing
+the cost is one attribute check and no string formatting happens:
+
+    from modules import trace
+
+    if trace.ACTIVE:
+        trace.emit("withdrawals", "shortfall", person=person.name, age=age, shortfall=shortfall)
+
+Records are plain dicts ({"channel", "event", **fields}) collected per request
+(per thread / asyncio task, via contextvars) instead of being written to the
+shared stderr:
+
+    with trace.collect({"withdrawals", "gis"}) as collector:
+        df = simulate(hh, tax_cfg)
+    collector.records  # -> list of dicts
+
+Channels:
+- withdrawals: shortfall sizing, withdrawal order, TFSA flows, surplus and gaps
+- rrif: RRIF minimums and frontload targets
+- gis: GIS income tests and benefits
+- pension: employer pension and other income streams
+- corp: corporate buckets, CDA and RDTOH flows
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
+
+CHANNELS = frozenset({"withdrawals", "rrif", "gis", "pension", "corp"})
+
+# Default cap on records kept per collector (oldest records are kept)
+DEFAULT_MAX_RECORDS = 20000
+
+# True while at least one collector is open anywhere in this process.
+# Call sites check this before building any record.
+ACTIVE = False
+
+_open_collectors = 0
+_open_lock = threading.Lock()
+_current: ContextVar = ContextVar("trace_collector", default=None)
+
+
+class TraceCollector:
+    """Records emitted on the selected channels within one collect() block."""
+
+    def __init__(self, channels: Optional[Iterable[str]] = None, max_records: int = DEFAULT_MAX_RECORDS):
+        if channels is None or channels == "all":
+            self.channels = CHANNELS
+        else:
+            self.channels = frozenset(channels)
+            unknown = self.channels - CHANNELS
+            if unknown:
+                raise ValueError(f"Unknown trace channel(s): {sorted(unknown)}. Valid: {sorted(CHANNELS)}")
+        self.max_records = max_records
+        self.records: List[Dict[str, Any]] = []
+        self.dropped = 0
+
+    def add(self, channel: str, event: str, fields: Dict[str, Any]) -> None:
+        if channel not in self.channels:
+            return
+        if len(self.records) >= self.max_records:
+            self.dropped += 1
+            return
+        record = {"channel": channel, "event": event}
+        record.update(fields)
+        self.records.append(record)
+
+
+def emit(channel: str, event: str, **fields: Any) -> None:
+    """
+    Record an event on a channel for the collector active in this context.
+
+    Guard calls with `if trace.ACTIVE:` so field values are not even
+    evaluated when tracing is off.
+    """
+    collector = _current.get()
+    if collector is not None:
+        collector.add(channel, event, fields)
+
+
+def enabled(channel: str) -> bool:
+    """True if the current context is collecting the given channel."""
+    collector = _current.get()
+    return collector is not None and channel in collector.channels
+
+
+@contextmanager
+def collect(channels: Optional[Iterable[str]] = None, max_records: int = DEFAULT_MAX_RECORDS):
+    """
+    Collect trace records emitted in this context.
+
+    Args:
+        channels: Channel names to record (default: all channels)
+        max_records: Maximum records kept; further records are counted in `dropped`
+
+    Yields:
+        TraceCollector whose `records` list fills as the block runs
+    """
+    global ACTIVE, _open_collectors
+
+    collector = TraceCollector(channels, max_records)
+    token = _current.set(collector)
+    with _open_lock:
+        _open_collectors += 1
+        ACTIVE = True
+    try:
+        yield collector
+    finally:
+        _current.reset(token)
+        with _open_lock:
+            _open_collectors -= 1
+            ACTIVE = _open_collectors > 0
+
+
+def parse_channels(spec: Optional[str]) -> Optional[frozenset]:
+    """
+    Parse a comma-separated channel list ("withdrawals,gis" or "all").
+
+    Returns:
+        frozenset of channels, or None if spec is empty (tracing off)
+    """
+    if not spec:
+        return None
+    spec = spec.strip().lower()
+    if spec in ("all", "1", "true", "*"):
+        return CHANNELS
+    return frozenset(c.strip() for c in spec.split(",") if c.strip())
@@ -13,9 +13,15 @@ Supported Strategies:
 - RRIFFrontloadOASProtectionStrategy: NonReg → RRIF → TFSA → Corp (OAS clawback protection)
 - GISOptimizedStrategy: NonReg → Corp → TFSA → RRIF
 - BalancedStrategy: Optimized for tax efficiency
+
+StrategyPlan carries what the year-by-year simulation needs to know about a
+strategy (base order, RRIF frontloading, deferred RRIF minimum, GIS mode,
+...) as plain attributes, resolved once per simulation by get_strategy_plan().
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 from modules.models import Person, Household
 
@@ -633,3 +639,110 @@ def is_hybrid_strategy(strategy_name: str) -> bool:
         False
     """
     return "hybrid" in (strategy_name or "").lower()
+
+
+@dataclass(frozen=True)
+class StrategyPlan:
+    """
+    Withdrawal strategy semantics used by simulate_year(), resolved from the
+    strategy name once per simulation.
+
+    Attributes:
+        name: Strategy name as given
+        base_order: Shortfall top-up order when the TaxOptimizer is disabled,
+            fails or is not allowed to reorder (preserve_order)
+        preserve_order: Keep base_order instead of the TaxOptimizer's order
+        rrif_frontload: Withdraw a fixed share of the RRIF up front (which also
+            covers the RRIF minimum) and never top up from the RRIF; plan TFSA
+            contributions into the withdrawal target
+        frontload_pct_before_oas: RRIF frontload share before OAS starts
+        frontload_pct_after_oas: RRIF frontload share from the OAS start age
+        defer_rrif_minimum: Enforce the RRIF minimum after the top-up order
+            rather than before (Balanced)
+        cda_first: Withdraw corporate funds from the CDA first (Balanced)
+        hybrid_topup: Withdraw the hybrid RRIF top-up before other sources
+        gis_optimized: Use the GIS-aware withdrawal calculation (minimize-income)
+        gis_walk: GIS-aware withdrawals by segment walk (allocate_gis_withdrawals());
+            False ranks sources once by estimated cost instead
+            (estimated_gis_withdrawals()), the fallback simulate() compares against
+    """
+    name: str
+    base_order: Tuple[str, ...]
+    preserve_order: bool = False
+    rrif_frontload: bool = False
+    frontload_pct_before_oas: float = 0.15
+    frontload_pct_after_oas: float = 0.08
+    defer_rrif_minimum: bool = False
+    cda_first: bool = False
+    hybrid_topup: bool = False
+    gis_optimized: bool = False
+    gis_walk: bool = True
+
+    def frontload_pct(self, age: int, oas_start_age: int) -> float:
+        """
+        RRIF frontload share for a person's age.
+
+        The year OAS starts counts as after OAS: OAS clawback risk exists from then on.
+        """
+        return self.frontload_pct_before_oas if age < oas_start_age else self.frontload_pct_after_oas
+
+
+def _base_order(strategy_name: str) -> Tuple[str, ...]:
+    """Shortfall top-up order for a strategy name (see StrategyPlan.base_order)"""
+    if strategy_name == "NonReg->RRIF->Corp->TFSA":
+        return ("nonreg", "rrif", "corp", "tfsa")
+    elif strategy_name == "RRIF->Corp->NonReg->TFSA":
+        return ("rrif", "corp", "nonreg", "tfsa")
+    elif strategy_name.startswith("Hybrid"):
+        return ("nonreg", "corp", "tfsa")  # already added RRIF top-up
+    elif strategy_name == "Corp->RRIF->NonReg->TFSA":
+        return ("corp", "rrif", "nonreg", "tfsa")
+    elif "rrif-frontload" in strategy_name.lower():
+        # RRIF-Frontload: RRIF is pre-withdrawn at a FIXED frontload amount, so
+        # "rrif" is NOT in the order. Gap-filling: Corp (tax credits) → NonReg
+        # (capital gains) → TFSA (preserve)
+        return ("corp", "nonreg", "tfsa")
+    elif "Balanced" in strategy_name or "tax efficiency" in strategy_name.lower():
+        # Corp (tax-credited), then RRIF (100% taxable at death - deplete early),
+        # then NonReg (ACB-protected), TFSA last
+        return ("corp", "rrif", "nonreg", "tfsa")
+    elif "corporate-optimized" in strategy_name.lower() or "Corporate Optimized" in strategy_name:
+        # Corp first (eligible dividends get tax credits), then RRIF, NonReg, TFSA
+        return ("corp", "rrif", "nonreg", "tfsa")
+    else:
+        return ("nonreg", "rrif", "corp", "tfsa")
+
+
+@lru_cache(maxsize=64)
+def get_strategy_plan(strategy_name: str) -> StrategyPlan:
+    """
+    Resolve a strategy name into a StrategyPlan.
+
+    Args:
+        strategy_name (str): Household strategy (canonical name or API key such
+                             as "rrif-frontload", "minimize-income")
+
+    Returns:
+        StrategyPlan: Shared, immutable plan for the name.
+
+    Examples:
+        >>> get_strategy_plan("rrif-frontload").base_order
+        ('corp', 'nonreg', 'tfsa')
+        >>> get_strategy_plan("minimize-income").gis_optimized
+        True
+    """
+    name = strategy_name or ""
+    lowered = name.lower()
+    balanced = "Balanced" in name or "tax efficiency" in lowered
+    return StrategyPlan(
+        name=name,
+        base_order=_base_order(name),
+        # TaxOptimizer does not override these carefully designed orders
+        preserve_order=("rrif-frontload" in name
+                        or ("corporate" in lowered and "optimized" in lowered)),
+        rrif_frontload="rrif-frontload" in lowered,
+        defer_rrif_minimum=balanced and "rrif-frontload" not in lowered,
+        cda_first=balanced,
+        hybrid_topup=name.startswith("Hybrid"),
+        gis_optimized=("GIS-Optimized" in name or "minimize-income" in lowered or "minimize_income" in lowered),
+    )
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the engine admission controller: work runs off the event loop, excess
+requests queue up to the limit, and the rest are rejected with 503 and a
+Retry-After header.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from api.utils.admission import AdmissionController
+
+
+def _work(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_event_loop_stays_free():
+    """A running job does not block other coroutines"""
+    async def scenario():
+        admission = AdmissionController(max_in_flight=1, max_queue=0)
+        job = asyncio.create_task(admission.run(_work, 0.3))
+        await asyncio.sleep(0.01)
+
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.01)
+        loop_delay = time.perf_counter() - t0
+
+        assert admission.stats()["in_flight"] == 1
+        assert await job == 0.3
+        admission.shutdown()
+        return loop_delay
+
+    loop_delay = asyncio.run(scenario())
+    assert loop_delay < 0.1, loop_delay
+    print(f"✅ Event loop responsive during engine work ({loop_delay * 1000:.0f} ms tick)")
+
+
+def test_queue_limits_and_rejection():
+    """One runs, one waits, the third is rejected at once with Retry-After"""
+    async def scenario():
+        admission = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=5.0)
+        first = asyncio.create_task(admission.run(_work, 0.2))
+        second = asyncio.create_task(admission.run(_work, 0.01))
+        await asyncio.sleep(0.05)
+        assert admission.stats()["queued"] == 1
+
+        try:
+            await admission.run(_work, 0.01)
+            assert False, "third job admitted past a full queue"
+        except HTTPException as e:
+            assert e.status_code == 503
+            assert int(e.headers["Retry-After"]) >= 1
+
+        assert await first == 0.2 and await second == 0.01
+        stats = admission.stats()
+        assert stats["admitted"] == 2 and stats["rejected"] == 1
+        assert stats["max_wait_ms"] >= 100  # second waited for the first
+        assert stats["queued"] == 0 and stats["in_flight"] == 0
+
+        # A queued job that cannot get a slot in time is rejected too
+        admission.queue_timeout = 0.05
+        slow = asyncio.create_task(admission.run(_work, 0.3))
+        await asyncio.sleep(0.01)
+        try:
+            await admission.run(_work, 0.01)
+            assert False, "job admitted after queue timeout"
+        except HTTPException as e:
+            assert e.status_code == 503
+        await slow
+        admission.shutdown()
+        return stats
+
+    stats = asyncio.run(scenario())
+    print(f"✅ Queue bound and timeout enforced: {stats}")
+
+
+if __name__ == "__main__":
+    test_event_loop_stays_free()
+    test_queue_limits_and_rejection()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test POST /api/run-simulation/batch: JSON array and NDJSON stream input
+(results stream back while the body is still arriving), per-item error
+lines, and the engine pool giving the same results as the single-household
+endpoint.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from starlette.requests import Request
+
+from api.routes import batch
+from api.routes.batch import run_simulation_batch
+from api.routes.simulation import _run_simulation
+from household_fixtures import flat_spending, household_input
+from modules.config import load_tax_config
+from modules.engine_pool import EnginePool
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _post(state, chunks, content_type):
+    """Call the route with a streamed request body; returns the parsed NDJSON lines"""
+    messages = [{"type": "http.request", "body": c, "more_body": True} for c in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    async def scenario():
+        scope = {
+            "type": "http", "method": "POST", "path": "/api/run-simulation/batch",
+            "headers": [(b"content-type", content_type.encode())],
+            "app": SimpleNamespace(state=state),
+        }
+        response = await run_simulation_batch(Request(scope, receive))
+        assert response.media_type == "application/x-ndjson"
+        return [json.loads(line) async for line in response.body_iterator]
+
+    return asyncio.run(scenario())
+
+
+def _post_asgi(tax_cfg, chunks, content_type, hold_last=False):
+    """POST through the ASGI app, as a server would: the body arrives in chunks,
+    then receive() waits for the client to disconnect after the response.
+
+    With hold_last the last chunk is only sent once a result line has come back
+    (or after 30 s). Returns (lines, whether a result came before the last chunk)."""
+    app = FastAPI()
+    app.include_router(batch.router, prefix="/api")
+    app.state.tax_cfg = tax_cfg
+
+    async def scenario():
+        messages = [{"type": "http.request", "body": c, "more_body": True} for c in chunks]
+        messages.append({"type": "http.request", "body": b"", "more_body": False})
+        finished, first_result = asyncio.Event(), asyncio.Event()
+        sent = []
+        result_before_last = False
+
+        async def receive():
+            nonlocal result_before_last
+            if messages:
+                if hold_last and len(messages) == 2:
+                    try:
+                        await asyncio.wait_for(first_result.wait(), 30)
+                        result_before_last = True
+                    except asyncio.TimeoutError:
+                        pass
+                message = messages.pop(0)
+                await asyncio.sleep(0)  # Let the app interleave, as a socket would
+                return message
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body":
+                if b'"index"' in message.get("body", b""):
+                    first_result.set()
+                if not message.get("more_body", False):
+                    finished.set()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+            "scheme": "http", "path": "/api/run-simulation/batch", "raw_path": b"/api/run-simulation/batch",
+            "root_path": "", "query_string": b"", "server": ("test", 80), "client": ("test", 1),
+            "headers": [(b"content-type", content_type.encode())],
+        }
+        await app(scope, receive, send)
+        assert sent[0]["status"] == 200
+        body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+        return [json.loads(line) for line in body.splitlines()], result_before_last
+
+    return asyncio.run(scenario())
+
+
+def _expected(state, household):
+    return json.loads(_run_simulation(household, state).model_dump_json())
+
+
+def test_ndjson_stream_with_bad_items():
+    """Each line gets its own result; bad lines become error lines"""
+    state = SimpleNamespace(tax_cfg=load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json")))
+    good = household_input()
+    body = (good.model_dump_json() + "\n" + "{not json\n" + json.dumps({"province": "ON"}) + "\n").encode()
+
+    # Split mid-line to check that lines are reassembled across chunks
+    lines = _post(state, [body[:50], body[50:]], "application/x-ndjson")
+    done = lines.pop()
+    assert done["done"] and done["items"] == 3 and done["errors"] == 2
+
+    by_index = {line["index"]: line for line in lines}
+    assert by_index[0]["status"] == 200
+    assert by_index[0]["result"] == _expected(state, good)
+    assert by_index[1]["status"] == 400
+    assert by_index[2]["status"] == 422
+    print(f"✅ NDJSON batch: 1 result, 2 error lines in {done['elapsed_ms']:.0f} ms")
+
+
+def test_chunked_body_through_app():
+    """Every line of a chunked NDJSON body is simulated once the response is streaming"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    body = b"".join(household_input(**flat_spending(40000 + 5000 * i)).model_dump_json().encode() + b"\n" for i in range(6))
+    chunks = [body[i:i + 700] for i in range(0, len(body), 700)]
+
+    lines, _ = _post_asgi(tax_cfg, chunks, "application/x-ndjson")
+    done = lines.pop()
+    assert done["done"] and done["items"] == 6 and done["errors"] == 0
+    assert sorted(line["index"] for line in lines) == list(range(6))
+    print(f"✅ Chunked NDJSON body through the app: {len(chunks)} chunks, {done['items']} results")
+
+
+def test_results_stream_before_body_ends():
+    """The first result goes out while the client is still sending the body"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    chunks = [household_input(**flat_spending(40000 + 5000 * i)).model_dump_json().encode() + b"\n" for i in range(3)]
+
+    lines, result_before_last = _post_asgi(tax_cfg, chunks, "application/x-ndjson", hold_last=True)
+    assert result_before_last
+    done = lines.pop()
+    assert done["items"] == 3 and done["errors"] == 0
+    print("✅ First result streamed back before the last chunk was sent")
+
+
+def test_json_array_on_engine_pool():
+    """Pool workers return the same results as the single-household endpoint"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    households = [
+        household_input(province=province, **flat_spending(spending))
+        for province, spending in (("ON", 50000), ("BC", 70000), ("QC", 90000))
+    ]
+    body = json.dumps([json.loads(h.model_dump_json()) for h in households]).encode()
+
+    pool = EnginePool(workers=2, config_dir=CONFIG_DIR)
+    try:
+        lines = _post(SimpleNamespace(tax_cfg=tax_cfg, engine_pool=pool), [body], "application/json")
+    finally:
+        pool.shutdown()
+
+    done = lines.pop()
+    assert done["items"] == 3 and done["errors"] == 0
+    state = SimpleNamespace(tax_cfg=tax_cfg)
+    for line in lines:
+        assert line["result"] == _expected(state, households[line["index"]])
+    print(f"✅ JSON array batch on 2 workers matches single runs ({done['elapsed_ms']:.0f} ms)")
+
+
+if __name__ == "__main__":
+    test_ndjson_stream_with_bad_items()
+    test_chunked_body_through_app()
+    test_results_stream_before_body_ends()
+    test_json_array_on_engine_pool()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test year-state checkpoints: what-if re-runs that change only late-life
+parameters resume mid-plan and give exactly the full simulate() result.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dataclasses
+from types import SimpleNamespace
+
+import pandas as pd
+
+from household_fixtures import household_input, partner_input, person_input
+from api.routes.simulation import _run_simulation
+from api.utils.converters import api_household_to_internal
+from modules.checkpoints import CheckpointStore, first_affected_year
+from modules.config import load_tax_config
+from modules.simulation import simulate, simulate_what_if
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _household_input():
+    """Couple with registered, non-registered, corporate and pension assets"""
+    p1 = person_input(corporate_balance=300000,
+                      pension_incomes=[{"name": "DB", "amount": 15000, "startAge": 66, "inflationIndexed": True}])
+    return household_input(p1=p1, p2=partner_input(),
+                           spending_go_go=110000, spending_slow_go=90000, spending_no_go=70000)
+
+
+def _household(tax_cfg):
+    return api_household_to_internal(_household_input(), tax_cfg)
+
+
+def test_resumed_matches_full_run():
+    """Late-life changes reuse the unchanged prefix and match simulate() exactly"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    base = simulate_what_if(hh, tax_cfg)
+    pd.testing.assert_frame_equal(base.df, simulate(hh, tax_cfg))
+    assert len(base.checkpoints) == len(base.df) + 1  # plus the state after the last year
+
+    for change in (dict(spending_no_go=50000), dict(slow_go_end_age=88), dict(end_age=100), dict(end_age=90)):
+        what_if = dataclasses.replace(hh, **change)
+        run = simulate_what_if(what_if, tax_cfg, base)
+        pd.testing.assert_frame_equal(run.df, simulate(what_if, tax_cfg))
+        assert run.years_reused == first_affected_year(hh, what_if) > 0
+        print(f"✅ {change}: reused {run.years_reused}/{len(run.df)} years")
+
+    # Resuming leaves the base run usable for the next what-if
+    pd.testing.assert_frame_equal(simulate_what_if(hh, tax_cfg, base).df, base.df)
+
+
+def test_other_changes_start_over():
+    """Anything that can change the first year disables reuse"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    base = simulate_what_if(hh, tax_cfg)
+
+    for what_if in (
+        dataclasses.replace(hh, spending_go_go=90000),
+        dataclasses.replace(hh, strategy="rrif-frontload"),
+        dataclasses.replace(hh, p1=dataclasses.replace(hh.p1, tfsa_balance=50000)),
+    ):
+        assert first_affected_year(hh, what_if) == 0
+        run = simulate_what_if(what_if, tax_cfg, base)
+        assert run.years_reused == 0
+        pd.testing.assert_frame_equal(run.df, simulate(what_if, tax_cfg))
+
+    # A different tax configuration never reuses rows either
+    tax_cfg_2026 = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2026.json"))
+    assert simulate_what_if(dataclasses.replace(hh, end_age=100), tax_cfg_2026, base).years_reused == 0
+    print("✅ Early-year and tax config changes re-run from the start")
+
+
+def test_store_finds_base_for_what_if():
+    """The store hands back the latest run of a plan for any late-life variant"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    store = CheckpointStore(max_runs=2)
+    store.put(simulate_what_if(hh, tax_cfg), tax_cfg)
+
+    what_if = dataclasses.replace(hh, spending_no_go=55000)
+    assert store.get(what_if, tax_cfg) is not None
+    assert store.get(dataclasses.replace(hh, province="BC"), tax_cfg) is None
+
+    store.put(simulate_what_if(what_if, tax_cfg, store.get(what_if, tax_cfg)), tax_cfg)
+    stats = store.stats()
+    assert stats["runs"] == 1 and stats["resumed"] == 1 and stats["years_reused"] > 0
+    print(f"✅ Store: {stats}")
+
+
+def test_only_what_if_requests_checkpoint():
+    """/run-simulation records checkpoints only when the request asks for a what-if run"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    state = SimpleNamespace(tax_cfg=tax_cfg, checkpoints=CheckpointStore(max_runs=2))
+
+    _run_simulation(_household_input(), state)
+    assert state.checkpoints.stats()["runs"] == 0
+
+    _run_simulation(_household_input(), state, what_if=True)
+    what_if = _household_input().model_copy(update=dict(spending_no_go=55000))
+    _run_simulation(what_if, state, what_if=True)
+    stats = state.checkpoints.stats()
+    assert stats["runs"] == 1 and stats["resumed"] == 1
+    print(f"✅ Checkpoints only for what-if requests: {stats}")
+
+
+if __name__ == "__main__":
+    test_resumed_matches_full_run()
+    test_other_changes_start_over()
+    test_store_finds_base_for_what_if()
+    test_only_what_if_requests_checkpoint()
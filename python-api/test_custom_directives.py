@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test CustomDirectives: custom CSV withdrawal and yield directives for
+simulate(custom_df=...), validated once and keyed by year.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from api.models.requests import HouseholdInput, PersonInput
+from api.utils.converters import api_household_to_internal
+from modules.config import load_tax_config
+from modules.custom_directives import CustomDirectives
+from modules.simulation import simulate
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_directives_by_year():
+    """Rows add up per person and account; yield overrides keep table order"""
+    directives = CustomDirectives(pd.DataFrame([
+        {"year": 2026, "person": "Juan", "account": "RRIF", "amount": 10000},
+        {"year": 2026, "person": 1, "account": " rrif ", "amount": 2500.5},
+        {"year": 2026, "person": " daniela ", "account": "tfsa", "amount": -300},  # Negative counts as 0
+        {"year": 2026.0, "person": "p2", "account": "corp", "amount": "4000"},
+        {"year": 2027, "person": "p2", "account": "nr_yield", "amount": 0.04, "field": "y_nr_inv_elig_div"},
+        {"year": 2027, "person": "p1", "account": "nr_yield", "amount": 0.02, "field": "yield_nonreg_interest"},
+    ]))
+    year = directives.withdrawals(2026)
+    assert year["p1"] == {"nonreg": 0.0, "rrif": 12500.5, "tfsa": 0.0, "corp": 0.0}
+    assert year["p2"] == {"nonreg": 0.0, "rrif": 0.0, "tfsa": 0.0, "corp": 4000.0}
+    assert directives.withdrawals(2027)["p1"]["rrif"] == 0.0
+    assert directives.yield_overrides(2026) == []
+    assert directives.yield_overrides(2027) == [("p2", "y_nr_inv_elig_div", 0.04),
+                                                ("p1", "yield_nonreg_interest", 0.02)]
+    print("✅ Directives keyed by year and person")
+
+
+def test_invalid_rows_rejected():
+    def error(rows):
+        try:
+            CustomDirectives(pd.DataFrame(rows))
+        except ValueError as e:
+            return str(e)
+        assert False, rows
+
+    ok = {"year": 2026, "person": "p1", "account": "rrif", "amount": 1000}
+    assert "missing columns: ['amount']" in error([{k: v for k, v in ok.items() if k != "amount"}])
+    assert "row 2: unknown person 'spouse'" in error([ok, {**ok, "person": "spouse"}])
+    assert "unknown account 'rrsp'" in error([{**ok, "account": "rrsp"}])
+    assert "year must be a whole number" in error([{**ok, "year": "next"}])
+    assert "amount must be a number" in error([{**ok, "amount": float("nan")}])
+    assert "yield field" in error([{**ok, "account": "nr_yield", "field": "rrif_balance"}])
+    print("✅ Invalid directives rejected with the row number")
+
+
+def test_simulation_applies_directives():
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    p1 = PersonInput(name="Custom", start_age=65, tfsa_balance=100000, rrif_balance=400000,
+                     nonreg_balance=100000, nonreg_acb=80000)
+    p2 = PersonInput(name="Partner", start_age=64, tfsa_balance=50000, rrif_balance=200000)
+    hh = api_household_to_internal(
+        HouseholdInput(p1=p1, p2=p2, province="ON", strategy="balanced", include_partner=True), tax_cfg)
+    year = hh.start_year + 2
+    plan = pd.DataFrame([{"year": year, "person": "p2", "account": "rrif", "amount": 80000}])
+
+    base = simulate(hh, tax_cfg)
+    custom = simulate(hh, tax_cfg, custom_df=plan)
+    row = lambda df: df[df["year"] == year].iloc[0]
+    assert row(base)["withdraw_rrif_p2"] < 80000 <= row(custom)["withdraw_rrif_p2"] + 1e-6
+    earlier = lambda df: df[df["year"] < year].drop(columns="lifetime_tax_at_death")  # Whole-plan figure
+    assert earlier(custom).equals(earlier(base))
+
+    try:
+        simulate(hh, tax_cfg, custom_df=pd.DataFrame([{"year": year, "person": "p3", "account": "rrif", "amount": 1}]))
+        assert False
+    except ValueError as e:
+        assert "unknown person" in str(e)
+    print(f"✅ Custom RRIF withdrawal applied in {year}")
+
+
+if __name__ == "__main__":
+    test_directives_by_year()
+    test_invalid_rows_rejected()
+    test_simulation_applies_directives()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test allocate_gis_withdrawals(): the GIS-Optimized (minimize-income) strategy
+raises its shortfall at the lowest tax + GIS lost, walking the piecewise
+linear tax and GIS clawback schedules. Whole plans are checked against the
+estimated-cost order (estimated_gis_withdrawals()) that simulate() falls back to.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules import trace
+from modules.config import load_tax_config
+from modules.models import Household, Person
+from modules.simulation import allocate_gis_withdrawals, calculate_gis, gis_breakpoints, simulate
+from household_fixtures import flat_spending, household, partner, person
+
+GIS_CONFIG = {"threshold_single": 20000, "max_benefit_single": 10000, "clawback_rate": 0.50}
+
+
+def _allocate(shortfall, available, minimum=None):
+    """20% tax on income above $15,000 (non-reg sales count at 25%), GIS income starts at $12,000"""
+    def tax_at(nonreg, rrif, corp):
+        return 0.20 * max(0.0, 10000 + rrif + corp + 0.25 * nonreg - 15000)
+
+    def tax_breakpoints(source, room, nonreg, rrif, corp):
+        slope = 0.25 if source == "nonreg" else 1.0
+        x = (15000 - (10000 + rrif + corp + 0.25 * nonreg)) / slope
+        return [x] if 0.0 < x < room else []
+
+    return allocate_gis_withdrawals(
+        shortfall, available, tax_at=tax_at, base_tax=0.0, tax_breakpoints=tax_breakpoints,
+        gis_at=lambda income: calculate_gis(income, 70, GIS_CONFIG, oas_amount=8000),
+        gis_income=12000, gis_kinks=gis_breakpoints(GIS_CONFIG), minimum=minimum,
+    )
+
+
+def test_cheapest_segments_first():
+    """Tax-free RRIF, then low-gain non-reg, then TFSA ahead of RRIF taxed at 20%"""
+    assert gis_breakpoints(GIS_CONFIG) == [20000, 40000]
+
+    extra, tax, analysis = _allocate(20000, {"rrif": 100000, "nonreg": 5000, "tfsa": 50000, "corp": 0.0})
+    assert [s for s, _, _ in analysis["segments"]] == ["rrif", "nonreg", "tfsa"]
+    assert abs(extra["rrif"] - 5000) < 0.01 and extra["nonreg"] == 5000 and extra["corp"] == 0.0
+    assert abs(extra["tfsa"] - 10250) < 0.02 and abs(tax - 250) < 0.01
+    assert abs(analysis["raised"] - 20000) < 0.02 and analysis["unmet"] == 0.0
+    assert analysis["gis_loss"] == 0.0
+    print(f"✅ Allocation {', '.join(f'{s} ${a:,.0f}' for s, a, _ in analysis['segments'])}")
+
+
+def test_minimum_and_exhausted_sources():
+    """The RRIF minimum is taken first and counts toward GIS income; a shortfall
+    beyond every balance is reported as unmet"""
+    extra, tax, analysis = _allocate(20000, {"rrif": 100000, "nonreg": 5000, "tfsa": 50000},
+                                     minimum={"rrif": 8000})
+    assert extra["rrif"] == 8000 and extra["nonreg"] == 5000
+    assert abs(extra["tfsa"] - 7850) < 0.02 and abs(tax - 850) < 0.01
+    assert analysis["gis_before"] == analysis["gis_after"] == 10000  # Right at the threshold
+
+    extra, tax, analysis = _allocate(20000, {"rrif": 3000, "tfsa": 1000})
+    assert extra["rrif"] == 3000 and extra["tfsa"] == 1000
+    assert abs(analysis["unmet"] - 16000) < 0.01
+    print("✅ RRIF minimum honoured, exhausted sources leave the rest unmet")
+
+
+def test_walks_into_gis_reducing_segments():
+    """Once the GIS-free room is used the walk goes on, TFSA first, then RRIF
+    through the clawback, until the shortfall is raised"""
+    extra, tax, analysis = _allocate(60000, {"rrif": 100000, "nonreg": 0.0, "tfsa": 10000})
+    assert [s for s, _, _ in analysis["segments"]][:3] == ["rrif", "tfsa", "rrif"]
+    assert extra["tfsa"] == 10000 and abs(extra["rrif"] - 61250) < 0.02 and abs(tax - 11250) < 0.01
+    assert abs(analysis["raised"] - 60000) < 0.02 and analysis["unmet"] == 0.0
+    assert analysis["gis_after"] == 0.0
+    print(f"✅ Walked through the GIS clawback to raise ${analysis['raised']:,.0f}")
+
+
+def test_minimize_income_simulation():
+    """Each year's GIS allocation nets the person's target without the fallback order"""
+    tax_cfg = load_tax_config(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           "tax_config_canada_2025.json"))
+    p1 = Person(name="GIS", start_age=67, rrif_balance=120000, tfsa_balance=40000,
+                nonreg_balance=60000, nonreg_acb=50000, cpp_start_age=65, oas_start_age=65,
+                cpp_annual_at_start=5000, oas_annual_at_start=8500)
+    hh = Household(p1=p1, p2=Person(name="", start_age=65), province="ON", start_year=2025, end_age=85,
+                   spending_go_go=30000, spending_slow_go=28000, spending_no_go=26000,
+                   strategy="minimize-income")
+
+    with trace.collect({"gis", "withdrawals"}) as collector:
+        df = simulate(hh, tax_cfg)
+
+    records = [r for r in collector.records if r.get("person") == "GIS" and r["year"] < 2030]
+    allocations = {r["year"]: r for r in records if r["event"] == "allocation"}
+    assert len(allocations) == 5 and all(r["unmet"] == 0.0 for r in allocations.values())
+    assert all(r["order"] == [] for r in records if r["event"] == "shortfall_loop_start")
+    assert df["gis_p1"].iloc[0] > 0 and not df["is_underfunded"].iloc[:5].any()
+    print(f"✅ GIS allocations met each target; first-year GIS ${df['gis_p1'].iloc[0]:,.0f}")
+
+
+def _couple(spending, **p2):
+    """AB couple: a 70-year-old with most of the savings and a 68-year-old spouse"""
+    p1 = Person(name="A", start_age=70, cpp_start_age=65, oas_start_age=65, cpp_annual_at_start=8000,
+                oas_annual_at_start=8500, tfsa_balance=50000, rrif_balance=400000,
+                nonreg_balance=300000, nonreg_acb=200000)
+    return Household(p1=p1, p2=Person(name="B", start_age=68, cpp_start_age=65, oas_start_age=65, **p2),
+                     province="AB", start_year=2025, end_age=95, strategy="minimize-income",
+                     spending_go_go=spending[0], spending_slow_go=spending[1], spending_no_go=spending[2])
+
+
+def test_couple_funded_while_assets_remain():
+    """A spouse's unmet need is covered from the other's accounts: no spending gap
+    while liquid assets remain, and no more tax or less GIS than the allocator that
+    stopped at the first GIS-reducing dollar (lifetime GIS $313,810, tax $52,467)"""
+    tax_cfg = load_tax_config(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           "tax_config_canada_2025.json"))
+    df = simulate(_couple((80000, 70000, 60000), cpp_annual_at_start=4000, oas_annual_at_start=8500,
+                          tfsa_balance=20000, rrif_balance=50000), tax_cfg)
+    gis = (df["gis_p1"] + df["gis_p2"]).sum()
+    assert not df["is_underfunded"].any() and df["spending_gap"].sum() == 0.0
+    assert gis >= 313810 and df["total_tax_after_split"].sum() <= 52467
+
+    # Savings alone cannot carry $80,000 a year: every year is funded until they run out
+    df = simulate(_couple((80000, 80000, 80000)), tax_cfg)
+    liquid = df["net_worth_end"] > 0
+    assert liquid.iloc[:10].all() and df.loc[liquid, "spending_gap"].sum() == 0.0
+    print(f"✅ Couple funded while assets remain; lifetime GIS ${gis:,.0f}, "
+          f"{int(liquid.sum())} liquid years without a gap")
+
+
+def _whole_plan(hh):
+    """(funded years, total spending gap, lifetime GIS) of a plan"""
+    tax_cfg = load_tax_config(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           "tax_config_canada_2025.json"))
+    totals = simulate(hh, tax_cfg).attrs["aggregates"]
+    return totals.years_funded, totals.total_underfunding, totals.total_gis
+
+
+def test_whole_plan_no_worse_than_estimated_order():
+    """A saver with RRSP, TFSA and non-reg money and $55,000 of spending, alone and
+    with a spouse who has no savings: as many funded years and no larger gap than
+    the estimated-cost order (single: 12 years, gap $664,728; couple: 25 years,
+    gap $112,896, lifetime GIS $471,734)"""
+    saver = person(rrif_balance=0, rrsp_balance=300000, tfsa_balance=80000, nonreg_balance=150000)
+    plan = dict(strategy="minimize-income", **flat_spending(55000))
+
+    funded, gap, gis = _whole_plan(household(saver, include_partner=False, **plan))
+    assert funded >= 12 and gap < 664729
+    # The walk funds more of the spending with less GIS than the estimated order's $348,492
+    assert gis >= 319000
+    print(f"✅ Single: {funded} funded years, gap ${gap:,.0f}, lifetime GIS ${gis:,.0f}")
+
+    spouse = partner(start_age=65, cpp_annual_at_start=0, tfsa_balance=0, rrif_balance=0)
+    funded, gap, gis = _whole_plan(household(saver, spouse, include_partner=True, **plan))
+    assert funded >= 25 and gap < 112897 and gis >= 471734
+    print(f"✅ Couple: {funded} funded years, gap ${gap:,.0f}, lifetime GIS ${gis:,.0f}")
+
+
+if __name__ == "__main__":
+    test_cheapest_segments_first()
+    test_minimum_and_exhausted_sources()
+    test_walks_into_gis_reducing_segments()
+    test_minimize_income_simulation()
+    test_couple_funded_while_assets_remain()
+    test_whole_plan_no_worse_than_estimated_order()
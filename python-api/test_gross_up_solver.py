@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the closed-form gross-up solver against the original 25-step bisection.
+Both must size the same withdrawal for every taxable source.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules.config import load_tax_config, get_tax_params
+from modules.simulation import tax_for, gross_up_breakpoints, solve_gross_up
+
+
+def _bisect(tax_at, available, shortfall, base_tax):
+    lo, hi = 0.0, available
+    for _ in range(25):
+        mid = (lo + hi) / 2.0
+        if mid - (tax_at(mid) - base_tax) >= shortfall:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def test_solver_matches_bisection():
+    """Solver agrees with bisection across sources, provinces and income levels"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+
+    scenarios = [
+        # (age, cpp, oas, pension, nr_interest, base rrif, shortfall)
+        (66, 9000, 8500, 0, 500, 0, 5000),        # Low income, credits cover tax
+        (70, 14000, 8800, 20000, 3000, 30000, 40000),  # Crosses brackets and age phase-out
+        (75, 16000, 9000, 60000, 8000, 60000, 60000),  # Into OAS clawback
+        (60, 0, 0, 0, 0, 0, 120000),              # No benefits, top brackets
+    ]
+
+    for province in ["ON", "BC", "AB"]:
+        fed, prov = get_tax_params(cfg, province)
+        for age, cpp, oas, pension, interest, rrif_base, shortfall in scenarios:
+            for source in ["rrif", "nonreg", "corp"]:
+                for div_type in ["eligible", "non-eligible"]:
+                    ctx = dict(
+                        nonreg_balance=400000.0, nonreg_acb=250000.0,
+                        corp_dividend_type=div_type,
+                        nr_interest=interest, nr_elig_div=1500.0,
+                        nr_nonelig_div=0.0, nr_capg_dist=800.0,
+                        withdrawals_rrif_base=0.0,
+                        cpp_income=cpp, oas_income=oas,
+                        pension_income_total=pension,
+                    )
+
+                    def tax_at(x):
+                        return tax_for(
+                            x if source == "nonreg" else 0.0,
+                            rrif_base + (x if source == "rrif" else 0.0),
+                            x if source == "corp" else 0.0,
+                            age=age, fed_params=fed, prov_params=prov, **ctx,
+                        )
+
+                    available = 400000.0
+                    base_tax = tax_at(0.0)
+                    kinks = gross_up_breakpoints(
+                        source, available, 0.0, rrif_base, 0.0,
+                        age=age, fed_params=fed, prov_params=prov, **ctx,
+                    )
+
+                    expected = _bisect(tax_at, available, shortfall, base_tax)
+                    solved = solve_gross_up(tax_at, available, shortfall, base_tax, kinks)
+
+                    # Tax results are cached on whole-dollar inputs, so the two
+                    # searches can land on either side of a cached step.
+                    assert abs(solved - expected) < 1.0, (
+                        f"{province} age={age} {source}/{div_type}: "
+                        f"solver={solved:.4f} bisection={expected:.4f}"
+                    )
+                    net = solved - (tax_at(solved) - base_tax)
+                    assert net >= shortfall - 1.0, f"{province} {source}: nets {net:.2f} < {shortfall}"
+
+    print("✅ Gross-up solver matches bisection")
+
+
+def test_solver_caps_at_available():
+    """When even the full balance cannot cover the need, the full balance is taken"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    fed, prov = get_tax_params(cfg, "ON")
+
+    def tax_at(x):
+        return tax_for(
+            0.0, x, 0.0,
+            nonreg_balance=0.0, nonreg_acb=0.0, corp_dividend_type="eligible",
+            nr_interest=0.0, nr_elig_div=0.0, nr_nonelig_div=0.0, nr_capg_dist=0.0,
+            withdrawals_rrif_base=0.0, cpp_income=10000, oas_income=8500,
+            age=72, fed_params=fed, prov_params=prov,
+        )
+
+    assert solve_gross_up(tax_at, 20000.0, 50000.0, tax_at(0.0), []) == 20000.0
+    assert solve_gross_up(tax_at, 20000.0, 0.0, tax_at(0.0), []) == 0.0
+    print("✅ Gross-up solver respects bounds")
+
+
+if __name__ == "__main__":
+    test_solver_matches_bisection()
+    test_solver_caps_at_available()
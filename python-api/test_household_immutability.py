@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test that simulate() treats the household as a read-only spec: balances,
+GIC lists and income dicts are unchanged afterwards, and repeated runs on
+the same object give identical results.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import copy
+
+from household_fixtures import household, partner, person
+from modules.config import load_tax_config
+from modules.simulation import simulate
+
+
+def _household():
+    """Couple with an RRSP, a corporation and a rental income list to mutate"""
+    p1 = person(rrsp_balance=300000, corporate_balance=200000,
+                other_incomes=[{"type": "rental", "amount": 12000, "startAge": 65}])
+    return household(p1=p1, p2=partner(), end_age=85)
+
+
+def test_simulate_does_not_mutate_household():
+    """Household compares equal before/after and re-running reproduces the frame"""
+    tax_cfg = load_tax_config("tax_config_canada_2025.json")
+    hh = _household()
+    before = copy.deepcopy(hh)
+
+    first = simulate(hh, tax_cfg)
+    assert hh == before, "simulate() modified the household"
+
+    second = simulate(hh, tax_cfg)
+    assert first.equals(second)
+    assert simulate(hh, tax_cfg, mode="metrics").years_simulated == len(first)
+    assert hh == before
+    print(f"✅ Household unchanged across 3 runs, {len(first)} years each")
+
+
+def test_working_copy_is_independent():
+    """Mutating a working copy never reaches the spec"""
+    hh = _household()
+    state = hh.working_copy()
+    state.p1.rrsp_balance = 0.0
+    state.p1.other_incomes[0]["endAge"] = 70
+    state.p2.gic_assets.append({"amount": 1.0})
+
+    assert hh.p1.rrsp_balance == 300000
+    assert "endAge" not in hh.p1.other_incomes[0]
+    assert hh.p2.gic_assets == []
+    print("✅ working_copy() separates balances and income lists")
+
+
+if __name__ == "__main__":
+    test_simulate_does_not_mutate_household()
+    test_working_copy_is_independent()
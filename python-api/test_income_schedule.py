@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test IncomeSchedule: CPP/QPP, OAS, pensions and other income compiled
+once per run into arrays over the simulation years.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from api.utils.converters import api_household_to_internal
+from household_fixtures import household_input, partner_input, person_input
+from modules.config import load_tax_config
+from modules.income_schedule import IncomeSchedule
+from modules.simulation import simulate
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _household(tax_cfg, province="ON"):
+    p1 = person_input(start_age=62, cpp_start_age=65, oas_start_age=65,
+                      pension_incomes=[
+                          {"name": "DB", "amount": 20000, "startAge": 64, "inflationIndexed": True},
+                          {"name": "Bridge", "amount": 6000, "startAge": 62, "endAge": 65, "inflationIndexed": False},
+                      ],
+                      other_incomes=[
+                          {"type": "employment", "amount": 40000},
+                          {"type": "rental", "amount": 18000, "startAge": 62, "inflationIndexed": False},
+                          {"type": "investment", "amount": 1000},
+                      ])
+    hh = api_household_to_internal(
+        household_input(p1=p1, p2=partner_input(start_age=60), province=province,
+                        spending_go_go=90000, spending_slow_go=80000, spending_no_go=70000),
+        tax_cfg,
+    )
+    hh.p1.plan_to_downsize, hh.p1.downsize_year = True, hh.start_year + 8
+    return hh
+
+
+def test_schedule_streams():
+    """Start/end ages, indexing, legislated maxima and the downsizing rental end age"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    income = IncomeSchedule(hh.p1, hh, 30)
+    g = 1 + hh.general_inflation
+    at = income.index
+
+    assert income.ages[0] == 62 and at(70) == 8
+    assert income.cpp[at(64)] == 0 and income.cpp[at(65)] == 12000 * g ** 3
+    assert income.oas[at(65)] == min(8500 * g ** 3, 8988.0 * 1.02 ** 3)
+
+    # DB indexed from its own start age; the bridge stops at 65
+    assert income.pension[at(63)] == 6000
+    assert income.pension[at(64)] == 6000 + 20000.0
+    assert income.pension[at(66)] == 20000 * g ** 2
+
+    # Employment runs to the CPP start age, rental to the downsizing year,
+    # investment income (no start age) is indexed from the simulation start
+    assert income.other[at(62)] == 40000 + 18000 + 1000
+    assert income.other[at(65)] == 18000 + 1000 * g ** 3
+    assert income.other[at(70)] == 1000 * g ** 8
+
+    quebec = IncomeSchedule(hh.p1, _household(tax_cfg, "QC"), 30)
+    assert quebec.cpp[at(65)] > income.cpp[at(65)]  # Low-income QPP supplement
+    print("✅ Income streams scheduled by age with indexing and end ages")
+
+
+def test_simulation_reads_schedule():
+    """Year rows carry the scheduled pension and other income"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    df = simulate(hh, tax_cfg)
+    income = IncomeSchedule(hh.p1, hh, len(df))
+
+    assert df["pension_income_p1"].tolist() == income.pension.tolist()
+    rental = hh.p1.rental_income_annual
+    assert df["other_income_p1"].tolist() == (income.other + rental).tolist()
+    assert df["years_since_start"].tolist() == list(range(len(df)))
+    print(f"✅ {len(df)} years read pension and other income from the schedule")
+
+
+if __name__ == "__main__":
+    test_schedule_streams()
+    test_simulation_reads_schedule()
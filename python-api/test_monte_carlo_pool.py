@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the Monte Carlo process pool: for a given seed it returns exactly the
+trials run_monte_carlo() computes in-process, whatever the worker count,
+and a config the workers did not preload is shipped with the job.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import copy
+
+import numpy as np
+
+from household_fixtures import household, person
+from modules.config import load_tax_config
+from modules.monte_carlo import run_monte_carlo
+from modules.monte_carlo_pool import MonteCarloPool
+from modules.tax_engine import clear_tax_cache
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _expected(hh, tax_cfg, **options):
+    """
+    run_monte_carlo() from a cold tax cache, as in a freshly spawned worker: the
+    cache keys on whole dollars, so a warm one can shift amounts by cents
+    """
+    clear_tax_cache()
+    return run_monte_carlo(hh, tax_cfg, **options)
+
+
+def _assert_same(a, b):
+    assert a.num_trials == b.num_trials and a.years_planned == b.years_planned
+    for name in ("success", "years_funded", "final_estate", "total_tax", "max_drawdown"):
+        assert np.array_equal(getattr(a, name), getattr(b, name)), name
+
+
+def test_pool_matches_in_process():
+    """Shard seeds make results independent of where and how widely shards run"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = household(p1=person(rrif_balance=300000))
+    # Not a multiple of the shard size, so the last shard is partial
+    expected = _expected(hh, tax_cfg, num_trials=1100, return_mean=5.0, seed=11)
+
+    for workers in (1, 3):
+        pool = MonteCarloPool(workers=workers, config_dir=CONFIG_DIR)
+        try:
+            _assert_same(pool.run(hh, tax_cfg, num_trials=1100, return_mean=5.0, seed=11), expected)
+        finally:
+            pool.shutdown()
+    print(f"✅ Pool of 1 and 3 workers match in-process run: success {expected.success_rate:.1%}")
+
+
+def test_pool_ships_unknown_config():
+    """A config that is not one of the preloaded files is sent with the job"""
+    tax_cfg = copy.deepcopy(load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json")))
+    tax_cfg["federal"]["bpa_amount"] += 1000
+    hh = household(p1=person(rrif_balance=300000))
+    expected = _expected(hh, tax_cfg, num_trials=300, seed=3)
+
+    pool = MonteCarloPool(workers=2, config_dir=CONFIG_DIR)
+    try:
+        _assert_same(pool.run(hh, tax_cfg, num_trials=300, seed=3), expected)
+    finally:
+        pool.shutdown()
+    print("✅ Pool handles a config the workers did not preload")
+
+
+if __name__ == "__main__":
+    test_pool_matches_in_process()
+    test_pool_ships_unknown_config()
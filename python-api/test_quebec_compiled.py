@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the compiled Quebec tax path against QuebecTaxCalculator: the scalar
+path must match total_provincial_tax exactly, the batch path to the cent.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import itertools
+
+import numpy as np
+
+from modules.quebec.quebec_tax import QuebecTaxCalculator, get_compiled_quebec_tax
+
+
+INCOMES = [-500.0, 0.0, 12000.0, 25685.0, 38286.0, 45000.0, 50679.0, 75000.0, 101364.0, 130000.0, 400000.0]
+AGES = [60, 65, 69, 70, 85]
+PENSIONS = [0.0, 2500.0, 20000.0]
+DIVIDENDS = [(0.0, 0.0), (8000.0, 0.0), (0.0, 5000.0), (3000.0, 3000.0)]
+HOUSEHOLDS = [(False, 0.0, 0.0), (True, 30000.0, 0.0), (False, 0.0, 15000.0), (True, 5000.0, 40000.0)]
+
+
+def _cases():
+    return itertools.product(INCOMES, AGES, PENSIONS, DIVIDENDS, HOUSEHOLDS)
+
+
+def test_compiled_matches_calculator():
+    """provincial_tax() == calculate_quebec_tax().total_provincial_tax, bit for bit"""
+    calc = QuebecTaxCalculator()
+    compiled = get_compiled_quebec_tax()
+    assert get_compiled_quebec_tax() is compiled
+
+    count = 0
+    for income, age, pension, (elig, nonelig), (couple, partner, employment) in _cases():
+        expected = calc.calculate_quebec_tax(
+            taxable_income=income, age=age, is_couple=couple, partner_income=partner,
+            employment_income=employment, pension_income=pension,
+            eligible_dividends=elig, non_eligible_dividends=nonelig,
+        ).total_provincial_tax
+        actual = compiled.provincial_tax(
+            income, age, pension_income=pension, eligible_dividends=elig,
+            non_eligible_dividends=nonelig, is_couple=couple, partner_income=partner,
+            employment_income=employment,
+        )
+        assert actual == expected, (income, age, pension, elig, nonelig, couple, actual, expected)
+        count += 1
+    print(f"✅ Compiled Quebec tax matches calculator on {count} cases")
+
+
+def test_batch_matches_scalar():
+    """provincial_tax_batch() agrees with the scalar path to the cent"""
+    compiled = get_compiled_quebec_tax()
+    cases = list(_cases())
+    columns = list(zip(*[(i, a, p, e, n, c, pi, emp) for i, a, p, (e, n), (c, pi, emp) in cases]))
+    batch = compiled.provincial_tax_batch(
+        np.array(columns[0]), np.array(columns[1]), pension_income=np.array(columns[2]),
+        eligible_dividends=np.array(columns[3]), non_eligible_dividends=np.array(columns[4]),
+        is_couple=np.array(columns[5]), partner_income=np.array(columns[6]),
+        employment_income=np.array(columns[7]),
+    )
+    scalar = np.array([
+        compiled.provincial_tax(i, a, p, e, n, c, pi, emp)
+        for i, a, p, e, n, c, pi, emp in zip(*columns)
+    ])
+    assert batch.shape == scalar.shape
+    assert np.max(np.abs(batch - scalar)) < 0.005
+    print(f"✅ Batch Quebec tax matches scalar on {len(scalar)} cases")
+
+
+if __name__ == "__main__":
+    test_compiled_matches_calculator()
+    test_batch_matches_scalar()
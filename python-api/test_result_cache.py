@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test the /run-simulation result cache: canonical keys, LRU/TTL/byte-budget
+eviction, the disk tier surviving a restart (without blocking memory hits),
+and hit-rate counters.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tempfile
+import threading
+import time
+
+from api.models.requests import HouseholdInput
+from api.utils.result_cache import ResultCache, simulation_cache_key
+from household_fixtures import household_input
+from modules.config import load_tax_config
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_key_is_canonical():
+    """Equivalent inputs share a key; any real change gives a new one"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    key = simulation_cache_key(household_input(), tax_cfg)
+
+    # Explicit defaults and field order do not matter
+    same = HouseholdInput.model_validate(dict(reversed(list(household_input().model_dump().items()))))
+    assert simulation_cache_key(same, tax_cfg) == key
+    assert simulation_cache_key(household_input(province="BC"), tax_cfg) != key
+
+    tax_cfg_2026 = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2026.json"))
+    assert simulation_cache_key(household_input(), tax_cfg_2026) != key
+    print(f"✅ Canonical key: {key[:16]}…")
+
+
+def test_eviction():
+    """Entries leave by LRU order, age and the memory budget"""
+    cache = ResultCache(max_entries=2, ttl_seconds=60, max_bytes=100)
+    cache.put("a", b"1" * 10)
+    cache.put("b", b"2" * 10)
+    assert cache.get("a") == b"1" * 10  # a is now the most recent
+    cache.put("c", b"3" * 10)
+    assert cache.get("b") is None and cache.get("a") is not None
+
+    cache.max_entries = 10
+    cache.put("big", b"x" * 90)  # over budget with a and c: oldest goes first
+    assert cache.stats()["bytes"] <= 100 and cache.get("big") is not None
+    cache.put("huge", b"x" * 101)  # larger than the whole budget: never stored
+    assert cache.get("huge") is None
+
+    cache.ttl_seconds = 0.01
+    time.sleep(0.02)
+    assert cache.get("big") is None
+
+    stats = cache.stats()
+    assert stats["evicted_lru"] >= 1 and stats["evicted_memory"] >= 1 and stats["evicted_ttl"] == 1
+    print(f"✅ LRU, byte budget and TTL eviction: {stats}")
+
+
+def test_disk_tier_survives_restart():
+    """A new cache on the same directory serves earlier results"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        ResultCache(disk_dir=disk_dir).put("k" * 64, b'{"success":true}')
+
+        restarted = ResultCache(disk_dir=disk_dir)
+        assert restarted.get("k" * 64) == b'{"success":true}'
+        assert restarted.get("k" * 64) == b'{"success":true}'  # now from memory
+        assert restarted.get("m" * 64) is None
+
+        stats = restarted.stats()
+        assert stats["disk_hits"] == 1 and stats["hits"] == 1 and stats["misses"] == 1
+        assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+        print(f"✅ Disk tier survives restart (hit rate {stats['hit_rate']:.2f})")
+
+
+def test_disk_read_does_not_block_memory_hits():
+    """A disk lookup in progress leaves the lock free for memory hits and stores"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = ResultCache(disk_dir=disk_dir)
+        cache.put("a" * 64, b"memory")
+        cache.put("d" * 64, b"disk")
+        restarted = ResultCache(disk_dir=disk_dir)
+        restarted.put("a" * 64, b"memory")
+
+        reading, release = threading.Event(), threading.Event()
+        disk_get = restarted._disk_get
+
+        def slow_disk_get(key, now):
+            reading.set()
+            release.wait(5)
+            return disk_get(key, now)
+
+        restarted._disk_get = slow_disk_get
+        results = {}
+        reader = threading.Thread(target=lambda: results.update(disk=restarted.get("d" * 64)))
+        reader.start()
+        assert reading.wait(5)
+
+        started = time.perf_counter()
+        assert restarted.get("a" * 64) == b"memory"
+        restarted.put("b" * 64, b"stored")
+        waited = time.perf_counter() - started
+        release.set()
+        reader.join(5)
+
+        assert results["disk"] == b"disk" and waited < 1.0
+        print(f"✅ Memory hit and store during a disk read took {waited * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_key_is_canonical()
+    test_eviction()
+    test_disk_tier_survives_restart()
+    test_disk_read_does_not_block_memory_hits()
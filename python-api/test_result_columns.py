@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test the columnar year-result accumulator against the YearResult dataclass
+it replaces in simulate().
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from modules.models import YearResult
+from modules.result_columns import YearResultColumns
+
+
+def _row(i, age_p2):
+    return dict(year=2025 + i, age_p1=65 + i, age_p2=age_p2, spend_target_after_tax=50000.0 + i,
+                years_since_start=i, oas_p1=8000.0, oas_p2=0.0, cpp_p1=9000.0, cpp_p2=0.0,
+                gis_p1=0.0, gis_p2=0.0, end_rrif_p1=100000.0 - i * 5000, is_underfunded=i == 3,
+                plan_success=i != 3, tax_accumulated=1000.0 * (i + 1))
+
+
+def test_frame_matches_dataclass_rows():
+    """Same columns, order and values as pd.DataFrame([YearResult.__dict__ ...])"""
+    for age_p2 in (None, 63):
+        rows = YearResultColumns(2)  # Smaller than the row count to exercise growth
+        expected = []
+        for i in range(5):
+            values = _row(i, age_p2 if age_p2 is None else age_p2 + i)
+            rows.append(**values)
+            expected.append(YearResult(**values))
+
+        rows.set_last(terminal_tax=1234.5, after_tax_legacy=80000.0)
+        rows.fill(lifetime_tax_at_death=6234.5)
+        expected[-1].terminal_tax = 1234.5
+        expected[-1].after_tax_legacy = 80000.0
+        for r in expected:
+            r.lifetime_tax_at_death = 6234.5
+
+        df = rows.to_frame()
+        ref = pd.DataFrame([r.__dict__ for r in expected])
+        assert list(df.columns) == list(ref.columns)
+        pd.testing.assert_frame_equal(df, ref, check_dtype=False)
+        assert rows.last("year") == 2029 and rows.last("age_p2") == (None if age_p2 is None else 67)
+
+    try:
+        YearResultColumns(1).append(not_a_field=1.0)
+        assert False, "unknown field accepted"
+    except TypeError:
+        pass
+    print("✅ YearResultColumns matches YearResult rows")
+
+
+if __name__ == "__main__":
+    test_frame_matches_dataclass_rows()
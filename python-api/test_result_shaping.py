@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized response shaping in api/utils/converters.py: every
+section is built from one ShapedResults per simulation and carries the
+DataFrame's values year by year.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from api.models.requests import HouseholdInput, PersonInput
+from api.utils.converters import (
+    ShapedResults,
+    api_household_to_internal,
+    calculate_estate_summary,
+    calculate_simulation_summary,
+    calculate_spending_analysis,
+    dataframe_to_year_results,
+    extract_chart_data,
+    extract_five_year_plan,
+)
+from modules.config import load_tax_config
+from modules.simulation import simulate
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _simulation():
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    p1 = PersonInput(name="Shape", start_age=65, cpp_annual_at_start=12000, oas_annual_at_start=8500,
+                     tfsa_balance=100000, rrif_balance=400000, nonreg_balance=300000, nonreg_acb=150000,
+                     corporate_balance=200000,
+                     pension_incomes=[{"name": "DB", "amount": 15000, "startAge": 66, "inflationIndexed": True}])
+    p2 = PersonInput(name="Partner", start_age=63, tfsa_balance=80000, rrif_balance=200000)
+    household = api_household_to_internal(
+        HouseholdInput(p1=p1, p2=p2, province="ON", strategy="balanced", include_partner=True,
+                       spending_go_go=150000, spending_slow_go=120000, spending_no_go=90000),
+        tax_cfg,
+    )
+    return household, simulate(household, tax_cfg)
+
+
+def _sections(df, household, shaped=None):
+    summary = calculate_simulation_summary(df, shaped)
+    return {
+        "year_by_year": [r.model_dump() for r in dataframe_to_year_results(df, shaped)],
+        "summary": summary.model_dump(),
+        "estate": calculate_estate_summary(df, household, shaped).model_dump(),
+        "five_year_plan": [r.model_dump() for r in extract_five_year_plan(df, shaped)],
+        "spending": calculate_spending_analysis(df, summary, shaped).model_dump(),
+        "chart": extract_chart_data(df, shaped).model_dump(),
+    }
+
+
+def test_sections_follow_the_frame():
+    """Year rows and chart points carry the frame's values, combined per household"""
+    household, df = _simulation()
+    sections = _sections(df, household, ShapedResults(df))
+    assert sections == _sections(df, household)
+
+    years = sections["year_by_year"]
+    points = sections["chart"]["data_points"]
+    assert [r["year"] for r in years] == df["year"].tolist() == [p["year"] for p in points]
+    for (_, row), year, point in zip(df.iterrows(), years, points):
+        assert year["employer_pension_p1"] == row["pension_income_p1"]
+        assert year["corporate_balance_p1"] == row["end_corp_p1"]
+        assert year["total_tax"] == row["total_tax_after_split"]
+        assert year["plan_success"] is bool(row["plan_success"])
+        assert point["cpp_total"] == row["cpp_p1"] + row["cpp_p2"]
+        assert point["tax_free_income"] == (row["withdraw_tfsa_p1"] + row["withdraw_tfsa_p2"]
+                                            + row["gis_p1"] + row["gis_p2"])
+        assert point["spending_met"] == row["spend_target_after_tax"] - row["underfunded_after_tax"]
+
+    plan = sections["five_year_plan"]
+    assert [p["year"] for p in plan] == df["year"].tolist()[:5]
+    assert all(p["total_withdrawn"] == p["total_withdrawn_p1"] + p["total_withdrawn_p2"] for p in plan)
+
+    summary = sections["summary"]
+    assert summary["years_simulated"] == len(df)
+    assert summary["total_cpp"] == df["cpp_p1"].sum() + df["cpp_p2"].sum()
+    assert summary["final_net_worth"] == df["net_worth_end"].iloc[-1]
+    print(f"✅ {len(years)} years shaped consistently across all sections")
+
+
+def test_legacy_column_names_and_empty_frame():
+    """Older column names are still picked up; an empty frame gives empty sections"""
+    household, df = _simulation()
+    legacy = df.drop(columns=["total_withdrawals", "total_tax"]).rename(columns={
+        "withdraw_tfsa_p1": "tfsa_withdrawal_p1",
+        "total_tax_after_split": "total_tax",
+        "plan_success": "success",
+    })
+    years = dataframe_to_year_results(legacy)
+    assert [r.tfsa_withdrawal_p1 for r in years] == df["withdraw_tfsa_p1"].tolist()
+    assert [r.total_tax for r in years] == df["total_tax_after_split"].tolist()
+    assert [r.plan_success for r in years] == df["plan_success"].tolist()
+    assert years[0].total_withdrawals > 0
+
+    empty = df.iloc[0:0]
+    assert dataframe_to_year_results(empty) == []
+    assert extract_chart_data(empty).data_points == []
+    assert extract_five_year_plan(empty) == []
+    assert calculate_simulation_summary(empty).years_simulated == 0
+    print("✅ Legacy column names and empty frames handled")
+
+
+if __name__ == "__main__":
+    test_sections_follow_the_frame()
+    test_legacy_column_names_and_empty_frame()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test SimulationAggregates: plan totals accumulated while simulate() runs,
+shared by the API summary, evaluate_strategy and PlanReliabilityAnalyzer.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dataclasses
+
+from api.utils.converters import api_household_to_internal, calculate_simulation_summary
+from household_fixtures import flat_spending, household_input, partner_input, person_input
+from modules.config import load_tax_config
+from modules.models import SimulationAggregates
+from modules.plan_reliability_analyzer import PlanReliabilityAnalyzer
+from modules.result_columns import frame_aggregates
+from modules.simulation import simulate, simulate_what_if
+from modules.strategy_optimizer import evaluate_strategy
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _household(tax_cfg, spending=120000):
+    household = household_input(p1=person_input(corporate_balance=200000), p2=partner_input(),
+                                **flat_spending(spending))
+    return api_household_to_internal(household, tax_cfg)
+
+
+def test_engine_fills_aggregates():
+    """Frame and metrics runs carry the same totals, matching the frame's columns"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    df = simulate(hh, tax_cfg)
+    totals = df.attrs["aggregates"]
+    assert isinstance(totals, SimulationAggregates)
+    assert frame_aggregates(df) is totals
+
+    metrics = simulate(hh, tax_cfg, mode="metrics")
+    for f in dataclasses.fields(SimulationAggregates):
+        assert getattr(metrics, f.name) == getattr(totals, f.name), f.name
+
+    assert totals.years_simulated == len(df)
+    assert totals.years_funded == int(df["plan_success"].sum())
+    assert abs(totals.total_tax - df["total_tax_after_split"].sum()) < 1e-6
+    assert abs(totals.total_withdrawals - df[[f"withdraw_{a}_{p}" for a in ("rrif", "nonreg", "tfsa", "corp")
+                                              for p in ("p1", "p2")]].sum().sum()) < 1e-6
+    assert totals.highest_annual_tax == df["total_tax_after_split"].max()
+    assert totals.final_net_worth == df["net_worth_end"].iloc[-1]
+    assert totals.after_tax_legacy == df["after_tax_legacy"].iloc[-1]
+
+    # A frame without them (or a slice) is replayed to the same numbers
+    plain = df.copy()
+    plain.attrs = {}
+    assert frame_aggregates(plain) == totals
+    assert frame_aggregates(df.iloc[:5]).years_simulated == 5
+    print(f"✅ Aggregates over {totals.years_simulated} years match metrics mode and the frame")
+
+
+def test_resumed_run_has_full_run_totals():
+    """A what-if resumed from checkpoints ends with the totals of a full run"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    base = simulate_what_if(hh, tax_cfg)
+    what_if = dataclasses.replace(hh, end_age=100)
+    run = simulate_what_if(what_if, tax_cfg, base)
+    assert run.years_reused > 0
+    assert run.df.attrs["aggregates"] == simulate(what_if, tax_cfg).attrs["aggregates"]
+    print(f"✅ Resumed run ({run.years_reused} years reused) has the full run's totals")
+
+
+def test_consumers_agree():
+    """Summary, strategy evaluation and reliability analysis report the same numbers"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg, spending=200000)
+    df = simulate(hh, tax_cfg)
+    totals = df.attrs["aggregates"]
+
+    summary = calculate_simulation_summary(df)
+    evaluation = evaluate_strategy(df, hh.strategy)
+    reliability = PlanReliabilityAnalyzer(hh, df).analyze_plan_reliability()
+
+    assert summary.total_tax_paid == evaluation.total_tax_paid == totals.total_tax
+    assert summary.first_failure_year == evaluation.first_failure_year == totals.first_failure_year
+    assert summary.years_funded == evaluation.years_funded
+    assert summary.total_government_benefits == evaluation.total_benefits
+    assert reliability["summary"]["final_net_worth"] == summary.final_net_worth
+    assert reliability["portfolio_depletion"]["year"] == totals.depleted_year
+    print(f"✅ Consumers agree: tax ${totals.total_tax:,.0f}, first failure {totals.first_failure_year}")
+
+
+if __name__ == "__main__":
+    test_engine_fills_aggregates()
+    test_resumed_run_has_full_run_totals()
+    test_consumers_agree()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test simulate(mode="metrics"): totals match the year-by-year frame, and
+min_years_funded stops a run early once it can no longer be reached.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from household_fixtures import household, person
+from modules.config import load_tax_config
+from modules.models import SimulationMetrics
+from modules.simulation import simulate
+
+
+def _short_household():
+    """Retiree whose savings run out before the plan ends"""
+    return household(p1=person(rrif_balance=0, nonreg_balance=0, nonreg_acb=0), end_age=90)
+
+
+def test_metrics_match_frame():
+    """Running totals equal the sums over the full DataFrame"""
+    tax_cfg = load_tax_config("tax_config_canada_2025.json")
+    df = simulate(household(end_age=90), tax_cfg)
+    m = simulate(household(end_age=90), tax_cfg, mode="metrics")
+
+    assert isinstance(m, SimulationMetrics)
+    assert m.years_simulated == len(df) == m.years_planned
+    assert m.years_funded == int(df["plan_success"].sum())
+    assert abs(m.total_tax - df["total_tax_after_split"].sum()) < 1e-6
+    benefits = df[["cpp_p1", "cpp_p2", "oas_p1", "oas_p2", "gis_p1", "gis_p2"]].to_numpy().sum()
+    assert abs(m.total_benefits - benefits) < 1e-6
+    assert abs(m.after_tax_legacy - df["after_tax_legacy"].iloc[-1]) < 1e-6
+    assert abs(m.lifetime_tax_at_death - df["lifetime_tax_at_death"].iloc[-1]) < 1e-6
+    assert not m.pruned
+    print(f"✅ Metrics match frame: {m.years_funded}/{m.years_simulated} funded, tax ${m.total_tax:,.0f}")
+
+
+def test_min_years_funded_prunes():
+    """A run that cannot reach min_years_funded stops after its first shortfall"""
+    tax_cfg = load_tax_config("tax_config_canada_2025.json")
+    full = simulate(_short_household(), tax_cfg, mode="metrics")
+    assert full.first_failure_year is not None, "household should run short"
+
+    pruned = simulate(_short_household(), tax_cfg, mode="metrics", min_years_funded=full.years_planned)
+    assert pruned.pruned
+    assert pruned.years_simulated == full.first_failure_year - 2025 + 1
+    assert pruned.years_simulated < full.years_simulated
+
+    try:
+        simulate(household(end_age=90), tax_cfg, mode="rows")
+        assert False, "unknown mode accepted"
+    except ValueError:
+        pass
+    print(f"✅ Pruned after {pruned.years_simulated} of {full.years_simulated} years")
+
+
+if __name__ == "__main__":
+    test_metrics_match_frame()
+    test_min_years_funded_prunes()
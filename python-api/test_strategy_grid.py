@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the strategy grid search behind /api/optimize-strategy: pruning never
+changes the winner, top-ups share simulations for non-hybrid strategies,
+and the engine pool ranks exactly like the in-process search.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from household_fixtures import household, partner, person
+from modules import strategy_grid
+from modules.config import load_tax_config
+from modules.engine_pool import EnginePool
+from modules.strategy_grid import OPTIMIZE_FOR, run_grid_search
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+STRATEGIES = ["minimize-income", "rrif-frontload", "tfsa-first", "balanced"]
+SPLITS = [0.0, 0.25, 0.5]
+TOPUPS = [0, 10000]
+
+
+def _household():
+    """Couple whose plan runs short in some candidates, so pruning has work to do"""
+    p1 = person(rrif_balance=350000, tfsa_balance=60000, nonreg_balance=120000, nonreg_acb=90000,
+                cpp_annual_at_start=11000)
+    p2 = partner(rrif_balance=150000, tfsa_balance=40000)
+    return household(p1=p1, p2=p2, end_age=92,
+                     spending_go_go=75000, spending_slow_go=65000, spending_no_go=55000)
+
+
+def _ranking(result):
+    return [(c.strategy, c.split_fraction, c.hybrid_topup, round(c.score, 12)) for c in result.candidates]
+
+
+def test_pruning_keeps_the_winner():
+    """Bounded runs pick the same best candidate as running everything to the end"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household()
+
+    for optimize_for in OPTIMIZE_FOR:
+        result = run_grid_search(hh, tax_cfg, STRATEGIES, SPLITS, TOPUPS, optimize_for)
+        assert result.candidates_tested == len(STRATEGIES) * len(SPLITS) * len(TOPUPS)
+        # No hybrid strategies in the grid, so top-ups never need their own run
+        assert result.simulations_run == len(STRATEGIES) * len(SPLITS)
+        assert all(c.shared == (c.hybrid_topup != TOPUPS[0]) for c in result.candidates + result.pruned)
+
+        bounds = strategy_grid._bounds
+        strategy_grid._bounds = lambda *args: {}
+        try:
+            full = run_grid_search(hh, tax_cfg, STRATEGIES, SPLITS, TOPUPS, optimize_for)
+        finally:
+            strategy_grid._bounds = bounds
+        assert not full.pruned
+
+        best = result.best
+        full_scores = {(c.strategy, c.split_fraction, c.hybrid_topup): c.score for c in full.candidates}
+        assert full_scores[(best.strategy, best.split_fraction, best.hybrid_topup)] == full.best.score, optimize_for
+        print(f"✅ {optimize_for}: best {best.strategy} split={best.split_fraction}, "
+              f"{len(result.pruned)}/{result.candidates_tested} pruned")
+
+    try:
+        run_grid_search(hh, tax_cfg, STRATEGIES, SPLITS, TOPUPS, "fastest")
+        assert False, "unknown criterion accepted"
+    except ValueError:
+        pass
+
+
+def test_pool_matches_in_process():
+    """Same candidates, scores and order whether simulations run here or on workers"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household()
+    expected = run_grid_search(hh, tax_cfg, STRATEGIES, SPLITS, TOPUPS, "legacy")
+
+    pool = EnginePool(workers=2, config_dir=CONFIG_DIR)
+    try:
+        result = run_grid_search(hh, tax_cfg, STRATEGIES, SPLITS, TOPUPS, "legacy", pool=pool)
+    finally:
+        pool.shutdown()
+    assert _ranking(result) == _ranking(expected)
+    assert all(c.simulate_ms > 0 for c in result.candidates if not c.shared)
+    print(f"✅ Pool ranking matches in-process: {result.candidates_tested} candidates "
+          f"in {result.elapsed_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    test_pruning_keeps_the_winner()
+    test_pool_matches_in_process()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test find_best_alternative_strategy on the engine pool: concurrent runs
+reach the same suggestion as sequential ones, and a passed deadline skips
+the alternatives instead of waiting for them.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import time
+
+from api.utils.converters import api_household_to_internal
+from household_fixtures import household_input, person_input
+from modules.config import load_tax_config
+from modules.engine_pool import EnginePool
+from modules.simulation import simulate
+from modules.strategy_optimizer import find_best_alternative_strategy
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+STRATEGY = "rrif-frontload"
+
+
+def _household(tax_cfg):
+    """Single retiree whose RRIF-frontload plan has gaps that tfsa-first reduces"""
+    p1 = person_input(corporate_balance=500000,
+                      pension_incomes=[{"name": "DB", "amount": 15000, "startAge": 66, "inflationIndexed": True}])
+    household = household_input(p1=p1, strategy=STRATEGY,
+                                spending_go_go=120000, spending_slow_go=90000, spending_no_go=70000)
+    return api_household_to_internal(household, tax_cfg)
+
+
+def test_pool_matches_sequential():
+    """Same suggestion whether alternatives run one by one or concurrently"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    df = simulate(hh, tax_cfg)
+
+    sequential = find_best_alternative_strategy(hh, tax_cfg, df, STRATEGY, simulate)
+    assert sequential is not None and sequential["alternatives_timed_out"] == []
+
+    pool = EnginePool(workers=2, config_dir=CONFIG_DIR)
+    try:
+        concurrent = find_best_alternative_strategy(
+            hh, tax_cfg, df, STRATEGY, simulate, pool=pool, deadline=time.monotonic() + 60
+        )
+    finally:
+        pool.shutdown()
+    assert concurrent == sequential
+    print(f"✅ Pool suggests {concurrent['optimized_strategy']} like the sequential run "
+          f"({concurrent['alternatives_evaluated']} alternatives)")
+
+
+def test_deadline_returns_best_so_far():
+    """Alternatives not started by the deadline are skipped, so nothing beats the original"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    hh = _household(tax_cfg)
+    df = simulate(hh, tax_cfg)
+
+    calls = []
+
+    def counting_simulate(*args, **kwargs):
+        calls.append(args[0].strategy)
+        return simulate(*args, **kwargs)
+
+    result = find_best_alternative_strategy(
+        hh, tax_cfg, df, STRATEGY, counting_simulate, deadline=time.monotonic() - 1
+    )
+    assert result is None and calls == []
+    print("✅ Past deadline: no alternatives run, original kept")
+
+
+if __name__ == "__main__":
+    test_pool_matches_sequential()
+    test_deadline_returns_best_so_far()
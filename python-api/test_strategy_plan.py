@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test StrategyPlan: withdrawal strategy names resolved once per run into
+the order and strategy-specific rules simulate_year() follows.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dataclasses
+
+from api.models.requests import HouseholdInput, PersonInput
+from api.utils.converters import api_household_to_internal
+from modules.config import load_tax_config
+from modules.tax_schedule import get_compiled_schedule
+from modules.simulation import simulate, simulate_year
+from modules.withdrawal_strategies import get_strategy_plan
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_plans_by_name():
+    """API keys and canonical names resolve to the same rules"""
+    frontload = get_strategy_plan("rrif-frontload")
+    assert frontload.base_order == ("corp", "nonreg", "tfsa")
+    assert frontload.rrif_frontload and frontload.preserve_order and not frontload.defer_rrif_minimum
+    assert frontload.frontload_pct(65, 70) == 0.15 and frontload.frontload_pct(70, 70) == 0.08
+    assert get_strategy_plan("RRIF-Frontload").rrif_frontload
+
+    balanced = get_strategy_plan("Balanced (Optimized for tax efficiency)")
+    assert balanced.base_order == ("corp", "rrif", "nonreg", "tfsa")
+    assert balanced.defer_rrif_minimum and balanced.cda_first and not balanced.preserve_order
+
+    assert get_strategy_plan("Corporate Optimized").preserve_order
+    assert get_strategy_plan("minimize-income").gis_optimized
+    assert get_strategy_plan("GIS-Optimized (NonReg->Corp->RRIF->TFSA)").gis_optimized
+
+    hybrid = get_strategy_plan("Hybrid (RRIF top-up first) -> NonReg -> Corp -> TFSA")
+    assert hybrid.hybrid_topup and hybrid.base_order == ("nonreg", "corp", "tfsa")
+    assert get_strategy_plan("RRIF->Corp->NonReg->TFSA").base_order == ("rrif", "corp", "nonreg", "tfsa")
+
+    default = get_strategy_plan(None)
+    assert default.base_order == ("nonreg", "rrif", "corp", "tfsa") and not default.gis_optimized
+    assert get_strategy_plan("tfsa-first") is get_strategy_plan("tfsa-first")  # Shared per name
+    print("✅ Strategy names resolve to plans")
+
+
+def test_simulation_uses_plan():
+    """simulate_year() resolves the plan from the name unless one is passed in"""
+    tax_cfg = load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json"))
+    p1 = PersonInput(name="Plan", start_age=66, oas_start_age=70, tfsa_balance=50000,
+                     rrif_balance=500000, nonreg_balance=100000, nonreg_acb=80000)
+    p2 = PersonInput(name="Partner", start_age=64, tfsa_balance=40000, rrif_balance=100000)
+    hh = api_household_to_internal(
+        HouseholdInput(p1=p1, p2=p2, province="ON", strategy="rrif-frontload", include_partner=True), tax_cfg)
+
+    df = simulate(hh, tax_cfg)
+    first = df.iloc[0]
+    assert abs(first["withdraw_rrif_p1"] - 0.15 * 500000) < 1.0  # Frontload before OAS
+
+    fed, prov = get_compiled_schedule(tax_cfg, hh.province, hh.general_inflation).params_for(0)
+
+    def year(plan=None):
+        person = dataclasses.replace(hh.p1)
+        return simulate_year(person, 66, 40000, fed, prov, 0.0,
+                             {"nonreg": 0.0, "rrif": 0.0, "tfsa": 0.0, "corp": 0.0},
+                             "rrif-frontload", 0.0, hh, hh.start_year, plan=plan)[0]
+
+    assert year() == year(get_strategy_plan("rrif-frontload"))
+    assert year(get_strategy_plan("balanced"))["rrif"] < year()["rrif"]
+    print(f"✅ RRIF frontload ${first['withdraw_rrif_p1']:,.0f} in {int(first['year'])}")
+
+
+if __name__ == "__main__":
+    test_plans_by_name()
+    test_simulation_uses_plan()
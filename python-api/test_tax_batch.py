@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Golden test for progressive_tax_batch: every field must match the scalar
+progressive_tax to the cent, across provinces, ages and income mixes.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import itertools
+import numpy as np
+
+from modules.config import load_tax_config, get_tax_params, index_tax_params
+from modules.tax_engine import (
+    progressive_tax, progressive_tax_batch, clear_tax_cache, configure_tax_cache,
+)
+import modules.tax_engine as tax_engine
+
+
+def _golden_cases(params):
+    """Income mixes around every bracket threshold plus typical retiree profiles"""
+    levels = [0.0, 1.0, 15000.0, 45000.0, 95000.0, 250000.0]
+    for b in params.brackets:
+        if b.threshold:
+            levels += [b.threshold - 0.5, b.threshold, b.threshold + 0.5]
+    for ordinary, age in itertools.product(levels, [60, 65, 71, 85]):
+        yield dict(age=age, ordinary_income=ordinary)
+        yield dict(age=age, ordinary_income=ordinary * 0.3, pension_income=ordinary * 0.5,
+                   oas_received=8800.0, cap_gains=ordinary * 0.2)
+        yield dict(age=age, ordinary_income=ordinary * 0.1, elig_dividends=ordinary * 0.6,
+                   nonelig_dividends=ordinary * 0.2, pension_income=1500.0, oas_received=9200.0)
+
+
+def test_batch_matches_scalar():
+    """Batch results equal scalar results to the cent for every field"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    original_size = tax_engine._tax_cache_max_size
+    configure_tax_cache(0)  # Scalar results computed exactly, not from rounded cache keys
+    try:
+        for province in ["AB", "BC", "ON", "QC"]:
+            fed, prov = get_tax_params(cfg, province)
+            for params in (fed, prov, index_tax_params(fed, 12, 0.02), index_tax_params(prov, 12, 0.02)):
+                cases = list(_golden_cases(params))
+                columns = ["ordinary_income", "elig_dividends", "nonelig_dividends",
+                           "cap_gains", "pension_income", "oas_received"]
+                arrays = {c: np.array([case.get(c, 0.0) for case in cases]) for c in columns}
+                ages = np.array([case["age"] for case in cases])
+
+                batch = progressive_tax_batch(params, ages, **arrays)
+
+                for i, case in enumerate(cases):
+                    scalar = progressive_tax(params, **case)
+                    for field, value in scalar.items():
+                        assert abs(batch[field][i] - value) < 0.005, (
+                            f"{province} {case} {field}: batch={batch[field][i]} scalar={value}"
+                        )
+    finally:
+        configure_tax_cache(original_size)
+        clear_tax_cache()
+
+    print("✅ progressive_tax_batch matches progressive_tax")
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
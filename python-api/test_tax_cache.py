@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the progressive_tax cache: content-keyed hits, no cross-talk between
+different params, LRU eviction, per-simulation scopes and no per-config
+bookkeeping left behind.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import gc
+
+import modules.tax_engine as tax_engine
+from modules.config import load_tax_config, get_tax_params, index_tax_params
+from modules.tax_engine import (
+    progressive_tax, clear_tax_cache, configure_tax_cache,
+    get_tax_cache_stats, tax_cache_scope,
+)
+
+
+def test_cache_hits_on_equal_content():
+    """Separately built but identical params share cache entries"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    fed, _ = get_tax_params(cfg, "ON")
+    clear_tax_cache()
+
+    first = progressive_tax(index_tax_params(fed, 5, 0.02), age=70, ordinary_income=60000, oas_received=8000)
+    second = progressive_tax(index_tax_params(fed, 5, 0.02), age=70, ordinary_income=60000, oas_received=8000)
+
+    stats = get_tax_cache_stats()
+    assert stats["misses"] == 1 and stats["hits"] == 1, stats
+    assert first is second
+    print("✅ Cache hits across equal params objects")
+
+
+def test_cache_never_mixes_params():
+    """Different params never return each other's results, even after id() reuse"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    fed, _ = get_tax_params(cfg, "ON")
+
+    # Expected tax per indexed year, computed once with objects kept alive
+    clear_tax_cache()
+    all_params = [index_tax_params(fed, years, 0.02) for years in range(20)]
+    expected = [progressive_tax(p, age=50, ordinary_income=80000)["net_tax"] for p in all_params]
+    del all_params
+
+    clear_tax_cache()
+    for years in range(20):
+        params = index_tax_params(fed, years, 0.02)
+        assert progressive_tax(params, age=50, ordinary_income=80000)["net_tax"] == expected[years], years
+        del params  # Allow id() reuse for the next year's params
+
+    assert get_tax_cache_stats()["misses"] == 20
+    print("✅ Indexed years never collide in the cache")
+
+
+def test_eviction_and_scope():
+    """LRU eviction is counted and scoped lookups bypass the shared cache"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    fed, _ = get_tax_params(cfg, "ON")
+    original_size = tax_engine._tax_cache_max_size
+    try:
+        clear_tax_cache()
+        configure_tax_cache(3)
+        for income in (10000, 20000, 30000, 40000, 50000):
+            progressive_tax(fed, age=70, ordinary_income=income)
+        stats = get_tax_cache_stats()
+        assert stats["size"] == 3 and stats["evictions"] == 2, stats
+
+        with tax_cache_scope():
+            progressive_tax(fed, age=70, ordinary_income=50000)
+            progressive_tax(fed, age=70, ordinary_income=50000)
+        stats = get_tax_cache_stats()
+        assert stats["hits"] == 1 and stats["scoped_hits"] == 1, stats
+    finally:
+        configure_tax_cache(original_size)
+        clear_tax_cache()
+    print("✅ Eviction and scoped cache counters")
+
+
+def test_fingerprints_released():
+    """Params fingerprints go away with their params, however many configs were seen"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    fed, _ = get_tax_params(cfg, "ON")
+    gc.collect()
+    before = len(tax_engine._params_fingerprints)
+    for year in range(1, 201):
+        progressive_tax(index_tax_params(fed, year, 0.03), age=70, ordinary_income=50000)
+    gc.collect()
+    assert len(tax_engine._params_fingerprints) == before
+    clear_tax_cache()
+    print("✅ No fingerprint bookkeeping kept for 200 distinct params")
+
+
+if __name__ == "__main__":
+    test_cache_hits_on_equal_content()
+    test_cache_never_mixes_params()
+    test_eviction_and_scope()
+    test_fingerprints_released()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test the compiled tax schedule registry.
+Every compiled year must equal index_tax_params() for the same inputs.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules.config import load_tax_config, get_tax_params, index_tax_params
+from modules.tax_schedule import get_compiled_schedule
+
+
+def test_schedule_matches_index_tax_params():
+    """Compiled years are identical to per-year indexing"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+
+    for province in ["AB", "BC", "ON", "QC"]:
+        fed, prov = get_tax_params(cfg, province)
+        for inflation in [0.0, 0.02, 0.035]:
+            schedule = get_compiled_schedule(cfg, province, inflation)
+            for years in [0, 1, 7, 30, schedule.horizon - 1, schedule.horizon + 5]:
+                fed_y, prov_y = schedule.params_for(years)
+                assert fed_y == index_tax_params(fed, years, inflation), (province, inflation, years)
+                assert prov_y == index_tax_params(prov, years, inflation), (province, inflation, years)
+
+    print("✅ Compiled schedule matches index_tax_params")
+
+
+def test_schedule_is_shared():
+    """Equal configs share one schedule and stable per-year params"""
+    cfg = load_tax_config("tax_config_canada_2025.json")
+    cfg_copy = load_tax_config("tax_config_canada_2025.json")
+
+    first = get_compiled_schedule(cfg, "ON", 0.02)
+    second = get_compiled_schedule(cfg_copy, "ON", 0.02)
+    assert first is second
+    assert first.params_for(10)[0] is second.params_for(10)[0]
+
+    assert get_compiled_schedule(cfg, "BC", 0.02) is not first
+    assert get_compiled_schedule(cfg, "ON", 0.03) is not first
+    print("✅ Compiled schedules are shared by key")
+
+
+if __name__ == "__main__":
+    test_schedule_matches_index_tax_params()
+    test_schedule_is_shared()
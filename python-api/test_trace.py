@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the simulation trace facility: records are only collected inside
+trace.collect(), filtered by channel, and simulate() writes nothing to
+stderr when tracing is off.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import contextlib
+import io
+
+from household_fixtures import household
+from modules import trace
+from modules.config import load_tax_config
+from modules.simulation import simulate
+
+
+def test_collect_filters_channels():
+    """emit() records only inside collect() and only on selected channels"""
+    assert not trace.ACTIVE
+    trace.emit("gis", "ignored", value=1)
+
+    with trace.collect({"gis"}) as collector:
+        assert trace.ACTIVE
+        assert trace.enabled("gis") and not trace.enabled("rrif")
+        trace.emit("gis", "kept", value=2)
+        trace.emit("rrif", "filtered", value=3)
+
+    assert not trace.ACTIVE
+    assert collector.records == [{"channel": "gis", "event": "kept", "value": 2}]
+    assert trace.parse_channels("withdrawals, gis") == {"withdrawals", "gis"}
+    assert trace.parse_channels("") is None
+
+    try:
+        trace.collect({"nope"}).__enter__()
+        assert False, "unknown channel accepted"
+    except ValueError:
+        pass
+    print("✅ Trace collection and channel filtering")
+
+
+def test_simulate_is_quiet_and_traceable():
+    """No stderr output without a collector; structured records with one"""
+    tax_cfg = load_tax_config("tax_config_canada_2025.json")
+
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr):
+        quiet = simulate(household(end_age=75), tax_cfg)
+    assert stderr.getvalue() == "", stderr.getvalue()[:500]
+
+    with trace.collect() as collector:
+        traced = simulate(household(end_age=75), tax_cfg)
+
+    assert quiet.equals(traced)
+    events = {(r["channel"], r["event"]) for r in collector.records}
+    assert ("withdrawals", "shortfall_loop_start") in events
+    assert ("gis", "individual_gis") in events
+    print(f"✅ simulate() quiet by default, {len(collector.records)} trace records when collected")
+
+
+if __name__ == "__main__":
+    test_collect_filters_channels()
+    test_simulate_is_quiet_and_traceable()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the columnar /run-simulation wire format: it carries exactly the row
+format's data in fewer bytes, precision rounds floats, NaN is sent as null
+in the requested format, and the format is negotiated from query parameters
+or the Accept header.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import json
+from types import SimpleNamespace
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from api.models.requests import HouseholdInput, PersonInput
+from api.routes.simulation import _render_response, _run_simulation
+from api.utils.wire_format import COLUMNAR_MEDIA_TYPE, ROW_FORMAT, WireFormat, negotiate
+from modules.config import load_tax_config
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _response():
+    p1 = PersonInput(name="Wire", start_age=65, tfsa_balance=100000, rrif_balance=300000,
+                     nonreg_balance=150000, nonreg_acb=100000)
+    p2 = PersonInput(name="Partner", start_age=64, tfsa_balance=50000, rrif_balance=200000)
+    household = HouseholdInput(p1=p1, p2=p2, province="ON", strategy="balanced", include_partner=True)
+    state = SimpleNamespace(tax_cfg=load_tax_config(os.path.join(CONFIG_DIR, "tax_config_canada_2025.json")))
+    return _run_simulation(household, state)
+
+
+def _rows(section):
+    return [{name: section["data"][name][i] for name in section["columns"]} for i in range(section["rows"])]
+
+
+def test_columnar_is_lossless_and_smaller():
+    """Rebuilding rows from the columns gives the row-format response back"""
+    response = _response()
+    rows_body = ROW_FORMAT.render(response)
+    columnar_body = WireFormat(columnar=True).render(response)
+    rows, columnar = json.loads(rows_body), json.loads(columnar_body)
+
+    assert _rows(columnar["year_by_year"]) == rows["year_by_year"]
+    assert _rows(columnar["chart_data"]["data_points"]) == rows["chart_data"]["data_points"]
+    rest = lambda content: {k: v for k, v in content.items() if k not in ("year_by_year", "chart_data")}
+    assert rest(columnar) == rest(rows)
+
+    assert len(columnar_body) < 0.6 * len(rows_body)
+    print(f"✅ Columnar: {len(columnar_body):,} bytes vs {len(rows_body):,} in rows")
+
+
+def test_precision_rounds_float_columns():
+    response = _response()
+    cents = json.loads(WireFormat(columnar=True, precision=2).render(response))["year_by_year"]["data"]
+    dollars = json.loads(WireFormat(columnar=True, precision=0).render(response))["year_by_year"]["data"]
+
+    exact = [r.tfsa_withdrawal_p1 for r in response.year_by_year]
+    assert all(abs(c - v) <= 0.005 + 1e-9 and c == round(c, 2) for c, v in zip(cents["tfsa_withdrawal_p1"], exact))
+    assert all(isinstance(v, int) for v in dollars["tfsa_withdrawal_p1"])
+    assert dollars["year"] == [r.year for r in response.year_by_year]
+    print("✅ precision=2 keeps cents, precision=0 sends whole dollars")
+
+
+def test_nan_sent_as_null_in_requested_format():
+    """A NaN result no longer drops a columnar request back to rows"""
+    response = _response()
+    response.year_by_year[0].tfsa_withdrawal_p1 = float("nan")
+    response.summary.total_tax_paid = float("inf")
+
+    rendered = _render_response(None, response, WireFormat(columnar=True, precision=2), None)
+    assert rendered.headers["X-Response-Format"] == "columnar"
+    content = json.loads(rendered.body)
+    assert content["year_by_year"]["data"]["tfsa_withdrawal_p1"][0] is None
+    assert content["summary"]["total_tax_paid"] is None
+
+    rows = json.loads(ROW_FORMAT.render(response))
+    assert rows["year_by_year"][0]["tfsa_withdrawal_p1"] is None and rows["summary"]["total_tax_paid"] is None
+    print("✅ NaN and infinity sent as null, columnar format kept")
+
+
+def test_negotiation():
+    def request(query=b"", accept=b"application/json"):
+        return Request({"type": "http", "query_string": query, "headers": [(b"accept", accept)]})
+
+    assert negotiate(request()) == ROW_FORMAT
+    assert negotiate(request(b"format=columnar&precision=2")) == WireFormat(columnar=True, precision=2)
+    assert negotiate(request(accept=COLUMNAR_MEDIA_TYPE.encode())) == WireFormat(columnar=True)
+    assert negotiate(request(b"format=rows", accept=COLUMNAR_MEDIA_TYPE.encode())) == ROW_FORMAT
+    for bad in (b"format=arrow", b"format=columnar&precision=-1", b"format=columnar&precision=two"):
+        try:
+            negotiate(request(bad))
+            assert False, bad
+        except HTTPException as e:
+            assert e.status_code == 400
+    print("✅ Format negotiated from query parameters and Accept header")
+
+
+if __name__ == "__main__":
+    test_columnar_is_lossless_and_smaller()
+    test_precision_rounds_float_columns()
+    test_nan_sent_as_null_in_requested_format()
+    test_negotiation()
@@ -14,10 +14,9 @@ This provides evidence-based recommendations rather than rule-based heuristics.
 """
 
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import logging
 from modules.simulation import simulate
-from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
@@ -59,12 +58,13 @@ class StrategyRecommender:
         "balanced",
     ]
 
-    def __init__(self, household, user_priorities: Dict[str, float] = None):
+    def __init__(self, household, tax_cfg: Dict, user_priorities: Dict[str, float] = None):
         """
         Initialize recommender.
 
         Args:
             household: Household object with financial data
+            tax_cfg: Tax configuration from load_tax_config()
             user_priorities: Optional dict with weights for optimization criteria
                 {
                     'spending': 0.25,  # Maximize total spending
@@ -74,6 +74,7 @@ class StrategyRecommender:
                 }
         """
         self.household = household
+        self.tax_cfg = tax_cfg
         self.priorities = user_priorities or {
             'spending': 0.20,
             'taxes': 0.25,
@@ -122,32 +123,27 @@ class StrategyRecommender:
         Returns:
             StrategyOutcome with all metrics
         """
-        # Create a copy of household with the test strategy
-        hh_test = deepcopy(self.household)
-        hh_test.strategy = strategy
+        # Household with the test strategy (simulate() leaves the shared Person specs untouched)
+        hh_test = replace(self.household, strategy=strategy)
 
-        # Run simulation
-        df, summary, estate_summary = simulate(hh_test)
+
+        # Run simulation (totals only - no year-by-year frame needed here)
+        metrics = simulate(hh_test, self.tax_cfg, mode="metrics")
 
         # Extract metrics
-        total_spending = summary.get('total_spending_available', 0)
-        total_tax_paid = summary.get('total_tax_paid', 0)
-        estate_taxes = estate_summary.get('taxes_at_death', 0)
-        estate_after_tax = estate_summary.get('after_tax_legacy', 0)
-        final_net_worth = estate_summary.get('gross_estate_value', 0)
-
-        government_benefits = (
-            summary.get('total_cpp', 0) +
-            summary.get('total_oas', 0) +
-            summary.get('total_gis', 0)
-        )
+        total_spending = metrics.total_spending - metrics.total_underfunding
+        total_tax_paid = metrics.total_tax
+        estate_taxes = metrics.terminal_tax
+        estate_after_tax = metrics.after_tax_legacy
+        final_net_worth = metrics.gross_legacy
+
+        government_benefits = metrics.total_benefits
 
         lifetime_taxes = total_tax_paid + estate_taxes
-        years_funded = summary.get('years_funded', 0)
-        years_simulated = summary.get('years_simulated', 30)
-        success_rate = years_funded / years_simulated if years_simulated > 0 else 0
+        years_funded = metrics.years_funded
+        success_rate = metrics.success_rate
 
-        total_oas_clawback = summary.get('total_oas_clawback', 0)
+        total_oas_clawback = metrics.total_oas_clawback
 
         # Calculate overall score
         score = self._calculate_score(
@@ -305,18 +301,21 @@ class StrategyRecommender:
         return rationale
 
 
-def recommend_strategy_from_simulations(household, strategies: List[str] = None) -> Tuple[str, str]:
+def recommend_strategy_from_simulations(household, tax_cfg: Dict, strategies: List[str] = None) -> Tuple[str, str]:
     """
     Convenience function to get strategy recommendation.
 
     Args:
         household: Household object
+        tax_cfg: Tax configuration from load_tax_config()
         strategies: Optional list of strategies to test
 
     Returns:
         Tuple of (recommended_strategy_name, rationale)
     """
-    recommender = StrategyRecommender(household)
+    recommender = StrategyRecommender(household, tax_cfg)
+
+
     recommender.compare_strategies(strategies)
     best_name, best_outcome = recommender.get_recommended_strategy()
     rationale = recommender.get_rationale_for_recommendation()